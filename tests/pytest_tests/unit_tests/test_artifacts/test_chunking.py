@@ -0,0 +1,127 @@
+import hashlib
+import os
+import random
+
+import pytest
+from wandb.sdk.artifacts import artifacts_cache, chunking
+from wandb.sdk.artifacts.artifact import Artifact
+from wandb.sdk.artifacts.artifact_manifest import ArtifactManifest
+from wandb.sdk.artifacts.artifact_state import ArtifactState
+from wandb.sdk.artifacts.storage_policies import chunked_storage_policy
+from wandb.sdk.artifacts.storage_policies.chunked_storage_policy import (
+    ChunkedStoragePolicy,
+)
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(chunking, "MIN_CHUNK_SIZE", 4 * 1024)
+    monkeypatch.setattr(chunking, "AVG_CHUNK_SIZE", 16 * 1024)
+    monkeypatch.setattr(chunking, "MAX_CHUNK_SIZE", 64 * 1024)
+    monkeypatch.setattr(chunked_storage_policy, "MIN_CHUNKED_FILE_SIZE", 1024)
+
+
+@pytest.fixture
+def chunked_artifact(tmp_path, monkeypatch, small_chunks):
+    monkeypatch.setenv("WANDB_ARTIFACT_CHUNKING", "true")
+    monkeypatch.setenv("WANDB_DATA_DIR", str(tmp_path / "data"))
+    cache = artifacts_cache.ArtifactsCache(tmp_path / "cache")
+    monkeypatch.setattr(artifacts_cache, "_artifacts_cache", cache)
+    return Artifact("checkpoint", type="model")
+
+
+def random_bytes(size, seed=0):
+    return random.Random(seed).getrandbits(size * 8).to_bytes(size, "little")
+
+
+def chunks(data):
+    return [data[start:end] for start, end in chunking.chunk_bounds(data)]
+
+
+def test_chunk_bounds(small_chunks):
+    data = random_bytes(1024**2)
+    bounds = list(chunking.chunk_bounds(data))
+    assert bounds[0][0] == 0
+    assert bounds[-1][1] == len(data)
+    assert all(a[1] == b[0] for a, b in zip(bounds, bounds[1:]))
+    sizes = [end - start for start, end in bounds]
+    assert all(4 * 1024 <= size <= 64 * 1024 for size in sizes[:-1])
+
+
+def test_chunks_survive_insertions(small_chunks):
+    data = random_bytes(1024**2)
+    edited = data[:300_000] + b"inserted" + data[300_000:]
+    before = {hashlib.md5(c).digest() for c in chunks(data)}
+    after = [hashlib.md5(c).digest() for c in chunks(edited)]
+    changed = [c for c in after if c not in before]
+    assert len(changed) <= 2
+
+
+def test_add_file_splits_large_files(chunked_artifact, tmp_path):
+    assert isinstance(chunked_artifact.manifest.storage_policy, ChunkedStoragePolicy)
+    data = random_bytes(256 * 1024)
+    path = tmp_path / "model.bin"
+    path.write_bytes(data)
+    small_path = tmp_path / "config.json"
+    small_path.write_text("{}")
+
+    entry = chunked_artifact.add_file(str(path))
+    chunked_artifact.add_file(str(small_path))
+
+    assert entry.local_path is None
+    assert len(entry.extra["chunks"]) == len(chunks(data))
+    chunk_paths = [p for p in chunked_artifact.manifest.entries if p != entry.path]
+    assert "config.json" in chunk_paths
+    assert all(
+        ChunkedStoragePolicy.is_chunk_path(p) for p in chunk_paths if p != "config.json"
+    )
+    assert chunked_artifact.size == len(data) + 2
+
+    # the manifest round-trips with its policy
+    manifest = ArtifactManifest.from_manifest_json(
+        chunked_artifact.manifest.to_manifest_json()
+    )
+    assert isinstance(manifest.storage_policy, ChunkedStoragePolicy)
+
+
+@pytest.fixture
+def committed_chunked_artifact(chunked_artifact, tmp_path):
+    data = random_bytes(256 * 1024)
+    path = tmp_path / "model.bin"
+    path.write_bytes(data)
+    chunked_artifact.add_file(str(path))
+    chunked_artifact._state = ArtifactState.COMMITTED
+    chunked_artifact._fetch_file_urls = lambda cursor: {
+        "pageInfo": {"hasNextPage": False, "endCursor": None},
+        "edges": [],
+    }
+    return chunked_artifact, data
+
+
+def test_download_reassembles_chunked_files(committed_chunked_artifact, tmp_path):
+    artifact, data = committed_chunked_artifact
+    root = artifact.download(str(tmp_path / "root"))
+    assert sorted(os.listdir(root)) == ["model.bin"]
+    with open(os.path.join(root, "model.bin"), "rb") as f:
+        assert f.read() == data
+
+    artifact.verify(root)
+    with open(os.path.join(root, "model.bin"), "r+b") as f:
+        f.write(b"corrupted")
+    with pytest.raises(ValueError, match="Digest mismatch"):
+        artifact.verify(root)
+
+
+def test_view_hides_chunks(committed_chunked_artifact):
+    artifact, data = committed_chunked_artifact
+    chunk_path = next(p for p in artifact.manifest.entries if p != "model.bin")
+    with artifact.view() as view:
+        assert view.paths() == ["model.bin"]
+        assert view.glob("*") == ["model.bin"]
+        assert view.listdir() == ["model.bin"]
+        with view.open("model.bin", "rb") as f:
+            assert f.read() == data
+        with pytest.raises(KeyError):
+            view.open(chunk_path)
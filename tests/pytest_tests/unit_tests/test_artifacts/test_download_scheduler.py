@@ -0,0 +1,98 @@
+import concurrent.futures
+import time
+from unittest import mock
+
+import pytest
+import responses
+from wandb.sdk.artifacts import download_scheduler
+from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
+from wandb.sdk.artifacts.artifacts_cache import ArtifactsCache
+from wandb.sdk.artifacts.storage_policies.wandb_storage_policy import WandbStoragePolicy
+from wandb.sdk.lib import hashutil
+
+
+def test_bandwidth_limiter():
+    limiter = download_scheduler.BandwidthLimiter(rate=100)
+    with mock.patch.object(
+        download_scheduler.time, "monotonic", return_value=1000.0
+    ), mock.patch.object(download_scheduler.time, "sleep") as sleep:
+        # a second of data goes through right away
+        limiter.consume(100)
+        sleep.assert_not_called()
+        limiter.consume(50)
+        sleep.assert_called_once_with(pytest.approx(0.5))
+
+
+def test_adaptive_limit_follows_throughput():
+    limit = download_scheduler.AdaptiveLimit(8, 4, 64, interval=0)
+    limit.acquire()
+    limit.release(100)
+    assert limit.limit == 10
+    # throughput kept improving, keep growing
+    limit.acquire()
+    limit.release(10**6)
+    assert limit.limit == 12
+    # throughput dropped, turn around
+    limit.acquire()
+    limit.release(1)
+    assert limit.limit == 9
+
+
+def test_scheduler_small_files_as_fast_as_thread_pool():
+    downloaded = []
+
+    def download(entry):
+        time.sleep(0.02)  # the latency of a request
+        downloaded.append(entry.path)
+
+    entries = [ArtifactManifestEntry(f"{n}.txt", "digest", size=1) for n in range(256)]
+
+    start = time.monotonic()
+    with concurrent.futures.ThreadPoolExecutor(64) as executor:
+        list(executor.map(download, entries))
+    pool_elapsed = time.monotonic() - start
+
+    downloaded.clear()
+    start = time.monotonic()
+    with download_scheduler.DownloadScheduler(download, max_workers=64) as s:
+        for entry in entries:
+            s.submit(entry)
+    elapsed = time.monotonic() - start
+
+    assert sorted(downloaded) == sorted(e.path for e in entries)
+    assert elapsed < pool_elapsed * 1.5 + 0.05
+
+
+def test_scheduler_raises_errors():
+    def download(entry):
+        raise ValueError(entry.path)
+
+    with pytest.raises(ValueError, match="a.txt"):
+        with download_scheduler.DownloadScheduler(download) as s:
+            s.submit(ArtifactManifestEntry("a.txt", "digest", size=1))
+
+
+def test_load_file_ranged_download(tmp_path, monkeypatch):
+    monkeypatch.setattr(download_scheduler, "RANGED_DOWNLOAD_MIN_SIZE", 10)
+    monkeypatch.setattr(download_scheduler, "RANGE_SIZE", 4)
+    content = b"0123456789abcdefghij!"
+    url = "https://example.com/object"
+
+    def ranged(request):
+        start, end = map(int, request.headers["Range"][6:].split("-"))
+        headers = {"Content-Range": f"bytes {start}-{end}/{len(content)}"}
+        return 206, headers, content[start : end + 1]
+
+    policy = WandbStoragePolicy(
+        cache=ArtifactsCache(tmp_path / "cache"), api=mock.Mock()
+    )
+    entry = ArtifactManifestEntry(
+        "object", hashutil.md5_string(content.decode()), size=len(content)
+    )
+    entry._download_url = url
+    with responses.RequestsMock() as rsps:
+        rsps.add_callback(responses.GET, url, callback=ranged)
+        path = policy.load_file(mock.Mock(), entry)
+        assert len(rsps.calls) == 6
+    with open(path, "rb") as f:
+        assert f.read() == content
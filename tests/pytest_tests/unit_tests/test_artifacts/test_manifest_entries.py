@@ -0,0 +1,112 @@
+import copy
+import json
+
+import pytest
+from wandb.sdk.artifacts.artifact_manifest import ArtifactManifest
+from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
+from wandb.sdk.artifacts.manifest_entries import ManifestEntries, load_manifest_json
+from wandb.sdk.lib import hashutil
+
+MANIFEST_JSON = {
+    "version": 1,
+    "storagePolicy": "wandb-storage-policy-v1",
+    "storagePolicyConfig": {"storageLayout": "V2"},
+    "contents": {
+        "a/1.txt": {"digest": hashutil.md5_string("1"), "size": 1},
+        "a/2.txt": {
+            "digest": hashutil.md5_string("2"),
+            "size": 1,
+            "birthArtifactID": "QXJ0aWZhY3Q6MQ==",
+            "extra": {"key": "value"},
+        },
+        "ref.txt": {"digest": "etag-1234", "ref": "s3://bucket/ref.txt"},
+    },
+}
+
+
+def chunked(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_load_manifest_json(chunk_size):
+    manifest_json = load_manifest_json(chunked(json.dumps(MANIFEST_JSON), chunk_size))
+    assert isinstance(manifest_json["contents"], ManifestEntries)
+    manifest = ArtifactManifest.from_manifest_json(manifest_json)
+    assert manifest.to_manifest_json() == MANIFEST_JSON
+    assert (
+        manifest.digest() == ArtifactManifest.from_manifest_json(MANIFEST_JSON).digest()
+    )
+
+
+def test_load_manifest_json_trailing_number():
+    manifest_json = load_manifest_json(['{"contents": {}, "version": 1', "2}"])
+    assert manifest_json["version"] == 12
+
+
+def test_load_manifest_json_invalid():
+    with pytest.raises(ValueError):
+        load_manifest_json(['{"version": 1, "contents": {'])
+
+
+def test_entries_materialized_on_lookup():
+    entries = ManifestEntries.from_contents(MANIFEST_JSON["contents"].items())
+    assert len(entries) == 3
+    assert "a/1.txt" in entries
+    entry = entries["ref.txt"]
+    assert entry.path == "ref.txt"
+    assert entry.digest == "etag-1234"
+    assert entry.ref == "s3://bucket/ref.txt"
+    assert entry.size is None
+    assert entries["a/2.txt"].extra == {"key": "value"}
+    # a held entry is shared by every lookup
+    assert entries["ref.txt"] is entry
+
+
+def test_entry_changes_are_written_back():
+    entries = ManifestEntries.from_contents(MANIFEST_JSON["contents"].items())
+    entry = entries["a/1.txt"]
+    entry.birth_artifact_id = "birth"
+    entry.digest = "not-an-md5"
+    entry._download_url = "https://example.com"
+    del entry
+    entry = entries["a/1.txt"]
+    assert entry.birth_artifact_id == "birth"
+    assert entry.digest == "not-an-md5"
+    assert entry._download_url is None
+
+    copied = copy.copy(entry)
+    assert type(copied) is ArtifactManifestEntry
+    copied.size = 100
+    assert entries["a/1.txt"].size == 1
+
+
+def test_entries_set_and_delete():
+    entries = ManifestEntries.from_contents(MANIFEST_JSON["contents"].items())
+    removed = entries["a/1.txt"]
+    del entries["a/1.txt"]
+    assert "a/1.txt" not in entries
+    with pytest.raises(KeyError):
+        del entries["a/1.txt"]
+    # a removed entry doesn't write to the manifest anymore
+    removed.size = 100
+
+    new_entry = ArtifactManifestEntry("a/1.txt", hashutil.md5_string("3"))
+    entries["a/1.txt"] = new_entry
+    assert entries["a/1.txt"] is new_entry
+    assert list(entries) == ["a/2.txt", "ref.txt", "a/1.txt"]
+
+
+def test_paths_with_ref_prefix():
+    contents = dict(MANIFEST_JSON["contents"])
+    contents["dep.txt"] = {"digest": "d", "ref": "wandb-artifact://abc/dep.txt"}
+    entries = ManifestEntries.from_contents(contents.items())
+    entries["set.txt"] = ArtifactManifestEntry(
+        "set.txt", "d", ref="wandb-artifact://def/set.txt"
+    )
+    assert list(entries.paths_with_ref_prefix("wandb-artifact://")) == [
+        "dep.txt",
+        "set.txt",
+    ]
+    # no entry is materialized to find them
+    assert len(entries._live) == 0
@@ -0,0 +1,110 @@
+import errno
+import os
+from unittest import mock
+
+import pytest
+from wandb.sdk.artifacts import staging
+from wandb.sdk.lib import hashutil
+
+
+@pytest.fixture
+def no_reflink(monkeypatch):
+    def reflink(src, dst):
+        raise OSError(errno.EOPNOTSUPP, "not supported")
+
+    monkeypatch.setattr(staging.filesystem, "_link_unsupported", set())
+    monkeypatch.setattr(staging.filesystem, "reflink", reflink)
+
+
+@pytest.fixture
+def src(tmp_path):
+    path = tmp_path / "src.txt"
+    path.write_text("hello")
+    return path
+
+
+@pytest.fixture
+def staging_dir(tmp_path):
+    path = tmp_path / "staging"
+    path.mkdir()
+    return path
+
+
+def test_stage_file_copy_hashes_in_one_pass(src, staging_dir, no_reflink):
+    with mock.patch.object(staging, "md5_file_b64") as md5_file_b64:
+        staged = staging.stage_file(src, staging_dir, mode="copy")
+    md5_file_b64.assert_not_called()
+    assert staged.strategy == staging.COPY
+    assert staged.digest == hashutil.md5_string("hello")
+    with open(staged.path) as f:
+        assert f.read() == "hello"
+    assert os.stat(staged.path).st_mode & 0o777 == 0o400
+
+
+def test_stage_file_falls_back_to_copy(src, staging_dir, no_reflink):
+    staged = staging.stage_file(src, staging_dir, mode="auto")
+    assert staged.strategy == staging.COPY
+    # the unsupported device pair isn't tried again
+    assert len(staging.filesystem._link_unsupported) == 1
+    staged = staging.stage_file(src, staging_dir, mode="auto")
+    assert staged.strategy == staging.COPY
+
+
+def test_stage_file_hardlink(src, staging_dir, no_reflink):
+    mode = os.stat(src).st_mode
+    staged = staging.stage_file(src, staging_dir, mode="hardlink")
+    assert staged.strategy == staging.HARDLINK
+    assert os.path.samefile(staged.path, src)
+    assert staged.digest == hashutil.md5_string("hello")
+    # the source keeps its permissions
+    assert os.stat(src).st_mode == mode
+
+
+def test_stage_file_invalid_mode(src, staging_dir):
+    with pytest.raises(ValueError):
+        staging.stage_file(src, staging_dir, mode="symlink")
+
+
+def test_batches_split_by_count_and_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(staging, "BATCH_FILES", 3)
+    monkeypatch.setattr(staging, "BATCH_BYTES", 10)
+    files = []
+    for n, size in enumerate([1, 1, 1, 1, 20, 1]):
+        path = tmp_path / f"{n}.bin"
+        path.write_bytes(b"x" * size)
+        files.append((path.name, str(path)))
+    sizes = [len(batch) for batch in staging._batches(files)]
+    assert sizes == [3, 1, 1, 1]
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_stage_files(tmp_path, staging_dir, monkeypatch, processes):
+    monkeypatch.setattr(staging, "BATCH_FILES", 4)
+    files = []
+    for n in range(10):
+        path = tmp_path / f"{n}.txt"
+        path.write_text(str(n))
+        files.append((path.name, str(path)))
+    staged = list(
+        staging.stage_files(files, staging_dir, max_workers=2, processes=processes)
+    )
+    assert sorted(physical for _, physical, _ in staged) == sorted(p for _, p in files)
+    for logical, _, staged_file in staged:
+        assert staged_file.digest == hashutil.md5_string(logical.split(".")[0])
+
+
+def test_process_pool_does_not_fork():
+    with staging._executor(1, processes=True) as executor:
+        method = executor._mp_context.get_start_method()
+    assert method != "fork"
+
+
+def test_stage_file_shares_link_support_with_downloads(
+    src, staging_dir, no_reflink, monkeypatch
+):
+    staging.stage_file(src, staging_dir, mode="auto")
+    reflink = mock.Mock()
+    monkeypatch.setattr(staging.filesystem, "reflink", reflink)
+    # downloads to the same filesystem don't try the reflink again
+    staging.filesystem.link_or_copy_changed(src, staging_dir / "dst.txt")
+    reflink.assert_not_called()
@@ -2,14 +2,18 @@ import asyncio
 import base64
 import os
 import random
+import time
 from multiprocessing import Pool
+from unittest import mock
 from urllib.parse import urlparse
 
 import pytest
 import wandb
+from wandb.sdk.artifacts import cache_index
 from wandb.sdk.artifacts.artifact import Artifact
 from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
 from wandb.sdk.artifacts.artifact_saver import get_staging_dir
+from wandb.sdk.artifacts.artifacts_cache import ArtifactsCache
 from wandb.sdk.artifacts.storage_handler import StorageHandler
 from wandb.sdk.artifacts.storage_handlers.gcs_handler import GCSHandler
 from wandb.sdk.artifacts.storage_handlers.local_file_handler import LocalFileHandler
@@ -397,3 +401,103 @@ def test_unwritable_staging_dir(monkeypatch):
 
     with pytest.raises(PermissionError, match="WANDB_DATA_DIR"):
         _ = get_staging_dir()
+
+
+def _write_cache_object(cache, name, size):
+    _, _, opener = cache.check_md5_obj_path(base64.b64encode(name.encode()), size)
+    with opener() as f:
+        f.write("x" * size)
+
+
+def test_artifacts_cache_cleanup_uses_index(cache, monkeypatch):
+    _write_cache_object(cache, "first", 3000)
+    _write_cache_object(cache, "second", 2000)
+    assert cache._index.total_size() == 5000
+    cache.cleanup(10000)
+    assert cache._index.is_built()
+
+    # once built, cleanup reads the index instead of walking the cache
+    monkeypatch.setattr(cache, "_scan", mock.Mock(side_effect=AssertionError))
+    monkeypatch.setattr(cache_index, "_TOUCH_INTERVAL", -1)
+    _write_cache_object(cache, "third", 1000)
+    # a hit makes "first" the most recently used object
+    _, hit, _ = cache.check_md5_obj_path(base64.b64encode(b"first"), 3000)
+    assert hit
+
+    assert cache.cleanup(5000) == 2000
+    assert cache._index.total_size() == 4000
+    _, hit, _ = cache.check_md5_obj_path(base64.b64encode(b"second"), 2000)
+    assert not hit
+
+
+def test_artifacts_cache_evicts_in_background(tmp_path, monkeypatch):
+    monkeypatch.setenv("WANDB_ARTIFACT_CACHE_MAX_SIZE", "2500B")
+    cache = ArtifactsCache(tmp_path)
+    _write_cache_object(cache, "first", 2000)
+    _write_cache_object(cache, "second", 2000)
+    cache._eviction_thread.join()
+    assert cache._index.total_size() == 2000
+
+
+def test_artifacts_cache_cleanup_without_index(cache):
+    cache._index.disabled = True
+    _write_cache_object(cache, "first", 3000)
+    _write_cache_object(cache, "second", 2000)
+    assert cache.cleanup(2500) == 3000
+
+
+def test_artifacts_cache_index_records_writes_in_batches(cache, monkeypatch):
+    monkeypatch.setattr(cache_index, "_FLUSH_INTERVAL", 60)
+    monkeypatch.setattr(cache_index, "_FLUSH_COUNT", 3)
+
+    def recorded():
+        conn = cache._index._connection()
+        return conn.execute("SELECT COUNT(*) FROM objects").fetchone()[0]
+
+    _write_cache_object(cache, "first", 3000)
+    _write_cache_object(cache, "second", 2000)
+    assert recorded() == 0
+    assert cache._index.total_size() == 5000
+
+    # the third write wakes up the thread recording them
+    _write_cache_object(cache, "third", 1000)
+    deadline = time.monotonic() + 10
+    while recorded() < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert recorded() == 3
+    assert cache._index.total_size() == 6000
+
+
+def test_artifacts_cache_index_records_reads_in_batches(cache, monkeypatch):
+    _write_cache_object(cache, "first", 3000)
+    cache._index.flush()
+    monkeypatch.setattr(cache_index, "_FLUSH_INTERVAL", 60)
+    monkeypatch.setattr(cache_index, "_TOUCH_INTERVAL", -1)
+
+    def atime():
+        conn = cache._index._connection()
+        return conn.execute("SELECT atime FROM objects").fetchone()[0]
+
+    before = atime()
+    # a hit doesn't write to the index on the reading thread
+    with mock.patch.object(cache._index, "_connection") as connection:
+        _, hit, _ = cache.check_md5_obj_path(base64.b64encode(b"first"), 3000)
+    assert hit
+    connection.assert_not_called()
+    assert atime() == before
+
+    cache._index.flush()
+    assert atime() > before
+
+
+def test_artifacts_cache_cleanup_finds_interrupted_writes(cache):
+    cache.cleanup(10000)
+    assert cache._index.is_built()
+    _, _, opener = cache.check_md5_obj_path(base64.b64encode(b"first"), 1000)
+    with pytest.raises(KeyboardInterrupt):
+        with opener() as f:
+            f.write("x" * 1000)
+            raise KeyboardInterrupt
+
+    assert cache.cleanup(10000, remove_temp=True) == 1000
+    assert os.listdir(os.path.join(cache._cache_dir, "tmp")) == []
@@ -142,3 +142,113 @@ def test_data_write_fill(with_datastore):
         expected_records=records,
         expected_record_sizes=lengths,
     )
+
+
+def _write_records(ds, count=20):
+    """Write history records with a large record in the middle, return offsets."""
+    offsets = []
+    for n in range(count):
+        rec = wandb_internal_pb2.Record(num=n + 1)
+        if n == count // 2:
+            rec.output.line = "x" * (32768 * 2)
+        else:
+            item = rec.history.item.add()
+            item.key = "step"
+            item.value_json = json.dumps(n)
+        start, end, _ = ds.write(rec)
+        offsets.append((start, end))
+    return offsets
+
+
+def test_mapped_index(with_datastore):
+    """Index records written by the datastore and read them back by position."""
+    offsets = _write_records(with_datastore)
+    with_datastore.close()
+
+    with datastore.MappedDataStore(FNAME) as mds:
+        assert len(mds) == len(offsets)
+        assert [mds.offsets(n) for n in range(len(mds))] == offsets
+        assert mds.incomplete is None
+        assert mds.select("output") == [10]
+        assert mds.record_type(0) == "history"
+        assert mds.find_num(11) == 10
+        assert mds.find_offset(offsets[3][0]) == 3
+        assert mds.find_offset(offsets[3][0] + 1) is None
+
+        records = mds.parse_batch(range(len(mds)))
+        assert [r.num for r in records] == list(range(1, 21))
+        assert records[10].output.line == "x" * (32768 * 2)
+
+        start, final = offsets[8][0], offsets[12][1]
+        ends = [end for _, end in mds.scan(start, final)]
+        assert ends == [end for _, end in offsets[8:13]]
+
+
+def test_mapped_index_persisted(with_datastore):
+    """A saved index is reused and extended with records appended since."""
+    offsets = _write_records(with_datastore)
+    with_datastore._fp.flush()
+
+    with datastore.MappedDataStore(FNAME) as mds:
+        index_fname = mds.save_index()
+    try:
+        rec = wandb_internal_pb2.Record(num=21)
+        rec.summary.update.add(key="a", value_json="1")
+        offsets.append(with_datastore.write(rec)[:2])
+        with_datastore.close()
+
+        with datastore.MappedDataStore(FNAME) as mds:
+            assert mds._indexed_end == offsets[-1][1]
+            assert [mds.offsets(n) for n in range(len(mds))] == offsets
+            assert mds.select("summary") == [20]
+    finally:
+        os.unlink(index_fname)
+
+
+def test_mapped_incomplete(with_datastore):
+    """A truncated trailing record is reported, and indexed once completed."""
+    _write_records(with_datastore, count=2)
+    with_datastore._fp.flush()
+    with open(FNAME, "rb") as f:
+        complete = f.read()
+
+    rec = wandb_internal_pb2.Record(num=3)
+    rec.history.item.add(key="step", value_json="3")
+    with_datastore.write(rec)
+    with_datastore.close()
+    with open(FNAME, "rb") as f:
+        data = f.read()
+
+    with open(FNAME, "wb") as f:
+        f.write(data[: len(complete) + 5])
+    with datastore.MappedDataStore(FNAME) as mds:
+        assert len(mds) == 2
+        assert mds.incomplete
+        with open(FNAME, "ab") as f:
+            f.write(data[len(complete) + 5 :])
+        assert mds.refresh() == 1
+        assert mds.incomplete is None
+        assert mds.parse_batch([2])[0].num == 3
+
+
+def test_mapped_records(with_datastore):
+    """Records are read in order without an index, up to a corrupt record."""
+    offsets = _write_records(with_datastore)
+    with_datastore.close()
+
+    with open(FNAME, "r+b") as f:
+        f.seek(offsets[5][1] - 1)
+        f.write(b"\xff")
+    mds = datastore.MappedDataStore(FNAME)
+    mds.open(build_index=False)
+    try:
+        assert len(mds) == 0
+        read = []
+        with pytest.raises(AssertionError, match="checksum"):
+            for data in mds.records():
+                record = wandb_internal_pb2.Record()
+                record.ParseFromString(data)
+                read.append(record.num)
+        assert read == list(range(1, 6))
+    finally:
+        mds.close()
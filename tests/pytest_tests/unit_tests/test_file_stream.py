@@ -1,11 +1,24 @@
+import functools
+import gzip
 import itertools
+import json
 import os
 import random
 import string
+import threading
+import time
 from dataclasses import dataclass
+from unittest.mock import MagicMock
 
+import pytest
 from wandb import util
-from wandb.sdk.internal.file_stream import CRDedupeFilePolicy
+from wandb.sdk.internal import pipeline_stats
+from wandb.sdk.internal.file_stream import (
+    AdaptiveBatchPolicy,
+    CRDedupeFilePolicy,
+    FileStreamApi,
+    OrderedRequestPipeline,
+)
 from wandb.sdk.lib.file_stream_utils import split_files
 
 
@@ -193,3 +206,83 @@ def test_crdedupe_process_chunks():
     files["output.log"] = ret
     file_requests = list(split_files(files, max_bytes=util.MAX_LINE_BYTES))
     assert 2 == len(file_requests)
+
+
+def test_ordered_pipeline_preserves_per_file_order():
+    pipeline = OrderedRequestPipeline(max_inflight=4)
+    sent = []
+    lock = threading.Lock()
+
+    def post(name, i):
+        # later requests finish faster, which would reorder a naive pool
+        time.sleep(random.random() * 0.01)
+        with lock:
+            sent.append((name, i))
+
+    for i in range(20):
+        for name in ("history", "events", "output"):
+            pipeline.submit([name], functools.partial(post, name, i))
+    pipeline.drain()
+    pipeline.shutdown()
+
+    assert len(sent) == 60
+    for name in ("history", "events", "output"):
+        assert [i for n, i in sent if n == name] == list(range(20))
+
+
+def test_file_stream_gzip_compression():
+    api = MagicMock()
+    api.client.transport.headers = {}
+    api.client.transport.cookies = {}
+    api.settings.return_value = {"base_url": "", "entity": "e", "project": "p"}
+    fs = FileStreamApi(api, "run", time.time(), compression="gzip")
+    fs._client = MagicMock()
+
+    payload = {"files": {"wandb-history.jsonl": {"offset": 0, "content": ["{}"] * 100}}}
+    fs._post(payload)
+
+    kwargs = fs._client.post.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["data"])) == payload
+    stats = fs.transmit_stats
+    assert stats["compressed_bytes"] == len(kwargs["data"])
+    assert stats["uncompressed_bytes"] > stats["compressed_bytes"]
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_file_stream_logs_transfer(compression):
+    api = MagicMock()
+    api.client.transport.headers = {}
+    api.client.transport.cookies = {}
+    api.settings.return_value = {"base_url": "", "entity": "e", "project": "p"}
+    stats = pipeline_stats.PipelineStats()
+    fs = FileStreamApi(
+        api, "run", time.time(), compression=compression, pipeline_stats=stats
+    )
+    fs._client = MagicMock()
+
+    payload = {"files": {"wandb-history.jsonl": {"offset": 0, "content": ["{}"] * 100}}}
+    fs._post(payload)
+
+    kwargs = fs._client.post.call_args.kwargs
+    sent = kwargs["data"] if compression else json.dumps(payload).encode("utf-8")
+    transfer = stats.snapshot()["stages"]["file_stream"]["transfer"]
+    assert transfer["count"] == 1
+    assert transfer["bytes"] == len(sent)
+
+
+def test_adaptive_batch_policy():
+    policy = AdaptiveBatchPolicy(lambda: 2.0, request_bytes=100)
+
+    # the interval shrinks as the backlog fills a request
+    assert policy.flush_interval(0) == 2.0
+    assert policy.flush_interval(50) == 1.0
+    assert policy.flush_interval(1000) == 0.0
+
+    # a fast server gets several requests' worth per flush, a slow one gets one
+    assert policy.batch_bytes() == 100
+    policy.observe_latency(0.5)
+    assert policy.batch_bytes() == 400
+    for _ in range(50):
+        policy.observe_latency(10.0)
+    assert policy.batch_bytes() == 100
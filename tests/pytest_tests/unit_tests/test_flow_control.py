@@ -11,7 +11,7 @@ from wandb.sdk.wandb_settings import Settings
 
 
 class FlowTester:
-    def __init__(self, high=1000, mid=500, low=250):
+    def __init__(self, high=1000, mid=500, low=250, backlog=1000):
         self._record_num = 0
         self._offset = 0
 
@@ -26,6 +26,7 @@ class FlowTester:
             _threshold_bytes_high=high,
             _threshold_bytes_mid=mid,
             _threshold_bytes_low=low,
+            _threshold_backlog_bytes=backlog,
         )
         self._fc = fc
         self._written = []
@@ -90,8 +91,8 @@ class FlowTester:
 
 @pytest.fixture
 def flow_tester():
-    def make_tester(high=None, mid=None, low=None):
-        ft = FlowTester(high=high, mid=mid, low=low)
+    def make_tester(high=None, mid=None, low=None, backlog=1000):
+        ft = FlowTester(high=high, mid=mid, low=low, backlog=backlog)
         return ft
 
     yield make_tester
@@ -106,6 +107,7 @@ class OpsFactory:
         op_type: str = "data"
         size: int = 0
         offset: int = 0
+        backlog: int = 0
         _id: int = 0
 
         @staticmethod
@@ -127,6 +129,7 @@ class OpsFactory:
             status_report = pb.StatusReportRequest(
                 record_num=0,
                 sent_offset=self.offset,
+                file_stream_backlog_bytes=self.backlog,
             )
             status_time = time.time()
             status_report.sync_time.FromMicroseconds(int(status_time * 1e6))
@@ -291,6 +294,27 @@ def test_pause_to_forward(flow_tester, ops_factory, size_offset, forwarding):
     assert ([] if forwarding else [(300, 350)]) == ft.recovered
 
 
+def test_file_stream_backlog_pauses(flow_tester, ops_factory):
+    ft = flow_tester(high=300, mid=200, low=100, backlog=1000)
+    ops = ops_factory()
+
+    ft.add(ops.op(size=50))
+    ft.add(ops.op(op_type="inform", offset=50, backlog=1000))
+    assert ft.state == State.PAUSING
+    assert 1 == len(ft.forwarded_ops)
+
+    # still backed up: data stays in the transaction log
+    ft.add(ops.op(op_type="inform", offset=50, backlog=600))
+    ft.add(ops.op(size=50))
+    assert ft.state == State.PAUSING
+    assert [] == ft.forwarded_ops
+
+    # drained below half the threshold: resume and recover what was skipped
+    ft.add(ops.op(op_type="inform", offset=50, backlog=499))
+    assert ft.state == State.FORWARDING
+    assert [(50, 100)] == ft.recovered
+
+
 def test_forwarding_mark():
     pass
 
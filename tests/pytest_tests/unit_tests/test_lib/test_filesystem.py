@@ -13,6 +13,7 @@ import pytest
 from pyfakefs.fake_filesystem import OSType
 from wandb.sdk.lib.filesystem import (
     copy_or_overwrite_changed,
+    link_or_copy_changed,
     mkdir_exists_ok,
     safe_copy,
     safe_open,
@@ -148,6 +149,41 @@ def test_copy_or_overwrite_changed_unfixable(tmp_path):
     assert "Unable to overwrite" in str(e.value)
 
 
+def test_link_or_copy_changed_hardlink(tmp_path):
+    source_path = tmp_path / "source.txt"
+    target_path = tmp_path / "sub" / "target.txt"
+    source_path.write_text("original")
+    write_pause(target_path, "outdated")
+
+    with patch("wandb.sdk.lib.filesystem._link_unsupported", set()), patch(
+        "wandb.sdk.lib.filesystem.reflink", side_effect=OSError(95, "unsupported")
+    ):
+        result = link_or_copy_changed(source_path, target_path, hardlink=True)
+
+    assert result == target_path
+    assert os.path.samefile(source_path, target_path)
+    assert os.listdir(target_path.parent) == ["target.txt"]
+
+
+def test_link_or_copy_changed_falls_back_to_copy(tmp_path):
+    source_path = tmp_path / "source.txt"
+    target_path = tmp_path / "target.txt"
+    source_path.write_text("original")
+
+    with patch("wandb.sdk.lib.filesystem._link_unsupported", set()) as unsupported:
+        with patch(
+            "wandb.sdk.lib.filesystem.reflink", side_effect=OSError(95, "unsupported")
+        ) as reflink_mock:
+            link_or_copy_changed(source_path, target_path)
+            link_or_copy_changed(source_path, tmp_path / "other.txt")
+        # an unsupported filesystem isn't tried again
+        assert reflink_mock.call_count == 1
+        assert len(unsupported) == 1
+
+    assert target_path.read_text() == "original"
+    assert not os.path.samefile(source_path, target_path)
+
+
 @pytest.mark.parametrize("binary", ["", "b", "t"])
 @pytest.mark.parametrize("mode", ["w", "w+", "a", "a+"])
 def test_safe_write_interrupted_overwrites(binary, mode):
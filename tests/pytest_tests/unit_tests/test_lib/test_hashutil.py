@@ -1,9 +1,13 @@
 import base64
 import hashlib
+import os
+import time
+from unittest import mock
 
+import pytest
 from hypothesis import given
 from hypothesis import strategies as st
-from wandb.sdk.lib import hashutil
+from wandb.sdk.lib import digest_index, hashutil
 
 
 def test_md5_string():
@@ -67,3 +71,55 @@ def test_md5_file_hex_three_files(data1, text, data2):
     # Intentionally provide the paths out of order (check sorting).
     path_hash = hashutil.md5_file_hex("c.bin", "a.bin", "b.txt")
     assert hashlib.md5(data).hexdigest() == path_hash
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    index = digest_index.DigestIndex(str(tmp_path / "digests.db"))
+    monkeypatch.setattr(digest_index, "_digest_index", index)
+    monkeypatch.setattr(digest_index, "_digest_index_disabled", False)
+    return index
+
+
+def _old_file(path, data):
+    path.write_bytes(data)
+    past = time.time() - 60
+    os.utime(path, (past, past))
+    return str(path)
+
+
+def test_md5_file_b64_uses_index(tmp_path, index):
+    path = _old_file(tmp_path / "data.bin", b"hello")
+    expected = base64.b64encode(hashlib.md5(b"hello").digest()).decode("ascii")
+    assert hashutil.md5_file_b64(path) == expected
+
+    with mock.patch.object(hashutil, "_md5_file_hasher") as hasher:
+        assert hashutil.md5_file_b64(path) == expected
+        hasher.assert_not_called()
+
+    # a changed file is hashed again
+    _old_file(tmp_path / "data.bin", b"hello world")
+    expected = base64.b64encode(hashlib.md5(b"hello world").digest()).decode("ascii")
+    assert hashutil.md5_file_b64(path) == expected
+
+
+def test_md5_file_b64_skips_recent_files(tmp_path, index):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"hello")
+    hashutil.md5_file_b64(str(path))
+    assert index.get(str(path), os.stat(path)) is None
+
+
+def test_digest_index_eviction(tmp_path, index):
+    for n in range(5):
+        path = _old_file(tmp_path / f"{n}.bin", b"x" * n)
+        index.put(path, os.stat(path), str(n))
+    assert index.cleanup(3) == 2
+    assert index.cleanup(3) == 0
+
+
+def test_digest_index_uses_rollback_journal(tmp_path, index):
+    path = _old_file(tmp_path / "data.bin", b"hello")
+    index.put(path, os.stat(path), "digest")
+    (mode,) = index._connection().execute("PRAGMA journal_mode").fetchone()
+    assert mode == "delete"
@@ -0,0 +1,66 @@
+from unittest import mock
+
+import pytest
+from wandb.sdk.lib import history_coalescer
+from wandb.sdk.lib.history_coalescer import HistoryCoalescer
+
+
+@pytest.fixture
+def coalescer():
+    published = []
+
+    def publish(row, step, commit):
+        row = {k: v for k, v in row.items() if k != "_timestamp"}
+        published.append((row, step, commit))
+
+    coalescer = HistoryCoalescer(publish)
+    coalescer.published = published
+    return coalescer
+
+
+def test_merges_updates_of_a_row(coalescer):
+    assert coalescer.add({"a": 1}, commit=False)
+    assert coalescer.add({"b": 2.5}, commit=False)
+    assert coalescer.published == []
+    assert coalescer.add({"c": "x"})
+    assert coalescer.published == [({"a": 1, "b": 2.5, "c": "x"}, None, True)]
+
+
+def test_steps(coalescer):
+    coalescer.add({"a": 1}, step=3)
+    coalescer.add({"b": 2}, step=3)
+    assert coalescer.published == []
+    # a new step ends the row of the pending update
+    coalescer.add({"c": 3}, step=4, commit=True)
+    assert coalescer.published == [
+        ({"a": 1, "b": 2}, 3, False),
+        ({"c": 3}, 4, True),
+    ]
+
+
+def test_pending_without_step_is_sent_before_update_with_step(coalescer):
+    coalescer.add({"a": 1}, commit=False)
+    coalescer.add({"b": 2}, step=5, commit=False)
+    assert coalescer.published == [({"a": 1}, None, False)]
+
+
+def test_other_values_are_not_merged(coalescer):
+    coalescer.add({"a": 1}, commit=False)
+    assert not coalescer.add({"image": object()})
+    assert coalescer.published == [({"a": 1}, None, False)]
+
+
+def test_flush_thresholds(coalescer, monkeypatch):
+    monkeypatch.setattr(history_coalescer, "MAX_PENDING_ITEMS", 2)
+    coalescer.add({"a": 1, "b": 2}, commit=False)
+    assert coalescer.published == [({"a": 1, "b": 2}, None, False)]
+
+    with mock.patch.object(history_coalescer.time, "time", return_value=100.0):
+        coalescer.add({"c": 3}, commit=False)
+    with mock.patch.object(history_coalescer.time, "time", return_value=102.0):
+        coalescer.add({"d": 4}, commit=False)
+    assert coalescer.published[-1] == ({"c": 3, "d": 4}, None, False)
+
+    coalescer.add({"e": 5}, commit=False)
+    coalescer.flush()
+    assert coalescer.published[-1] == ({"e": 5}, None, False)
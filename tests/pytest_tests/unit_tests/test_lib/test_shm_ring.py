@@ -0,0 +1,142 @@
+import os
+import socket
+import threading
+
+import pytest
+from wandb.proto import wandb_server_pb2 as spb
+from wandb.sdk.lib import shm_ring
+from wandb.sdk.lib.shm_client import ShmAttachError, ShmSockClient
+from wandb.sdk.lib.sock_client import SockClientClosedError
+
+pytestmark = pytest.mark.skipif(
+    not shm_ring.is_supported(), reason="requires multiprocessing.shared_memory"
+)
+
+
+@pytest.fixture
+def rings():
+    writer = shm_ring.ShmRing.create(capacity=1000)
+    reader = shm_ring.ShmRing.attach(writer.name)
+    yield writer, reader
+    reader.close()
+    writer.close()
+
+
+def _read(reader, size):
+    data = bytearray()
+    buf = bytearray(333)
+    while len(data) < size:
+        n = reader.recv_into(memoryview(buf))
+        data += buf[:n]
+    return bytes(data)
+
+
+def test_write_read_wraps(rings):
+    writer, reader = rings
+    assert writer.capacity == 1000
+    for size in (10, 700, 999, 1000):
+        data = os.urandom(size)
+        writer.write(data, wake=lambda: None)
+        assert reader.readable() == size
+        assert _read(reader, size) == data
+    assert reader.recv_into(memoryview(bytearray(10))) == 0
+
+
+def test_recv_into_nbytes(rings):
+    writer, reader = rings
+    writer.write(b"0123456789", wake=lambda: None)
+    buf = bytearray(10)
+    assert reader.recv_into(memoryview(buf), 4) == 4
+    assert buf[:4] == b"0123"
+    assert reader.readable() == 6
+
+
+def test_write_waits_for_room(rings):
+    writer, reader = rings
+    data = os.urandom(100_000)
+    thread = threading.Thread(target=writer.write, args=(data, lambda: None))
+    thread.start()
+    assert _read(reader, len(data)) == data
+    thread.join()
+    assert writer.blocked_seconds > 0
+
+
+def test_wake_only_when_waiting(rings):
+    writer, reader = rings
+    wakes = []
+    writer.write(b"a", wake=lambda: wakes.append(1))
+    assert not wakes
+    reader.set_waiting(True)
+    writer.write(b"b", wake=lambda: wakes.append(1))
+    assert wakes == [1]
+    reader.set_waiting(False)
+    assert _read(reader, 2) == b"ab"
+
+
+def _make_request(size):
+    request = spb.ServerRequest()
+    request.record_publish.output_raw.line = "x" * size
+    return request
+
+
+def test_shm_sock_client():
+    left, right = socket.socketpair()
+    client = ShmSockClient()
+    client.set_socket(left)
+    server = ShmSockClient()
+    server.set_socket(right)
+    requests = [_make_request(size) for size in (0, 10, 5000, 100_000, 20)]
+    received = []
+
+    def serve():
+        sreq = server.read_server_request()
+        server.accept_shm(sreq.inform_shm.name)
+        server.send_server_response(
+            spb.ServerResponse(inform_shm_response=spb.ServerInformShmResponse())
+        )
+        try:
+            while True:
+                received.append(server.read_server_request())
+        except SockClientClosedError:
+            pass
+        server.close_shm()
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    try:
+        client.connect_shm(capacity=4096)
+        for request in requests:
+            client.send_server_request(request)
+    finally:
+        client.close()
+        thread.join()
+        client.close_shm()
+        server.close()
+
+    assert received == requests
+
+
+def test_shm_sock_client_attach_error():
+    left, right = socket.socketpair()
+    client = ShmSockClient()
+    client.set_socket(left)
+    server = ShmSockClient()
+    server.set_socket(right)
+
+    def serve():
+        server.read_server_request()
+        response = spb.ServerInformShmResponse(error="no shared memory")
+        server.send_server_response(spb.ServerResponse(inform_shm_response=response))
+        assert server.read_server_request() == _make_request(10)
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    try:
+        with pytest.raises(ShmAttachError, match="no shared memory"):
+            client.connect_shm(capacity=4096)
+        # the client keeps sending through the socket
+        client.send_server_request(_make_request(10))
+        thread.join()
+    finally:
+        client.close()
+        server.close()
@@ -1,4 +1,9 @@
+import socket
+import struct
+import threading
+
 import pytest
+from wandb.proto import wandb_server_pb2 as spb
 from wandb.sdk.lib import sock_client
 
 
@@ -86,3 +91,75 @@ def test_get_index_error():
     assert buffer.length == 7
     with pytest.raises(IndexError):
         buffer.get(3, 8)
+
+
+def test_get_view():
+    buffer = sock_client.SockBuffer()
+    data1 = b"0123456"
+    buffer.put(data1, len(data1))
+    view = buffer.get_view(2, 5)
+    assert isinstance(view, memoryview)
+    assert view == b"234"
+    assert buffer.length == 2
+
+
+def test_unpack_from():
+    buffer = sock_client.SockBuffer()
+    buffer.put(b"x", 1)
+    buffer.get(0, 1)
+    data = struct.pack("<BI", ord("W"), 42)
+    buffer.put(data, len(data))
+    assert buffer.unpack_from(struct.Struct("<BI")) == (ord("W"), 42)
+    assert buffer.length == 5
+    with pytest.raises(IndexError):
+        buffer.unpack_from(struct.Struct("<BI"), 1)
+
+
+def test_grow_keeps_views():
+    buffer = sock_client.SockBuffer()
+    data1 = b"a" * buffer.INITIAL_SIZE
+    buffer.put(data1, len(data1))
+    view = buffer.get_view(0, 10)
+    data2 = b"b" * buffer.INITIAL_SIZE
+    buffer.put(data2, len(data2))
+    assert view == b"a" * 10
+    assert buffer.length == 2 * buffer.INITIAL_SIZE - 10
+    assert buffer.get(0, buffer.length) == data1[10:] + data2
+
+
+def test_recv_into():
+    buffer = sock_client.SockBuffer()
+    left, right = socket.socketpair()
+    try:
+        left.sendall(b"0123456789")
+        received = 0
+        while received < 10:
+            received += buffer.recv_into(right, 4)
+        assert buffer.get(0, 10) == b"0123456789"
+        left.close()
+        assert buffer.recv_into(right, 4) == 0
+    finally:
+        left.close()
+        right.close()
+
+
+@pytest.mark.parametrize("size", [0, 100, 10 * 1024**2])
+def test_read_server_request(size):
+    left, right = socket.socketpair()
+    sender = sock_client.SockClient()
+    sender.set_socket(left)
+    receiver = sock_client.SockClient()
+    receiver.set_socket(right)
+    request = spb.ServerRequest()
+    request.record_publish.output_raw.line = "x" * size
+    try:
+        thread = threading.Thread(
+            target=lambda: [sender.send_server_request(request) for _ in range(3)]
+        )
+        thread.start()
+        for _ in range(3):
+            assert receiver.read_server_request() == request
+        thread.join()
+    finally:
+        sender.close()
+        receiver.close()
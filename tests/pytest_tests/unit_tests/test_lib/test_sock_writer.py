@@ -0,0 +1,141 @@
+import socket
+import threading
+
+import pytest
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.lib import sock_client, sock_writer
+
+
+class BlockingSend:
+    """A send that blocks until released, recording what it sent."""
+
+    def __init__(self):
+        self.sent = []
+        self.release = threading.Event()
+
+    def __call__(self, data):
+        self.release.wait()
+        self.sent.append(data)
+
+
+def test_writer_batches_frames():
+    send = BlockingSend()
+    writer = sock_writer.SockWriter(send)
+    writer.put(b"a")
+    writer.put(b"b")
+    writer.put(b"c")
+    send.release.set()
+    assert writer.flush(timeout=5)
+    assert b"".join(send.sent) == b"abc"
+    # the frames queued while the first send was blocked went in one send
+    assert len(send.sent) <= 2
+    writer.close()
+
+
+def test_writer_blocks_when_full():
+    send = BlockingSend()
+    writer = sock_writer.SockWriter(send, max_size=4)
+    writer.put(b"0123")
+    writer.put(b"4567")  # taken by the writer thread or queued
+
+    def release():
+        send.release.set()
+
+    threading.Timer(0.2, release).start()
+    writer.put(b"89ab")
+    writer.put(b"cdef")
+    assert writer.flush(timeout=5)
+    assert b"".join(send.sent) == b"0123456789abcdef"
+    assert writer.stats.blocked_puts >= 1
+    assert writer.stats.blocked_seconds > 0
+    writer.close()
+
+
+def test_writer_drops_oldest_of_kind():
+    send = BlockingSend()
+    writer = sock_writer.SockWriter(send, max_size=6, policy="drop_oldest")
+    writer.put(b"x")
+    assert not writer.flush(timeout=0.1)  # the writer thread is sending x
+    writer.put(b"s1", "stats")
+    writer.put(b"r1", "run")
+    writer.put(b"s2", "stats")
+    writer.put(b"s3", "stats")
+    send.release.set()
+    assert writer.flush(timeout=5)
+    assert b"".join(send.sent) == b"xr1s2s3"
+    assert writer.stats.as_dict()["dropped"] == {"stats": 1}
+    writer.close()
+
+
+@pytest.mark.parametrize("kind", ["history", "partial_history"])
+def test_writer_keeps_history_step_boundaries(kind):
+    send = BlockingSend()
+    writer = sock_writer.SockWriter(send, max_size=6, policy="drop_oldest")
+    writer.put(b"x")
+    assert not writer.flush(timeout=0.1)  # the writer thread is sending x
+    # the second record flushes the step of the first, dropping either
+    # would merge their keys into one row
+    writer.put(b"h1", kind)
+    writer.put(b"f1", kind)
+    writer.put(b"h2", kind)
+    threading.Timer(0.2, send.release.set).start()
+    writer.put(b"f2", kind)
+    assert writer.flush(timeout=5)
+    assert b"".join(send.sent) == b"xh1f1h2f2"
+    assert writer.stats.as_dict()["dropped"] == {}
+    assert writer.stats.blocked_puts >= 1
+    writer.close()
+
+
+def test_writer_spills_in_order():
+    send = BlockingSend()
+    writer = sock_writer.SockWriter(send, max_size=4, policy="spill")
+    writer.put(b"x")
+    assert not writer.flush(timeout=0.1)
+    writer.put(b"0123")
+    writer.put(b"4567")
+    writer.put(b"8")  # after spilled frames, spilled too
+    send.release.set()
+    assert writer.flush(timeout=5)
+    assert b"".join(send.sent) == b"x012345678"
+    assert writer.stats.spilled_bytes == 5
+    # caught up, frames are queued in memory again
+    writer.put(b"9")
+    assert writer.flush(timeout=5)
+    assert writer.stats.spilled_bytes == 5
+    writer.close()
+
+
+def test_writer_raises_send_errors():
+    def send(data):
+        raise sock_client.SockClientClosedError()
+
+    writer = sock_writer.SockWriter(send)
+    writer.put(b"x")
+    writer.flush(timeout=5)
+    with pytest.raises(sock_client.SockClientClosedError):
+        writer.put(b"y")
+
+
+def test_sock_client_async_publish():
+    server, client_sock = socket.socketpair()
+    client = sock_client.SockClient()
+    client.set_socket(client_sock)
+    reader = sock_client.SockClient()
+    reader.set_socket(server)
+    client.start_async_publish(policy="block")
+    try:
+        for i in range(100):
+            record = pb.Record()
+            record.history.step.num = i
+            client.send_record_publish(record)
+        client.stop_async_publish()
+        assert client.async_publish_stats() is None
+        steps = [
+            reader.read_server_request().record_publish.history.step.num
+            for _ in range(100)
+        ]
+        assert steps == list(range(100))
+    finally:
+        client.close()
+        reader.close()
@@ -0,0 +1,27 @@
+"""metric tracker tests."""
+
+from wandb.sdk.internal.metric_tracker import MetricTracker
+
+
+def test_metric_tracker_stats():
+    tracker = MetricTracker(capacity=1)
+    a = tracker.slot(("a",))
+    b = tracker.slot(("b", "c"))
+    assert tracker.slot(("a",)) == a
+    assert len(tracker) == 2
+
+    all_changed = MetricTracker.LAST | MetricTracker.MIN | MetricTracker.MAX
+    assert tracker.update_row([a, b], [2.0, 5.0]) == [all_changed, all_changed]
+    assert tracker.update(a, 1.0) == MetricTracker.LAST | MetricTracker.MIN
+    assert tracker.update(a, 1.0) == 0
+    assert tracker.update(a, 4.0) == MetricTracker.LAST | MetricTracker.MAX
+    assert tracker.mean(a) == 2.0
+    assert tracker.mean(b) == 5.0
+
+
+def test_metric_tracker_grows():
+    tracker = MetricTracker(capacity=2)
+    slots = [tracker.slot((str(n),)) for n in range(100)]
+    assert slots == list(range(100))
+    tracker.update_row(slots, [float(n) for n in slots])
+    assert [tracker.mean(slot) for slot in slots] == [float(n) for n in slots]
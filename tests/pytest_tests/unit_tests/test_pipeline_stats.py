@@ -0,0 +1,89 @@
+"""pipeline stats tests."""
+
+import time
+import urllib.request
+from types import SimpleNamespace
+
+import pytest
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.internal import internal, pipeline_stats
+
+
+@pytest.fixture
+def stats():
+    return pipeline_stats.PipelineStats()
+
+
+def test_timed_queue_wait():
+    q = pipeline_stats.TimedQueue()
+    q.put("a")
+    time.sleep(0.01)
+    assert q.get() == "a"
+    assert q.last_wait >= 0.01
+
+
+def test_setup_is_per_run():
+    disabled = SimpleNamespace(_pipeline_stats=False, _pipeline_stats_port=None)
+    assert internal._setup_pipeline_stats(disabled) == (None, None)
+
+    enabled = SimpleNamespace(_pipeline_stats=True, _pipeline_stats_port=None)
+    first, _ = internal._setup_pipeline_stats(enabled)
+    second, _ = internal._setup_pipeline_stats(enabled)
+    first.log_transfer("file_stream", 10, 0.1)
+    assert first is not second
+    assert second.snapshot()["stages"] == {}
+
+
+def test_log_process(stats):
+    record = pb.Record()
+    record.history.item.add(key="a", value_json="1")
+    stats.log_process("HandlerThread", record, 0.5, 0.25)
+    stats.log_process("HandlerThread", record, None, 0.75)
+    request = pb.Record()
+    request.request.status.SetInParent()
+    stats.log_process("SenderThread", request, 0.1, 0.1)
+    stats.log_transfer("file_stream", 100, 0.2)
+
+    snap = stats.snapshot()
+    history = snap["stages"]["HandlerThread"]["history"]
+    assert history["count"] == 2
+    assert history["bytes"] == 2 * record.ByteSize()
+    assert history["wait_seconds"] == 0.5
+    assert history["max_process_seconds"] == 0.75
+    assert snap["stages"]["SenderThread"]["status"]["count"] == 1
+    assert snap["stages"]["file_stream"]["transfer"]["bytes"] == 100
+
+    table = pipeline_stats.to_table(snap).splitlines()
+    assert table[0].startswith("stage")
+    # the stage that took the most time comes first
+    assert table[1].split()[:2] == ["HandlerThread", "history"]
+
+
+def test_serve_openmetrics(stats):
+    stats.log_transfer("file_sync", 1024, 0.5)
+    server = pipeline_stats.serve(stats, 0)
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/metrics"
+        with urllib.request.urlopen(url) as response:
+            body = response.read().decode("utf-8")
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert "# TYPE wandb_pipeline_bytes counter" in body
+    assert (
+        'wandb_pipeline_bytes_total{stage="file_sync",record_type="transfer"} 1024'
+        in body
+    )
+    assert body.endswith("# EOF\n")
+
+
+def test_serve_port_reusable_after_close(stats):
+    server = pipeline_stats.serve(stats, 0)
+    port = server.server_port
+    server.shutdown()
+    server.server_close()
+
+    # the next run of the service binds the same port
+    server = pipeline_stats.serve(pipeline_stats.PipelineStats(), port)
+    server.shutdown()
+    server.server_close()
@@ -1,3 +1,4 @@
+import json
 from unittest import mock
 
 import pytest
@@ -170,3 +171,88 @@ def test_artifact_download_logger():
             assert termlog.call_args == call
         else:
             termlog.assert_not_called()
+
+
+def _history_scan(pages, history_keys=None):
+    from wandb.apis.public import HistoryScan
+
+    def execute(query, variable_values):
+        rows = pages[variable_values["minStep"] // 2]
+        return {"project": {"run": {"history": [json.dumps(row) for row in rows]}}}
+
+    client = mock.MagicMock()
+    client.execute.side_effect = execute
+    run = mock.MagicMock()
+    run._attrs = {"historyKeys": history_keys}
+    return HistoryScan(client, run, min_step=0, max_step=2 * len(pages), page_size=2)
+
+
+HISTORY_PAGES = [
+    [{"_step": 0, "loss": 1.5, "acc": 1}, {"_step": 1, "loss": 0.5, "done": True}],
+    [{"_step": 2, "loss": 0.25, "img": {"path": "a.png"}}, {"_step": 3, "loss": 2}],
+]
+
+
+def test_history_scan_numpy():
+    from wandb.apis.public import ColumnarHistoryScan
+
+    np = pytest.importorskip("numpy")
+    scan = _history_scan(HISTORY_PAGES)
+    first, second = list(ColumnarHistoryScan(scan, format="numpy"))
+    assert first["_step"].dtype == np.int64
+    assert first["loss"].tolist() == [1.5, 0.5]
+    assert np.isnan(first["acc"][1])
+    assert first["done"].tolist() == [None, True]
+    assert second["loss"].tolist() == [0.25, 2.0]
+    assert second["img"].tolist() == [{"path": "a.png"}, None]
+    # rows are unchanged
+    assert list(scan) == HISTORY_PAGES[0] + HISTORY_PAGES[1]
+
+
+def test_history_scan_to_parquet(tmp_path):
+    from wandb.apis.public import ColumnarHistoryScan
+
+    pq = pytest.importorskip("pyarrow.parquet")
+    history_keys = {
+        "keys": {
+            "_step": {"typeCounts": [{"type": "number", "count": 4}]},
+            "loss": {"typeCounts": [{"type": "number", "count": 4}]},
+            "acc": {"typeCounts": [{"type": "number", "count": 1}]},
+            "img": {"typeCounts": [{"type": "map", "count": 1}]},
+        }
+    }
+    scan = ColumnarHistoryScan(_history_scan(HISTORY_PAGES, history_keys), "arrow")
+    batches = list(scan)
+    assert batches[0].column(batches[0].schema.get_field_index("acc")).null_count == 1
+
+    path = str(tmp_path / "history.parquet")
+    assert scan.to_parquet(path) == 4
+    table = pq.read_table(path)
+    assert table.schema.names == ["_step", "loss", "acc", "img"]
+    assert table.column("_step").to_pylist() == [0, 1, 2, 3]
+    assert table.column("loss").to_pylist() == [1.5, 0.5, 0.25, 2.0]
+    assert table.column("img").to_pylist() == [None, None, '{"path": "a.png"}', None]
+
+
+def test_runs_history_many():
+    from wandb.apis.public import Runs
+
+    pd = pytest.importorskip("pandas")
+    pa = pytest.importorskip("pyarrow")
+    runs = Runs(mock.MagicMock(), "entity", "project")
+    runs.last_response = {"project": {"runs": {"pageInfo": {"hasNextPage": False}}}}
+    for n in range(5):
+        run = mock.MagicMock(id=f"run{n}")
+        run._full_history.return_value = [{"_step": 0, "loss": n}, {"_step": 1}]
+        runs.objects.append(run)
+
+    history = runs.history_many(max_workers=3)
+    runs.client.set_max_connections.assert_called_with(3)
+    assert isinstance(history, pd.DataFrame)
+    assert history["run_id"].tolist() == [f"run{n // 2}" for n in range(10)]
+    assert history["loss"].tolist()[::2] == [0, 1, 2, 3, 4]
+
+    table = runs.history_many(format="arrow")
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == 10
+    assert table.column("loss").null_count == 5
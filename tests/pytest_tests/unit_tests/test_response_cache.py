@@ -0,0 +1,95 @@
+"""public api response cache tests."""
+
+import os
+from unittest import mock
+
+from wandb.apis.public import RetryingClient
+from wandb.apis.response_cache import ResponseCache
+from wandb_gql import gql
+
+RUN_QUERY = gql(
+    """
+    query Run($entity: String!, $project: String!, $name: String!) {
+        project(name: $project, entityName: $entity) { run(name: $name) { state } }
+    }
+    """
+)
+UPSERT_MUTATION = gql(
+    """
+    mutation UpsertRun($entity: String, $project: String) {
+        upsertBucket(input: {entityName: $entity, modelName: $project}) { inserted }
+    }
+    """
+)
+
+
+def _client(tmp_path, response, ttl=60):
+    base_client = mock.MagicMock()
+    base_client.transport.url = "https://api.wandb.test/graphql"
+    base_client.execute.return_value = response
+    cache = ResponseCache(str(tmp_path / "api"), ttl=ttl)
+    return RetryingClient(base_client, cache=cache), base_client
+
+
+def _run(state):
+    return {"project": {"run": {"state": state}}}
+
+
+def _execute(client, name="run1", query=RUN_QUERY):
+    variables = {"entity": "e", "project": "p", "name": name}
+    return client.execute(query, variable_values=variables)
+
+
+def test_cache_finished_run(tmp_path):
+    client, base_client = _client(tmp_path, _run("finished"), ttl=0)
+    assert _execute(client) == _run("finished")
+    assert _execute(client) == _run("finished")
+    assert base_client.execute.call_count == 1
+    _execute(client, name="run2")
+    assert base_client.execute.call_count == 2
+
+
+def test_cache_live_run_expires(tmp_path):
+    client, base_client = _client(tmp_path, _run("running"), ttl=0)
+    _execute(client)
+    _execute(client)
+    assert base_client.execute.call_count == 2
+
+    client, base_client = _client(tmp_path, _run("running"), ttl=60)
+    _execute(client)
+    _execute(client)
+    assert base_client.execute.call_count == 1
+
+
+def test_cache_alias_expires(tmp_path):
+    client, base_client = _client(tmp_path, _run("COMMITTED"), ttl=0)
+    _execute(client, name="model:v3")
+    _execute(client, name="model:v3")
+    assert base_client.execute.call_count == 1
+    _execute(client, name="model:latest")
+    _execute(client, name="model:latest")
+    assert base_client.execute.call_count == 3
+
+
+def test_cache_mutation_invalidates(tmp_path):
+    client, base_client = _client(tmp_path, _run("finished"))
+    _execute(client)
+    _execute(client, query=UPSERT_MUTATION)
+    _execute(client, query=UPSERT_MUTATION)
+    assert base_client.execute.call_count == 3
+    _execute(client)
+    assert base_client.execute.call_count == 4
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    client, _ = _client(tmp_path, _run("finished"))
+    for n in range(10):
+        _execute(client, name=f"run{n}")
+    sizes = [
+        os.path.getsize(os.path.join(root, f))
+        for root, _, files in os.walk(tmp_path / "api")
+        for f in files
+    ]
+    assert len(sizes) == 10
+    assert client._cache.cleanup(sum(sizes[:5])) <= sum(sizes[:5])
+    assert sum(len(files) for _, _, files in os.walk(tmp_path / "api")) == 5
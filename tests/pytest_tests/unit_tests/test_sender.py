@@ -1,6 +1,8 @@
+import json
 from unittest.mock import MagicMock
 
 import yaml
+from wandb.proto import wandb_internal_pb2 as pb
 from wandb.sdk.internal.sender import SendManager
 from wandb.sdk.internal.settings_static import SettingsStatic
 
@@ -23,3 +25,37 @@ def test_config_save_preserve_order(tmp_path, test_settings):
     saved_config.pop("wandb_version")
 
     assert saved_config == original_config
+
+
+def _summary_request(update=None, remove=()):
+    record = pb.Record()
+    summary = record.request.summary_record.summary
+    for k, v in (update or {}).items():
+        summary.update.add(key=k, value_json=json.dumps(v))
+    for k in remove:
+        summary.remove.add(key=k)
+    return record
+
+
+def test_summary_updates_are_merged_and_debounced(tmp_path, test_settings):
+    summary_file = tmp_path / "wandb-summary.json"
+    settings = test_settings({"files_dir": str(tmp_path)})
+    sender = SendManager(
+        settings=SettingsStatic(settings.to_proto()),
+        record_q=MagicMock(),
+        result_q=MagicMock(),
+        interface=MagicMock(),
+        context_keeper=MagicMock(),
+    )
+    sender._debounce_summary_time = 0
+
+    # the first update after a quiet period is written right away
+    sender.send_request_summary_record(_summary_request({"a": 1, "b": 2}))
+    assert json.loads(summary_file.read_text()) == {"a": 1, "b": 2}
+
+    # later deltas are merged but not written until the debounce interval
+    sender.send_request_summary_record(_summary_request({"a": 3}, remove=["b"]))
+    assert json.loads(summary_file.read_text()) == {"a": 1, "b": 2}
+
+    sender.debounce(final=True)
+    assert json.loads(summary_file.read_text()) == {"a": 3}
@@ -18,7 +18,7 @@ from wandb.filesync.step_upload import (
     RequestUpload,
     StepUpload,
 )
-from wandb.sdk.internal import file_stream, internal_api
+from wandb.sdk.internal import file_stream, internal_api, pipeline_stats
 from wandb.sdk.internal.settings_static import SettingsStatic
 from wandb.sdk.wandb_settings import Settings
 
@@ -377,6 +377,33 @@ class TestUpload:
         else:
             assert f.exists()
 
+    def test_pipeline_stats_survive_file_removed_during_upload(
+        self,
+        tmp_path: Path,
+    ):
+        f = make_tmp_file(tmp_path)
+        size = f.stat().st_size
+
+        def save_fn(progress):
+            f.unlink()
+            return False
+
+        q = queue.Queue()
+        q.put(make_request_upload(f, save_fn=save_fn, save_fn_async=None))
+
+        fs = Mock(spec=file_stream.FileStreamApi)
+        stats = pipeline_stats.PipelineStats()
+        step_upload = make_step_upload(
+            event_queue=q, file_stream=fs, pipeline_stats=stats
+        )
+        step_upload.start()
+
+        finish_and_wait(q)
+
+        fs.push_success.assert_called_once_with(None, str(f))
+        transfer = stats.snapshot()["stages"]["file_sync"]["transfer"]
+        assert transfer["bytes"] == size
+
     class TestErrorDoesntStopFutureUploads:
         def test_nonexistent_file_upload(
             self,
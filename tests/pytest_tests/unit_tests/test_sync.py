@@ -0,0 +1,102 @@
+"""sync tests."""
+
+import os
+import threading
+from unittest import mock
+
+from wandb.sync import sync
+
+
+def test_sync_parallel_shards_runs(capsys):
+    seen = []
+    lock = threading.Lock()
+
+    def _sync_item(self, sync_item):
+        with lock:
+            seen.append((sync_item, threading.current_thread().name))
+        if sync_item.endswith("bad"):
+            raise ValueError("boom")
+        return sync.SYNC_INCOMPLETE if sync_item.endswith("3") else sync.SYNC_DONE
+
+    paths = [f"/runs/run{n}" for n in range(6)] + ["/runs/bad"]
+    with mock.patch.object(sync.SyncThread, "_sync_item", _sync_item):
+        sm = sync.SyncManager(jobs=3)
+        for path in paths:
+            sm.add(path)
+        sm.start()
+        assert len(sm._threads) == 3
+        for thread in sm._threads:
+            thread.join()
+        assert sm.is_done()
+        sm.report()
+
+    # every run is synced exactly once
+    assert sorted(path for path, _ in seen) == sorted(paths)
+    statuses = sm._results.statuses()
+    assert statuses["/runs/run0"] == sync.SYNC_DONE
+    assert statuses["/runs/run3"] == sync.SYNC_INCOMPLETE
+    assert statuses["/runs/bad"] == sync.SYNC_FAILED
+    assert "2 of 7 runs were not synced" in capsys.readouterr().err
+
+
+def test_sync_parallel_splits_uploads():
+    with mock.patch.object(sync.SyncThread, "run"):
+        sm = sync.SyncManager(jobs=4)
+        sm.add("/runs/run0")
+        sm.add("/runs/run1")
+        sm.start()
+    # never more workers than runs
+    assert len(sm._threads) == 2
+    assert all(
+        thread._max_upload_jobs == sync.MAX_UPLOAD_JOBS // 2 for thread in sm._threads
+    )
+
+
+def test_sync_tensorboard_items_use_separate_dirs():
+    root_dirs = []
+
+    def setup(root_dir, **kwargs):
+        root_dirs.append(root_dir)
+        return mock.Mock()
+
+    with mock.patch.object(
+        sync.sender.SendManager, "setup", side_effect=setup
+    ), mock.patch.object(
+        sync.SyncThread, "_find_tfevent_files", return_value=(1, ["/tb"], "/tb")
+    ), mock.patch.object(
+        sync.SyncThread, "_send_tensorboard"
+    ):
+        thread = sync.SyncThread(sync_list=[], sync_tensorboard=True)
+        assert thread._sync_item("/tb/run0") == sync.SYNC_DONE
+        assert thread._sync_item("/tb/run1") == sync.SYNC_DONE
+
+    assert len(set(root_dirs)) == 2
+    assert all(os.path.dirname(d) == sync.TMPDIR.name for d in root_dirs)
+
+
+def test_sync_corrupt_file_syncs_valid_prefix(tmp_path, capsys):
+    from wandb.proto import wandb_internal_pb2
+    from wandb.sdk.internal import datastore
+
+    path = str(tmp_path / "run-abc.wandb")
+    ds = datastore.DataStore()
+    ds.open_for_write(path)
+    ends = []
+    for n in range(10):
+        record = wandb_internal_pb2.Record(num=n + 1)
+        record.output.line = "x" * 10_000
+        ends.append(ds.write(record)[1])
+    ds.close()
+    with open(path, "r+b") as f:
+        f.seek(ends[2] - 1)
+        f.write(b"\xff")
+
+    send_manager = mock.Mock()
+    with mock.patch.object(sync.sender.SendManager, "setup", return_value=send_manager):
+        thread = sync.SyncThread(sync_list=[], mark_synced=True)
+        assert thread._sync_item(path) == sync.SYNC_FAILED
+
+    sent = [call.args[0].num for call in send_manager.send.call_args_list]
+    assert sent == [1, 2]
+    assert "corrupt" in capsys.readouterr().err
+    assert not os.path.exists(path + sync.SYNCED_SUFFIX)
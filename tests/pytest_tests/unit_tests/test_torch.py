@@ -1,3 +1,6 @@
+import time
+from unittest import mock
+
 import pytest
 import torch
 import torch.nn as nn
@@ -105,3 +108,91 @@ def test_watch_bad_argument(mock_run):
         ValueError, match="log must be one of 'gradients', 'parameters', 'all', or None"
     ):
         run.watch(net, log="bad_argument")
+
+
+def logged_histograms(log):
+    histograms = {}
+    for call in log.call_args_list:
+        assert call.kwargs == {"commit": False}
+        histograms.update(call.args[0])
+    return {name: (hist.histogram, hist.bins) for name, hist in histograms.items()}
+
+
+def test_batched_histograms_match_log_tensor_stats(mock_run):
+    run = mock_run()
+    tensors = {
+        "normal": torch.randn(1000),
+        "matrix": torch.randn(30, 40) * 100,
+        "single": torch.ones(10),
+        "non_finite": torch.Tensor([1.0, float("nan"), float("inf"), -3.0]),
+        "all_nan": torch.Tensor([float("nan"), float("nan")]),
+        "half": torch.randn(100).half(),
+        "empty": torch.Tensor([]),
+    }
+    with mock.patch.object(run, "_log") as log:
+        for name, tensor in tensors.items():
+            run._torch.log_tensor_stats(tensor, name)
+    expected = logged_histograms(log)
+
+    batcher = run._torch._get_histogram_batcher(batched=True, background=False)
+    with mock.patch.object(run, "_log") as log:
+        for name, tensor in tensors.items():
+            assert batcher.add(name, tensor)
+        batcher.flush()
+    assert log.call_count == 1
+    batched = logged_histograms(log)
+
+    assert sorted(batched) == sorted(expected)
+    for name, (histogram, bins) in expected.items():
+        assert batched[name][0] == histogram
+        assert batched[name][1] == pytest.approx(bins)
+
+
+def test_batched_histograms_sparse_fallback(mock_run):
+    run = mock_run()
+    batcher = run._torch._get_histogram_batcher(batched=True, background=False)
+    sparse = torch.Tensor([[0, 1], [2, 0]]).to_sparse()
+    assert not batcher.add("sparse", sparse)
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_watch_batched(mock_run, background):
+    run = mock_run()
+    net = nn.Sequential(nn.Linear(10, 5), nn.ReLU(), nn.Linear(5, 2))
+    with mock.patch.object(run, "_log") as log:
+        run.watch(net, log="all", log_freq=1, batched=True, background=background)
+        net(torch.randn(3, 10)).sum().backward()
+        run._torch.close()
+
+    # one update for the parameters, one for the gradients
+    assert log.call_count == 2
+    names = {name for name, _ in net.named_parameters()}
+    assert set(logged_histograms(log)) == {
+        f"{kind}/{name}" for kind in ("parameters", "gradients") for name in names
+    }
+
+
+def test_background_histograms_logged_at_their_step(mock_run):
+    run = mock_run()
+    batcher = run._torch._get_histogram_batcher(batched=True, background=True)
+    summarize = batcher._summarize
+
+    def slow_summarize(*args):
+        time.sleep(0.2)
+        return summarize(*args)
+
+    rows = []
+    step = run._step
+    with mock.patch.object(batcher, "_summarize", side_effect=slow_summarize):
+        with mock.patch.object(
+            run,
+            "_partial_history_callback",
+            side_effect=lambda row, *args: rows.append((run._step, sorted(row))),
+        ):
+            batcher.add("weights", torch.randn(100))
+            batcher.flush()
+            # committing the step waits for its histograms
+            run._log({"loss": 1.0})
+            run._torch.close()
+
+    assert rows == [(step, ["weights"]), (step, ["loss"])]
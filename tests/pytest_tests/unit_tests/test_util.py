@@ -211,6 +211,30 @@ def test_make_json_if_not_number():
     assert util.make_json_if_not_number({"a": "1.0"}) == '{"a": "1.0"}'
 
 
+###############################################################################
+# Test util.json_dumps_plain
+###############################################################################
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        0,
+        -3,
+        10**30,
+        1.5,
+        1e-300,
+        float("nan"),
+        float("inf"),
+        True,
+        False,
+        "a\n\u00e9",
+    ],
+)
+def test_json_dumps_plain(value):
+    assert util.json_dumps_plain(value) == util.json_dumps_safer_history(value)
+
+
 ###############################################################################
 # Test util.image_from_docker_args
 ###############################################################################
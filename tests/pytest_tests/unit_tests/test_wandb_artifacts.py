@@ -1,7 +1,10 @@
 import asyncio
 import functools
+import hashlib
+import os
 import queue
 import shutil
+import time
 import unittest.mock as mock
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Mapping, Optional
@@ -10,10 +13,12 @@ from unittest.mock import Mock
 import pytest
 import requests
 from wandb.filesync.step_prepare import ResponsePrepare, StepPrepare
+from wandb.sdk.artifacts import multipart
 from wandb.sdk.artifacts.artifact import Artifact
 from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
 from wandb.sdk.artifacts.artifacts_cache import ArtifactsCache
 from wandb.sdk.artifacts.storage_policies.wandb_storage_policy import WandbStoragePolicy
+from wandb.sdk.lib import digest_index, hashutil
 
 if TYPE_CHECKING:
     import sys
@@ -449,12 +454,15 @@ class TestStoreFile:
         chunk_size = 1
         test_file = some_file(tmp_path)
         policy = WandbStoragePolicy(api=api)
-        responses = []
+        responses = {}
         for idx in range(1, len(hex_digests) + 1):
             etag_response = requests.Response()
             etag_response.headers = {"ETag": hex_digests[idx]}
-            responses.append(etag_response)
-        api.upload_multipart_file_chunk_retry.side_effect = responses
+            responses[multipart_parts[idx]] = etag_response
+        # parts are uploaded concurrently, respond by url rather than call order
+        api.upload_multipart_file_chunk_retry.side_effect = (
+            lambda url, *args, **kwargs: responses[url]
+        )
 
         with mock.patch("builtins.open", mock.mock_open(read_data="abc")):
             etags = policy.s3_multipart_file_upload(
@@ -466,6 +474,216 @@ class TestStoreFile:
             for etag in etags:
                 assert etag["hexMD5"] == hex_digests[etag["partNumber"]]
 
+    def test_s3_multipart_file_upload_resumes(self, api, tmp_path: Path):
+        test_file = tmp_path / "data.bin"
+        test_file.write_bytes(b"aabbcc")
+        chunk_size = 2
+        hex_digests = dict(
+            enumerate(multipart.part_digests(str(test_file), chunk_size), start=1)
+        )
+        assert hex_digests[2] == hashlib.md5(b"bb").hexdigest()
+        multipart_parts = {n: f"http://wandb-test/part={n}" for n in hex_digests}
+        journal = multipart.MultipartJournal(str(tmp_path / "journal.json"))
+        journal.add(1, "etag1")
+
+        def upload(url, data, extra_headers):
+            response = requests.Response()
+            response.headers = {"ETag": f"etag-{data.decode()}"}
+            return response
+
+        api.upload_multipart_file_chunk_retry.side_effect = upload
+        etags = WandbStoragePolicy(api=api).s3_multipart_file_upload(
+            str(test_file),
+            chunk_size,
+            hex_digests,
+            multipart_parts,
+            extra_headers={},
+            journal=journal,
+        )
+
+        # the acknowledged part isn't uploaded again
+        assert api.upload_multipart_file_chunk_retry.call_count == 2
+        assert etags == [
+            {"partNumber": 1, "hexMD5": "etag1"},
+            {"partNumber": 2, "hexMD5": "etag-bb"},
+            {"partNumber": 3, "hexMD5": "etag-cc"},
+        ]
+        reloaded = multipart.MultipartJournal(str(tmp_path / "journal.json"))
+        assert reloaded.parts == {1: "etag1", 2: "etag-bb", 3: "etag-cc"}
+
+    def test_s3_multipart_file_upload_reports_progress(self, api, tmp_path: Path):
+        test_file = tmp_path / "data.bin"
+        test_file.write_bytes(b"aabbc")
+        chunk_size = 2
+        hex_digests = dict(
+            enumerate(multipart.part_digests(str(test_file), chunk_size), start=1)
+        )
+        multipart_parts = {n: f"http://wandb-test/part={n}" for n in hex_digests}
+        journal = multipart.MultipartJournal(str(tmp_path / "journal.json"))
+        journal.add(1, "etag1")
+
+        def upload(url, data, extra_headers):
+            response = requests.Response()
+            response.headers = {"ETag": f"etag-{data.decode()}"}
+            return response
+
+        api.upload_multipart_file_chunk_retry.side_effect = upload
+        progress_callback = mock.Mock()
+        WandbStoragePolicy(api=api).s3_multipart_file_upload(
+            str(test_file),
+            chunk_size,
+            hex_digests,
+            multipart_parts,
+            extra_headers={},
+            journal=journal,
+            progress_callback=progress_callback,
+        )
+
+        # every part, also the one uploaded before, is reported once it's done
+        reported = [call.args for call in progress_callback.call_args_list]
+        assert sorted(new for new, _ in reported) == [1, 2, 2]
+        assert max(total for _, total in reported) == 5
+
+
+def test_max_parallel_parts(monkeypatch):
+    monkeypatch.setenv("WANDB_MULTIPART_UPLOAD_WORKERS", "8")
+    monkeypatch.setenv("WANDB_MULTIPART_UPLOAD_MEMORY", str(300 * 1024**2))
+    assert multipart.max_parallel_parts(100 * 1024**2) == 3
+    # a part larger than the budget is still uploaded, one at a time
+    assert multipart.max_parallel_parts(400 * 1024**2) == 1
+    monkeypatch.setenv("WANDB_MULTIPART_UPLOAD_WORKERS", "2")
+    assert multipart.max_parallel_parts(100 * 1024**2) == 2
+
+
+def test_entry_download_trusts_recorded_digest(tmp_path, monkeypatch):
+    index = digest_index.DigestIndex(str(tmp_path / "digests.db"))
+    monkeypatch.setattr(digest_index, "_digest_index", index)
+    monkeypatch.setattr(digest_index, "_digest_index_disabled", False)
+    cache_path = tmp_path / "cache-object"
+    cache_path.write_text("hello")
+    past = time.time() - 60
+    os.utime(cache_path, (past, past))
+
+    artifact = Artifact("test", type="dataset")
+    load_file = Mock(return_value=str(cache_path))
+    monkeypatch.setattr(artifact.manifest.storage_policy, "load_file", load_file)
+    entry = ArtifactManifestEntry(
+        path="data/hello.txt", digest=hashutil.md5_string("hello"), size=5
+    )
+    entry._parent_artifact = artifact
+    root = str(tmp_path / "root")
+
+    dest_path = entry.download(root)
+    assert open(dest_path).read() == "hello"
+    assert load_file.call_count == 1
+
+    # a repeat download only stats the file
+    with mock.patch.object(hashutil, "_md5_file_hasher", side_effect=AssertionError):
+        assert entry.download(root) == dest_path
+    assert load_file.call_count == 1
+
+    # verify hashes the file, and replaces it when it changed
+    os.chmod(dest_path, 0o644)
+    with open(dest_path, "w") as f:
+        f.write("HELLO")
+    os.utime(dest_path, (past + 30, past + 30))
+    index.put(os.path.abspath(dest_path), os.stat(dest_path), entry.digest)
+    entry.download(root, verify=True)
+    assert load_file.call_count == 2
+    assert open(dest_path).read() == "hello"
+
+
+def test_verify_ignores_indexed_digests(tmp_path, monkeypatch):
+    from wandb.sdk.artifacts.artifact_state import ArtifactState
+
+    index = digest_index.DigestIndex(str(tmp_path / "digests.db"))
+    monkeypatch.setattr(digest_index, "_digest_index", index)
+    monkeypatch.setattr(digest_index, "_digest_index_disabled", False)
+    artifact = Artifact("test", type="dataset")
+    artifact.manifest.add_entry(
+        ArtifactManifestEntry(
+            path="hello.txt", digest=hashutil.md5_string("hello"), size=5
+        )
+    )
+    artifact._state = ArtifactState.COMMITTED
+    root = tmp_path / "root"
+    root.mkdir()
+    path = root / "hello.txt"
+    path.write_text("hello")
+    past = time.time() - 60
+    os.utime(path, (past, past))
+    assert hashutil.md5_file_b64(str(path)) == hashutil.md5_string("hello")
+    artifact.verify(str(root))
+
+    # corrupted in place, keeping the size and mtime the index knows
+    path.write_text("HELLO")
+    os.utime(path, (past, past))
+    with pytest.raises(ValueError, match="Digest mismatch"):
+        artifact.verify(str(root))
+
+
+@pytest.fixture
+def committed_artifact(tmp_path, monkeypatch):
+    """A logged artifact whose files are fetched from `tmp_path / "cache"`."""
+    from wandb.sdk.artifacts.artifact_state import ArtifactState
+
+    artifact = Artifact("test", type="dataset")
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    for name in ["a.txt", "train/1.png", "train/2.png", "test/1.png"]:
+        artifact.manifest.add_entry(
+            ArtifactManifestEntry(
+                path=name, digest=hashutil.md5_string(name), size=len(name)
+            )
+        )
+        (cache_dir / name.replace("/", "_")).write_text(name)
+
+    def load_file(artifact, entry):
+        return str(cache_dir / entry.path.replace("/", "_"))
+
+    monkeypatch.setattr(artifact.manifest.storage_policy, "load_file", load_file)
+    artifact._state = ArtifactState.COMMITTED
+    return artifact
+
+
+def test_artifact_view(committed_artifact):
+    with committed_artifact.view(read_ahead=1) as view:
+        assert view.glob("train/*.png") == ["train/1.png", "train/2.png"]
+        assert view.listdir() == ["a.txt", "test", "train"]
+        assert view.listdir("train") == ["1.png", "2.png"]
+        with pytest.raises(FileNotFoundError):
+            view.listdir("valid")
+        contents = [open(path).read() for _, path in view.iter_files()]
+        assert contents == view.paths()
+        with view.open("test/1.png") as f:
+            assert f.read() == "test/1.png"
+
+
+def test_artifact_open_is_read_only(committed_artifact):
+    with committed_artifact.open("a.txt") as f:
+        assert f.read() == "a.txt"
+    with pytest.raises(ValueError):
+        committed_artifact.open("a.txt", "w")
+    with pytest.raises(KeyError):
+        committed_artifact.open("b.txt")
+
+
+def test_download_include(committed_artifact, tmp_path):
+    def fetch_file_urls(cursor):
+        edges = [
+            {"node": {"name": name, "directUrl": None}}
+            for name in committed_artifact.manifest.entries
+        ]
+        return {"pageInfo": {"hasNextPage": False, "endCursor": None}, "edges": edges}
+
+    committed_artifact._fetch_file_urls = fetch_file_urls
+    root = tmp_path / "root"
+    committed_artifact.download(str(root), include=["train/*", "a.txt"])
+    downloaded = sorted(
+        str(path.relative_to(root)) for path in root.rglob("*") if path.is_file()
+    )
+    assert downloaded == ["a.txt", "train/1.png", "train/2.png"]
+
 
 @pytest.mark.parametrize("type", ["job", "wandb-history", "wandb-foo"])
 def test_invalid_artifact_type(type):
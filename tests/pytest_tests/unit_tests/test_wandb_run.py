@@ -298,3 +298,24 @@ def test_error_when_using_attributes_of_finished_run(mock_run, attribute, value)
             setattr(getattr(run, attribute), *value)
         else:
             setattr(run, attribute, value)
+
+
+def test_coalesce_history(mock_run, parse_records, record_q):
+    run = mock_run(settings={"_coalesce_history": True})
+    run.log(dict(this=1), commit=False)
+    run.log(dict(that=2.5), commit=False)
+    run.log(dict(other="3"))
+    run.log(dict(this=4), commit=False)
+    run._history_coalescer.flush()
+
+    parsed = parse_records(record_q)
+    history = parsed.partial_history
+    assert len(history) == 2
+    assert history[0]["this"] == "1"
+    assert history[0]["that"] == "2.5"
+    assert history[0]["other"] == '"3"'
+    assert history[1]["this"] == "4"
+    assert [r.request.partial_history.action.flush for r in parsed.records] == [
+        True,
+        False,
+    ]
@@ -0,0 +1,89 @@
+"""Benchmark chunked storage of successive versions of a checkpoint.
+
+Each version of the checkpoint rewrites a few small regions of the previous
+one and inserts a few bytes, like a fine-tuned model saved by a framework
+that adds metadata. The benchmark times chunking a version and reports the
+bytes of the version that are in chunks no earlier version had, i.e. the
+bytes the chunked storage policy uploads:
+
+    pytest tests/standalone_tests/artifact_chunking_benchmark.py -s
+
+The default checkpoint is 256 MB. Set WANDB_BENCHMARK_FULL_SCALE=1 to use
+a 4 GB checkpoint.
+"""
+import os
+import random
+import sys
+
+import pytest
+from wandb.sdk.artifacts import chunking
+from wandb.sdk.lib.hashutil import _b64_from_hasher, _md5
+
+FULL_SCALE = bool(os.environ.get("WANDB_BENCHMARK_FULL_SCALE"))
+
+CHECKPOINT_SIZE = 4 * 1024**3 if FULL_SCALE else 256 * 1024**2
+NUM_VERSIONS = 5
+# fraction of the bytes of a version rewritten in the next one
+CHANGED_FRACTION = 0.02
+CHANGED_REGIONS = 16
+
+
+def _next_version(data: bytearray, rng: random.Random) -> bytearray:
+    data = bytearray(data)
+    region_size = int(len(data) * CHANGED_FRACTION / CHANGED_REGIONS)
+    for _ in range(CHANGED_REGIONS):
+        offset = rng.randrange(len(data) - region_size)
+        data[offset : offset + region_size] = os.urandom(region_size)
+    offset = rng.randrange(len(data))
+    data[offset:offset] = b"step=%d" % rng.randrange(10**6)
+    return data
+
+
+@pytest.fixture(scope="module")
+def versions():
+    pytest.importorskip("numpy")
+    rng = random.Random(0)
+    data = bytearray(os.urandom(CHECKPOINT_SIZE))
+    versions = [data]
+    for _ in range(NUM_VERSIONS - 1):
+        versions.append(_next_version(versions[-1], rng))
+    return versions
+
+
+def _chunk_digests(data: bytearray):
+    view = memoryview(data)
+    return [
+        (_b64_from_hasher(_md5(view[start:end])), end - start)
+        for start, end in chunking.chunk_bounds(view)
+    ]
+
+
+def test_benchmark_chunked_versions(benchmark, versions):
+    stored = set()
+    total_bytes = 0
+    new_bytes = 0
+    for n, data in enumerate(versions):
+        if n == len(versions) - 1:
+            chunks = benchmark.pedantic(
+                _chunk_digests, args=(data,), rounds=3, iterations=1
+            )
+        else:
+            chunks = _chunk_digests(data)
+        version_new = sum(size for digest, size in chunks if digest not in stored)
+        stored.update(digest for digest, _ in chunks)
+        if n > 0:
+            total_bytes += len(data)
+            new_bytes += version_new
+        print(
+            f"version {n}: {len(chunks)} chunks, "
+            f"{version_new / 1024**2:.1f} of {len(data) / 1024**2:.1f} MB uploaded"
+        )
+
+    saved = 1 - new_bytes / total_bytes
+    benchmark.extra_info["bytes_saved_fraction"] = saved
+    print(f"versions 1-{len(versions) - 1}: {saved:.1%} of bytes not uploaded")
+    assert saved > 0.5
+
+
+if __name__ == "__main__":
+    pytest.main(sys.argv)
@@ -0,0 +1,84 @@
+"""Benchmark staging and hashing the files of Artifact.add_dir.
+
+Compares the thread and process pools of wandb.sdk.artifacts.staging on a
+directory of many small files and on a few large files:
+
+    pytest tests/standalone_tests/artifact_hashing_benchmark.py
+
+The default sizes are scaled down. Set WANDB_BENCHMARK_FULL_SCALE=1 to use
+1M files of 4 KB and 10 files of 10 GB, which needs about 110 GB of disk.
+"""
+import os
+import pathlib
+import shutil
+import sys
+from unittest.mock import patch
+
+import pytest
+from wandb.sdk.artifacts import staging
+
+FULL_SCALE = bool(os.environ.get("WANDB_BENCHMARK_FULL_SCALE"))
+
+# (number of files, size of a file)
+DATASETS = {
+    "small_files": (1_000_000, 4 * 1024) if FULL_SCALE else (20_000, 4 * 1024),
+    "large_files": (10, 10 * 1024**3) if FULL_SCALE else (10, 64 * 1024**2),
+}
+
+
+def _write_files(root: pathlib.Path, num_files: int, size: int) -> None:
+    chunk = os.urandom(min(size, 16 * 1024 * 1024))
+    for n in range(num_files):
+        # spread files over directories like an image dataset
+        subdir = root / f"{n // 1000:04d}"
+        subdir.mkdir(exist_ok=True)
+        with open(subdir / f"{n:07d}.bin", "wb") as f:
+            remaining = size
+            while remaining > 0:
+                f.write(chunk[:remaining])
+                remaining -= len(chunk)
+
+
+@pytest.fixture(scope="module", params=list(DATASETS))
+def dataset(request, tmp_path_factory):
+    root = tmp_path_factory.mktemp(request.param)
+    _write_files(root, *DATASETS[request.param])
+    files = []
+    for dirpath, _, filenames in os.walk(root):
+        for fname in filenames:
+            physical_path = os.path.join(dirpath, fname)
+            files.append((os.path.relpath(physical_path, root), physical_path))
+    yield files
+    shutil.rmtree(root)
+
+
+@pytest.mark.parametrize(
+    "processes, max_workers",
+    [(False, 8), (True, os.cpu_count())],
+    ids=["threads", "processes"],
+)
+def test_benchmark_stage_files(tmp_path, benchmark, dataset, processes, max_workers):
+    staging_dir = tmp_path / "staging"
+
+    def setup():
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        staging_dir.mkdir()
+
+    def stage():
+        for _ in staging.stage_files(
+            dataset, staging_dir, max_workers=max_workers, processes=processes
+        ):
+            pass
+
+    # measure hashing every file, not reading digests from the index
+    with patch.dict(
+        os.environ,
+        {"WANDB_DISABLE_DIGEST_INDEX": "true", "WANDB_ARTIFACT_STAGING_MODE": "copy"},
+    ), patch("wandb.sdk.lib.digest_index._digest_index", None), patch(
+        "wandb.sdk.lib.digest_index._digest_index_disabled", True
+    ):
+        benchmark.pedantic(stage, setup=setup, rounds=3, iterations=1)
+
+
+if __name__ == "__main__":
+    pytest.main(sys.argv)
@@ -0,0 +1,128 @@
+"""Benchmark `wandb.log` calls per second for rows of scalars.
+
+Logs steps of scalar metrics into a run whose records go to an in-memory
+queue, so only the work done in the user process is timed. Each step logs
+its keys in one or more calls, all but the last with commit=False, with:
+
+- legacy: every value converted by history_dict_to_json and encoded by
+  json_dumps_safer_history, as before the plain value fast path,
+- default: the plain value fast path,
+- coalesced: the fast path and the _coalesce_history setting, which merges
+  the calls of a step into a single record.
+
+    pytest tests/standalone_tests/log_scalars_benchmark.py
+
+The default runs log 200 steps. Set WANDB_BENCHMARK_FULL_SCALE=1 to log
+5000 steps.
+"""
+import os
+import queue
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+import wandb
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.data_types.utils import history_dict_to_json
+from wandb.sdk.interface.interface_queue import InterfaceQueue
+from wandb.sdk.lib.module import unset_globals
+from wandb.util import json_dumps_safer_history
+
+FULL_SCALE = bool(os.environ.get("WANDB_BENCHMARK_FULL_SCALE"))
+
+NUM_STEPS = 5000 if FULL_SCALE else 200
+
+
+class LegacyInterfaceQueue(InterfaceQueue):
+    """Publishes partial history converting and encoding every value."""
+
+    def publish_partial_history(
+        self,
+        data: dict,
+        user_step: int,
+        step: Optional[int] = None,
+        flush: Optional[bool] = None,
+        publish_step: bool = True,
+        run: Optional[Any] = None,
+    ) -> None:
+        run = run or self._run
+        data = history_dict_to_json(run, data, step=user_step, ignore_copy_err=True)
+        data.pop("_step", None)
+        if "_timestamp" not in data:
+            data["_timestamp"] = time.time()
+        partial_history = pb.PartialHistoryRequest()
+        for k, v in data.items():
+            item = partial_history.item.add()
+            item.key = k
+            item.value_json = json_dumps_safer_history(v)
+        if publish_step and step is not None:
+            partial_history.step.num = step
+        if flush is not None:
+            partial_history.action.flush = flush
+        self._publish_partial_history(partial_history)
+
+
+class Backend:
+    def __init__(self, interface: InterfaceQueue) -> None:
+        self.interface = interface
+
+
+def _make_run(mode: str) -> "wandb.sdk.wandb_run.Run":
+    settings = wandb.Settings(console="off", save_code=False, mode="offline")
+    settings.update(
+        {"_coalesce_history": mode == "coalesced"},
+        source=wandb.sdk.wandb_settings.Source.BASE,
+    )
+    settings._set_run_start_time()
+    run = wandb.sdk.wandb_run.Run(settings=settings)
+    interface_class = LegacyInterfaceQueue if mode == "legacy" else InterfaceQueue
+    run._set_backend(Backend(interface_class(record_q=queue.Queue())))
+    return run
+
+
+def _make_calls(num_keys: int, calls_per_step: int) -> List[List[Dict[str, Any]]]:
+    rng = random.Random(num_keys)
+    keys = [f"train/metric_{k}" for k in range(num_keys)]
+    steps = []
+    for _ in range(NUM_STEPS):
+        row = {key: rng.random() for key in keys}
+        row["epoch"] = 1
+        items = list(row.items())
+        per_call = -(-len(items) // calls_per_step)
+        steps.append(
+            [dict(items[i : i + per_call]) for i in range(0, len(items), per_call)]
+        )
+    return steps
+
+
+@pytest.mark.parametrize("calls_per_step", [1, 8])
+@pytest.mark.parametrize("num_keys", [10, 50])
+@pytest.mark.parametrize("mode", ["legacy", "default", "coalesced"])
+def test_benchmark_log_scalars(benchmark, mode, num_keys, calls_per_step):
+    steps = _make_calls(num_keys, calls_per_step)
+    num_calls = sum(len(calls) for calls in steps)
+
+    def setup():
+        unset_globals()
+        return (_make_run(mode),), {}
+
+    def log(run):
+        for calls in steps:
+            for call in calls[:-1]:
+                run.log(call, commit=False)
+            run.log(calls[-1])
+        return run
+
+    run = benchmark.pedantic(log, setup=setup, rounds=5, iterations=1)
+    records = run._backend.interface.record_q.qsize()
+    benchmark.extra_info["calls_per_second"] = num_calls / benchmark.stats["mean"]
+    benchmark.extra_info["records_per_step"] = records / NUM_STEPS
+    unset_globals()
+
+    assert records == (NUM_STEPS if mode == "coalesced" else num_calls)
+
+
+if __name__ == "__main__":
+    pytest.main(sys.argv)
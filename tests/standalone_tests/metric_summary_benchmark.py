@@ -0,0 +1,178 @@
+"""Benchmark summary metric tracking in the internal process handler.
+
+Compares rows per second of the columnar MetricTracker against the previous
+dict based implementation, for runs that use define_metric over many keys:
+
+    pytest tests/standalone_tests/metric_summary_benchmark.py
+"""
+import math
+import numbers
+import queue
+import random
+import sys
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.internal import context
+from wandb.sdk.internal.handler import HandleManager, _dict_nested_set
+
+NUM_ROWS = 200
+
+
+class LegacyHandleManager(HandleManager):
+    """HandleManager tracking summary metrics in a dict keyed by tuples."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._metric_track: Dict[Tuple[str, ...], float] = dict()
+
+    def _update_summary_legacy_metrics(
+        self,
+        s: "pb.MetricSummary",
+        kl: List[str],
+        v: "numbers.Real",
+        float_v: float,
+        goal_max: Optional[bool],
+    ) -> bool:
+        updated = False
+        best_key: Optional[Tuple[str, ...]] = None
+        if s.none:
+            return False
+        if s.copy:
+            if len(kl) > 1:
+                _dict_nested_set(self._consolidated_summary, kl, v)
+                self._mark_summary_dirty(kl[0])
+                return True
+        if s.last:
+            last_key = tuple(kl + ["last"])
+            old_last = self._metric_track.get(last_key)
+            if old_last is None or float_v != old_last:
+                self._metric_track[last_key] = float_v
+                _dict_nested_set(self._consolidated_summary, last_key, v)
+                updated = True
+        if s.best:
+            best_key = tuple(kl + ["best"])
+        if s.max or best_key and goal_max:
+            max_key = tuple(kl + ["max"])
+            old_max = self._metric_track.get(max_key)
+            if old_max is None or float_v > old_max:
+                self._metric_track[max_key] = float_v
+                if s.max:
+                    _dict_nested_set(self._consolidated_summary, max_key, v)
+                    updated = True
+                if best_key:
+                    _dict_nested_set(self._consolidated_summary, best_key, v)
+                    updated = True
+        if s.min or best_key and not goal_max:
+            min_key = tuple(kl + ["min"])
+            old_min = self._metric_track.get(min_key)
+            if old_min is None or float_v < old_min:
+                self._metric_track[min_key] = float_v
+                if s.min:
+                    _dict_nested_set(self._consolidated_summary, min_key, v)
+                    updated = True
+                if best_key:
+                    _dict_nested_set(self._consolidated_summary, best_key, v)
+                    updated = True
+        if s.mean:
+            tot_key = tuple(kl + ["tot"])
+            num_key = tuple(kl + ["num"])
+            avg_key = tuple(kl + ["mean"])
+            tot = self._metric_track.get(tot_key, 0.0)
+            num = self._metric_track.get(num_key, 0)
+            tot += float_v
+            num += 1
+            self._metric_track[tot_key] = tot
+            self._metric_track[num_key] = num
+            _dict_nested_set(self._consolidated_summary, avg_key, tot / num)
+            updated = True
+        if updated:
+            self._mark_summary_dirty(kl[0])
+        return updated
+
+    def _update_summary_leaf(
+        self,
+        kl: List[str],
+        v: Any,
+        d: Optional[pb.MetricRecord] = None,
+    ) -> bool:
+        has_summary = d and d.HasField("summary")
+        if len(kl) == 1:
+            copy_key = tuple(kl)
+            old_copy = self._metric_copy.get(copy_key)
+            if old_copy is None or v != old_copy:
+                self._metric_copy[copy_key] = v
+                if not has_summary or (d and d.summary.copy):
+                    self._consolidated_summary[kl[0]] = v
+                    self._mark_summary_dirty(kl[0])
+                    return True
+        if not d or not has_summary:
+            return False
+        if not isinstance(v, numbers.Real) or math.isnan(v):
+            return False
+        goal_max = None
+        if d.goal:
+            goal_max = d.goal == d.GOAL_MAXIMIZE
+        return self._update_summary_legacy_metrics(
+            d.summary, kl=kl, v=v, float_v=float(v), goal_max=goal_max
+        )
+
+
+def _make_handler(handler_class: type, keys: Dict[str, Any]) -> HandleManager:
+    handler = handler_class(
+        settings=MagicMock(),
+        record_q=queue.Queue(),
+        result_q=queue.Queue(),
+        stopped=threading.Event(),
+        writer_q=queue.Queue(),
+        interface=MagicMock(),
+        context_keeper=context.ContextKeeper(),
+    )
+    record = pb.Record()
+    record.metric.glob_name = "*"
+    record.metric.summary.min = True
+    record.metric.summary.max = True
+    record.metric.summary.mean = True
+    record.metric.summary.last = True
+    record.metric.summary.best = True
+    record.metric.goal = pb.MetricRecord.GOAL_MINIMIZE
+    handler.handle_metric(record)
+    # define the glob matched metrics up front, as the first logged row would
+    handler._history_update(pb.HistoryRecord(), dict(keys))
+    return handler
+
+
+def _make_rows(num_keys: int) -> List[Dict[str, Any]]:
+    rng = random.Random(num_keys)
+    return [
+        {f"layer{k}/loss": rng.random() for k in range(num_keys)}
+        for _ in range(NUM_ROWS)
+    ]
+
+
+@pytest.mark.parametrize("num_keys", [10, 100, 1_000])
+@pytest.mark.parametrize("handler_class", [HandleManager, LegacyHandleManager])
+def test_benchmark_summary_metrics(benchmark, handler_class, num_keys):
+    rows = _make_rows(num_keys)
+
+    def setup():
+        return (_make_handler(handler_class, rows[0]),), {}
+
+    def run(handler):
+        for row in rows:
+            handler._update_summary(row)
+        return handler
+
+    handler = benchmark.pedantic(run, setup=setup, rounds=5, iterations=1)
+    benchmark.extra_info["rows_per_second"] = NUM_ROWS / benchmark.stats["mean"]
+
+    expected = _make_handler(LegacyHandleManager, rows[0])
+    run(expected)
+    assert handler._consolidated_summary == expected._consolidated_summary
+
+
+if __name__ == "__main__":
+    pytest.main(sys.argv)
@@ -0,0 +1,126 @@
+"""Benchmark sending records to another process, over tcp or shared memory.
+
+A reader process accepts a connection like the wandb service does, and reads
+and parses the records this process publishes, with:
+
+- tcp: the records sent through the socket,
+- shm: the records sent through a shared memory ring, the socket only waking
+  up the reader.
+
+The records carry the time they were sent, to measure their latency. The
+reader reports the 50th, 99th and 99.9th percentiles of latency.
+
+    pytest tests/standalone_tests/shm_transport_benchmark.py
+
+The default runs send 8MB of records of each size, and at least 1000
+records. Set WANDB_BENCHMARK_FULL_SCALE=1 to send 128MB.
+"""
+import multiprocessing
+import os
+import socket
+import sys
+import time
+from typing import Dict, List
+
+import pytest
+from wandb.proto import wandb_server_pb2 as spb
+from wandb.sdk.lib import shm_ring
+from wandb.sdk.lib.shm_client import ShmSockClient
+from wandb.sdk.lib.sock_client import SockClient, SockClientClosedError
+
+FULL_SCALE = bool(os.environ.get("WANDB_BENCHMARK_FULL_SCALE"))
+
+TOTAL_SIZE = (128 if FULL_SCALE else 8) * 1024**2
+MIN_RECORDS = 1000
+
+
+def _percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def _read(listener: socket.socket, conn: "multiprocessing.connection.Connection"):
+    sock, _ = listener.accept()
+    conn.send("ready")
+    reader = ShmSockClient()
+    reader.set_socket(sock)
+    latencies = []
+    while True:
+        try:
+            request = reader.read_server_request()
+        except SockClientClosedError:
+            break
+        if request.WhichOneof("server_request_type") == "inform_shm":
+            reader.accept_shm(request.inform_shm.name)
+            reader.send_server_response(
+                spb.ServerResponse(inform_shm_response=spb.ServerInformShmResponse())
+            )
+            continue
+        sent = int(request.record_publish.history.item[0].value_json)
+        latencies.append((time.monotonic_ns() - sent) / 1000)
+    reader.close_shm()
+    conn.send(
+        {
+            "p50_latency_us": _percentile(latencies, 0.5),
+            "p99_latency_us": _percentile(latencies, 0.99),
+            "p999_latency_us": _percentile(latencies, 0.999),
+        }
+    )
+
+
+def _make_request(record_size: int) -> spb.ServerRequest:
+    request = spb.ServerRequest()
+    history = request.record_publish.history
+    history.item.add(key="_sent")
+    history.item.add(key="data", value_json="x" * record_size)
+    return request
+
+
+def _send(writer: SockClient, request: spb.ServerRequest, num_records: int):
+    sent = request.record_publish.history.item[0]
+    for _ in range(num_records):
+        sent.value_json = str(time.monotonic_ns())
+        writer.send_server_request(request)
+
+
+@pytest.mark.parametrize("record_size", [100, 10_000, 1_000_000])
+@pytest.mark.parametrize("transport", ["tcp", "shm"])
+def test_benchmark_transport(benchmark, transport, record_size):
+    if transport == "shm" and not shm_ring.is_supported():
+        pytest.skip("requires multiprocessing.shared_memory")
+    request = _make_request(record_size)
+    num_records = max(MIN_RECORDS, TOTAL_SIZE // request.ByteSize())
+    results: List[Dict[str, float]] = []
+    ctx = multiprocessing.get_context("spawn")
+
+    def setup():
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        recv_conn, send_conn = ctx.Pipe(duplex=False)
+        process = ctx.Process(target=_read, args=(listener, send_conn))
+        process.start()
+        writer = ShmSockClient() if transport == "shm" else SockClient()
+        writer.connect(listener.getsockname()[1])
+        listener.close()
+        recv_conn.recv()
+        if transport == "shm":
+            writer.connect_shm()
+        return (writer, process, recv_conn), {}
+
+    def send(writer, process, recv_conn):
+        _send(writer, request, num_records)
+        writer.close()
+        if transport == "shm":
+            writer.close_shm()
+        results.append(recv_conn.recv())
+        process.join()
+
+    benchmark.pedantic(send, setup=setup, rounds=5, iterations=1)
+    benchmark.extra_info["records_per_second"] = num_records / benchmark.stats["mean"]
+    for key in results[0]:
+        benchmark.extra_info[key] = _percentile([r[key] for r in results], 0.5)
+
+
+if __name__ == "__main__":
+    pytest.main(sys.argv)
@@ -0,0 +1,144 @@
+"""Benchmark reading messages from the service socket.
+
+A thread sends framed server requests over a socket pair, and a SockClient
+reads and parses them, with:
+
+- legacy: the receive buffer joining and slicing the received chunks for
+  every read, as before reading in place,
+- default: the receive buffer read in place, messages parsed from views.
+
+    pytest tests/standalone_tests/sock_throughput_benchmark.py
+
+The default runs send 8MB of messages of each size. Set
+WANDB_BENCHMARK_FULL_SCALE=1 to send 128MB.
+"""
+import os
+import socket
+import struct
+import sys
+import threading
+from typing import List, Optional
+
+import pytest
+from wandb.proto import wandb_server_pb2 as spb
+from wandb.sdk.lib import sock_client
+
+FULL_SCALE = bool(os.environ.get("WANDB_BENCHMARK_FULL_SCALE"))
+
+TOTAL_SIZE = (128 if FULL_SCALE else 8) * 1024**2
+
+
+class LegacySockBuffer:
+    def __init__(self) -> None:
+        self._buf_list: List[bytes] = []
+        self._buf_lengths: List[int] = []
+        self._buf_total = 0
+
+    @property
+    def length(self) -> int:
+        return self._buf_total
+
+    def _get(self, start: int, end: int, peek: bool = False) -> bytes:
+        index: Optional[int] = None
+        buffers = []
+        need = end
+        for i, (buf_len, buf_data) in enumerate(zip(self._buf_lengths, self._buf_list)):
+            buffers.append(buf_data[:need] if need < buf_len else buf_data)
+            if need <= buf_len:
+                index = i
+                break
+            need -= buf_len
+        if index is None:
+            raise IndexError("SockBuffer index out of range")
+        if not peek:
+            self._buf_total -= end
+            if need < buf_len:
+                self._buf_list = self._buf_list[index:]
+                self._buf_lengths = self._buf_lengths[index:]
+                self._buf_list[0] = self._buf_list[0][need:]
+                self._buf_lengths[0] -= need
+            else:
+                self._buf_list = self._buf_list[index + 1 :]
+                self._buf_lengths = self._buf_lengths[index + 1 :]
+        return b"".join(buffers)[start:end]
+
+    def put(self, data: bytes, data_len: int) -> None:
+        self._buf_list.append(data)
+        self._buf_lengths.append(data_len)
+        self._buf_total += data_len
+
+
+class LegacySockClient(sock_client.SockClient):
+    """Reads messages copying the received chunks into bytes."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._legacy_buffer = LegacySockBuffer()
+
+    def _read_packet_bytes(self, timeout: Optional[int] = None) -> memoryview:
+        buffer = self._legacy_buffer
+        while True:
+            if buffer.length >= self.HEADLEN:
+                header = buffer._get(0, self.HEADLEN, peek=True)
+                magic, dlength = struct.unpack("<BI", header)
+                assert magic == ord("W")
+                if buffer.length >= self.HEADLEN + dlength:
+                    data = buffer._get(self.HEADLEN, self.HEADLEN + dlength)
+                    return memoryview(data)
+            data = self._sock.recv(self._bufsize)
+            if not data:
+                raise sock_client.SockClientClosedError
+            buffer.put(data, len(data))
+
+
+def _make_frames(message_size: int) -> List[bytes]:
+    request = spb.ServerRequest()
+    request.record_publish.output_raw.line = "x" * message_size
+    data = request.SerializeToString()
+    frame = struct.pack("<BI", ord("W"), len(data)) + data
+    return [frame] * max(1, TOTAL_SIZE // len(frame))
+
+
+def _receive(client_class: type, frames: List[bytes]) -> int:
+    left, right = socket.socketpair()
+    receiver = client_class()
+    receiver.set_socket(right)
+
+    def send() -> None:
+        for frame in frames:
+            left.sendall(frame)
+
+    thread = threading.Thread(target=send)
+    thread.start()
+    received = 0
+    try:
+        for _ in frames:
+            request = receiver.read_server_request()
+            received += len(request.record_publish.output_raw.line)
+    finally:
+        thread.join()
+        left.close()
+        right.close()
+    return received
+
+
+@pytest.mark.parametrize("message_size", [100, 10_000, 1_000_000, 16_000_000])
+@pytest.mark.parametrize("mode", ["legacy", "default"])
+def test_benchmark_sock_receive(benchmark, mode, message_size):
+    frames = _make_frames(message_size)
+    client_class = LegacySockClient if mode == "legacy" else sock_client.SockClient
+
+    received = benchmark.pedantic(
+        _receive, args=(client_class, frames), rounds=5, iterations=1
+    )
+    total_bytes = sum(len(frame) for frame in frames)
+    benchmark.extra_info["messages_per_second"] = len(frames) / benchmark.stats["mean"]
+    benchmark.extra_info["mb_per_second"] = (
+        total_bytes / 1024**2 / benchmark.stats["mean"]
+    )
+
+    assert received == len(frames) * message_size
+
+
+if __name__ == "__main__":
+    pytest.main(sys.argv)
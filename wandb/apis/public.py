@@ -11,6 +11,7 @@ You might use the Public API to
 For more on using the Public API, check out [our guide](https://docs.wandb.com/guides/track/public-api-guide).
 """
 import ast
+import concurrent.futures
 import datetime
 import io
 import json
@@ -30,6 +31,7 @@ from typing import (
     MutableMapping,
     Optional,
     Sequence,
+    Union,
 )
 
 import requests
@@ -40,6 +42,7 @@ import wandb
 from wandb import env, util
 from wandb.apis.internal import Api as InternalApi
 from wandb.apis.normalize import normalize_exceptions
+from wandb.apis.response_cache import ResponseCache, cache_user
 from wandb.errors import CommError
 from wandb.sdk.data_types._dtypes import InvalidType, Type, TypeRegistry
 from wandb.sdk.internal.thread_local_settings import _thread_local_api_settings
@@ -192,9 +195,15 @@ class RetryingClient:
         """
     )
 
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, cache: Optional["ResponseCache"] = None):
         self._server_info = None
         self._client = client
+        self._cache = cache
+        self._cache_user = None
+        if cache is not None:
+            transport = client.transport
+            auth = getattr(getattr(transport, "session", None), "auth", None)
+            self._cache_user = cache_user(transport.url, auth)
 
     @property
     def app_url(self):
@@ -205,7 +214,7 @@ class RetryingClient:
         check_retry_fn=util.no_retry_auth,
         retryable_exceptions=(RetryError, requests.RequestException),
     )
-    def execute(self, *args, **kwargs):
+    def _execute(self, *args, **kwargs):
         try:
             return self._client.execute(*args, **kwargs)
         except requests.exceptions.ReadTimeout:
@@ -218,6 +227,27 @@ class RetryingClient:
                 )
             raise
 
+    def execute(self, document, *args, **kwargs):
+        if self._cache is None:
+            return self._execute(document, *args, **kwargs)
+        variables = kwargs.get("variable_values") or (args[0] if args else {}) or {}
+        if self._cache.is_mutation(document):
+            try:
+                return self._execute(document, *args, **kwargs)
+            finally:
+                self._cache.invalidate(self._cache_user, variables)
+        hit, data = self._cache.get(self._cache_user, document, variables)
+        if not hit:
+            data = self._execute(document, *args, **kwargs)
+            self._cache.put(self._cache_user, document, variables, data)
+        return data
+
+    def set_max_connections(self, max_connections):
+        """Allow up to `max_connections` queries to be in flight at once."""
+        transport = self._client.transport
+        if isinstance(transport, GraphQLSession):
+            transport.set_pool_maxsize(max_connections)
+
     @property
     def server_info(self):
         if self._server_info is None:
@@ -243,6 +273,9 @@ class Api:
         overrides: (dict) You can set `base_url` if you are using a wandb server
             other than https://api.wandb.ai.
             You can also set defaults for `entity`, `project`, and `run`.
+        cache: (bool or ResponseCache) Cache query responses on disk, so
+            repeated queries for finished runs and committed artifacts don't
+            hit the network. Other responses are cached for a minute.
     """
 
     _HTTP_TIMEOUT = env.get_http_timeout(9)
@@ -361,6 +394,7 @@ class Api:
         overrides=None,
         timeout: Optional[int] = None,
         api_key: Optional[str] = None,
+        cache: Union[bool, "ResponseCache"] = False,
     ) -> None:
         self.settings = InternalApi().settings()
         _overrides = overrides or {}
@@ -401,7 +435,9 @@ class Api:
                 cookies=_thread_local_api_settings.cookies,
             )
         )
-        self._client = RetryingClient(self._base_client)
+        if cache is True:
+            cache = ResponseCache(os.path.join(env.get_cache_dir(), "api"))
+        self._client = RetryingClient(self._base_client, cache=cache or None)
 
     def create_run(self, **kwargs):
         """Create a new run."""
@@ -1701,6 +1737,86 @@ class Runs(Paginator):
 
         return objs
 
+    @normalize_exceptions
+    def history_many(
+        self,
+        keys=None,
+        samples=500,
+        x_axis="_step",
+        stream="default",
+        max_workers=8,
+        format="pandas",
+    ):
+        """Return sampled history metrics for all runs, fetched concurrently.
+
+        Example:
+            Export the loss of every run in a sweep
+
+            ```python
+            runs = api.runs("l2k2/examples", filters={"sweep": "xyz12345"})
+            losses = runs.history_many(keys=["loss"], max_workers=16)
+            losses.groupby("run_id")["loss"].min()
+            ```
+
+        Arguments:
+            keys (list, optional): Only return these keys, see `Run.history`
+            samples (int, optional): The number of samples to return per run
+            x_axis (str, optional): Use this metric as the xAxis defaults to _step
+            stream (str, optional): "default" for metrics, "system" for machine metrics
+            max_workers (int, optional): The number of runs to fetch at once
+            format (str, optional): "pandas", "arrow" or None for a list of dicts
+
+        Returns:
+            The history rows of every run with an extra "run_id" column, as a
+            `pandas.DataFrame`, a `pyarrow.Table` or a list of dicts.
+        """
+        if format not in ("pandas", "arrow", None):
+            raise ValueError('format must be one of: "pandas", "arrow", None')
+        if keys is not None and not isinstance(keys, list):
+            raise ValueError("keys must be specified in a list")
+        if keys and stream != "default":
+            raise ValueError("stream must be default when specifying keys")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        def fetch(run):
+            if keys:
+                rows = run._sampled_history(keys=keys, x_axis=x_axis, samples=samples)
+            else:
+                rows = run._full_history(samples=samples, stream=stream)
+            return [{"run_id": run.id, **row} for row in rows]
+
+        self.client.set_max_connections(max_workers)
+        # runs are fetched as the paginator loads them, each worker holds one
+        # connection of the shared session
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="HistoryMany"
+        ) as executor:
+            futures = [executor.submit(fetch, run) for run in self]
+            try:
+                rows = [row for future in futures for row in future.result()]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        if format == "pandas":
+            pandas = util.get_module(
+                "pandas",
+                required="history_many requires pandas, run pip install pandas",
+            )
+            return pandas.DataFrame.from_records(rows)
+        if format == "arrow":
+            np = util.get_module(
+                "numpy", required="history_many requires numpy, run pip install numpy"
+            )
+            pa = util.get_module(
+                "pyarrow",
+                required="history_many requires pyarrow, run pip install pyarrow",
+            )
+            return pa.Table.from_batches([_arrow_history(np, pa, rows)])
+        return rows
+
     def __repr__(self):
         return f"<Runs {self.entity}/{self.project}>"
 
@@ -2125,7 +2241,9 @@ class Run(Attrs):
         return lines
 
     @normalize_exceptions
-    def scan_history(self, keys=None, page_size=1000, min_step=None, max_step=None):
+    def scan_history(
+        self, keys=None, page_size=1000, min_step=None, max_step=None, format=None
+    ):
         """Returns an iterable collection of all history records for a run.
 
         Example:
@@ -2137,14 +2255,30 @@ class Run(Attrs):
             losses = [row["Loss"] for row in history]
             ```
 
+            Stream the full history of a run into a Parquet file
+
+            ```python
+            run = api.run("l2k2/examples-numpy-boston/i0wt6xua")
+            run.scan_history(format="arrow").to_parquet("history.parquet")
+            ```
+
 
         Arguments:
             keys ([str], optional): only fetch these keys, and only fetch rows that have all of keys defined.
             page_size (int, optional): size of pages to fetch from the api
+            format (str, optional): "numpy" or "arrow" to iterate over pages of
+                typed columns instead of rows, see `ColumnarHistoryScan`.
 
         Returns:
-            An iterable collection over history records (dict).
+            An iterable collection over history records (dict), or over pages of
+            columns if `format` is set.
         """
+        if format is not None and format not in ColumnarHistoryScan.FORMATS:
+            raise ValueError(
+                "format must be one of: {}".format(
+                    ", ".join(ColumnarHistoryScan.FORMATS)
+                )
+            )
         if keys is not None and not isinstance(keys, list):
             wandb.termerror("keys must be specified in a list")
             return []
@@ -2162,7 +2296,7 @@ class Run(Attrs):
         if max_step > last_step:
             max_step = last_step + 1
         if keys is None:
-            return HistoryScan(
+            scan = HistoryScan(
                 run=self,
                 client=self.client,
                 page_size=page_size,
@@ -2170,7 +2304,7 @@ class Run(Attrs):
                 max_step=max_step,
             )
         else:
-            return SampledHistoryScan(
+            scan = SampledHistoryScan(
                 run=self,
                 client=self.client,
                 keys=keys,
@@ -2178,6 +2312,9 @@ class Run(Attrs):
                 min_step=min_step,
                 max_step=max_step,
             )
+        if format is not None:
+            return ColumnarHistoryScan(scan, format=format)
+        return scan
 
     @normalize_exceptions
     def logged_artifacts(self, per_page=100):
@@ -3551,29 +3688,34 @@ class HistoryScan:
 
     next = __next__
 
+    def _load_next(self):
+        self.rows = self._fetch(self.page_offset)
+        self.page_offset += self.page_size
+        self.scan_offset = 0
+
     @normalize_exceptions
     @retry.retriable(
         check_retry_fn=util.no_retry_auth,
         retryable_exceptions=(RetryError, requests.RequestException),
     )
-    def _load_next(self):
-        max_step = self.page_offset + self.page_size
+    def _fetch(self, page_offset):
+        """Fetch the page of rows starting at step `page_offset`."""
+        max_step = page_offset + self.page_size
         if max_step > self.max_step:
             max_step = self.max_step
         variables = {
             "entity": self.run.entity,
             "project": self.run.project,
             "run": self.run.id,
-            "minStep": int(self.page_offset),
+            "minStep": int(page_offset),
             "maxStep": int(max_step),
             "pageSize": int(self.page_size),
         }
 
         res = self.client.execute(self.QUERY, variable_values=variables)
         res = res["project"]["run"]["history"]
-        self.rows = [json.loads(row) for row in res]
-        self.page_offset += self.page_size
-        self.scan_offset = 0
+        # rows are JSON encoded, decode the whole page in a single call
+        return json.loads("[" + ",".join(res) + "]")
 
 
 class SampledHistoryScan:
@@ -3618,13 +3760,19 @@ class SampledHistoryScan:
 
     next = __next__
 
+    def _load_next(self):
+        self.rows = self._fetch(self.page_offset)
+        self.page_offset += self.page_size
+        self.scan_offset = 0
+
     @normalize_exceptions
     @retry.retriable(
         check_retry_fn=util.no_retry_auth,
         retryable_exceptions=(RetryError, requests.RequestException),
     )
-    def _load_next(self):
-        max_step = self.page_offset + self.page_size
+    def _fetch(self, page_offset):
+        """Fetch the page of rows starting at step `page_offset`."""
+        max_step = page_offset + self.page_size
         if max_step > self.max_step:
             max_step = self.max_step
         variables = {
@@ -3634,7 +3782,7 @@ class SampledHistoryScan:
             "spec": json.dumps(
                 {
                     "keys": self.keys,
-                    "minStep": int(self.page_offset),
+                    "minStep": int(page_offset),
                     "maxStep": int(max_step),
                     "samples": int(self.page_size),
                 }
@@ -3643,9 +3791,276 @@ class SampledHistoryScan:
 
         res = self.client.execute(self.QUERY, variable_values=variables)
         res = res["project"]["run"]["sampledHistory"]
-        self.rows = res[0]
-        self.page_offset += self.page_size
-        self.scan_offset = 0
+        return res[0]
+
+
+def _column_kind(values):
+    kinds = set(map(type, values))
+    if kinds == {int}:
+        return "int"
+    if kinds <= {int, float}:
+        return "float"
+    if kinds == {bool}:
+        return "bool"
+    return "object"
+
+
+def _history_columns(rows):
+    """Split rows into sparse columns of (row indices, values)."""
+    columns = {}
+    for i, row in enumerate(rows):
+        for key, value in row.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = ([], [])
+            column[0].append(i)
+            column[1].append(value)
+    return columns
+
+
+def _numpy_column(np, size, index, values):
+    kind = _column_kind(values)
+    dense = len(values) == size
+    try:
+        if kind == "int" and dense:
+            return np.array(values, dtype=np.int64)
+        if kind in ("int", "float"):
+            column = np.full(size, np.nan)
+            column[index] = values
+            return column
+        if kind == "bool" and dense:
+            return np.array(values, dtype=np.bool_)
+    except OverflowError:
+        pass
+    column = np.empty(size, dtype=object)
+    for i, value in zip(index, values):
+        column[i] = value
+    return column
+
+
+def _numpy_history(np, rows):
+    """Decode history rows into a dict of numpy arrays."""
+    size = len(rows)
+    return {
+        key: _numpy_column(np, size, index, values)
+        for key, (index, values) in _history_columns(rows).items()
+    }
+
+
+def _arrow_column(np, pa, size, index, values):
+    mask = None
+    if len(values) < size:
+        mask = np.ones(size, dtype=np.bool_)
+        mask[index] = False
+    dtype = {"int": np.int64, "float": np.float64, "bool": np.bool_}.get(
+        _column_kind(values)
+    )
+    if dtype is not None:
+        try:
+            column = np.zeros(size, dtype=dtype)
+            column[index] = values
+            return pa.array(column, mask=mask)
+        except OverflowError:
+            pass
+    column = [None] * size
+    for i, value in zip(index, values):
+        column[i] = value
+    try:
+        return pa.array(column)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # mixed types, keep the values as JSON
+        return pa.array(
+            [None if value is None else json.dumps(value) for value in column],
+            type=pa.string(),
+        )
+
+
+def _arrow_history(np, pa, rows):
+    """Decode history rows into a pyarrow RecordBatch."""
+    size = len(rows)
+    columns = _history_columns(rows)
+    return pa.RecordBatch.from_arrays(
+        [
+            _arrow_column(np, pa, size, index, values)
+            for index, values in columns.values()
+        ],
+        names=list(columns),
+    )
+
+
+class ColumnarHistoryScan:
+    """Iterate over the history of a run one page of typed columns at a time.
+
+    Wraps a `HistoryScan` or `SampledHistoryScan`. Every page is decoded into
+    one buffer per key instead of one dict per row, and the next page is
+    fetched in the background while the current one is consumed.
+
+    With `format="numpy"` each page is a dict mapping keys to numpy arrays.
+    Numeric columns are float64 with NaN where a row did not log the key, or
+    int64 when every row logged an integer; everything else is an object
+    array. With `format="arrow"` each page is a `pyarrow.RecordBatch` where
+    missing values are nulls.
+
+    Example:
+        ```python
+        run = api.run("l2k2/examples-numpy-boston/i0wt6xua")
+        for columns in run.scan_history(keys=["Loss"], format="numpy"):
+            print(columns["Loss"].mean())
+        ```
+    """
+
+    FORMATS = ("numpy", "arrow")
+
+    def __init__(self, scan, format="numpy"):
+        if format not in self.FORMATS:
+            raise ValueError(
+                "format must be one of: {}".format(", ".join(self.FORMATS))
+            )
+        self.scan = scan
+        self.format = format
+        self._np = util.get_module(
+            "numpy", required="Columnar history requires numpy, run pip install numpy"
+        )
+        self._pa = None
+        if format == "arrow":
+            self._load_arrow()
+
+    def _load_arrow(self):
+        if self._pa is None:
+            self._pa = util.get_module(
+                "pyarrow",
+                required="Arrow history requires pyarrow, run pip install pyarrow",
+            )
+        return self._pa
+
+    def __iter__(self):
+        for rows in self._pages():
+            if self.format == "arrow":
+                yield _arrow_history(self._np, self._pa, rows)
+            else:
+                yield _numpy_history(self._np, rows)
+
+    def _pages(self):
+        """Yield the non-empty pages of rows, prefetching one page ahead."""
+        scan = self.scan
+        offsets = range(scan.min_step, scan.max_step, scan.page_size)
+        if not offsets:
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="HistoryPrefetch"
+        ) as executor:
+            future = executor.submit(scan._fetch, offsets[0])
+            for offset in offsets[1:]:
+                rows = future.result()
+                future = executor.submit(scan._fetch, offset)
+                if rows:
+                    yield rows
+            rows = future.result()
+            if rows:
+                yield rows
+
+    def _history_schema(self):
+        """Build a schema from the history keys of the run, if known."""
+        pa = self._pa
+        if not isinstance(self.scan, HistoryScan):
+            return None
+        keys = (self.scan.run._attrs.get("historyKeys") or {}).get("keys")
+        if not keys:
+            return None
+        fields = []
+        for key, info in keys.items():
+            types = {count.get("type") for count in info.get("typeCounts") or []}
+            if key == "_step":
+                fields.append(pa.field(key, pa.int64()))
+            elif types == {"number"}:
+                fields.append(pa.field(key, pa.float64()))
+            elif types == {"boolean"}:
+                fields.append(pa.field(key, pa.bool_()))
+            else:
+                fields.append(pa.field(key, pa.string()))
+        return pa.schema(fields)
+
+    def _conform(self, batch, schema):
+        """Cast `batch` to `schema`, filling missing columns with nulls."""
+        pa = self._pa
+        arrays = []
+        for field in schema:
+            i = batch.schema.get_field_index(field.name)
+            if i < 0:
+                arrays.append(pa.nulls(batch.num_rows, type=field.type))
+                continue
+            column = batch.column(i)
+            if not column.type.equals(field.type):
+                try:
+                    column = column.cast(field.type)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    if not pa.types.is_string(field.type):
+                        raise
+                    column = pa.array(
+                        [
+                            None if value is None else json.dumps(value)
+                            for value in column.to_pylist()
+                        ],
+                        type=pa.string(),
+                    )
+            arrays.append(column)
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def to_parquet(self, path, **kwargs):
+        """Stream the history into a Parquet file, one row group per page.
+
+        Only one page of rows is held in memory at a time. The schema is taken
+        from the history keys of the run when available, otherwise from the
+        first page; later pages are cast to it.
+
+        Arguments:
+            path (str): where to write the Parquet file
+            **kwargs: passed through to `pyarrow.parquet.ParquetWriter`
+
+        Returns:
+            The number of rows written.
+        """
+        pa = self._load_arrow()
+        pq = util.get_module(
+            "pyarrow.parquet",
+            required="Parquet export requires pyarrow, run pip install pyarrow",
+        )
+        schema = self._history_schema()
+        writer = None
+        num_rows = 0
+        dropped = set()
+        try:
+            for rows in self._pages():
+                batch = _arrow_history(self._np, pa, rows)
+                if schema is None:
+                    schema = pa.schema(
+                        [
+                            pa.field(field.name, pa.string())
+                            if pa.types.is_null(field.type)
+                            else field
+                            for field in batch.schema
+                        ]
+                    )
+                extra = set(batch.schema.names).difference(schema.names, dropped)
+                if extra:
+                    wandb.termwarn(
+                        "Dropping history keys missing from the Parquet schema: {}".format(
+                            ", ".join(sorted(extra))
+                        )
+                    )
+                    dropped.update(extra)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, schema, **kwargs)
+                writer.write_table(
+                    pa.Table.from_batches([self._conform(batch, schema)])
+                )
+                num_rows += batch.num_rows
+            if writer is None and schema is not None:
+                writer = pq.ParquetWriter(path, schema, **kwargs)
+        finally:
+            if writer is not None:
+                writer.close()
+        return num_rows
 
 
 class ProjectArtifactTypes(Paginator):
@@ -0,0 +1,214 @@
+"""On-disk cache of public API query responses."""
+import hashlib
+import json
+import os
+import re
+import secrets
+import shutil
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from wandb_graphql.language import ast
+from wandb_graphql.language.printer import print_ast
+
+from wandb.sdk.lib.filesystem import mkdir_exists_ok
+
+# run and artifact states after which the entity no longer changes
+FINAL_STATES = frozenset(
+    ("finished", "crashed", "failed", "killed", "preempted", "committed")
+)
+
+_SCOPE_VARIABLES = (("entity", "entityName"), ("project", "projectName"))
+
+
+# variables of paginated queries, new items may show up in later responses
+_PAGE_VARIABLES = frozenset(("cursor", "perPage"))
+
+# an alias such as "name:latest" may later point to another artifact version
+_ALIAS_RE = re.compile(r":(?!v\d+$)[^/:]+$")
+
+
+def _is_final(data: Any, variables: Dict[str, Any]) -> bool:
+    """Return whether the response `data` to a query can never change.
+
+    That is the case when it only describes runs and artifacts in a final
+    state, and the query neither pages through a collection nor looks up an
+    artifact by alias.
+    """
+    if _PAGE_VARIABLES.intersection(variables):
+        return False
+    if any(isinstance(v, str) and _ALIAS_RE.search(v) for v in variables.values()):
+        return False
+    found = False
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            state = value.get("state")
+            if isinstance(state, str):
+                if state.lower() not in FINAL_STATES:
+                    return False
+                found = True
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return found
+
+
+def _scope(variables: Dict[str, Any]) -> str:
+    parts = []
+    for names in _SCOPE_VARIABLES:
+        value = next((variables[n] for n in names if variables.get(n)), "")
+        parts.append(str(value))
+    return "/".join(parts)
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def cache_user(url: str, auth: Any) -> str:
+    """Return the key that separates the entries of different users and servers."""
+    return _digest(url, repr(auth))
+
+
+class ResponseCache:
+    """Cache GraphQL query responses on disk.
+
+    Responses that only describe finished runs and committed artifact
+    versions are kept until evicted, all other responses expire after `ttl`
+    seconds. Once the cache grows past `max_size` bytes the least recently
+    used entries are removed.
+
+    Entries are stored per user and per entity/project, and a mutation drops
+    every entry of the entity/project it targets, or of the user when it
+    doesn't name one.
+    """
+
+    _TMP_PREFIX = "tmp"
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_size: int = 512 * 1024 * 1024,
+        ttl: float = 60,
+    ) -> None:
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        self._ttl = ttl
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+        mkdir_exists_ok(self._cache_dir)
+
+    def _path(
+        self, user: str, document: ast.Document, variables: Dict[str, Any]
+    ) -> str:
+        key = _digest(print_ast(document), json.dumps(variables, sort_keys=True))
+        return os.path.join(
+            self._cache_dir, user, _digest(_scope(variables)), key + ".json"
+        )
+
+    @staticmethod
+    def is_mutation(document: ast.Document) -> bool:
+        return any(
+            isinstance(definition, ast.OperationDefinition)
+            and definition.operation == "mutation"
+            for definition in document.definitions
+        )
+
+    def get(
+        self, user: str, document: ast.Document, variables: Dict[str, Any]
+    ) -> Tuple[bool, Any]:
+        """Return (True, data) for a cached response, or (False, None)."""
+        path = self._path(user, document, variables)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return False, None
+        expires = entry.get("expires")
+        if expires is not None and expires < time.time():
+            self._remove(path)
+            return False, None
+        try:
+            # the modification time orders entries for eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return True, entry.get("data")
+
+    def put(
+        self,
+        user: str,
+        document: ast.Document,
+        variables: Dict[str, Any],
+        data: Any,
+    ) -> None:
+        path = self._path(user, document, variables)
+        expires = None if _is_final(data, variables) else time.time() + self._ttl
+        body = json.dumps({"expires": expires, "data": data})
+        tmp_path = os.path.join(
+            os.path.dirname(path), f"{self._TMP_PREFIX}_{secrets.token_hex(8)}"
+        )
+        try:
+            mkdir_exists_ok(os.path.dirname(path))
+            with open(tmp_path, "w") as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        except OSError:
+            self._remove(tmp_path)
+            return
+        with self._lock:
+            if self._size is None:
+                self._size = self._disk_size()
+            else:
+                self._size += len(body)
+            if self._size > self._max_size:
+                self._size = self.cleanup(self._max_size * 3 // 4)
+
+    def invalidate(self, user: str, variables: Dict[str, Any]) -> None:
+        """Drop the entries a mutation with `variables` may have changed."""
+        scope = _scope(variables)
+        if scope.strip("/"):
+            path = os.path.join(self._cache_dir, user, _digest(scope))
+        else:
+            path = os.path.join(self._cache_dir, user)
+        shutil.rmtree(path, ignore_errors=True)
+        with self._lock:
+            self._size = None
+
+    def _entries(self) -> List[Tuple[str, os.stat_result]]:
+        entries = []
+        for root, _, files in os.walk(self._cache_dir):
+            for file in files:
+                path = os.path.join(root, file)
+                try:
+                    entries.append((path, os.stat(path)))
+                except OSError:
+                    continue
+        return entries
+
+    def _disk_size(self) -> int:
+        return sum(stat.st_size for _, stat in self._entries())
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def cleanup(self, target_size: int) -> int:
+        """Remove least recently used entries until at most `target_size` bytes remain.
+
+        Returns the size of the cache after cleanup.
+        """
+        entries = self._entries()
+        total_size = sum(stat.st_size for _, stat in entries)
+        for path, stat in sorted(entries, key=lambda entry: entry[1].st_mtime):
+            if total_size <= target_size:
+                break
+            self._remove(path)
+            total_size -= stat.st_size
+        return total_size
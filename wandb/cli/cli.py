@@ -483,6 +483,13 @@ def init(ctx, project, entity, reset, mode):
 @click.option("--ignore", hidden=True)
 @click.option("--show", default=5, help="Number of runs to show")
 @click.option("--append", is_flag=True, default=False, help="Append run")
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of runs to sync in parallel",
+)
 @display_error
 def sync(
     ctx,
@@ -506,6 +513,7 @@ def sync(
     clean_old_hours=24,
     clean_force=None,
     append=None,
+    jobs=None,
 ):
     # TODO: rather unfortunate, needed to avoid creating a `wandb` directory
     os.environ["WANDB_DIR"] = TMPDIR.name
@@ -575,12 +583,14 @@ def sync(
             sync_tensorboard=_sync_tensorboard,
             log_path=_wandb_log_path,
             append=append,
+            jobs=jobs,
         )
         for p in _path:
             sm.add(p)
         sm.start()
         while not sm.is_done():
             _ = sm.poll()
+        sm.report()
 
     def _sync_all():
         sync_items = get_runs(
@@ -2198,6 +2208,50 @@ def cleanup(target_size, remove_temp):
     print(f"Reclaimed {util.to_human_size(reclaimed_bytes)} of space")
 
 
+@cli.group(help="Commands for debugging wandb")
+def debug():
+    pass
+
+
+@debug.command(
+    context_settings=CONTEXT,
+    help="""Show where the internal process of a run spends its time.
+
+    PATH is a run directory or a pipeline stats file, defaulting to the latest
+    run. Stats are only collected for runs started with the
+    WANDB__PIPELINE_STATS=true environment variable set.""",
+)
+@click.argument("path", required=False)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "json", "openmetrics"]),
+    default="table",
+    help="Output format",
+)
+@display_error
+def profile(path, output_format):
+    from wandb.sdk.internal import pipeline_stats
+
+    path = path or os.path.join(wandb.old.core.wandb_dir(env.get_dir()), "latest-run")
+    if os.path.isdir(path):
+        path = os.path.join(path, "logs", pipeline_stats.STATS_FNAME)
+    if not os.path.isfile(path):
+        wandb.termerror(
+            f"No pipeline stats found at {path}, set WANDB__PIPELINE_STATS=true "
+            "to collect them"
+        )
+        sys.exit(1)
+    with open(path) as f:
+        snap = json.load(f)
+    if output_format == "json":
+        click.echo(json.dumps(snap, indent=2))
+    elif output_format == "openmetrics":
+        click.echo(pipeline_stats.to_openmetrics(snap), nl=False)
+    else:
+        click.echo(pipeline_stats.to_table(snap))
+
+
 @cli.command(context_settings=CONTEXT, help="Pull files from Weights & Biases")
 @click.argument("run", envvar=env.RUN_ID)
 @click.option(
@@ -73,6 +73,17 @@ CONFIG_DIR = "WANDB_CONFIG_DIR"
 DATA_DIR = "WANDB_DATA_DIR"
 ARTIFACT_DIR = "WANDB_ARTIFACT_DIR"
 CACHE_DIR = "WANDB_CACHE_DIR"
+DISABLE_DIGEST_INDEX = "WANDB_DISABLE_DIGEST_INDEX"
+ARTIFACT_STAGING_MODE = "WANDB_ARTIFACT_STAGING_MODE"
+ARTIFACT_DOWNLOAD_HARDLINK = "WANDB_ARTIFACT_DOWNLOAD_HARDLINK"
+ARTIFACT_HASH_WORKERS = "WANDB_ARTIFACT_HASH_WORKERS"
+ARTIFACT_HASH_PROCESSES = "WANDB_ARTIFACT_HASH_PROCESSES"
+MULTIPART_UPLOAD_WORKERS = "WANDB_MULTIPART_UPLOAD_WORKERS"
+MULTIPART_UPLOAD_MEMORY = "WANDB_MULTIPART_UPLOAD_MEMORY"
+ARTIFACT_CACHE_MAX_SIZE = "WANDB_ARTIFACT_CACHE_MAX_SIZE"
+ARTIFACT_DOWNLOAD_WORKERS = "WANDB_ARTIFACT_DOWNLOAD_WORKERS"
+ARTIFACT_DOWNLOAD_BANDWIDTH = "WANDB_ARTIFACT_DOWNLOAD_BANDWIDTH"
+ARTIFACT_CHUNKING = "WANDB_ARTIFACT_CHUNKING"
 DISABLE_SSL = "WANDB_INSECURE_DISABLE_SSL"
 SERVICE = "WANDB_SERVICE"
 _DISABLE_SERVICE = "WANDB_DISABLE_SERVICE"
@@ -375,6 +386,92 @@ def get_cache_dir(env: Optional[Env] = None) -> str:
     return val
 
 
+def get_disable_digest_index(env: Optional[Env] = None) -> bool:
+    return _env_as_bool(DISABLE_DIGEST_INDEX, default="False", env=env)
+
+
+def get_artifact_cache_max_size(env: Optional[Env] = None) -> Optional[str]:
+    if env is None:
+        env = os.environ
+    return env.get(ARTIFACT_CACHE_MAX_SIZE)
+
+
+def get_artifact_download_workers(
+    default: Optional[int] = None, env: Optional[Env] = None
+) -> Optional[int]:
+    if env is None:
+        env = os.environ
+    val = env.get(ARTIFACT_DOWNLOAD_WORKERS, default)
+    try:
+        val = int(val)  # type: ignore
+    except (TypeError, ValueError):
+        val = default
+    return val
+
+
+def get_artifact_download_bandwidth(env: Optional[Env] = None) -> Optional[str]:
+    if env is None:
+        env = os.environ
+    return env.get(ARTIFACT_DOWNLOAD_BANDWIDTH)
+
+
+def get_artifact_staging_mode(env: Optional[Env] = None) -> str:
+    if env is None:
+        env = os.environ
+    return env.get(ARTIFACT_STAGING_MODE, "auto").lower()
+
+
+def get_artifact_chunking(env: Optional[Env] = None) -> bool:
+    return _env_as_bool(ARTIFACT_CHUNKING, default="False", env=env)
+
+
+def get_artifact_download_hardlink(env: Optional[Env] = None) -> bool:
+    return _env_as_bool(ARTIFACT_DOWNLOAD_HARDLINK, default="False", env=env)
+
+
+def get_artifact_hash_workers(
+    default: Optional[int] = None, env: Optional[Env] = None
+) -> Optional[int]:
+    if env is None:
+        env = os.environ
+    val = env.get(ARTIFACT_HASH_WORKERS, default)
+    try:
+        val = int(val)  # type: ignore
+    except (TypeError, ValueError):
+        val = default
+    return val
+
+
+def get_artifact_hash_processes(env: Optional[Env] = None) -> bool:
+    return _env_as_bool(ARTIFACT_HASH_PROCESSES, default="False", env=env)
+
+
+def get_multipart_upload_workers(
+    default: Optional[int] = None, env: Optional[Env] = None
+) -> Optional[int]:
+    if env is None:
+        env = os.environ
+    val = env.get(MULTIPART_UPLOAD_WORKERS, default)
+    try:
+        val = int(val)  # type: ignore
+    except (TypeError, ValueError):
+        val = default
+    return val
+
+
+def get_multipart_upload_memory(
+    default: Optional[int] = None, env: Optional[Env] = None
+) -> Optional[int]:
+    if env is None:
+        env = os.environ
+    val = env.get(MULTIPART_UPLOAD_MEMORY, default)
+    try:
+        val = int(val)  # type: ignore
+    except (TypeError, ValueError):
+        val = default
+    return val
+
+
 def get_use_v1_artifacts(env: Optional[Env] = None) -> bool:
     if env is None:
         env = os.environ
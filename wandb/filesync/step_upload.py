@@ -25,6 +25,7 @@ from wandb.sdk.lib.paths import LogicalPath
 if TYPE_CHECKING:
     from wandb.filesync import stats
     from wandb.sdk.internal import file_stream, internal_api, progress
+    from wandb.sdk.internal.pipeline_stats import PipelineStats
     from wandb.sdk.internal.settings_static import SettingsStatic
 
     if sys.version_info >= (3, 8):
@@ -128,11 +129,13 @@ class StepUpload:
         max_threads: int,
         file_stream: "file_stream.FileStreamApi",
         settings: Optional["SettingsStatic"] = None,
+        pipeline_stats: Optional["PipelineStats"] = None,
     ) -> None:
         self._api = api
         self._stats = stats
         self._event_queue = event_queue
         self._file_stream = file_stream
+        self._pipeline_stats = pipeline_stats
 
         self._thread = threading.Thread(target=self._thread_body)
         self._thread.daemon = True
@@ -326,6 +329,7 @@ class StepUpload:
             event.copied,
             event.save_fn,
             event.digest,
+            pipeline_stats=self._pipeline_stats,
         )
         job.run()
 
@@ -339,6 +343,7 @@ class StepUpload:
             silent=self.silent,
             request=event,
             save_fn_async=event.save_fn_async,
+            pipeline_stats=self._pipeline_stats,
         )
         await job.run()
 
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import os
+import time
 from typing import TYPE_CHECKING, Optional
 
 import wandb
@@ -9,6 +10,7 @@ from wandb.sdk.lib.paths import LogicalPath
 if TYPE_CHECKING:
     from wandb.filesync import dir_watcher, stats, step_upload
     from wandb.sdk.internal import file_stream, internal_api
+    from wandb.sdk.internal.pipeline_stats import PipelineStats
 
 
 logger = logging.getLogger(__name__)
@@ -28,6 +30,7 @@ class UploadJob:
         copied: bool,
         save_fn: Optional["step_upload.SaveFn"],
         digest: Optional[str],
+        pipeline_stats: Optional["PipelineStats"] = None,
     ) -> None:
         """A file uploader.
 
@@ -49,10 +52,20 @@ class UploadJob:
         self.copied = copied
         self.save_fn = save_fn
         self.digest = digest
+        self._pipeline_stats = pipeline_stats
         super().__init__()
 
     def run(self) -> None:
         success = False
+        size = None
+        if self._pipeline_stats is not None:
+            # Measured up front: a failing stat after the push must not turn
+            # a successful upload into a failed one.
+            try:
+                size = os.path.getsize(self.save_path)
+            except OSError:
+                pass
+        start = time.monotonic()
         try:
             self.push()
             success = True
@@ -61,6 +74,10 @@ class UploadJob:
                 os.remove(self.save_path)
             if success:
                 self._file_stream.push_success(self.artifact_id, self.save_name)  # type: ignore
+        if self._pipeline_stats is not None and size is not None:
+            self._pipeline_stats.log_transfer(
+                "file_sync", size, time.monotonic() - start
+            )
 
     def push(self) -> None:
         if self.save_fn:
@@ -159,6 +176,7 @@ class UploadJobAsync:
         silent: bool,
         request: "step_upload.RequestUpload",
         save_fn_async: "step_upload.SaveFnAsync",
+        pipeline_stats: Optional["PipelineStats"] = None,
     ) -> None:
         self._stats = stats
         self._api = api
@@ -166,6 +184,7 @@ class UploadJobAsync:
         self.silent = silent
         self._request = request
         self._save_fn_async = save_fn_async
+        self._pipeline_stats = pipeline_stats
 
     async def run(self) -> None:
         try:
@@ -193,6 +212,7 @@ class UploadJobAsync:
                 self._request.copied,
                 self._request.save_fn,
                 self._request.digest,
+                pipeline_stats=self._pipeline_stats,
             )
 
             await loop.run_in_executor(None, sync_job.run)
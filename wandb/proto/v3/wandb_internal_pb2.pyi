@@ -2057,19 +2057,22 @@ class StatusReportRequest(google.protobuf.message.Message):
     RECORD_NUM_FIELD_NUMBER: builtins.int
     SENT_OFFSET_FIELD_NUMBER: builtins.int
     SYNC_TIME_FIELD_NUMBER: builtins.int
+    FILE_STREAM_BACKLOG_BYTES_FIELD_NUMBER: builtins.int
     record_num: builtins.int
     sent_offset: builtins.int
     @property
     def sync_time(self) -> google.protobuf.timestamp_pb2.Timestamp: ...
+    file_stream_backlog_bytes: builtins.int
     def __init__(
         self,
         *,
         record_num: builtins.int = ...,
         sent_offset: builtins.int = ...,
         sync_time: google.protobuf.timestamp_pb2.Timestamp | None = ...,
+        file_stream_backlog_bytes: builtins.int = ...,
     ) -> None: ...
     def HasField(self, field_name: typing_extensions.Literal["sync_time", b"sync_time"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing_extensions.Literal["record_num", b"record_num", "sent_offset", b"sent_offset", "sync_time", b"sync_time"]) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["file_stream_backlog_bytes", b"file_stream_backlog_bytes", "record_num", b"record_num", "sent_offset", b"sent_offset", "sync_time", b"sync_time"]) -> None: ...
 
 global___StatusReportRequest = StatusReportRequest
 
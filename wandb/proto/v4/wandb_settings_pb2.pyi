@@ -127,8 +127,11 @@ class Settings(google.protobuf.message.Message):
 
     _ARGS_FIELD_NUMBER: builtins.int
     _AWS_LAMBDA_FIELD_NUMBER: builtins.int
+    _ASYNC_PUBLISH_FIELD_NUMBER: builtins.int
+    _ASYNC_PUBLISH_MAX_SIZE_FIELD_NUMBER: builtins.int
     _ASYNC_UPLOAD_CONCURRENCY_LIMIT_FIELD_NUMBER: builtins.int
     _CLI_ONLY_MODE_FIELD_NUMBER: builtins.int
+    _COALESCE_HISTORY_FIELD_NUMBER: builtins.int
     _COLAB_FIELD_NUMBER: builtins.int
     _CUDA_FIELD_NUMBER: builtins.int
     _DISABLE_META_FIELD_NUMBER: builtins.int
@@ -139,6 +142,9 @@ class Settings(google.protobuf.message.Message):
     _EXCEPT_EXIT_FIELD_NUMBER: builtins.int
     _EXECUTABLE_FIELD_NUMBER: builtins.int
     _EXTRA_HTTP_HEADERS_FIELD_NUMBER: builtins.int
+    _FILE_STREAM_COMPRESSION_FIELD_NUMBER: builtins.int
+    _FILE_STREAM_MAX_BACKLOG_BYTES_FIELD_NUMBER: builtins.int
+    _FILE_STREAM_MAX_INFLIGHT_FIELD_NUMBER: builtins.int
     _FILE_STREAM_TIMEOUT_SECONDS_FIELD_NUMBER: builtins.int
     _FLOW_CONTROL_CUSTOM_FIELD_NUMBER: builtins.int
     _FLOW_CONTROL_DISABLED_FIELD_NUMBER: builtins.int
@@ -153,12 +159,15 @@ class Settings(google.protobuf.message.Message):
     _LIVE_POLICY_RATE_LIMIT_FIELD_NUMBER: builtins.int
     _LIVE_POLICY_WAIT_TIME_FIELD_NUMBER: builtins.int
     _LOG_LEVEL_FIELD_NUMBER: builtins.int
+    _MAX_UPLOAD_JOBS_FIELD_NUMBER: builtins.int
     _NETWORK_BUFFER_FIELD_NUMBER: builtins.int
     _NOOP_FIELD_NUMBER: builtins.int
     _NOTEBOOK_FIELD_NUMBER: builtins.int
     _OFFLINE_FIELD_NUMBER: builtins.int
     _SYNC_FIELD_NUMBER: builtins.int
     _OS_FIELD_NUMBER: builtins.int
+    _PIPELINE_STATS_FIELD_NUMBER: builtins.int
+    _PIPELINE_STATS_PORT_FIELD_NUMBER: builtins.int
     _PLATFORM_FIELD_NUMBER: builtins.int
     _PYTHON_FIELD_NUMBER: builtins.int
     _RUNQUEUE_ITEM_ID_FIELD_NUMBER: builtins.int
@@ -274,10 +283,16 @@ class Settings(google.protobuf.message.Message):
     @property
     def _aws_lambda(self) -> google.protobuf.wrappers_pb2.BoolValue: ...
     @property
+    def _async_publish(self) -> google.protobuf.wrappers_pb2.StringValue: ...
+    @property
+    def _async_publish_max_size(self) -> google.protobuf.wrappers_pb2.Int32Value: ...
+    @property
     def _async_upload_concurrency_limit(self) -> google.protobuf.wrappers_pb2.Int32Value: ...
     @property
     def _cli_only_mode(self) -> google.protobuf.wrappers_pb2.BoolValue: ...
     @property
+    def _coalesce_history(self) -> google.protobuf.wrappers_pb2.BoolValue: ...
+    @property
     def _colab(self) -> google.protobuf.wrappers_pb2.BoolValue: ...
     @property
     def _cuda(self) -> google.protobuf.wrappers_pb2.StringValue: ...
@@ -298,6 +313,12 @@ class Settings(google.protobuf.message.Message):
     @property
     def _extra_http_headers(self) -> global___MapStringKeyStringValue: ...
     @property
+    def _file_stream_compression(self) -> google.protobuf.wrappers_pb2.StringValue: ...
+    @property
+    def _file_stream_max_backlog_bytes(self) -> google.protobuf.wrappers_pb2.Int32Value: ...
+    @property
+    def _file_stream_max_inflight(self) -> google.protobuf.wrappers_pb2.Int32Value: ...
+    @property
     def _file_stream_timeout_seconds(self) -> google.protobuf.wrappers_pb2.DoubleValue: ...
     @property
     def _flow_control_custom(self) -> google.protobuf.wrappers_pb2.BoolValue: ...
@@ -326,6 +347,8 @@ class Settings(google.protobuf.message.Message):
     @property
     def _log_level(self) -> google.protobuf.wrappers_pb2.Int32Value: ...
     @property
+    def _max_upload_jobs(self) -> google.protobuf.wrappers_pb2.Int32Value: ...
+    @property
     def _network_buffer(self) -> google.protobuf.wrappers_pb2.Int32Value: ...
     @property
     def _noop(self) -> google.protobuf.wrappers_pb2.BoolValue: ...
@@ -338,6 +361,10 @@ class Settings(google.protobuf.message.Message):
     @property
     def _os(self) -> google.protobuf.wrappers_pb2.StringValue: ...
     @property
+    def _pipeline_stats(self) -> google.protobuf.wrappers_pb2.BoolValue: ...
+    @property
+    def _pipeline_stats_port(self) -> google.protobuf.wrappers_pb2.Int32Value: ...
+    @property
     def _platform(self) -> google.protobuf.wrappers_pb2.StringValue: ...
     @property
     def _python(self) -> google.protobuf.wrappers_pb2.StringValue: ...
@@ -562,8 +589,11 @@ class Settings(google.protobuf.message.Message):
         *,
         _args: global___ListStringValue | None = ...,
         _aws_lambda: google.protobuf.wrappers_pb2.BoolValue | None = ...,
+        _async_publish: google.protobuf.wrappers_pb2.StringValue | None = ...,
+        _async_publish_max_size: google.protobuf.wrappers_pb2.Int32Value | None = ...,
         _async_upload_concurrency_limit: google.protobuf.wrappers_pb2.Int32Value | None = ...,
         _cli_only_mode: google.protobuf.wrappers_pb2.BoolValue | None = ...,
+        _coalesce_history: google.protobuf.wrappers_pb2.BoolValue | None = ...,
         _colab: google.protobuf.wrappers_pb2.BoolValue | None = ...,
         _cuda: google.protobuf.wrappers_pb2.StringValue | None = ...,
         _disable_meta: google.protobuf.wrappers_pb2.BoolValue | None = ...,
@@ -574,6 +604,9 @@ class Settings(google.protobuf.message.Message):
         _except_exit: google.protobuf.wrappers_pb2.BoolValue | None = ...,
         _executable: google.protobuf.wrappers_pb2.StringValue | None = ...,
         _extra_http_headers: global___MapStringKeyStringValue | None = ...,
+        _file_stream_compression: google.protobuf.wrappers_pb2.StringValue | None = ...,
+        _file_stream_max_backlog_bytes: google.protobuf.wrappers_pb2.Int32Value | None = ...,
+        _file_stream_max_inflight: google.protobuf.wrappers_pb2.Int32Value | None = ...,
         _file_stream_timeout_seconds: google.protobuf.wrappers_pb2.DoubleValue | None = ...,
         _flow_control_custom: google.protobuf.wrappers_pb2.BoolValue | None = ...,
         _flow_control_disabled: google.protobuf.wrappers_pb2.BoolValue | None = ...,
@@ -588,12 +621,15 @@ class Settings(google.protobuf.message.Message):
         _live_policy_rate_limit: google.protobuf.wrappers_pb2.Int32Value | None = ...,
         _live_policy_wait_time: google.protobuf.wrappers_pb2.Int32Value | None = ...,
         _log_level: google.protobuf.wrappers_pb2.Int32Value | None = ...,
+        _max_upload_jobs: google.protobuf.wrappers_pb2.Int32Value | None = ...,
         _network_buffer: google.protobuf.wrappers_pb2.Int32Value | None = ...,
         _noop: google.protobuf.wrappers_pb2.BoolValue | None = ...,
         _notebook: google.protobuf.wrappers_pb2.BoolValue | None = ...,
         _offline: google.protobuf.wrappers_pb2.BoolValue | None = ...,
         _sync: google.protobuf.wrappers_pb2.BoolValue | None = ...,
         _os: google.protobuf.wrappers_pb2.StringValue | None = ...,
+        _pipeline_stats: google.protobuf.wrappers_pb2.BoolValue | None = ...,
+        _pipeline_stats_port: google.protobuf.wrappers_pb2.Int32Value | None = ...,
         _platform: google.protobuf.wrappers_pb2.StringValue | None = ...,
         _python: google.protobuf.wrappers_pb2.StringValue | None = ...,
         _runqueue_item_id: google.protobuf.wrappers_pb2.StringValue | None = ...,
@@ -705,7 +741,7 @@ class Settings(google.protobuf.message.Message):
         username: google.protobuf.wrappers_pb2.StringValue | None = ...,
         wandb_dir: google.protobuf.wrappers_pb2.StringValue | None = ...,
     ) -> None: ...
-    def HasField(self, field_name: typing_extensions.Literal["_args", b"_args", "_async_upload_concurrency_limit", b"_async_upload_concurrency_limit", "_aws_lambda", b"_aws_lambda", "_cli_only_mode", b"_cli_only_mode", "_colab", b"_colab", "_cuda", b"_cuda", "_disable_meta", b"_disable_meta", "_disable_service", b"_disable_service", "_disable_setproctitle", b"_disable_setproctitle", "_disable_stats", b"_disable_stats", "_disable_viewer", b"_disable_viewer", "_except_exit", b"_except_exit", "_executable", b"_executable", "_extra_http_headers", b"_extra_http_headers", "_file_stream_timeout_seconds", b"_file_stream_timeout_seconds", "_flow_control_custom", b"_flow_control_custom", "_flow_control_disabled", b"_flow_control_disabled", "_internal_check_process", b"_internal_check_process", "_internal_queue_timeout", b"_internal_queue_timeout", "_ipython", b"_ipython", "_jupyter", b"_jupyter", "_jupyter_name", b"_jupyter_name", "_jupyter_path", b"_jupyter_path", "_jupyter_root", b"_jupyter_root", "_kaggle", b"_kaggle", "_live_policy_rate_limit", b"_live_policy_rate_limit", "_live_policy_wait_time", b"_live_policy_wait_time", "_log_level", b"_log_level", "_network_buffer", b"_network_buffer", "_noop", b"_noop", "_notebook", b"_notebook", "_offline", b"_offline", "_os", b"_os", "_platform", b"_platform", "_python", b"_python", "_require_nexus", b"_require_nexus", "_runqueue_item_id", b"_runqueue_item_id", "_save_requirements", b"_save_requirements", "_service_transport", b"_service_transport", "_service_wait", b"_service_wait", "_start_datetime", b"_start_datetime", "_start_time", b"_start_time", "_stats_join_assets", b"_stats_join_assets", "_stats_neuron_monitor_config_path", b"_stats_neuron_monitor_config_path", "_stats_open_metrics_endpoints", b"_stats_open_metrics_endpoints", "_stats_open_metrics_filters", b"_stats_open_metrics_filters", "_stats_pid", b"_stats_pid", "_stats_sample_rate_seconds", b"_stats_sample_rate_seconds", "_stats_samples_to_average", b"_stats_samples_to_average", "_sync", b"_sync", "_tmp_code_dir", b"_tmp_code_dir", "_tracelog", b"_tracelog", "_unsaved_keys", b"_unsaved_keys", "_windows", b"_windows", "allow_val_change", b"allow_val_change", "anonymous", b"anonymous", "api_key", b"api_key", "azure_account_url_to_access_key", b"azure_account_url_to_access_key", "base_url", b"base_url", "code_dir", b"code_dir", "config_paths", b"config_paths", "console", b"console", "deployment", b"deployment", "disable_code", b"disable_code", "disable_git", b"disable_git", "disable_hints", b"disable_hints", "disable_job_creation", b"disable_job_creation", "disabled", b"disabled", "docker", b"docker", "email", b"email", "entity", b"entity", "files_dir", b"files_dir", "force", b"force", "git_commit", b"git_commit", "git_remote", b"git_remote", "git_remote_url", b"git_remote_url", "git_root", b"git_root", "heartbeat_seconds", b"heartbeat_seconds", "host", b"host", "ignore_globs", b"ignore_globs", "init_timeout", b"init_timeout", "is_local", b"is_local", "job_name", b"job_name", "job_source", b"job_source", "label_disable", b"label_disable", "launch", b"launch", "launch_config_path", b"launch_config_path", "log_dir", b"log_dir", "log_internal", b"log_internal", "log_symlink_internal", b"log_symlink_internal", "log_symlink_user", b"log_symlink_user", "log_user", b"log_user", "login_timeout", b"login_timeout", "mode", b"mode", "notebook_name", b"notebook_name", "problem", b"problem", "program", b"program", "program_relpath", b"program_relpath", "project", b"project", "project_url", b"project_url", "quiet", b"quiet", "reinit", b"reinit", "relogin", b"relogin", "resume", b"resume", "resume_fname", b"resume_fname", "resumed", b"resumed", "root_dir", b"root_dir", "run_group", b"run_group", "run_id", b"run_id", "run_job_type", b"run_job_type", "run_mode", b"run_mode", "run_name", b"run_name", "run_notes", b"run_notes", "run_tags", b"run_tags", "run_url", b"run_url", "sagemaker_disable", b"sagemaker_disable", "save_code", b"save_code", "settings_system", b"settings_system", "settings_workspace", b"settings_workspace", "show_colors", b"show_colors", "show_emoji", b"show_emoji", "show_errors", b"show_errors", "show_info", b"show_info", "show_warnings", b"show_warnings", "silent", b"silent", "start_method", b"start_method", "strict", b"strict", "summary_errors", b"summary_errors", "summary_timeout", b"summary_timeout", "summary_warnings", b"summary_warnings", "sweep_id", b"sweep_id", "sweep_param_path", b"sweep_param_path", "sweep_url", b"sweep_url", "symlink", b"symlink", "sync_dir", b"sync_dir", "sync_file", b"sync_file", "sync_symlink_latest", b"sync_symlink_latest", "system_sample", b"system_sample", "system_sample_seconds", b"system_sample_seconds", "table_raise_on_max_row_limit_exceeded", b"table_raise_on_max_row_limit_exceeded", "timespec", b"timespec", "tmp_dir", b"tmp_dir", "username", b"username", "wandb_dir", b"wandb_dir"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing_extensions.Literal["_args", b"_args", "_async_upload_concurrency_limit", b"_async_upload_concurrency_limit", "_aws_lambda", b"_aws_lambda", "_cli_only_mode", b"_cli_only_mode", "_colab", b"_colab", "_cuda", b"_cuda", "_disable_meta", b"_disable_meta", "_disable_service", b"_disable_service", "_disable_setproctitle", b"_disable_setproctitle", "_disable_stats", b"_disable_stats", "_disable_viewer", b"_disable_viewer", "_except_exit", b"_except_exit", "_executable", b"_executable", "_extra_http_headers", b"_extra_http_headers", "_file_stream_timeout_seconds", b"_file_stream_timeout_seconds", "_flow_control_custom", b"_flow_control_custom", "_flow_control_disabled", b"_flow_control_disabled", "_internal_check_process", b"_internal_check_process", "_internal_queue_timeout", b"_internal_queue_timeout", "_ipython", b"_ipython", "_jupyter", b"_jupyter", "_jupyter_name", b"_jupyter_name", "_jupyter_path", b"_jupyter_path", "_jupyter_root", b"_jupyter_root", "_kaggle", b"_kaggle", "_live_policy_rate_limit", b"_live_policy_rate_limit", "_live_policy_wait_time", b"_live_policy_wait_time", "_log_level", b"_log_level", "_network_buffer", b"_network_buffer", "_noop", b"_noop", "_notebook", b"_notebook", "_offline", b"_offline", "_os", b"_os", "_platform", b"_platform", "_python", b"_python", "_require_nexus", b"_require_nexus", "_runqueue_item_id", b"_runqueue_item_id", "_save_requirements", b"_save_requirements", "_service_transport", b"_service_transport", "_service_wait", b"_service_wait", "_start_datetime", b"_start_datetime", "_start_time", b"_start_time", "_stats_join_assets", b"_stats_join_assets", "_stats_neuron_monitor_config_path", b"_stats_neuron_monitor_config_path", "_stats_open_metrics_endpoints", b"_stats_open_metrics_endpoints", "_stats_open_metrics_filters", b"_stats_open_metrics_filters", "_stats_pid", b"_stats_pid", "_stats_sample_rate_seconds", b"_stats_sample_rate_seconds", "_stats_samples_to_average", b"_stats_samples_to_average", "_sync", b"_sync", "_tmp_code_dir", b"_tmp_code_dir", "_tracelog", b"_tracelog", "_unsaved_keys", b"_unsaved_keys", "_windows", b"_windows", "allow_val_change", b"allow_val_change", "anonymous", b"anonymous", "api_key", b"api_key", "azure_account_url_to_access_key", b"azure_account_url_to_access_key", "base_url", b"base_url", "code_dir", b"code_dir", "config_paths", b"config_paths", "console", b"console", "deployment", b"deployment", "disable_code", b"disable_code", "disable_git", b"disable_git", "disable_hints", b"disable_hints", "disable_job_creation", b"disable_job_creation", "disabled", b"disabled", "docker", b"docker", "email", b"email", "entity", b"entity", "files_dir", b"files_dir", "force", b"force", "git_commit", b"git_commit", "git_remote", b"git_remote", "git_remote_url", b"git_remote_url", "git_root", b"git_root", "heartbeat_seconds", b"heartbeat_seconds", "host", b"host", "ignore_globs", b"ignore_globs", "init_timeout", b"init_timeout", "is_local", b"is_local", "job_name", b"job_name", "job_source", b"job_source", "label_disable", b"label_disable", "launch", b"launch", "launch_config_path", b"launch_config_path", "log_dir", b"log_dir", "log_internal", b"log_internal", "log_symlink_internal", b"log_symlink_internal", "log_symlink_user", b"log_symlink_user", "log_user", b"log_user", "login_timeout", b"login_timeout", "mode", b"mode", "notebook_name", b"notebook_name", "problem", b"problem", "program", b"program", "program_relpath", b"program_relpath", "project", b"project", "project_url", b"project_url", "quiet", b"quiet", "reinit", b"reinit", "relogin", b"relogin", "resume", b"resume", "resume_fname", b"resume_fname", "resumed", b"resumed", "root_dir", b"root_dir", "run_group", b"run_group", "run_id", b"run_id", "run_job_type", b"run_job_type", "run_mode", b"run_mode", "run_name", b"run_name", "run_notes", b"run_notes", "run_tags", b"run_tags", "run_url", b"run_url", "sagemaker_disable", b"sagemaker_disable", "save_code", b"save_code", "settings_system", b"settings_system", "settings_workspace", b"settings_workspace", "show_colors", b"show_colors", "show_emoji", b"show_emoji", "show_errors", b"show_errors", "show_info", b"show_info", "show_warnings", b"show_warnings", "silent", b"silent", "start_method", b"start_method", "strict", b"strict", "summary_errors", b"summary_errors", "summary_timeout", b"summary_timeout", "summary_warnings", b"summary_warnings", "sweep_id", b"sweep_id", "sweep_param_path", b"sweep_param_path", "sweep_url", b"sweep_url", "symlink", b"symlink", "sync_dir", b"sync_dir", "sync_file", b"sync_file", "sync_symlink_latest", b"sync_symlink_latest", "system_sample", b"system_sample", "system_sample_seconds", b"system_sample_seconds", "table_raise_on_max_row_limit_exceeded", b"table_raise_on_max_row_limit_exceeded", "timespec", b"timespec", "tmp_dir", b"tmp_dir", "username", b"username", "wandb_dir", b"wandb_dir"]) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["_args", b"_args", "_async_publish", b"_async_publish", "_async_publish_max_size", b"_async_publish_max_size", "_async_upload_concurrency_limit", b"_async_upload_concurrency_limit", "_aws_lambda", b"_aws_lambda", "_cli_only_mode", b"_cli_only_mode", "_coalesce_history", b"_coalesce_history", "_colab", b"_colab", "_cuda", b"_cuda", "_disable_meta", b"_disable_meta", "_disable_service", b"_disable_service", "_disable_setproctitle", b"_disable_setproctitle", "_disable_stats", b"_disable_stats", "_disable_viewer", b"_disable_viewer", "_except_exit", b"_except_exit", "_executable", b"_executable", "_extra_http_headers", b"_extra_http_headers", "_file_stream_compression", b"_file_stream_compression", "_file_stream_max_backlog_bytes", b"_file_stream_max_backlog_bytes", "_file_stream_max_inflight", b"_file_stream_max_inflight", "_file_stream_timeout_seconds", b"_file_stream_timeout_seconds", "_flow_control_custom", b"_flow_control_custom", "_flow_control_disabled", b"_flow_control_disabled", "_internal_check_process", b"_internal_check_process", "_internal_queue_timeout", b"_internal_queue_timeout", "_ipython", b"_ipython", "_jupyter", b"_jupyter", "_jupyter_name", b"_jupyter_name", "_jupyter_path", b"_jupyter_path", "_jupyter_root", b"_jupyter_root", "_kaggle", b"_kaggle", "_live_policy_rate_limit", b"_live_policy_rate_limit", "_live_policy_wait_time", b"_live_policy_wait_time", "_log_level", b"_log_level", "_max_upload_jobs", b"_max_upload_jobs", "_network_buffer", b"_network_buffer", "_noop", b"_noop", "_notebook", b"_notebook", "_offline", b"_offline", "_os", b"_os", "_pipeline_stats", b"_pipeline_stats", "_pipeline_stats_port", b"_pipeline_stats_port", "_platform", b"_platform", "_python", b"_python", "_require_nexus", b"_require_nexus", "_runqueue_item_id", b"_runqueue_item_id", "_save_requirements", b"_save_requirements", "_service_transport", b"_service_transport", "_service_wait", b"_service_wait", "_start_datetime", b"_start_datetime", "_start_time", b"_start_time", "_stats_join_assets", b"_stats_join_assets", "_stats_neuron_monitor_config_path", b"_stats_neuron_monitor_config_path", "_stats_open_metrics_endpoints", b"_stats_open_metrics_endpoints", "_stats_open_metrics_filters", b"_stats_open_metrics_filters", "_stats_pid", b"_stats_pid", "_stats_sample_rate_seconds", b"_stats_sample_rate_seconds", "_stats_samples_to_average", b"_stats_samples_to_average", "_sync", b"_sync", "_tmp_code_dir", b"_tmp_code_dir", "_tracelog", b"_tracelog", "_unsaved_keys", b"_unsaved_keys", "_windows", b"_windows", "allow_val_change", b"allow_val_change", "anonymous", b"anonymous", "api_key", b"api_key", "azure_account_url_to_access_key", b"azure_account_url_to_access_key", "base_url", b"base_url", "code_dir", b"code_dir", "config_paths", b"config_paths", "console", b"console", "deployment", b"deployment", "disable_code", b"disable_code", "disable_git", b"disable_git", "disable_hints", b"disable_hints", "disable_job_creation", b"disable_job_creation", "disabled", b"disabled", "docker", b"docker", "email", b"email", "entity", b"entity", "files_dir", b"files_dir", "force", b"force", "git_commit", b"git_commit", "git_remote", b"git_remote", "git_remote_url", b"git_remote_url", "git_root", b"git_root", "heartbeat_seconds", b"heartbeat_seconds", "host", b"host", "ignore_globs", b"ignore_globs", "init_timeout", b"init_timeout", "is_local", b"is_local", "job_name", b"job_name", "job_source", b"job_source", "label_disable", b"label_disable", "launch", b"launch", "launch_config_path", b"launch_config_path", "log_dir", b"log_dir", "log_internal", b"log_internal", "log_symlink_internal", b"log_symlink_internal", "log_symlink_user", b"log_symlink_user", "log_user", b"log_user", "login_timeout", b"login_timeout", "mode", b"mode", "notebook_name", b"notebook_name", "problem", b"problem", "program", b"program", "program_relpath", b"program_relpath", "project", b"project", "project_url", b"project_url", "quiet", b"quiet", "reinit", b"reinit", "relogin", b"relogin", "resume", b"resume", "resume_fname", b"resume_fname", "resumed", b"resumed", "root_dir", b"root_dir", "run_group", b"run_group", "run_id", b"run_id", "run_job_type", b"run_job_type", "run_mode", b"run_mode", "run_name", b"run_name", "run_notes", b"run_notes", "run_tags", b"run_tags", "run_url", b"run_url", "sagemaker_disable", b"sagemaker_disable", "save_code", b"save_code", "settings_system", b"settings_system", "settings_workspace", b"settings_workspace", "show_colors", b"show_colors", "show_emoji", b"show_emoji", "show_errors", b"show_errors", "show_info", b"show_info", "show_warnings", b"show_warnings", "silent", b"silent", "start_method", b"start_method", "strict", b"strict", "summary_errors", b"summary_errors", "summary_timeout", b"summary_timeout", "summary_warnings", b"summary_warnings", "sweep_id", b"sweep_id", "sweep_param_path", b"sweep_param_path", "sweep_url", b"sweep_url", "symlink", b"symlink", "sync_dir", b"sync_dir", "sync_file", b"sync_file", "sync_symlink_latest", b"sync_symlink_latest", "system_sample", b"system_sample", "system_sample_seconds", b"system_sample_seconds", "table_raise_on_max_row_limit_exceeded", b"table_raise_on_max_row_limit_exceeded", "timespec", b"timespec", "tmp_dir", b"tmp_dir", "username", b"username", "wandb_dir", b"wandb_dir"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["_args", b"_args", "_async_publish", b"_async_publish", "_async_publish_max_size", b"_async_publish_max_size", "_async_upload_concurrency_limit", b"_async_upload_concurrency_limit", "_aws_lambda", b"_aws_lambda", "_cli_only_mode", b"_cli_only_mode", "_coalesce_history", b"_coalesce_history", "_colab", b"_colab", "_cuda", b"_cuda", "_disable_meta", b"_disable_meta", "_disable_service", b"_disable_service", "_disable_setproctitle", b"_disable_setproctitle", "_disable_stats", b"_disable_stats", "_disable_viewer", b"_disable_viewer", "_except_exit", b"_except_exit", "_executable", b"_executable", "_extra_http_headers", b"_extra_http_headers", "_file_stream_compression", b"_file_stream_compression", "_file_stream_max_backlog_bytes", b"_file_stream_max_backlog_bytes", "_file_stream_max_inflight", b"_file_stream_max_inflight", "_file_stream_timeout_seconds", b"_file_stream_timeout_seconds", "_flow_control_custom", b"_flow_control_custom", "_flow_control_disabled", b"_flow_control_disabled", "_internal_check_process", b"_internal_check_process", "_internal_queue_timeout", b"_internal_queue_timeout", "_ipython", b"_ipython", "_jupyter", b"_jupyter", "_jupyter_name", b"_jupyter_name", "_jupyter_path", b"_jupyter_path", "_jupyter_root", b"_jupyter_root", "_kaggle", b"_kaggle", "_live_policy_rate_limit", b"_live_policy_rate_limit", "_live_policy_wait_time", b"_live_policy_wait_time", "_log_level", b"_log_level", "_max_upload_jobs", b"_max_upload_jobs", "_network_buffer", b"_network_buffer", "_noop", b"_noop", "_notebook", b"_notebook", "_offline", b"_offline", "_os", b"_os", "_pipeline_stats", b"_pipeline_stats", "_pipeline_stats_port", b"_pipeline_stats_port", "_platform", b"_platform", "_python", b"_python", "_require_nexus", b"_require_nexus", "_runqueue_item_id", b"_runqueue_item_id", "_save_requirements", b"_save_requirements", "_service_transport", b"_service_transport", "_service_wait", b"_service_wait", "_start_datetime", b"_start_datetime", "_start_time", b"_start_time", "_stats_join_assets", b"_stats_join_assets", "_stats_neuron_monitor_config_path", b"_stats_neuron_monitor_config_path", "_stats_open_metrics_endpoints", b"_stats_open_metrics_endpoints", "_stats_open_metrics_filters", b"_stats_open_metrics_filters", "_stats_pid", b"_stats_pid", "_stats_sample_rate_seconds", b"_stats_sample_rate_seconds", "_stats_samples_to_average", b"_stats_samples_to_average", "_sync", b"_sync", "_tmp_code_dir", b"_tmp_code_dir", "_tracelog", b"_tracelog", "_unsaved_keys", b"_unsaved_keys", "_windows", b"_windows", "allow_val_change", b"allow_val_change", "anonymous", b"anonymous", "api_key", b"api_key", "azure_account_url_to_access_key", b"azure_account_url_to_access_key", "base_url", b"base_url", "code_dir", b"code_dir", "config_paths", b"config_paths", "console", b"console", "deployment", b"deployment", "disable_code", b"disable_code", "disable_git", b"disable_git", "disable_hints", b"disable_hints", "disable_job_creation", b"disable_job_creation", "disabled", b"disabled", "docker", b"docker", "email", b"email", "entity", b"entity", "files_dir", b"files_dir", "force", b"force", "git_commit", b"git_commit", "git_remote", b"git_remote", "git_remote_url", b"git_remote_url", "git_root", b"git_root", "heartbeat_seconds", b"heartbeat_seconds", "host", b"host", "ignore_globs", b"ignore_globs", "init_timeout", b"init_timeout", "is_local", b"is_local", "job_name", b"job_name", "job_source", b"job_source", "label_disable", b"label_disable", "launch", b"launch", "launch_config_path", b"launch_config_path", "log_dir", b"log_dir", "log_internal", b"log_internal", "log_symlink_internal", b"log_symlink_internal", "log_symlink_user", b"log_symlink_user", "log_user", b"log_user", "login_timeout", b"login_timeout", "mode", b"mode", "notebook_name", b"notebook_name", "problem", b"problem", "program", b"program", "program_relpath", b"program_relpath", "project", b"project", "project_url", b"project_url", "quiet", b"quiet", "reinit", b"reinit", "relogin", b"relogin", "resume", b"resume", "resume_fname", b"resume_fname", "resumed", b"resumed", "root_dir", b"root_dir", "run_group", b"run_group", "run_id", b"run_id", "run_job_type", b"run_job_type", "run_mode", b"run_mode", "run_name", b"run_name", "run_notes", b"run_notes", "run_tags", b"run_tags", "run_url", b"run_url", "sagemaker_disable", b"sagemaker_disable", "save_code", b"save_code", "settings_system", b"settings_system", "settings_workspace", b"settings_workspace", "show_colors", b"show_colors", "show_emoji", b"show_emoji", "show_errors", b"show_errors", "show_info", b"show_info", "show_warnings", b"show_warnings", "silent", b"silent", "start_method", b"start_method", "strict", b"strict", "summary_errors", b"summary_errors", "summary_timeout", b"summary_timeout", "summary_warnings", b"summary_warnings", "sweep_id", b"sweep_id", "sweep_param_path", b"sweep_param_path", "sweep_url", b"sweep_url", "symlink", b"symlink", "sync_dir", b"sync_dir", "sync_file", b"sync_file", "sync_symlink_latest", b"sync_symlink_latest", "system_sample", b"system_sample", "system_sample_seconds", b"system_sample_seconds", "table_raise_on_max_row_limit_exceeded", b"table_raise_on_max_row_limit_exceeded", "timespec", b"timespec", "tmp_dir", b"tmp_dir", "username", b"username", "wandb_dir", b"wandb_dir"]) -> None: ...
 
 global___Settings = Settings
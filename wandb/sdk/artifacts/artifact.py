@@ -1,13 +1,13 @@
 """Artifact class."""
-import concurrent.futures
+import codecs
+import collections
 import contextlib
 import datetime
+import fnmatch
 import json
-import multiprocessing.dummy
 import os
 import platform
 import re
-import shutil
 import tempfile
 import time
 from copy import copy
@@ -17,8 +17,10 @@ from typing import (
     IO,
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Generator,
+    Iterable,
     List,
     Optional,
     Sequence,
@@ -46,19 +48,31 @@ from wandb.sdk.artifacts.artifact_manifests.artifact_manifest_v1 import (
 )
 from wandb.sdk.artifacts.artifact_saver import get_staging_dir
 from wandb.sdk.artifacts.artifact_state import ArtifactState
+from wandb.sdk.artifacts.artifact_view import ArtifactView, fetch_entry
 from wandb.sdk.artifacts.artifacts_cache import get_artifacts_cache
+from wandb.sdk.artifacts.download_scheduler import DownloadScheduler
 from wandb.sdk.artifacts.exceptions import (
     ArtifactFinalizedError,
     ArtifactNotLoggedError,
     WaitTimeoutError,
 )
+from wandb.sdk.artifacts.manifest_entries import ManifestEntries, load_manifest_json
+from wandb.sdk.artifacts.staging import StagedFile, stage_file, stage_files
 from wandb.sdk.artifacts.storage_layout import StorageLayout
+from wandb.sdk.artifacts.storage_policies.chunked_storage_policy import (
+    ChunkedStoragePolicy,
+)
 from wandb.sdk.artifacts.storage_policies.wandb_storage_policy import WandbStoragePolicy
 from wandb.sdk.data_types._dtypes import Type as WBType
 from wandb.sdk.data_types._dtypes import TypeRegistry
 from wandb.sdk.internal.thread_local_settings import _thread_local_api_settings
 from wandb.sdk.lib import filesystem, retry, runid, telemetry
-from wandb.sdk.lib.hashutil import B64MD5, b64_to_hex_id, md5_file_b64
+from wandb.sdk.lib.hashutil import (
+    B64MD5,
+    b64_to_hex_id,
+    md5_file_b64,
+    md5_file_b64_unindexed,
+)
 from wandb.sdk.lib.paths import FilePathStr, LogicalPath, StrPath, URIStr
 
 reset_path = util.vendor_setup()
@@ -169,7 +183,10 @@ class Artifact:
         storage_layout = (
             StorageLayout.V1 if env.get_use_v1_artifacts() else StorageLayout.V2
         )
-        self._storage_policy = WandbStoragePolicy(
+        storage_policy_cls = (
+            ChunkedStoragePolicy if env.get_artifact_chunking() else WandbStoragePolicy
+        )
+        self._storage_policy = storage_policy_cls(
             config={
                 "storageLayout": storage_layout,
                 #  TODO: storage region
@@ -602,6 +619,9 @@ class Artifact:
         """
         total_size: int = 0
         for entry in self.manifest.entries.values():
+            if self._is_chunk_path(entry.path):
+                # counted in the size of the files they make up
+                continue
             if entry.size is not None:
                 total_size += entry.size
         return total_size
@@ -1069,9 +1089,10 @@ class Artifact:
             raise ValueError("Path is not a file: %s" % local_path)
 
         name = LogicalPath(name or os.path.basename(local_path))
-        digest = md5_file_b64(local_path)
+        digest = None
 
         if is_tmp:
+            digest = md5_file_b64(local_path)
             file_path, file_name = os.path.split(name)
             file_name_parts = file_name.split(".")
             file_name_parts[0] = b64_to_hex_id(digest)[:20]
@@ -1123,17 +1144,20 @@ class Artifact:
                     logical_path = os.path.join(name, logical_path)
                 paths.append((logical_path, physical_path))
 
-        def add_manifest_file(log_phy_path: Tuple[str, str]) -> None:
-            logical_path, physical_path = log_phy_path
-            self._add_local_file(logical_path, physical_path)
-
-        num_threads = 8
-        pool = multiprocessing.dummy.Pool(num_threads)
-        pool.map(add_manifest_file, paths)
-        pool.close()
-        pool.join()
+        strategies: "collections.Counter[str]" = collections.Counter()
+        for logical_path, physical_path, staged in stage_files(
+            paths, get_staging_dir()
+        ):
+            self._add_staged_file(logical_path, physical_path, staged)
+            strategies[staged.strategy] += 1
 
-        termlog("Done. %.1fs" % (time.time() - start_time), prefix=False)
+        staged = ", ".join(f"{n} {s}" for s, n in strategies.most_common())
+        termlog(
+            "Done. {:.1f}s{}".format(
+                time.time() - start_time, f" ({staged})" if staged else ""
+            ),
+            prefix=False,
+        )
 
     def add_reference(
         self,
@@ -1353,19 +1377,33 @@ class Artifact:
     def _add_local_file(
         self, name: StrPath, path: StrPath, digest: Optional[B64MD5] = None
     ) -> ArtifactManifestEntry:
-        with tempfile.NamedTemporaryFile(dir=get_staging_dir(), delete=False) as f:
-            staging_path = f.name
-            shutil.copyfile(path, staging_path)
-            os.chmod(staging_path, 0o400)
+        staged = stage_file(path, get_staging_dir(), digest=digest)
+        return self._add_staged_file(name, path, staged)
 
+    def _add_staged_file(
+        self, name: StrPath, path: StrPath, staged: StagedFile
+    ) -> ArtifactManifestEntry:
         entry = ArtifactManifestEntry(
             path=name,
-            digest=digest or md5_file_b64(staging_path),
-            size=os.path.getsize(staging_path),
-            local_path=staging_path,
+            digest=staged.digest,
+            size=os.path.getsize(staged.path),
+            local_path=staged.path,
         )
 
+        chunk_entries = []
+        if isinstance(self._storage_policy, ChunkedStoragePolicy):
+            chunk_entries = self._storage_policy.split_entry(entry)
         self.manifest.add_entry(entry)
+        for chunk_entry in chunk_entries:
+            self.manifest.add_entry(chunk_entry)
+        if chunk_entries:
+            # the chunks are uploaded from the cache, drop the staging copy
+            try:
+                if os.stat(staged.path).st_nlink == 1:
+                    os.chmod(staged.path, 0o600)
+                os.remove(staged.path)
+            except OSError:
+                pass
         self._added_local_paths[os.fspath(path)] = entry
         return entry
 
@@ -1551,6 +1589,8 @@ class Artifact:
         root: Optional[str] = None,
         recursive: bool = False,
         allow_missing_references: bool = False,
+        verify: bool = False,
+        include: Optional[Union[str, Sequence[str]]] = None,
     ) -> FilePathStr:
         """Download the contents of the artifact to the specified root directory.
 
@@ -1558,10 +1598,20 @@ class Artifact:
         root before calling `download` if you want the contents of `root` to exactly
         match the artifact.
 
+        Files already in `root` are checked against the digest recorded when they
+        were last downloaded, which only needs a `stat` of each file as long as it
+        is unchanged. Files are linked from the cache instead of copied where the
+        filesystem supports it.
+
         Arguments:
             root: The directory in which to download this artifact's files.
             recursive: If true, then all dependent artifacts are eagerly downloaded.
                 Otherwise, the dependent artifacts are downloaded as needed.
+            verify: If true, hash every file in `root` rather than trusting the
+                recorded digests, and check every downloaded file.
+            include: Glob pattern, or list of patterns, of the files to download,
+                e.g. `"train/*.png"`. Defaults to all files. Use `view()` to
+                fetch files lazily instead.
 
         Returns:
             The path to the downloaded contents.
@@ -1575,8 +1625,16 @@ class Artifact:
         root = root or self._default_root()
         self._add_download_root(root)
 
-        nfiles = len(self.manifest.entries)
-        size = sum(e.size or 0 for e in self.manifest.entries.values())
+        entry_paths = self._paths_matching(include)
+        if not verify and self._is_downloaded_to(root, entry_paths):
+            # nothing to download, skip fetching the file urls
+            if recursive:
+                for dependent_artifact in self._dependent_artifacts:
+                    dependent_artifact.download()
+            return FilePathStr(root)
+
+        nfiles = len(entry_paths)
+        size = sum(self.manifest.entries[path].size or 0 for path in entry_paths)
         log = False
         if nfiles > 5000 or size > 50 * 1024 * 1024:
             log = True
@@ -1599,7 +1657,7 @@ class Artifact:
             _thread_local_api_settings.headers = headers
 
             try:
-                entry.download(root)
+                entry.download(root, verify=verify)
             except FileNotFoundError as e:
                 if allow_missing_references:
                     wandb.termwarn(str(e))
@@ -1614,29 +1672,7 @@ class Artifact:
             headers=_thread_local_api_settings.headers,
         )
 
-        with concurrent.futures.ThreadPoolExecutor(64) as executor:
-            active_futures = set()
-            has_next_page = True
-            cursor = None
-            while has_next_page:
-                attrs = self._fetch_file_urls(cursor)
-                has_next_page = attrs["pageInfo"]["hasNextPage"]
-                cursor = attrs["pageInfo"]["endCursor"]
-                for edge in attrs["edges"]:
-                    entry = self.get_path(edge["node"]["name"])
-                    entry._download_url = edge["node"]["directUrl"]
-                    active_futures.add(executor.submit(download_entry, entry))
-                # Wait for download threads to catch up.
-                max_backlog = 5000
-                if len(active_futures) > max_backlog:
-                    for future in concurrent.futures.as_completed(active_futures):
-                        future.result()  # check for errors
-                        active_futures.remove(future)
-                        if len(active_futures) <= max_backlog:
-                            break
-            # Check for errors.
-            for future in concurrent.futures.as_completed(active_futures):
-                future.result()
+        self._download_entries(entry_paths, download_entry)
 
         if recursive:
             for dependent_artifact in self._dependent_artifacts:
@@ -1654,6 +1690,67 @@ class Artifact:
             )
         return FilePathStr(root)
 
+    def _download_entries(
+        self,
+        entry_paths: Set[str],
+        download_entry: Callable[[ArtifactManifestEntry], None],
+    ) -> None:
+        listed: Set[str] = set()
+        with DownloadScheduler(download_entry) as scheduler:
+            has_next_page = True
+            cursor = None
+            while has_next_page:
+                attrs = self._fetch_file_urls(cursor)
+                has_next_page = attrs["pageInfo"]["hasNextPage"]
+                cursor = attrs["pageInfo"]["endCursor"]
+                for edge in attrs["edges"]:
+                    if edge["node"]["name"] not in entry_paths:
+                        continue
+                    entry = self.get_path(edge["node"]["name"])
+                    entry._download_url = edge["node"]["directUrl"]
+                    scheduler.submit(entry)
+                    listed.add(entry.path)
+            # chunked files may only be listed as their chunks
+            for path in entry_paths - listed:
+                entry = self.get_path(path)
+                if entry.extra.get("chunks"):
+                    scheduler.submit(entry)
+
+    def _is_downloaded_to(self, root: str, paths: Iterable[str]) -> bool:
+        return all(
+            self.manifest.entries[path]._is_downloaded(os.path.join(root, path))
+            for path in paths
+        )
+
+    def _is_chunk_path(self, path: str) -> bool:
+        policy = self.manifest.storage_policy
+        return isinstance(policy, ChunkedStoragePolicy) and policy.is_chunk_path(path)
+
+    def _file_paths(self) -> Iterable[str]:
+        """Return the paths of the files of the artifact, leaving out chunks."""
+        # iterate over paths rather than entries, so entries are only
+        # materialized from a compact manifest one at a time
+        paths: Iterable[str] = self.manifest.entries
+        policy = self.manifest.storage_policy
+        if isinstance(policy, ChunkedStoragePolicy):
+            # chunks are only stored as part of the files they make up
+            paths = (path for path in paths if not policy.is_chunk_path(path))
+        return paths
+
+    def _paths_matching(
+        self, patterns: Optional[Union[str, Sequence[str]]]
+    ) -> Set[str]:
+        paths = self._file_paths()
+        if patterns is None:
+            return set(paths)
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        return {
+            path
+            for path in paths
+            if any(fnmatch.fnmatchcase(path, pattern) for pattern in patterns)
+        }
+
     @retry.retriable(
         retry_timedelta=datetime.timedelta(minutes=3),
         retryable_exceptions=(requests.RequestException),
@@ -1754,15 +1851,52 @@ class Artifact:
                     )
 
         ref_count = 0
-        for entry in self.manifest.entries.values():
+        for path in self._file_paths():
+            entry = self.manifest.entries[path]
             if entry.ref is None:
-                if md5_file_b64(os.path.join(root, entry.path)) != entry.digest:
+                local_path = os.path.join(root, entry.path)
+                if md5_file_b64_unindexed(local_path) != entry.digest:
                     raise ValueError("Digest mismatch for file: %s" % entry.path)
             else:
                 ref_count += 1
         if ref_count > 0:
             print("Warning: skipped verification of %s refs" % ref_count)
 
+    def view(self, read_ahead: int = 8) -> ArtifactView:
+        """Get a lazy, read-only view of the files of this artifact.
+
+        Files are fetched into the artifacts cache on first access instead of
+        being downloaded up front, see `ArtifactView`.
+
+        Arguments:
+            read_ahead: The number of files fetched ahead of the reader by
+                `ArtifactView.iter_files`.
+
+        Raises:
+            ArtifactNotLoggedError: if the artifact has not been logged
+        """
+        if self._state == ArtifactState.PENDING:
+            raise ArtifactNotLoggedError(self, "view")
+        return ArtifactView(self, read_ahead=read_ahead)
+
+    def open(self, name: StrPath, mode: str = "r", **kwargs: Any) -> IO:
+        """Open a file of this artifact for reading, fetching only that file.
+
+        Arguments:
+            name: The artifact relative name of the file.
+            mode: The mode to open the file with, "r" or "rb".
+
+        Raises:
+            ArtifactNotLoggedError: if the artifact has not been logged
+            KeyError: if the artifact doesn't contain an entry with the given name
+            ValueError: if the mode isn't a read-only mode
+        """
+        if self._state == ArtifactState.PENDING:
+            raise ArtifactNotLoggedError(self, "open")
+        if any(flag in mode for flag in "wax+"):
+            raise ValueError(f"Artifact files can only be opened for reading: {mode}")
+        return open(fetch_entry(self.get_path(name)), mode, **kwargs)
+
     def file(self, root: Optional[str] = None) -> StrPath:
         """Download a single file artifact to dir specified by the root.
 
@@ -2095,16 +2229,20 @@ class Artifact:
         )
 
     def _load_manifest(self, url: str) -> None:
-        with requests.get(url) as request:
+        with requests.get(url, stream=True) as request:
             request.raise_for_status()
+            # stream the manifest, it can be too large to hold as a document
+            chunks = request.iter_content(chunk_size=1024 * 1024)
             self._manifest = ArtifactManifest.from_manifest_json(
-                json.loads(util.ensure_text(request.content))
+                load_manifest_json(codecs.iterdecode(chunks, "utf-8"))
             )
-        for entry in self.manifest.entries.values():
-            if entry._is_artifact_reference():
-                assert self._client is not None
-                dep_artifact = entry._get_referenced_artifact(self._client)
-                self._dependent_artifacts.add(dep_artifact)
+        entries = self.manifest.entries
+        assert isinstance(entries, ManifestEntries)
+        # only materialize the few entries that reference other artifacts
+        for path in entries.paths_with_ref_prefix("wandb-artifact://"):
+            assert self._client is not None
+            dep_artifact = entries[path]._get_referenced_artifact(self._client)
+            self._dependent_artifacts.add(dep_artifact)
 
 
 class _ArtifactVersionType(WBType):
@@ -1,6 +1,7 @@
 """Artifact manifest."""
-from typing import TYPE_CHECKING, Dict, List, Mapping, Optional
+from typing import TYPE_CHECKING, Dict, List, Mapping, MutableMapping, Optional
 
+from wandb.sdk.artifacts.manifest_entries import ManifestEntries
 from wandb.sdk.lib.hashutil import HexMD5
 
 if TYPE_CHECKING:
@@ -11,7 +12,7 @@ if TYPE_CHECKING:
 
 
 class ArtifactManifest:
-    entries: Dict[str, "ArtifactManifestEntry"]
+    entries: MutableMapping[str, "ArtifactManifestEntry"]
 
     @classmethod
     def from_manifest_json(cls, manifest_json: Dict) -> "ArtifactManifest":
@@ -33,7 +34,12 @@ class ArtifactManifest:
         entries: Optional[Mapping[str, "ArtifactManifestEntry"]] = None,
     ) -> None:
         self.storage_policy = storage_policy
-        self.entries = dict(entries) if entries else {}
+        self.entries: MutableMapping[str, "ArtifactManifestEntry"]
+        if isinstance(entries, ManifestEntries):
+            # parsed entries are stored compactly, don't copy them into a dict
+            self.entries = entries
+        else:
+            self.entries = dict(entries) if entries else {}
 
     def to_manifest_json(self) -> Dict:
         raise NotImplementedError
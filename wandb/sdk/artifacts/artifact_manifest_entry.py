@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Dict, Optional, Union
 from urllib.parse import urlparse
 
 import wandb
-from wandb import util
+from wandb import env, util
 from wandb.errors.term import termwarn
 from wandb.sdk.lib import filesystem
 from wandb.sdk.lib.hashutil import (
@@ -13,7 +13,10 @@ from wandb.sdk.lib.hashutil import (
     ETag,
     b64_to_hex_id,
     hex_to_b64_id,
+    lookup_md5_file_b64,
     md5_file_b64,
+    md5_file_b64_unindexed,
+    record_md5_file_b64,
 )
 from wandb.sdk.lib.paths import FilePathStr, LogicalPath, StrPath, URIStr
 
@@ -72,12 +75,15 @@ class ArtifactManifestEntry:
             raise NotImplementedError
         return self._parent_artifact
 
-    def download(self, root: Optional[str] = None) -> FilePathStr:
+    def download(self, root: Optional[str] = None, verify: bool = False) -> FilePathStr:
         """Download this artifact entry to the specified root path.
 
         Arguments:
             root: (str, optional) The root path in which to download this
                 artifact entry. Defaults to the artifact's root.
+            verify: (bool, optional) Hash an existing file at the destination
+                rather than trusting the digest recorded when it was last
+                downloaded or hashed, and check the downloaded file.
 
         Returns:
             (str): The path of the downloaded artifact entry.
@@ -91,7 +97,7 @@ class ArtifactManifestEntry:
 
         # Skip checking the cache (and possibly downloading) if the file already exists
         # and has the digest we're expecting.
-        if os.path.exists(dest_path) and self.digest == md5_file_b64(dest_path):
+        if self._is_downloaded(dest_path, verify):
             return FilePathStr(dest_path)
 
         if self.ref is not None:
@@ -102,9 +108,27 @@ class ArtifactManifestEntry:
             cache_path = self._parent_artifact.manifest.storage_policy.load_file(
                 self._parent_artifact, self
             )
-        return FilePathStr(
-            str(filesystem.copy_or_overwrite_changed(cache_path, dest_path))
+        dest_path = str(
+            filesystem.link_or_copy_changed(
+                cache_path, dest_path, hardlink=env.get_artifact_download_hardlink()
+            )
         )
+        if self.ref is None:
+            if verify and md5_file_b64_unindexed(dest_path) != self.digest:
+                raise ValueError(
+                    f"Digest mismatch for {dest_path}, the cached file is corrupt"
+                )
+            # the next download of this file only needs to stat it
+            record_md5_file_b64(dest_path, os.stat(dest_path), B64MD5(self.digest))
+        return FilePathStr(dest_path)
+
+    def _is_downloaded(self, dest_path: str, verify: bool = False) -> bool:
+        if not os.path.isfile(dest_path):
+            return False
+        if verify:
+            return md5_file_b64_unindexed(dest_path) == self.digest
+        digest = lookup_md5_file_b64(dest_path) or md5_file_b64(dest_path)
+        return digest == self.digest
 
     def ref_target(self) -> Union[FilePathStr, URIStr]:
         """Get the reference URL that is targeted by this artifact entry.
@@ -3,6 +3,10 @@ from typing import Any, Dict, Mapping, Optional
 
 from wandb.sdk.artifacts.artifact_manifest import ArtifactManifest
 from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
+from wandb.sdk.artifacts.manifest_entries import ManifestEntries
+from wandb.sdk.artifacts.storage_policies.chunked_storage_policy import (  # noqa: F401
+    ChunkedStoragePolicy,
+)
 from wandb.sdk.artifacts.storage_policies.wandb_storage_policy import WandbStoragePolicy
 from wandb.sdk.artifacts.storage_policy import StoragePolicy
 from wandb.sdk.lib.hashutil import HexMD5, _md5
@@ -31,19 +35,10 @@ class ArtifactManifestV1(ArtifactManifest):
                 % storage_policy_name
             )
 
-        entries: Mapping[str, ArtifactManifestEntry]
-        entries = {
-            name: ArtifactManifestEntry(
-                path=name,
-                digest=val["digest"],
-                birth_artifact_id=val.get("birthArtifactID"),
-                ref=val.get("ref"),
-                size=val.get("size"),
-                extra=val.get("extra"),
-                local_path=val.get("local_path"),
-            )
-            for name, val in manifest_json["contents"].items()
-        }
+        # contents streamed by `load_manifest_json` are already parsed
+        entries = manifest_json["contents"]
+        if not isinstance(entries, ManifestEntries):
+            entries = ManifestEntries.from_contents(entries.items())
 
         return cls(storage_policy_cls.from_config(storage_policy_config), entries)
 
@@ -63,7 +58,8 @@ class ArtifactManifestV1(ArtifactManifest):
         contents.
         """
         contents = {}
-        for entry in sorted(self.entries.values(), key=lambda k: k.path):
+        for path in sorted(self.entries):
+            entry = self.entries[path]
             json_entry: Dict[str, Any] = {
                 "digest": entry.digest,
             }
@@ -86,6 +82,6 @@ class ArtifactManifestV1(ArtifactManifest):
     def digest(self) -> HexMD5:
         hasher = _md5()
         hasher.update(b"wandb-artifact-manifest-v1\n")
-        for name, entry in sorted(self.entries.items(), key=lambda kv: kv[0]):
-            hasher.update(f"{name}:{entry.digest}\n".encode())
+        for name in sorted(self.entries):
+            hasher.update(f"{name}:{self.entries[name].digest}\n".encode())
         return HexMD5(hasher.hexdigest())
@@ -302,7 +302,9 @@ class ArtifactSaver:
         for entry in self._manifest.entries.values():
             if entry.local_path and entry.local_path.startswith(staging_dir):
                 try:
-                    os.chmod(entry.local_path, 0o600)
+                    # a hardlinked staging file shares its mode with the source
+                    if os.stat(entry.local_path).st_nlink == 1:
+                        os.chmod(entry.local_path, 0o600)
                     os.remove(entry.local_path)
                 except OSError:
                     pass
@@ -0,0 +1,155 @@
+"""Lazy, read-only view of the files of an artifact."""
+import collections
+import concurrent.futures
+import fnmatch
+import threading
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from wandb.sdk.internal.thread_local_settings import _thread_local_api_settings
+from wandb.sdk.lib.paths import FilePathStr, LogicalPath, StrPath
+
+if TYPE_CHECKING:
+    from wandb.sdk.artifacts.artifact import Artifact
+    from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
+
+
+def fetch_entry(entry: "ArtifactManifestEntry") -> FilePathStr:
+    """Fetch an entry into the artifacts cache and return its path in the cache."""
+    artifact = entry.parent_artifact()
+    storage_policy = artifact.manifest.storage_policy
+    if entry.ref is not None:
+        return FilePathStr(str(storage_policy.load_reference(entry, local=True)))
+    return storage_policy.load_file(artifact, entry)
+
+
+class ArtifactView:
+    """Read-only view of the files of a logged artifact, fetched on first access.
+
+    Files are read from the artifacts cache, nothing is written to the
+    artifact's root directory. Iterating over files with `iter_files` fetches
+    the next `read_ahead` files in the background, so a data loader can start
+    on the first file while the following ones download.
+
+    Examples:
+        ```
+        artifact = run.use_artifact("my_dataset:latest")
+        with artifact.view(read_ahead=16) as view:
+            for path, local_path in view.iter_files(view.glob("train/*.png")):
+                image = load_image(local_path)
+        ```
+    """
+
+    def __init__(
+        self, artifact: "Artifact", read_ahead: int = 8, max_workers: int = 8
+    ) -> None:
+        self._artifact = artifact
+        self._read_ahead = read_ahead
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix="ArtifactView"
+        )
+        self._fetches: Dict[LogicalPath, "concurrent.futures.Future[FilePathStr]"] = {}
+        self._lock = threading.Lock()
+        self._api_settings = (
+            _thread_local_api_settings.api_key,
+            _thread_local_api_settings.cookies,
+            _thread_local_api_settings.headers,
+        )
+
+    def __enter__(self) -> "ArtifactView":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop fetching files in the background."""
+        for future in self._fetches.values():
+            future.cancel()
+        self._executor.shutdown(wait=True)
+
+    def paths(self) -> List[LogicalPath]:
+        """Return the paths of all files in the artifact."""
+        return sorted(self._artifact._file_paths())
+
+    def glob(self, pattern: str) -> List[LogicalPath]:
+        """Return the paths of the files matching the glob `pattern`."""
+        return [path for path in self.paths() if fnmatch.fnmatchcase(path, pattern)]
+
+    def listdir(self, path: StrPath = "") -> List[str]:
+        """Return the names of the files and directories in the directory `path`."""
+        prefix = LogicalPath(path) + "/" if str(path).strip("/") else ""
+        names = {
+            entry_path[len(prefix) :].split("/", 1)[0]
+            for entry_path in self._artifact._file_paths()
+            if entry_path.startswith(prefix)
+        }
+        if not names and prefix:
+            raise FileNotFoundError(f"No such directory: {path}")
+        return sorted(names)
+
+    def _fetch(self, entry: "ArtifactManifestEntry") -> FilePathStr:
+        (
+            _thread_local_api_settings.api_key,
+            _thread_local_api_settings.cookies,
+            _thread_local_api_settings.headers,
+        ) = self._api_settings
+        return fetch_entry(entry)
+
+    def prefetch(self, path: StrPath) -> "concurrent.futures.Future[FilePathStr]":
+        """Start fetching the file at `path` in the background, if it isn't yet."""
+        path = LogicalPath(path)
+        with self._lock:
+            future = self._fetches.get(path)
+            if future is None or future.cancelled():
+                if self._artifact._is_chunk_path(path):
+                    raise KeyError(f"No such file: {path}")
+                entry = self._artifact.get_path(path)
+                future = self._executor.submit(self._fetch, entry)
+                self._fetches[path] = future
+        return future
+
+    def fetch(self, path: StrPath) -> FilePathStr:
+        """Return the path in the cache of the file at `path`, fetching it if needed."""
+        return self.prefetch(path).result()
+
+    def open(self, path: StrPath, mode: str = "r", **kwargs: Any) -> IO:
+        """Open the file at `path` for reading, fetching it if needed."""
+        if any(flag in mode for flag in "wax+"):
+            raise ValueError(f"Artifact files can only be opened for reading: {mode}")
+        return open(self.fetch(path), mode, **kwargs)
+
+    def iter_files(
+        self, paths: Optional[Iterable[StrPath]] = None
+    ) -> Iterator[Tuple[LogicalPath, FilePathStr]]:
+        """Yield (path, path in the cache) of the files at `paths`, in order.
+
+        Arguments:
+            paths: the files to iterate over, defaults to all files.
+        """
+        pending: Deque[Tuple[LogicalPath, "concurrent.futures.Future[FilePathStr]"]]
+        pending = collections.deque()
+        upcoming = iter(self.paths() if paths is None else paths)
+        for path in upcoming:
+            pending.append((LogicalPath(path), self.prefetch(path)))
+            if len(pending) > self._read_ahead:
+                break
+        while pending:
+            path, future = pending.popleft()
+            next_path = next(upcoming, None)
+            if next_path is not None:
+                pending.append((LogicalPath(next_path), self.prefetch(next_path)))
+            yield path, future.result()
+            with self._lock:
+                # only keep the fetches that are still ahead of the reader
+                self._fetches.pop(path, None)
@@ -3,10 +3,23 @@ import contextlib
 import hashlib
 import os
 import secrets
-from typing import IO, TYPE_CHECKING, ContextManager, Dict, Generator, Optional, Tuple
+import threading
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    Generator,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import wandb
 from wandb import env, util
+from wandb.sdk.artifacts.cache_index import INDEX_FNAME, CacheIndex
 from wandb.sdk.artifacts.exceptions import ArtifactNotLoggedError
 from wandb.sdk.lib.capped_dict import CappedDict
 from wandb.sdk.lib.filesystem import mkdir_exists_ok
@@ -36,8 +49,29 @@ class ArtifactsCache:
         mkdir_exists_ok(self._cache_dir)
         self._md5_obj_dir = os.path.join(self._cache_dir, "obj", "md5")
         self._etag_obj_dir = os.path.join(self._cache_dir, "obj", "etag")
+        # writers stage their files here, so that files left behind by
+        # interrupted writers are found without walking the cache
+        self._tmp_dir = os.path.join(self._cache_dir, ArtifactsCache._TMP_PREFIX)
         self._artifacts_by_id: Dict[str, "Artifact"] = CappedDict()
         self._artifacts_by_client_id: Dict[str, "Artifact"] = CappedDict()
+        self._index = CacheIndex(os.path.join(self._cache_dir, INDEX_FNAME))
+        max_size = env.get_artifact_cache_max_size()
+        self._max_size = util.from_human_size(max_size) if max_size else None
+        self._eviction_lock = threading.Lock()
+        self._eviction_thread: Optional[threading.Thread] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_eviction_lock"]
+        state["_eviction_thread"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._eviction_lock = threading.Lock()
+
+    def _relpath(self, path: StrPath) -> str:
+        return os.path.relpath(path, self._cache_dir)
 
     def check_md5_obj_path(
         self, b64_md5: B64MD5, size: int
@@ -46,6 +80,7 @@ class ArtifactsCache:
         path = os.path.join(self._cache_dir, "obj", "md5", hex_md5[:2], hex_md5[2:])
         opener = self._cache_opener(path)
         if os.path.isfile(path) and os.path.getsize(path) == size:
+            self._index.touch(self._relpath(path))
             return FilePathStr(path), True, opener
         mkdir_exists_ok(os.path.dirname(path))
         return FilePathStr(path), False, opener
@@ -65,6 +100,7 @@ class ArtifactsCache:
         path = os.path.join(self._cache_dir, "obj", "etag", hexhash[:2], hexhash[2:])
         opener = self._cache_opener(path)
         if os.path.isfile(path) and os.path.getsize(path) == size:
+            self._index.touch(self._relpath(path))
             return FilePathStr(path), True, opener
         mkdir_exists_ok(os.path.dirname(path))
         return FilePathStr(path), False, opener
@@ -84,36 +120,109 @@ class ArtifactsCache:
         self._artifacts_by_client_id[artifact._client_id] = artifact
 
     def cleanup(self, target_size: int, remove_temp: bool = False) -> int:
+        """Remove least recently used objects until the cache is below `target_size`.
+
+        Returns the number of bytes reclaimed.
+        """
+        self._index.flush()
+        if not self._index.disabled and not self._index.is_built():
+            self._index.build(self._scan())
+        if self._index.disabled:
+            return self._cleanup_scan(target_size, remove_temp)
+
         bytes_reclaimed = 0
-        paths = {}
-        total_size = 0
         temp_size = 0
+        for relpath in self._temp_paths():
+            path = os.path.join(self._cache_dir, relpath)
+            try:
+                size = os.path.getsize(path)
+                if remove_temp:
+                    os.remove(path)
+                    bytes_reclaimed += size
+                else:
+                    temp_size += size
+                    continue
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            self._index.remove(relpath)
+        self._warn_temp_size(temp_size)
+
+        total_size = self._index.total_size()
+        for relpath, size in self._index.least_recently_used():
+            if total_size < target_size:
+                break
+            try:
+                os.remove(os.path.join(self._cache_dir, relpath))
+                bytes_reclaimed += size
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            self._index.remove(relpath)
+            total_size -= size
+        return bytes_reclaimed
+
+    def _temp_paths(self) -> Set[str]:
+        """Return the paths of temporary files, relative to the cache."""
+        # including files found in the object directories when the index was
+        # built, written by versions staging them there
+        paths = set(self._index.temp_paths())
+        try:
+            files = os.listdir(self._tmp_dir)
+        except OSError:
+            return paths
+        paths.update(self._relpath(os.path.join(self._tmp_dir, file)) for file in files)
+        return paths
+
+    def _scan(self) -> Iterator[Tuple[str, int, float, bool]]:
+        """Yield the (path, size, atime, temp) of every file in the cache."""
         for root, _, files in os.walk(self._cache_dir):
             for file in files:
+                path = os.path.join(root, file)
+                relpath = self._relpath(path)
+                if relpath.startswith(INDEX_FNAME):
+                    continue
                 try:
-                    path = os.path.join(root, file)
                     stat = os.stat(path)
-
-                    if file.startswith(ArtifactsCache._TMP_PREFIX):
-                        if remove_temp:
-                            os.remove(path)
-                            bytes_reclaimed += stat.st_size
-                        else:
-                            temp_size += stat.st_size
-                        continue
                 except OSError:
                     continue
-                paths[path] = stat
-                total_size += stat.st_size
+                temp = file.startswith(ArtifactsCache._TMP_PREFIX)
+                yield relpath, stat.st_size, stat.st_atime, temp
 
+    def _warn_temp_size(self, temp_size: int) -> None:
         if temp_size:
             wandb.termwarn(
                 f"Cache contains {util.to_human_size(temp_size)} of temporary files. "
                 "Run `wandb artifact cleanup --remove-temp` to remove them."
             )
 
-        sorted_paths = sorted(paths.items(), key=lambda x: x[1].st_atime)
-        for path, stat in sorted_paths:
+    def _cleanup_scan(self, target_size: int, remove_temp: bool) -> int:
+        # used when the index can't be, walks the whole cache
+        bytes_reclaimed = 0
+        paths = {}
+        total_size = 0
+        temp_size = 0
+        for relpath, size, atime, temp in self._scan():
+            path = os.path.join(self._cache_dir, relpath)
+            if temp:
+                if remove_temp:
+                    try:
+                        os.remove(path)
+                        bytes_reclaimed += size
+                    except OSError:
+                        pass
+                else:
+                    temp_size += size
+                continue
+            paths[path] = (size, atime)
+            total_size += size
+
+        self._warn_temp_size(temp_size)
+
+        sorted_paths = sorted(paths.items(), key=lambda x: x[1][1])
+        for path, (size, _) in sorted_paths:
             if total_size < target_size:
                 return bytes_reclaimed
 
@@ -122,22 +231,38 @@ class ArtifactsCache:
             except OSError:
                 pass
 
-            total_size -= stat.st_size
-            bytes_reclaimed += stat.st_size
+            total_size -= size
+            bytes_reclaimed += size
         return bytes_reclaimed
 
+    def _maybe_evict(self) -> None:
+        """Evict objects in the background once the cache exceeds its max size."""
+        if self._max_size is None or self._index.total_size() <= self._max_size:
+            return
+        with self._eviction_lock:
+            if self._eviction_thread is not None and self._eviction_thread.is_alive():
+                return
+            self._eviction_thread = threading.Thread(
+                target=self.cleanup,
+                args=(self._max_size,),
+                name="ArtifactsCacheEviction",
+                daemon=True,
+            )
+            self._eviction_thread.start()
+
     def _cache_opener(self, path: StrPath) -> "Opener":
         @contextlib.contextmanager
         def helper(mode: str = "w") -> Generator[IO, None, None]:
             if "a" in mode:
                 raise ValueError("Appending to cache files is not supported")
 
-            dirname = os.path.dirname(path)
+            mkdir_exists_ok(self._tmp_dir)
             tmp_file = os.path.join(
-                dirname, f"{ArtifactsCache._TMP_PREFIX}_{secrets.token_hex(8)}"
+                self._tmp_dir, f"{ArtifactsCache._TMP_PREFIX}_{secrets.token_hex(8)}"
             )
             with util.fsync_open(tmp_file, mode=mode) as f:
                 yield f
+            size = os.path.getsize(tmp_file)
 
             try:
                 # Use replace where we can, as it implements an atomic
@@ -159,6 +284,8 @@ class ArtifactsCache:
                 os.replace(tmp_file, path)
             except AttributeError:
                 os.rename(tmp_file, path)
+            self._index.put(self._relpath(path), size)
+            self._maybe_evict()
 
         return helper
 
@@ -0,0 +1,323 @@
+"""Index of the objects in the artifacts cache.
+
+Tracks the size and last access time of every object as it is written and
+read, and the total size of the cache, so that evicting objects only reads
+the index entries of the objects it evicts instead of walking the cache.
+Written and read objects are recorded in batches by a background thread, so
+neither writers nor readers wait on the database.
+
+The index is a sqlite database next to the objects, shared by every process
+using the cache. It uses a rollback journal rather than WAL since caches
+are often shared over NFS, where WAL doesn't work. Any error using it
+disables the index, and the cache falls back to walking its directory.
+"""
+import atexit
+import contextlib
+import functools
+import logging
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+try:
+    import sqlite3
+except ImportError:  # pragma: no cover - python built without sqlite
+    sqlite3 = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+INDEX_FNAME = "index.db"
+
+# Refresh the access time of an object at most this often, in seconds.
+_TOUCH_INTERVAL = 60
+
+# Number of objects read from the index at a time while evicting.
+_PAGE_SIZE = 1000
+
+# Written and read objects are recorded once this many are pending, or after
+# this many seconds.
+_FLUSH_COUNT = 100
+_FLUSH_INTERVAL = 1.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    atime REAL NOT NULL,
+    temp INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS objects_atime ON objects (temp, atime, path);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+T = TypeVar("T")
+
+
+def _disable_on_error(default: Any) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    def decorator(method: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(method)
+        def wrapper(self: "CacheIndex", *args: Any, **kwargs: Any) -> T:
+            if self.disabled:
+                return default  # type: ignore
+            try:
+                return method(self, *args, **kwargs)
+            except sqlite3.Error as e:
+                logger.warning("Disabling the artifacts cache index: %s", e)
+                self.disabled = True
+                return default  # type: ignore
+
+        return wrapper
+
+    return decorator
+
+
+class CacheIndex:
+    """Sizes and access times of the objects in a cache, by path relative to it.
+
+    Temporary files found when the index is built are tracked too, so that
+    files left behind by interrupted writers can be removed.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self._db_path = db_path
+        self._local = threading.local()
+        self.disabled = sqlite3 is None
+        self._init_pending()
+
+    def _init_pending(self) -> None:
+        self._pending: List[Tuple[str, int, float]] = []
+        self._pending_size = 0
+        self._pending_touches: Dict[str, float] = {}
+        self._pending_cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_at_exit = False
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # connections and pending objects are per thread and process
+        self.flush()
+        state = self.__dict__.copy()
+        for key in (
+            "_local",
+            "_pending",
+            "_pending_size",
+            "_pending_touches",
+            "_pending_cond",
+            "_flush_lock",
+            "_flush_thread",
+            "_flush_at_exit",
+        ):
+            del state[key]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._init_pending()
+
+    def _connection(self) -> "sqlite3.Connection":
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # autocommit, transactions are started explicitly
+            conn = sqlite3.connect(self._db_path, timeout=30, isolation_level=None)
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Generator["sqlite3.Connection", None, None]:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _add_total(conn: "sqlite3.Connection", delta: int) -> None:
+        conn.execute("INSERT OR IGNORE INTO meta VALUES ('total', 0)")
+        conn.execute("UPDATE meta SET value = value + ? WHERE key = 'total'", (delta,))
+
+    @staticmethod
+    def _remove(conn: "sqlite3.Connection", path: str) -> None:
+        row = conn.execute(
+            "SELECT size, temp FROM objects WHERE path = ?", (path,)
+        ).fetchone()
+        if row is None:
+            return
+        conn.execute("DELETE FROM objects WHERE path = ?", (path,))
+        size, temp = row
+        if not temp:
+            CacheIndex._add_total(conn, -size)
+
+    def put(self, path: str, size: int) -> None:
+        """Record that an object of `size` bytes was written to `path`.
+
+        The object is recorded in the background, along with other objects
+        written around the same time, or by `flush`.
+        """
+        if self.disabled:
+            return
+        with self._pending_cond:
+            self._pending.append((path, size, time.time()))
+            self._pending_size += size
+            self._schedule_flush()
+
+    def touch(self, path: str) -> None:
+        """Record that the object at `path` was read.
+
+        Like written objects, the access time is updated in the background.
+        """
+        if self.disabled:
+            return
+        with self._pending_cond:
+            self._pending_touches[path] = time.time()
+            self._schedule_flush()
+
+    def _pending_count(self) -> int:
+        return len(self._pending) + len(self._pending_touches)
+
+    def _schedule_flush(self) -> None:
+        # called holding _pending_cond
+        if self._flush_thread is None or not self._flush_thread.is_alive():
+            self._flush_thread = threading.Thread(
+                target=self._flush_pending,
+                name="ArtifactsCacheIndex",
+                daemon=True,
+            )
+            self._flush_thread.start()
+            if not self._flush_at_exit:
+                # the thread is a daemon, don't lose what it hasn't written
+                atexit.register(self.flush)
+                self._flush_at_exit = True
+        elif self._pending_count() >= _FLUSH_COUNT:
+            self._pending_cond.notify()
+
+    def _flush_pending(self) -> None:
+        while True:
+            with self._pending_cond:
+                self._pending_cond.wait_for(
+                    lambda: self._pending_count() >= _FLUSH_COUNT,
+                    timeout=_FLUSH_INTERVAL,
+                )
+                if not self._pending_count():
+                    # stop while idle, the next put starts another thread
+                    self._flush_thread = None
+                    return
+            self.flush()
+
+    @_disable_on_error(None)
+    def flush(self) -> None:
+        """Record the objects written and read since the last flush."""
+        with self._flush_lock:
+            with self._pending_cond:
+                pending, self._pending = self._pending, []
+                touches, self._pending_touches = self._pending_touches, {}
+                self._pending_size = 0
+            if not pending and not touches:
+                return
+            # an object written twice is recorded once, with its latest size
+            objects = {path: (path, size, atime) for path, size, atime in pending}
+            with self._transaction() as conn:
+                for path in objects:
+                    self._remove(conn, path)
+                conn.executemany(
+                    "INSERT INTO objects VALUES (?, ?, ?, 0)", objects.values()
+                )
+                self._add_total(conn, sum(size for _, size, _ in objects.values()))
+                conn.executemany(
+                    "UPDATE objects SET atime = ? WHERE path = ? AND atime < ?",
+                    (
+                        (atime, path, atime - _TOUCH_INTERVAL)
+                        for path, atime in touches.items()
+                    ),
+                )
+
+    @_disable_on_error(None)
+    def remove(self, path: str) -> None:
+        with self._transaction() as conn:
+            self._remove(conn, path)
+
+    @_disable_on_error(0)
+    def total_size(self) -> int:
+        """Return the total size of the objects, including those not flushed yet."""
+        row = (
+            self._connection()
+            .execute("SELECT value FROM meta WHERE key = 'total'")
+            .fetchone()
+        )
+        return (row[0] if row else 0) + self._pending_size
+
+    @_disable_on_error(False)
+    def is_built(self) -> bool:
+        row = (
+            self._connection()
+            .execute("SELECT value FROM meta WHERE key = 'built'")
+            .fetchone()
+        )
+        return bool(row and row[0])
+
+    @_disable_on_error(None)
+    def build(self, entries: Iterable[Tuple[str, int, float, bool]]) -> None:
+        """Add the (path, size, atime, temp) of objects missing from the index.
+
+        Used once, for objects written before the cache was indexed.
+        """
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO objects VALUES (?, ?, ?, ?)",
+                ((path, size, atime, int(temp)) for path, size, atime, temp in entries),
+            )
+            (total,) = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM objects WHERE temp = 0"
+            ).fetchone()
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('total', ?)", (total,))
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('built', 1)")
+
+    @_disable_on_error([])
+    def temp_paths(self) -> List[str]:
+        rows = self._connection().execute("SELECT path FROM objects WHERE temp = 1")
+        return [path for (path,) in rows]
+
+    def least_recently_used(self) -> Iterator[Tuple[str, int]]:
+        """Yield the (path, size) of objects, least recently used first.
+
+        Objects removed while iterating are not returned again.
+        """
+        last_atime, last_path = float("-inf"), ""
+        while not self.disabled:
+            page = self._page(last_atime, last_path)
+            if not page:
+                return
+            for path, size, atime in page:
+                yield path, size
+                last_atime, last_path = atime, path
+
+    @_disable_on_error([])
+    def _page(self, atime: float, path: str) -> List[Tuple[str, int, float]]:
+        return (
+            self._connection()
+            .execute(
+                "SELECT path, size, atime FROM objects WHERE temp = 0 "
+                "AND (atime > ? OR (atime = ? AND path > ?)) "
+                "ORDER BY atime, path LIMIT ?",
+                (atime, atime, path, _PAGE_SIZE),
+            )
+            .fetchall()
+        )
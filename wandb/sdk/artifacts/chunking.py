@@ -0,0 +1,114 @@
+"""Content-defined chunking of files.
+
+A file is cut where a rolling hash of the last `_WINDOW` bytes falls below a
+threshold, so cuts depend only on the nearby contents: an edit only changes
+the chunks around it, even when it inserts or removes bytes and shifts the
+rest of the file. Cuts are at least MIN_CHUNK_SIZE and at most MAX_CHUNK_SIZE
+apart, and about AVG_CHUNK_SIZE apart on average.
+
+The rolling hash is a polynomial hash of the gear values of the bytes,
+modulo 2**32, computed for a block of bytes at a time with numpy: with the
+prefix sums C[i] of gear[b[j]] * P**-j, the hash of the window ending at i
+is (C[i] - C[i - _WINDOW]) * P**i.
+"""
+from typing import TYPE_CHECKING, Any, Iterator, Tuple
+
+from wandb import util
+from wandb.sdk.lib.hashutil import _md5
+
+if TYPE_CHECKING:
+    import numpy as np
+
+MIN_CHUNK_SIZE = 1024**2
+AVG_CHUNK_SIZE = 4 * 1024**2
+MAX_CHUNK_SIZE = 16 * 1024**2
+
+_WINDOW = 64
+_BLOCK_SIZE = 2 * 1024**2
+_PRIME = 0x01000193
+
+
+def _inverse(a: int) -> int:
+    """Return the inverse of the odd `a` modulo 2**32."""
+    x = a  # correct to 3 bits, each step doubles that
+    for _ in range(5):
+        x = x * (2 - a * x) % 2**32
+    return x
+
+
+def _numpy() -> Any:
+    return util.get_module(
+        "numpy",
+        required="Chunked artifact storage requires numpy, run pip install numpy",
+    )
+
+
+class _Tables:
+    def __init__(self) -> None:
+        np = _numpy()
+        self.np = np
+        self.gear = np.array(
+            [
+                int.from_bytes(_md5(bytes([b])).digest()[:4], "little")
+                for b in range(256)
+            ],
+            dtype=np.uint32,
+        )
+        n = _BLOCK_SIZE + _WINDOW
+        self.inverse_powers = self._powers(_inverse(_PRIME), n)
+        self.powers = self._powers(_PRIME, n)
+
+    def _powers(self, base: int, n: int) -> "np.ndarray":
+        np = self.np
+        powers = np.empty(n, dtype=np.uint32)
+        powers[0] = 1
+        powers[1:] = np.cumprod(np.full(n - 1, base, dtype=np.uint32))
+        return powers
+
+
+_tables = None
+
+
+def _get_tables() -> _Tables:
+    global _tables
+    if _tables is None:
+        _tables = _Tables()
+    return _tables
+
+
+def _candidates(data: Any, start: int, end: int) -> "np.ndarray":
+    """Return the offsets after the bytes in [start, end) where a cut may be."""
+    tables = _get_tables()
+    np = tables.np
+    window_start = max(0, start - _WINDOW + 1)
+    values = tables.gear[
+        np.frombuffer(data, np.uint8, end - window_start, window_start)
+    ]
+    n = len(values)
+    with np.errstate(over="ignore"):
+        sums = np.zeros(n + 1, dtype=np.uint32)
+        np.cumsum(values * tables.inverse_powers[:n], dtype=np.uint32, out=sums[1:])
+        hashes = (sums[_WINDOW:] - sums[:-_WINDOW]) * tables.powers[_WINDOW - 1 : n]
+    threshold = np.uint32(2**32 // (AVG_CHUNK_SIZE - MIN_CHUNK_SIZE))
+    # hashes[k] is that of the window ending at window_start + _WINDOW - 1 + k
+    return np.flatnonzero(hashes < threshold) + (window_start + _WINDOW)
+
+
+def chunk_bounds(data: Any) -> Iterator[Tuple[int, int]]:
+    """Yield the (start, end) offsets of the chunks of the bytes-like `data`."""
+    size = len(data)
+    start = 0
+    for block_start in range(0, size, _BLOCK_SIZE):
+        block_end = min(block_start + _BLOCK_SIZE, size)
+        for cut in _candidates(data, block_start, block_end).tolist():
+            while cut - start > MAX_CHUNK_SIZE:
+                yield start, start + MAX_CHUNK_SIZE
+                start += MAX_CHUNK_SIZE
+            if cut - start >= MIN_CHUNK_SIZE:
+                yield start, cut
+                start = cut
+        while block_end - start > MAX_CHUNK_SIZE:
+            yield start, start + MAX_CHUNK_SIZE
+            start += MAX_CHUNK_SIZE
+    if start < size:
+        yield start, size
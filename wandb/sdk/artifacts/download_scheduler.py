@@ -0,0 +1,284 @@
+"""Scheduling of artifact file downloads.
+
+`DownloadScheduler` runs the downloads of the files of an artifact on a pool
+of threads, one file per task so that the latency of the requests for small
+files overlaps. The number of downloads running at once starts at the size
+of the pool and adapts to the measured throughput: it keeps moving in one
+direction while that improves the throughput and turns around when it
+doesn't.
+
+Large files are downloaded with parallel ranged requests, written to their
+place in the cache file. All downloads in the process together read at most
+WANDB_ARTIFACT_DOWNLOAD_BANDWIDTH bytes per second, e.g. "100MB".
+"""
+import concurrent.futures
+import logging
+import re
+import threading
+import time
+from typing import IO, TYPE_CHECKING, Any, Callable, Optional, Set
+
+from wandb import env, util
+
+if TYPE_CHECKING:
+    import requests
+
+    from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 64
+
+# The number of tasks submitted but not done before submitting waits.
+MAX_BACKLOG = 5000
+
+# Files at least this large are downloaded in ranges of RANGE_SIZE bytes.
+RANGED_DOWNLOAD_MIN_SIZE = 256 * 1024**2
+RANGE_SIZE = 64 * 1024**2
+MAX_PARALLEL_RANGES = 8
+
+CHUNK_SIZE = 16 * 1024
+RANGE_CHUNK_SIZE = 1024**2
+
+# Downloads may run ahead of the bandwidth cap by this many seconds of data.
+_BURST_SECONDS = 1.0
+
+_CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+
+class BandwidthLimiter:
+    """Limits the bytes per second read by all the threads using it."""
+
+    def __init__(self, rate: Optional[int]) -> None:
+        self.rate = rate
+        self._lock = threading.Lock()
+        # the time at which the bytes consumed so far are within the rate
+        self._due = 0.0
+
+    def consume(self, nbytes: int) -> None:
+        """Wait until `nbytes` more bytes can be read."""
+        if not self.rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._due = max(self._due, now - _BURST_SECONDS) + nbytes / self.rate
+            delay = self._due - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+_bandwidth_limiter: Optional[BandwidthLimiter] = None
+_bandwidth_limiter_lock = threading.Lock()
+
+
+def get_bandwidth_limiter() -> BandwidthLimiter:
+    global _bandwidth_limiter
+    with _bandwidth_limiter_lock:
+        if _bandwidth_limiter is None:
+            bandwidth = env.get_artifact_download_bandwidth()
+            rate = None
+            if bandwidth:
+                try:
+                    rate = util.from_human_size(bandwidth)
+                except ValueError:
+                    logger.warning("Invalid artifact download bandwidth %s", bandwidth)
+            _bandwidth_limiter = BandwidthLimiter(rate)
+        return _bandwidth_limiter
+
+
+class AdaptiveLimit:
+    """A limit on concurrent tasks, tuned by the throughput of the tasks.
+
+    Every `interval` seconds the throughput is compared to that of the last
+    interval: while it improves the limit keeps moving in the same
+    direction, and when it gets worse the direction is reversed.
+    """
+
+    def __init__(
+        self, initial: int, minimum: int, maximum: int, interval: float = 2.0
+    ) -> None:
+        self.limit = initial
+        self._minimum = minimum
+        self._maximum = maximum
+        self._interval = interval
+        self._cond = threading.Condition()
+        self._active = 0
+        self._direction = 1
+        self._throughput = 0.0
+        self._window_bytes = 0
+        self._window_start = time.monotonic()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+
+    def release(self, nbytes: int) -> None:
+        with self._cond:
+            self._active -= 1
+            self._window_bytes += nbytes
+            self._adjust()
+            self._cond.notify_all()
+
+    def _adjust(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed < self._interval:
+            return
+        throughput = self._window_bytes / elapsed
+        if throughput < self._throughput * 0.95:
+            self._direction = -self._direction
+        step = max(1, self.limit // 4)
+        self.limit = min(
+            self._maximum, max(self._minimum, self.limit + self._direction * step)
+        )
+        if self.limit in (self._minimum, self._maximum):
+            # turn around at the bounds, to keep probing
+            self._direction = 1 if self.limit == self._minimum else -1
+        logger.debug(
+            "Artifact download throughput %.0f B/s, limit %d", throughput, self.limit
+        )
+        self._throughput = throughput
+        self._window_bytes = 0
+        self._window_start = now
+
+
+class DownloadScheduler:
+    """Runs `download` on entries in parallel, with adaptive concurrency.
+
+    Used as a context manager, which waits for all the downloads on exit and
+    raises the first error of any of them.
+    """
+
+    def __init__(
+        self,
+        download: Callable[["ArtifactManifestEntry"], None],
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self._download = download
+        if max_workers is None:
+            max_workers = env.get_artifact_download_workers(default=DEFAULT_MAX_WORKERS)
+        max_workers = max(1, max_workers or DEFAULT_MAX_WORKERS)
+        self._limit = AdaptiveLimit(
+            initial=max_workers,
+            minimum=min(4, max_workers),
+            maximum=max_workers,
+        )
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix="ArtifactDownload"
+        )
+        self._futures: Set["concurrent.futures.Future[None]"] = set()
+
+    def __enter__(self) -> "DownloadScheduler":
+        return self
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        try:
+            if exc_type is None:
+                self.wait()
+        finally:
+            for future in self._futures:
+                future.cancel()
+            self._executor.shutdown(wait=True)
+
+    def _run(self, entry: "ArtifactManifestEntry") -> None:
+        self._limit.acquire()
+        nbytes = 0
+        try:
+            self._download(entry)
+            nbytes = entry.size or 0
+        finally:
+            self._limit.release(nbytes)
+
+    def _wait_for(self, max_pending: int) -> None:
+        for future in concurrent.futures.as_completed(list(self._futures)):
+            future.result()  # check for errors
+            self._futures.remove(future)
+            if len(self._futures) <= max_pending:
+                break
+
+    def submit(self, entry: "ArtifactManifestEntry") -> None:
+        self._futures.add(self._executor.submit(self._run, entry))
+        if len(self._futures) > MAX_BACKLOG:
+            self._wait_for(MAX_BACKLOG)
+
+    def wait(self) -> None:
+        """Wait for all submitted downloads."""
+        if self._futures:
+            self._wait_for(0)
+
+
+def range_header(size: Optional[int]) -> Optional[str]:
+    """Return the Range header of the first request for an object of `size`."""
+    if size is None or size < RANGED_DOWNLOAD_MIN_SIZE:
+        return None
+    return f"bytes=0-{RANGE_SIZE - 1}"
+
+
+def write_response(response: "requests.Response", file: IO) -> None:
+    """Write the body of `response` to `file`."""
+    limiter = get_bandwidth_limiter()
+    for data in response.iter_content(chunk_size=CHUNK_SIZE):
+        limiter.consume(len(data))
+        file.write(data)
+
+
+def _write_range(
+    response: "requests.Response", file: IO, offset: int, lock: threading.Lock
+) -> None:
+    limiter = get_bandwidth_limiter()
+    for data in response.iter_content(chunk_size=RANGE_CHUNK_SIZE):
+        limiter.consume(len(data))
+        with lock:
+            file.seek(offset)
+            file.write(data)
+        offset += len(data)
+
+
+def download_ranges(
+    session: "requests.Session",
+    url: str,
+    first: "requests.Response",
+    file: IO,
+    **kwargs: Any,
+) -> None:
+    """Download the rest of an object in parallel ranges, given its first range.
+
+    Arguments:
+        session: the session to request the ranges with.
+        url: the url of the object.
+        first: the 206 response to the request of the first range.
+        file: the file to write the object to.
+        kwargs: arguments of the requests, as passed to `session.get`.
+    """
+    match = _CONTENT_RANGE_RE.match(first.headers.get("Content-Range", ""))
+    if match is None:
+        raise ValueError(f"Invalid Content-Range of ranged download of {url}")
+    first_end, total = int(match.group(2)), int(match.group(3))
+    headers = kwargs.pop("headers", None) or {}
+
+    def fetch(start: int) -> None:
+        end = min(start + RANGE_SIZE, total) - 1
+        range_headers = {**headers, "Range": f"bytes={start}-{end}"}
+        with session.get(url, headers=range_headers, stream=True, **kwargs) as r:
+            r.raise_for_status()
+            if r.status_code != 206:
+                raise ValueError(f"Ranged download of {url} returned {r.status_code}")
+            _write_range(r, file, start, lock)
+
+    lock = threading.Lock()
+    with concurrent.futures.ThreadPoolExecutor(
+        MAX_PARALLEL_RANGES, thread_name_prefix="ArtifactRange"
+    ) as executor:
+        futures = [
+            executor.submit(fetch, start)
+            for start in range(first_end + 1, total, RANGE_SIZE)
+        ]
+        try:
+            _write_range(first, file, 0, lock)
+            for future in futures:
+                future.result()
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,324 @@
+"""Compact storage of the entries of a parsed artifact manifest.
+
+A manifest can hold millions of entries, and an `ArtifactManifestEntry` with
+its attribute dict, base64 digest string and `extra` dict costs several
+hundred bytes each. `ManifestEntries` keeps the entries of a parsed manifest
+in columns instead: md5 digests as 16 raw bytes, sizes in an array, and the
+rarely set attributes (references, birth artifact ids, extras) in sparse
+dicts. Entries are materialized when they are looked up, and changes to a
+materialized entry are written back to its columns.
+
+`load_manifest_json` parses the JSON of a manifest from an iterable of text
+chunks, adding entries as they are read, so that neither the document nor
+a dict of its contents is held in memory.
+"""
+import array
+import base64
+import binascii
+import json
+import os
+import weakref
+from typing import Any, Dict, Iterable, Iterator, MutableMapping, Optional, Tuple
+
+from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
+from wandb.sdk.lib.paths import LogicalPath
+
+_MD5_SIZE = 16
+
+# The attributes of an entry that are stored in sparse dicts, by the key
+# of the attribute in the manifest JSON.
+_SPARSE_KEYS = {
+    "ref": "ref",
+    "birthArtifactID": "birth_artifact_id",
+    "extra": "extra",
+    "local_path": "local_path",
+}
+
+# Attributes of an entry that are not written back: the path is the key of
+# the entry, and download urls are only used while the entry is downloaded.
+_UNSTORED = frozenset(("path", "_download_url", "_entries", "_row"))
+
+# Attributes shared by all the entries of a manifest.
+_SHARED = frozenset(("_parent_artifact",))
+
+
+def _encode_md5(digest: Any) -> Optional[bytes]:
+    """Return the raw bytes of a base64 md5 digest, None for other digests."""
+    if not isinstance(digest, str) or len(digest) != 24 or digest[-2:] != "==":
+        return None
+    try:
+        raw = base64.b64decode(digest, validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    # only store digests that decode back to the same string
+    if base64.b64encode(raw).decode("ascii") != digest:
+        return None
+    return raw
+
+
+class _ManifestEntry(ArtifactManifestEntry):
+    """An entry materialized from `ManifestEntries`, writing changes back to it."""
+
+    _entries: "ManifestEntries"
+    _row: int
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # entries removed from the manifest aren't written back
+        if name not in _UNSTORED and self._entries._live.get(self._row) is self:
+            self._entries._store(self._row, name, value)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # copies and pickles are detached from the manifest
+        state = {k: v for k, v in self.__dict__.items() if k not in _UNSTORED}
+        state["path"] = self.path
+        return (_detached_entry, (state,))
+
+
+def _detached_entry(state: Dict[str, Any]) -> ArtifactManifestEntry:
+    entry = ArtifactManifestEntry.__new__(ArtifactManifestEntry)
+    entry.__dict__.update(state)
+    return entry
+
+
+class ManifestEntries(MutableMapping[str, ArtifactManifestEntry]):
+    """The entries of a manifest by path, stored in columns.
+
+    Entries set with `entries[path] = entry` are kept as they are, since the
+    caller may still hold and change them. Only entries added by `_add`
+    while parsing a manifest are stored compactly.
+    """
+
+    def __init__(self) -> None:
+        self._rows: Dict[str, int] = {}
+        self._md5s = bytearray()
+        self._sizes = array.array("q")
+        self._digests: Dict[int, str] = {}
+        self._sparse: Dict[int, Dict[str, Any]] = {}
+        self._shared: Dict[str, Any] = {}
+        self._objects: Dict[int, ArtifactManifestEntry] = {}
+        # materialized entries, so that all the holders of an entry share it
+        self._live: "weakref.WeakValueDictionary[int, ArtifactManifestEntry]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    @classmethod
+    def from_contents(
+        cls, contents: Iterable[Tuple[str, Dict[str, Any]]]
+    ) -> "ManifestEntries":
+        """Create the entries from the (path, JSON entry) items of a manifest."""
+        entries = cls()
+        for path, val in contents:
+            entries._add(path, val["digest"], val.get("size"), val)
+        return entries
+
+    def _new_row(self) -> int:
+        row = len(self._sizes)
+        self._md5s.extend(bytes(_MD5_SIZE))
+        self._sizes.append(-1)
+        return row
+
+    def _add(
+        self, path: str, digest: str, size: Optional[int], val: Dict[str, Any]
+    ) -> None:
+        if size is None and val.get("local_path"):
+            size = os.path.getsize(val["local_path"])
+        self._remove(path)
+        row = self._new_row()
+        self._rows[path] = row
+        self._store(row, "digest", digest)
+        self._store(row, "size", size)
+        for key, name in _SPARSE_KEYS.items():
+            self._store(row, name, val.get(key))
+
+    def _store(self, row: int, name: str, value: Any) -> None:
+        if name == "digest":
+            raw = _encode_md5(value)
+            if raw is None:
+                self._digests[row] = value
+            else:
+                self._digests.pop(row, None)
+                self._md5s[row * _MD5_SIZE : (row + 1) * _MD5_SIZE] = raw
+        elif name == "size":
+            self._sizes[row] = -1 if value is None else value
+        elif name in _SHARED:
+            self._shared[name] = value
+        elif value is None or (name == "extra" and not value):
+            sparse = self._sparse.get(row)
+            if sparse is not None:
+                sparse.pop(name, None)
+                if not sparse:
+                    del self._sparse[row]
+        else:
+            self._sparse.setdefault(row, {})[name] = value
+
+    def _materialize(self, path: str, row: int) -> ArtifactManifestEntry:
+        digest = self._digests.get(row)
+        if digest is None:
+            md5 = self._md5s[row * _MD5_SIZE : (row + 1) * _MD5_SIZE]
+            digest = base64.b64encode(md5).decode("ascii")
+        size = self._sizes[row]
+        sparse = self._sparse.get(row, {})
+        entry = _ManifestEntry.__new__(_ManifestEntry)
+        entry.__dict__.update(
+            path=LogicalPath(path),
+            digest=digest,
+            ref=sparse.get("ref"),
+            birth_artifact_id=sparse.get("birth_artifact_id"),
+            size=None if size < 0 else size,
+            extra=sparse.get("extra", {}),
+            local_path=sparse.get("local_path"),
+            _entries=self,
+            _row=row,
+        )
+        entry.__dict__.update(
+            {k: v for k, v in sparse.items() if k not in entry.__dict__}
+        )
+        entry.__dict__.update(self._shared)
+        return entry
+
+    def paths_with_ref_prefix(self, prefix: str) -> Iterator[str]:
+        """Yield the paths of the entries whose reference starts with `prefix`.
+
+        Reads the references from their column, without materializing entries.
+        """
+        for path, row in self._rows.items():
+            entry = self._objects.get(row)
+            if entry is not None:
+                ref = entry.ref
+            else:
+                sparse = self._sparse.get(row)
+                ref = sparse.get("ref") if sparse is not None else None
+            if ref is not None and ref.startswith(prefix):
+                yield path
+
+    def _remove(self, path: str) -> None:
+        row = self._rows.pop(path, None)
+        if row is None:
+            return
+        # rows aren't reused, so that entries still held by callers don't
+        # write to the entry replacing theirs
+        self._digests.pop(row, None)
+        self._sparse.pop(row, None)
+        self._objects.pop(row, None)
+        self._live.pop(row, None)
+
+    def __getitem__(self, path: str) -> ArtifactManifestEntry:
+        row = self._rows[path]
+        entry = self._objects.get(row) or self._live.get(row)
+        if entry is None:
+            entry = self._materialize(path, row)
+            self._live[row] = entry
+        return entry
+
+    def __setitem__(self, path: str, entry: ArtifactManifestEntry) -> None:
+        if (
+            isinstance(entry, _ManifestEntry)
+            and entry._entries is self
+            and self._rows.get(path) == entry._row
+        ):
+            return
+        self._remove(path)
+        row = self._new_row()
+        self._rows[path] = row
+        self._objects[row] = entry
+
+    def __delitem__(self, path: str) -> None:
+        if path not in self._rows:
+            raise KeyError(path)
+        self._remove(path)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} with {len(self)} entries>"
+
+
+class _JSONStream:
+    """Incremental reader of JSON values from text chunks."""
+
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+
+    def _fill(self) -> bool:
+        for chunk in self._chunks:
+            if chunk:
+                self._buf = self._buf[self._pos :] + chunk
+                self._pos = 0
+                return True
+        return False
+
+    def _peek(self) -> str:
+        while True:
+            while (
+                self._pos < len(self._buf) and self._buf[self._pos] in self._WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of manifest JSON")
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            context = self._buf[self._pos : self._pos + 20]
+            raise ValueError(f"Invalid manifest JSON: expected {char!r} at {context!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # a number at the end of the buffer may continue in the next chunk
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def keys(self) -> Iterator[str]:
+        """Yield the keys of an object, the caller reads the value of each."""
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError(f"Invalid manifest JSON: key {key!r}")
+            self._expect(":")
+            yield key
+            if self._peek() != ",":
+                break
+            self._pos += 1
+        self._expect("}")
+
+
+def load_manifest_json(chunks: Iterable[str]) -> Dict[str, Any]:
+    """Parse the JSON of a manifest, with its contents as `ManifestEntries`."""
+    stream = _JSONStream(chunks)
+    manifest_json: Dict[str, Any] = {}
+    for key in stream.keys():
+        if key == "contents":
+            manifest_json[key] = ManifestEntries.from_contents(
+                (path, stream.value()) for path in stream.keys()
+            )
+        else:
+            manifest_json[key] = stream.value()
+    return manifest_json
@@ -0,0 +1,104 @@
+"""Multipart uploads of large artifact files.
+
+Parts are hashed in a single pass over a memory map of the file, and
+uploaded concurrently. At most WANDB_MULTIPART_UPLOAD_WORKERS parts are in
+flight, and no more than fit in WANDB_MULTIPART_UPLOAD_MEMORY bytes, since
+every part in flight is held in memory.
+
+The parts acknowledged by the storage are recorded in a journal in the
+cache directory, so when the upload is retried with the same upload id
+only the remaining parts are sent.
+"""
+import hashlib
+import json
+import logging
+import mmap
+import os
+import secrets
+import threading
+from typing import Dict, List
+
+from wandb import env
+from wandb.sdk.lib.filesystem import mkdir_exists_ok
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 8
+DEFAULT_MEMORY_BUDGET = 512 * 1024**2
+
+
+def part_digests(path: str, chunk_size: int) -> List[str]:
+    """Return the hex md5 digest of every `chunk_size` part of the file."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    digests = []
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                for offset in range(0, size, chunk_size):
+                    digests.append(
+                        hashlib.md5(view[offset : offset + chunk_size]).hexdigest()
+                    )
+            finally:
+                view.release()
+    return digests
+
+
+def max_parallel_parts(chunk_size: int) -> int:
+    """Return how many parts of `chunk_size` bytes can be uploaded at once."""
+    workers = env.get_multipart_upload_workers(default=DEFAULT_WORKERS)
+    budget = env.get_multipart_upload_memory(default=DEFAULT_MEMORY_BUDGET)
+    return max(1, min(workers or DEFAULT_WORKERS, (budget or 0) // chunk_size))
+
+
+class MultipartJournal:
+    """The parts of a multipart upload the storage acknowledged, by part number."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self.parts: Dict[int, str] = {}
+        try:
+            with open(path) as f:
+                self.parts = {int(k): v for k, v in json.load(f)["parts"].items()}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            logger.warning("Ignoring invalid multipart upload journal %s: %s", path, e)
+
+    @classmethod
+    def for_upload(
+        cls, storage_path: str, upload_id: str, digest: str, chunk_size: int
+    ) -> "MultipartJournal":
+        key = hashlib.sha256(
+            "\0".join((storage_path, upload_id, digest, str(chunk_size))).encode()
+        ).hexdigest()
+        return cls(os.path.join(env.get_cache_dir(), "multipart", key + ".json"))
+
+    def add(self, part_number: int, etag: str) -> None:
+        with self._lock:
+            self.parts[part_number] = etag
+            body = json.dumps({"parts": self.parts})
+            tmp_path = f"{self._path}.{secrets.token_hex(4)}.tmp"
+            try:
+                mkdir_exists_ok(os.path.dirname(self._path))
+                with open(tmp_path, "w") as f:
+                    f.write(body)
+                os.replace(tmp_path, self._path)
+            except OSError as e:
+                # the upload continues, it just can't be resumed
+                logger.warning("Failed to write multipart upload journal: %s", e)
+
+    def remove(self) -> None:
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
+
+
+def read_part(path: str, part_number: int, chunk_size: int) -> bytes:
+    with open(path, "rb") as f:
+        f.seek((part_number - 1) * chunk_size)
+        return f.read(chunk_size)
@@ -0,0 +1,204 @@
+"""Stage local files added to an artifact.
+
+An artifact freezes the contents of a local file when it is added, by
+staging it in the staging directory until it is uploaded. Staging uses the
+cheapest strategy the filesystem supports:
+
+    reflink   - a copy-on-write clone, shares the data blocks of the source
+    hardlink  - a second link to the source, only when explicitly enabled
+                with WANDB_ARTIFACT_STAGING_MODE=hardlink, since later writes
+                to the source then change the staged file too
+    copy      - a full copy, hashed in the same pass when no digest is known
+
+`stage_files` stages many files in parallel, on a pool of threads or, with
+WANDB_ARTIFACT_HASH_PROCESSES, of processes, so that hashing isn't limited
+by the GIL. Small files are staged in batches to amortize the overhead of a
+task, and staged files are returned as soon as their batch is done. Worker
+processes aren't forked, so like with any such multiprocessing pool they
+import the __main__ module of the user, which has to guard its entry point
+with `if __name__ == "__main__"`.
+"""
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import secrets
+import shutil
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from wandb import env
+from wandb.sdk.lib import filesystem
+from wandb.sdk.lib.hashutil import (
+    B64MD5,
+    lookup_md5_file_b64,
+    md5_copy_file_b64,
+    md5_file_b64,
+    record_md5_file_b64,
+)
+from wandb.sdk.lib.paths import FilePathStr, StrPath
+
+logger = logging.getLogger(__name__)
+
+STAGING_MODES = ("auto", "hardlink", "copy")
+
+REFLINK = "reflink"
+HARDLINK = "hardlink"
+COPY = "copy"
+
+# a batch holds at most this many files, or more bytes than this
+BATCH_FILES = 256
+BATCH_BYTES = 64 * 1024 * 1024
+
+DEFAULT_THREAD_WORKERS = 8
+
+
+class StagedFile(NamedTuple):
+    path: FilePathStr
+    digest: B64MD5
+    strategy: str
+
+
+def _changed(before: os.stat_result, after: os.stat_result) -> bool:
+    return (before.st_size, before.st_mtime_ns) != (after.st_size, after.st_mtime_ns)
+
+
+def stage_file(
+    src: StrPath,
+    staging_dir: StrPath,
+    digest: Optional[B64MD5] = None,
+    mode: Optional[str] = None,
+) -> StagedFile:
+    """Freeze the contents of `src` in `staging_dir`.
+
+    Arguments:
+        src: the file to stage.
+        staging_dir: the directory to stage the file in.
+        digest: the digest of `src`, if it is already known.
+        mode: one of STAGING_MODES, defaults to WANDB_ARTIFACT_STAGING_MODE.
+
+    Returns:
+        The staged file with the digest of its contents and the strategy used.
+    """
+    mode = mode or env.get_artifact_staging_mode()
+    if mode not in STAGING_MODES:
+        raise ValueError(
+            f"Invalid artifact staging mode {mode!r}, expected one of {STAGING_MODES}"
+        )
+    dst = os.path.join(staging_dir, f"tmp{secrets.token_hex(8)}")
+    before = os.stat(src)
+    if digest is None:
+        digest = lookup_md5_file_b64(src)
+    devices = (before.st_dev, os.stat(staging_dir).st_dev)
+
+    if mode != "copy" and filesystem.try_link(REFLINK, src, dst, devices):
+        strategy = REFLINK
+    elif mode == "hardlink" and filesystem.try_link(HARDLINK, src, dst, devices):
+        strategy = HARDLINK
+    elif digest is None:
+        # one read of the source both copies and hashes it, and the digest
+        # is that of the staged copy even if the source changes meanwhile
+        digest = md5_copy_file_b64(src, dst)
+        os.chmod(dst, 0o400)
+        if not _changed(before, os.stat(src)):
+            record_md5_file_b64(src, before, digest)
+        return StagedFile(FilePathStr(dst), digest, COPY)
+    else:
+        shutil.copyfile(src, dst)
+        strategy = COPY
+
+    if strategy != HARDLINK:
+        os.chmod(dst, 0o400)
+    if digest is None:
+        # hash the source, through the digest index
+        digest = md5_file_b64(src)
+    if _changed(before, os.stat(src)):
+        # the file changed while it was staged, use the digest of the copy
+        digest = md5_file_b64(dst)
+    return StagedFile(FilePathStr(dst), digest, strategy)
+
+
+def _batches(files: Iterable[Tuple[str, str]]) -> Iterator[List[Tuple[str, str]]]:
+    batch: List[Tuple[str, str]] = []
+    batch_bytes = 0
+    for logical_path, physical_path in files:
+        try:
+            size = os.path.getsize(physical_path)
+        except OSError:
+            # staging the file raises the error
+            size = 0
+        if batch and (len(batch) >= BATCH_FILES or batch_bytes + size > BATCH_BYTES):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append((logical_path, physical_path))
+        batch_bytes += size
+    if batch:
+        yield batch
+
+
+def _stage_batch(
+    batch: List[Tuple[str, str]], staging_dir: str, mode: str
+) -> List[Tuple[str, str, StagedFile]]:
+    return [
+        (logical_path, physical_path, stage_file(physical_path, staging_dir, mode=mode))
+        for logical_path, physical_path in batch
+    ]
+
+
+def _executor(max_workers: int, processes: bool) -> concurrent.futures.Executor:
+    if not processes:
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix="ArtifactStaging"
+        )
+    # forking the user's process would copy its threads' locks (ours, sqlite,
+    # the logging module) in whatever state they are in, so workers are
+    # started from a forkserver, or spawned where there is none
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+    else:
+        context = multiprocessing.get_context()
+    return concurrent.futures.ProcessPoolExecutor(max_workers, mp_context=context)
+
+
+def stage_files(
+    files: Iterable[Tuple[str, str]],
+    staging_dir: StrPath,
+    max_workers: Optional[int] = None,
+    processes: Optional[bool] = None,
+) -> Iterator[Tuple[str, str, StagedFile]]:
+    """Stage many files in parallel.
+
+    Arguments:
+        files: (logical path, physical path) pairs of the files to stage.
+        staging_dir: the directory to stage the files in.
+        max_workers: the number of workers, defaults to
+            WANDB_ARTIFACT_HASH_WORKERS, or 8 threads or a process per cpu.
+        processes: whether to stage files in worker processes rather than
+            threads, defaults to WANDB_ARTIFACT_HASH_PROCESSES.
+
+    Yields:
+        (logical path, physical path, staged file) in the order files are staged.
+    """
+    mode = env.get_artifact_staging_mode()
+    if mode not in STAGING_MODES:
+        raise ValueError(
+            f"Invalid artifact staging mode {mode!r}, expected one of {STAGING_MODES}"
+        )
+    if processes is None:
+        processes = env.get_artifact_hash_processes()
+    if max_workers is None:
+        max_workers = env.get_artifact_hash_workers()
+    if max_workers is None:
+        max_workers = (os.cpu_count() or 1) if processes else DEFAULT_THREAD_WORKERS
+
+    staging_dir = os.fspath(staging_dir)
+    with _executor(max_workers, processes) as executor:
+        futures = [
+            executor.submit(_stage_batch, batch, staging_dir, mode)
+            for batch in _batches(files)
+        ]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
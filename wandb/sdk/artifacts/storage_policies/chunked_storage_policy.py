@@ -0,0 +1,144 @@
+"""Chunked WandB storage policy."""
+import concurrent.futures
+import functools
+import mmap
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from wandb.sdk.artifacts import chunking
+from wandb.sdk.artifacts.artifact_manifest_entry import ArtifactManifestEntry
+from wandb.sdk.artifacts.storage_policies.wandb_storage_policy import WandbStoragePolicy
+from wandb.sdk.lib.hashutil import B64MD5, _b64_from_hasher, _md5, b64_to_hex_id
+from wandb.sdk.lib.paths import FilePathStr
+
+if TYPE_CHECKING:
+    from wandb.sdk.artifacts.artifact import Artifact
+
+# The directory of the artifact holding the chunks of its chunked files.
+CHUNKS_DIR = ".wandb-chunks"
+
+# Files smaller than this are stored whole.
+MIN_CHUNKED_FILE_SIZE = 64 * 1024**2
+
+MAX_PARALLEL_CHUNKS = 8
+
+
+class ChunkedStoragePolicy(WandbStoragePolicy):
+    """Stores large files as content-defined chunks, deduplicated by digest.
+
+    A chunked file is stored as one entry per distinct chunk, at
+    `.wandb-chunks/<hex md5 of the chunk>`, and the entry of the file lists
+    the digests of its chunks in `extra["chunks"]` instead of being uploaded.
+    Chunks unchanged since the previous version of the artifact have the same
+    path and digest as there, so they aren't uploaded again. Files are
+    reassembled from their chunks in the artifacts cache when downloaded.
+
+    Enabled with WANDB_ARTIFACT_CHUNKING=true, requires numpy.
+    """
+
+    @classmethod
+    def name(cls) -> str:
+        return "wandb-chunked-storage-policy-v1"
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "ChunkedStoragePolicy":
+        return cls(config=config)
+
+    @staticmethod
+    def chunk_path(digest: B64MD5) -> str:
+        return f"{CHUNKS_DIR}/{b64_to_hex_id(digest)}"
+
+    @staticmethod
+    def is_chunk_path(path: str) -> bool:
+        return path.startswith(CHUNKS_DIR + "/")
+
+    def split_entry(self, entry: ArtifactManifestEntry) -> List[ArtifactManifestEntry]:
+        """Store the chunks of the file of `entry` in the cache.
+
+        The entry keeps its digest and size but loses its local path, since
+        its contents are uploaded as its chunks.
+
+        Returns:
+            The entries of the distinct chunks of the file, none if the file
+            is stored whole.
+        """
+        if (
+            entry.local_path is None
+            or entry.size is None
+            or entry.size < MIN_CHUNKED_FILE_SIZE
+            or self.is_chunk_path(entry.path)
+        ):
+            return []
+
+        digests = []
+        chunk_entries: Dict[str, ArtifactManifestEntry] = {}
+        with open(entry.local_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    for start, end in chunking.chunk_bounds(view):
+                        chunk = view[start:end]
+                        digest = _b64_from_hasher(_md5(chunk))
+                        digests.append(digest)
+                        if digest not in chunk_entries:
+                            chunk_entries[digest] = self._store_chunk(digest, chunk)
+                        chunk.release()
+                finally:
+                    view.release()
+
+        entry.local_path = None
+        entry.extra = {**entry.extra, "chunks": digests}
+        return list(chunk_entries.values())
+
+    def _store_chunk(self, digest: B64MD5, chunk: memoryview) -> ArtifactManifestEntry:
+        path, hit, cache_open = self._cache.check_md5_obj_path(digest, len(chunk))
+        if not hit:
+            with cache_open(mode="wb") as f:
+                f.write(chunk)
+        return ArtifactManifestEntry(
+            path=self.chunk_path(digest),
+            digest=digest,
+            size=len(chunk),
+            local_path=path,
+        )
+
+    def load_file(
+        self,
+        artifact: "Artifact",
+        manifest_entry: ArtifactManifestEntry,
+    ) -> FilePathStr:
+        digests: Optional[List[B64MD5]] = manifest_entry.extra.get("chunks")
+        if not digests:
+            return super().load_file(artifact, manifest_entry)
+
+        path, hit, cache_open = self._cache.check_md5_obj_path(
+            B64MD5(manifest_entry.digest),
+            manifest_entry.size if manifest_entry.size is not None else 0,
+        )
+        if hit:
+            return path
+
+        unique_digests = list(dict.fromkeys(digests))
+        chunk_entries = [
+            artifact.manifest.entries[self.chunk_path(digest)]
+            for digest in unique_digests
+        ]
+        load_chunk = functools.partial(super().load_file, artifact)
+        with concurrent.futures.ThreadPoolExecutor(
+            MAX_PARALLEL_CHUNKS, thread_name_prefix="ArtifactChunks"
+        ) as executor:
+            chunk_paths = dict(
+                zip(unique_digests, executor.map(load_chunk, chunk_entries))
+            )
+
+        hasher = _md5()
+        with cache_open(mode="wb") as f:
+            for digest in digests:
+                with open(chunk_paths[digest], "rb") as chunk_file:
+                    data = chunk_file.read()
+                hasher.update(data)
+                f.write(data)
+            if _b64_from_hasher(hasher) != manifest_entry.digest:
+                raise ValueError(
+                    f"Digest mismatch reassembling {manifest_entry.path} from chunks"
+                )
+        return path
@@ -1,7 +1,11 @@
 """WandB storage policy."""
-import hashlib
+import asyncio
+import concurrent.futures
+import functools
 import math
+import os
 import shutil
+import threading
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
 from urllib.parse import quote
 
@@ -10,7 +14,14 @@ import urllib3
 
 from wandb.apis import InternalApi
 from wandb.errors.term import termwarn
+from wandb.sdk.artifacts import download_scheduler
 from wandb.sdk.artifacts.artifacts_cache import ArtifactsCache, get_artifacts_cache
+from wandb.sdk.artifacts.multipart import (
+    MultipartJournal,
+    max_parallel_parts,
+    part_digests,
+    read_part,
+)
 from wandb.sdk.artifacts.storage_handlers.azure_handler import AzureHandler
 from wandb.sdk.artifacts.storage_handlers.gcs_handler import GCSHandler
 from wandb.sdk.artifacts.storage_handlers.http_handler import HTTPHandler
@@ -115,8 +126,13 @@ class WandbStoragePolicy(StoragePolicy):
         if hit:
             return path
 
+        # large files are downloaded in parallel ranges, if the server supports it
+        range_header = download_scheduler.range_header(manifest_entry.size)
+
         if manifest_entry._download_url is not None:
-            response = self._session.get(manifest_entry._download_url, stream=True)
+            url = manifest_entry._download_url
+            kwargs: Dict[str, Any] = {}
+            response = self._get(url, range_header, **kwargs)
             try:
                 response.raise_for_status()
             except Exception:
@@ -126,20 +142,37 @@ class WandbStoragePolicy(StoragePolicy):
             auth = None
             if not _thread_local_api_settings.cookies:
                 auth = ("api", self._api.api_key)
-            response = self._session.get(
-                self._file_url(self._api, artifact.entity, manifest_entry),
-                auth=auth,
-                cookies=_thread_local_api_settings.cookies,
-                headers=_thread_local_api_settings.headers,
-                stream=True,
-            )
+            url = self._file_url(self._api, artifact.entity, manifest_entry)
+            kwargs = {
+                "auth": auth,
+                "cookies": _thread_local_api_settings.cookies,
+                "headers": _thread_local_api_settings.headers,
+            }
+            response = self._get(url, range_header, **kwargs)
             response.raise_for_status()
 
         with cache_open(mode="wb") as file:
-            for data in response.iter_content(chunk_size=16 * 1024):
-                file.write(data)
+            if response.status_code == 206:
+                download_scheduler.download_ranges(
+                    self._session, url, response, file, **kwargs
+                )
+            else:
+                download_scheduler.write_response(response, file)
         return path
 
+    def _get(
+        self,
+        url: str,
+        range_header: Optional[str],
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        if range_header:
+            headers = {**(headers or {}), "Range": range_header}
+        if headers is not None:
+            kwargs["headers"] = headers
+        return self._session.get(url, stream=True, **kwargs)
+
     def store_reference(
         self,
         artifact: "Artifact",
@@ -195,30 +228,47 @@ class WandbStoragePolicy(StoragePolicy):
         hex_digests: Dict[int, str],
         multipart_urls: Dict[int, str],
         extra_headers: Dict[str, str],
+        journal: Optional[MultipartJournal] = None,
+        progress_callback: Optional["progress.ProgressFn"] = None,
     ) -> List[Dict[str, Any]]:
-        etags = []
-        part_number = 1
-
-        with open(file_path, "rb") as f:
-            while True:
-                data = f.read(chunk_size)
-                if not data:
-                    break
-                md5_b64_str = str(hex_to_b64_id(hex_digests[part_number]))
-                upload_resp = self._api.upload_multipart_file_chunk_retry(
-                    multipart_urls[part_number],
-                    data,
-                    extra_headers={
-                        "content-md5": md5_b64_str,
-                        "content-length": str(len(data)),
-                        "content-type": extra_headers.get("Content-Type"),
-                    },
-                )
-                etags.append(
-                    {"partNumber": part_number, "hexMD5": upload_resp.headers["ETag"]}
-                )
-                part_number += 1
-        return etags
+        uploaded = 0
+        progress_lock = threading.Lock()
+
+        def report(nbytes: int) -> None:
+            nonlocal uploaded
+            if progress_callback is None:
+                return
+            with progress_lock:
+                uploaded += nbytes
+                progress_callback(nbytes, uploaded)
+
+        def upload_part(part_number: int) -> Dict[str, Any]:
+            if journal is not None and part_number in journal.parts:
+                # uploaded by an earlier attempt
+                offset = (part_number - 1) * chunk_size
+                report(max(0, min(chunk_size, os.path.getsize(file_path) - offset)))
+                return {"partNumber": part_number, "hexMD5": journal.parts[part_number]}
+            data = read_part(file_path, part_number, chunk_size)
+            md5_b64_str = str(hex_to_b64_id(hex_digests[part_number]))
+            upload_resp = self._api.upload_multipart_file_chunk_retry(
+                multipart_urls[part_number],
+                data,
+                extra_headers={
+                    "content-md5": md5_b64_str,
+                    "content-length": str(len(data)),
+                    "content-type": extra_headers.get("Content-Type"),
+                },
+            )
+            etag = upload_resp.headers["ETag"]
+            if journal is not None:
+                journal.add(part_number, etag)
+            report(len(data))
+            return {"partNumber": part_number, "hexMD5": etag}
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_parallel_parts(chunk_size), thread_name_prefix="MultipartUpload"
+        ) as executor:
+            return list(executor.map(upload_part, sorted(hex_digests)))
 
     def default_file_upload(
         self,
@@ -270,18 +320,11 @@ class WandbStoragePolicy(StoragePolicy):
             file_size >= S3_MIN_MULTI_UPLOAD_SIZE
             and file_size <= S3_MAX_MULTI_UPLOAD_SIZE
         ):
-            part_number = 1
-            with open(file_path, "rb") as f:
-                while True:
-                    data = f.read(chunk_size)
-                    if not data:
-                        break
-                    hex_digest = hashlib.md5(data).hexdigest()
-                    upload_parts.append(
-                        {"hexMD5": hex_digest, "partNumber": part_number}
-                    )
-                    hex_digests[part_number] = hex_digest
-                    part_number += 1
+            for part_number, hex_digest in enumerate(
+                part_digests(file_path, chunk_size), start=1
+            ):
+                upload_parts.append({"hexMD5": hex_digest, "partNumber": part_number})
+                hex_digests[part_number] = hex_digest
 
         resp = preparer.prepare_sync(
             {
@@ -314,6 +357,11 @@ class WandbStoragePolicy(StoragePolicy):
         else:
             if multipart_urls is None:
                 raise ValueError(f"No multipart urls to upload for file: {file_path}")
+            journal = None
+            if resp.upload_id:
+                journal = MultipartJournal.for_upload(
+                    resp.storage_path, resp.upload_id, entry.digest, chunk_size
+                )
             # Upload files using s3 multipart upload urls
             etags = self.s3_multipart_file_upload(
                 file_path,
@@ -321,10 +369,14 @@ class WandbStoragePolicy(StoragePolicy):
                 hex_digests,
                 multipart_urls,
                 extra_headers,
+                journal=journal,
+                progress_callback=progress_callback,
             )
             self._api.complete_multipart_upload_artifact(
                 artifact_id, resp.storage_path, etags, resp.upload_id
             )
+            if journal is not None:
+                journal.remove()
         self._write_cache(entry)
 
         return False
@@ -338,6 +390,21 @@ class WandbStoragePolicy(StoragePolicy):
         progress_callback: Optional["progress.ProgressFn"] = None,
     ) -> bool:
         """Async equivalent to `store_file_sync`."""
+        file_size = entry.size if entry.size is not None else 0
+        if S3_MIN_MULTI_UPLOAD_SIZE <= file_size <= S3_MAX_MULTI_UPLOAD_SIZE:
+            # upload the parts of large files concurrently, from worker threads
+            return await asyncio.get_event_loop().run_in_executor(
+                None,
+                functools.partial(
+                    self.store_file_sync,
+                    artifact_id,
+                    artifact_manifest_id,
+                    entry,
+                    preparer,
+                    progress_callback,
+                ),
+            )
+
         resp = await preparer.prepare_async(
             {
                 "artifactID": artifact_id,
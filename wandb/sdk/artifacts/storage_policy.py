@@ -16,6 +16,10 @@ class StoragePolicy:
         for sub in cls.__subclasses__():
             if sub.name() == name:
                 return sub
+            # policies extending another policy
+            found = sub.lookup_by_name(name)
+            if found is not None:
+                return found
         return None
 
     @classmethod
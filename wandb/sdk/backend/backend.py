@@ -154,11 +154,16 @@ class Backend:
         svc_iface = svc.service_interface
 
         svc_transport = svc_iface.get_transport()
-        if svc_transport == "tcp":
+        if svc_transport in ("tcp", "shm"):
             from ..interface.interface_sock import InterfaceSock
 
             svc_iface_sock = cast("ServiceSockInterface", svc_iface)
             sock_client = svc_iface_sock._get_sock_client()
+            if self._settings and self._settings._async_publish:
+                sock_client.start_async_publish(
+                    policy=self._settings._async_publish,
+                    max_size=self._settings._async_publish_max_size,
+                )
             sock_interface = InterfaceSock(sock_client, mailbox=self._mailbox)
             self.interface = sock_interface
         elif svc_transport == "grpc":
@@ -21,8 +21,10 @@ from wandb.proto import wandb_internal_pb2 as pb
 from wandb.proto import wandb_telemetry_pb2 as tpb
 from wandb.sdk.artifacts.artifact_manifest import ArtifactManifest
 from wandb.util import (
+    PLAIN_JSON_TYPES,
     WandBJSONEncoderOld,
     get_h5_typename,
+    json_dumps_plain,
     json_dumps_safer,
     json_dumps_safer_history,
     json_friendly,
@@ -632,19 +634,33 @@ class InterfaceBase:
     ) -> None:
         run = run or self._run
 
-        data = history_dict_to_json(run, data, step=user_step, ignore_copy_err=True)
-        data.pop("_step", None)
+        # plain values are encoded directly, the rest converted first
+        value_jsons: Dict[str, Optional[str]] = {}
+        others = {}
+        for k, v in data.items():
+            if type(v) in PLAIN_JSON_TYPES:
+                value_jsons[k] = json_dumps_plain(v)
+            else:
+                value_jsons[k] = None
+                others[k] = v
+        if others:
+            others = history_dict_to_json(
+                run, others, step=user_step, ignore_copy_err=True
+            )
+            for k, v in others.items():
+                value_jsons[k] = json_dumps_safer_history(v)
+        value_jsons.pop("_step", None)
 
         # add timestamp to the history request, if not already present
         # the timestamp might come from the tensorboard log logic
-        if "_timestamp" not in data:
-            data["_timestamp"] = time.time()
+        if "_timestamp" not in value_jsons:
+            value_jsons["_timestamp"] = json_dumps_plain(time.time())
 
         partial_history = pb.PartialHistoryRequest()
-        for k, v in data.items():
+        for k, value_json in value_jsons.items():
             item = partial_history.item.add()
             item.key = k
-            item.value_json = json_dumps_safer_history(v)
+            item.value_json = value_json
 
         if publish_step and step is not None:
             partial_history.step.num = step
@@ -18,13 +18,18 @@ header :=
 
 # TODO: possibly restructure code by porting the C++ or go implementation
 
+import bisect
 import logging
+import mmap
 import os
 import struct
+import sys
 import zlib
-from typing import TYPE_CHECKING, Tuple
+from array import array
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple
 
 import wandb
+from wandb.proto import wandb_internal_pb2
 
 if TYPE_CHECKING:
     from wandb.proto.wandb_internal_pb2 import Record
@@ -46,6 +51,23 @@ LEVELDBLOG_HEADER_MAGIC = (
 )
 LEVELDBLOG_HEADER_VERSION = 0
 
+LEVELDBLOG_INDEX_SUFFIX = ".idx"
+LEVELDBLOG_INDEX_MAGIC = b":WIX"
+LEVELDBLOG_INDEX_VERSION = 1
+
+# checksum, length, type of a record
+_RECORD_HEADER = struct.Struct("<IHB")
+# magic, version, number of records, indexed end offset, crc32 of the first block
+_INDEX_HEADER = struct.Struct("<4sHQQI")
+
+_RECORD_TYPE_FIELDS = {
+    field.name: field.number
+    for field in wandb_internal_pb2.Record.DESCRIPTOR.oneofs_by_name[
+        "record_type"
+    ].fields
+}
+_RECORD_TYPE_NAMES = {number: name for name, number in _RECORD_TYPE_FIELDS.items()}
+
 try:
     bytes("", "ascii")
 
@@ -293,3 +315,347 @@ class DataStore:
         if self._fp is not None:
             logger.info("close: %s", self._fname)
             self._fp.close()
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _peek_record(data: bytes) -> Tuple[int, int]:
+    """Return the `num` and record type field number of a serialized Record.
+
+    Walks the top level fields of the wire format without parsing nested
+    messages, so it costs a handful of byte lookups per record.
+    """
+    num = record_type = 0
+    pos, end = 0, len(data)
+    try:
+        while pos < end:
+            tag, pos = _read_varint(data, pos)
+            field, wire_type = tag >> 3, tag & 7
+            if wire_type == 0:
+                value, pos = _read_varint(data, pos)
+                if field == 1:
+                    num = value
+                continue
+            if field in _RECORD_TYPE_NAMES:
+                record_type = field
+            if wire_type == 2:
+                length, pos = _read_varint(data, pos)
+                pos += length
+            elif wire_type == 1:
+                pos += 8
+            elif wire_type == 5:
+                pos += 4
+            else:
+                break
+    except IndexError:
+        pass
+    return num, record_type
+
+
+class MappedDataStore:
+    """Read-only, memory-mapped view of a transaction log.
+
+    Opening the store builds an index of the start and end offset, `num` and
+    record type of every complete record, so records can be looked up by
+    position, type or number and read without scanning the file. The index
+    can be persisted next to the log with `save_index()`; a later `open()`
+    loads it and only indexes records appended since.
+
+    Unlike `DataStore` the file is never opened for writing, so offline tools
+    can use this outside of the internal process.
+    """
+
+    def __init__(self, fname: str, verify: bool = True) -> None:
+        self._fname = fname
+        self._verify = verify
+        self._fp = None
+        self._mm: Optional[mmap.mmap] = None
+        self._size = 0
+        self._starts = array("Q")
+        self._ends = array("Q")
+        self._nums = array("Q")
+        self._types = array("H")
+        self._indexed_end = LEVELDBLOG_HEADER_LEN
+        self._incomplete: Optional[str] = None
+
+        self._crc = [0] * (LEVELDBLOG_LAST + 1)
+        for x in range(1, LEVELDBLOG_LAST + 1):
+            self._crc[x] = zlib.crc32(strtobytes(chr(x))) & 0xFFFFFFFF
+
+    def __enter__(self) -> "MappedDataStore":
+        self.open()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @property
+    def incomplete(self) -> Optional[str]:
+        """Why the data after the last indexed record could not be read, if any."""
+        return self._incomplete
+
+    def open(self, index_fname: Optional[str] = None, build_index: bool = True) -> None:
+        """Map the log and index its records.
+
+        Arguments:
+            index_fname: Persisted index to load, defaults to the log name
+                with LEVELDBLOG_INDEX_SUFFIX appended.
+            build_index: Index records now; `scan()` works without an index.
+        """
+        logger.info("open mapped: %s", self._fname)
+        self._fp = open(self._fname, "rb")
+        self._remap()
+        assert (
+            self._size >= LEVELDBLOG_HEADER_LEN
+        ), "header is {} bytes instead of the expected {}".format(
+            self._size, LEVELDBLOG_HEADER_LEN
+        )
+        ident, magic, version = struct.unpack_from("<4sHB", self._mm)
+        if (
+            ident != strtobytes(LEVELDBLOG_HEADER_IDENT)
+            or magic != LEVELDBLOG_HEADER_MAGIC
+            or version != LEVELDBLOG_HEADER_VERSION
+        ):
+            raise Exception("Invalid header")
+        if build_index:
+            self._load_index(index_fname or self._fname + LEVELDBLOG_INDEX_SUFFIX)
+            self._index_records()
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def refresh(self) -> int:
+        """Map and index records appended since the last refresh.
+
+        Returns:
+            The number of new records.
+        """
+        count = len(self)
+        self._remap()
+        self._index_records()
+        return len(self) - count
+
+    def _remap(self) -> None:
+        size = os.fstat(self._fp.fileno()).st_size
+        if self._mm is not None:
+            if size == self._size:
+                return
+            self._mm.close()
+            self._mm = None
+        self._size = size
+        if size:
+            self._mm = mmap.mmap(self._fp.fileno(), size, access=mmap.ACCESS_READ)
+
+    def _decode(self, pos: int) -> Tuple[bytes, int]:
+        """Decode the record at `pos`, returning its data and end offset.
+
+        Raises:
+            EOFError: The record extends past the end of the file.
+            AssertionError: The record is corrupt.
+        """
+        mm, size = self._mm, self._size
+        space_left = LEVELDBLOG_BLOCK_LEN - pos % LEVELDBLOG_BLOCK_LEN
+        if space_left < LEVELDBLOG_HEADER_LEN:
+            if pos + space_left > size:
+                raise EOFError("padding is truncated")
+            assert mm[pos : pos + space_left] == bytes(space_left), "invalid padding"
+            pos += space_left
+
+        chunks = []
+        expected: Tuple[int, ...] = (LEVELDBLOG_FULL, LEVELDBLOG_FIRST)
+        while True:
+            if pos + LEVELDBLOG_HEADER_LEN > size:
+                raise EOFError("record header is truncated")
+            checksum, dlength, dtype = _RECORD_HEADER.unpack_from(mm, pos)
+            pos += LEVELDBLOG_HEADER_LEN
+            assert (
+                dtype in expected
+            ), f"expected record to be type {expected} but found {dtype}"
+            if pos + dlength > size:
+                raise EOFError("record data is truncated")
+            data = mm[pos : pos + dlength]
+            pos += dlength
+            if self._verify:
+                checksum_computed = zlib.crc32(data, self._crc[dtype]) & 0xFFFFFFFF
+                assert (
+                    checksum == checksum_computed
+                ), "record checksum is invalid, data may be corrupt"
+            if dtype == LEVELDBLOG_FULL:
+                return data, pos
+            chunks.append(data)
+            if dtype == LEVELDBLOG_LAST:
+                return b"".join(chunks), pos
+            expected = (LEVELDBLOG_MIDDLE, LEVELDBLOG_LAST)
+
+    def _complete_records(self, pos: int) -> Iterator[Tuple[int, bytes, int]]:
+        """Yield the start, data and end offset of complete records from `pos`.
+
+        Stops at a record that can't be read yet and sets `incomplete`.
+
+        Raises:
+            AssertionError: A record before the last block is corrupt.
+        """
+        self._incomplete = None
+        while pos < self._size:
+            try:
+                data, end = self._decode(pos)
+            except EOFError as e:
+                # the writer may still be appending this record
+                self._incomplete = str(e)
+                return
+            except AssertionError as e:
+                # corruption in the last block is most likely an interrupted write
+                if pos <= self._size - LEVELDBLOG_DATA_LEN:
+                    raise
+                self._incomplete = str(e)
+                return
+            yield pos, data, end
+            pos = end
+
+    def _index_records(self) -> None:
+        for start, data, end in self._complete_records(self._indexed_end):
+            num, record_type = _peek_record(data)
+            self._starts.append(start)
+            self._ends.append(end)
+            self._nums.append(num)
+            self._types.append(record_type)
+            self._indexed_end = end
+
+    def records(self) -> Iterator[bytes]:
+        """Yield every complete record in order, without indexing them.
+
+        For a single pass over the log, after `open(build_index=False)`; like
+        `open()`, sets `incomplete` if the log ends in a partial record.
+
+        Raises:
+            AssertionError: A record before the last block is corrupt.
+        """
+        for _, data, _ in self._complete_records(LEVELDBLOG_HEADER_LEN):
+            yield data
+
+    def _index_checksum(self, end: int) -> int:
+        return zlib.crc32(self._mm[: min(end, LEVELDBLOG_BLOCK_LEN)]) & 0xFFFFFFFF
+
+    def _load_index(self, index_fname: str) -> None:
+        try:
+            with open(index_fname, "rb") as f:
+                header = f.read(_INDEX_HEADER.size)
+                if len(header) != _INDEX_HEADER.size:
+                    return
+                magic, version, count, end, checksum = _INDEX_HEADER.unpack(header)
+                if (
+                    magic != LEVELDBLOG_INDEX_MAGIC
+                    or version != LEVELDBLOG_INDEX_VERSION
+                    or end > self._size
+                    or checksum != self._index_checksum(end)
+                ):
+                    logger.info("ignoring stale index: %s", index_fname)
+                    return
+                columns = (array("Q"), array("Q"), array("Q"), array("H"))
+                for column in columns:
+                    column.fromfile(f, count)
+        except (OSError, EOFError):
+            return
+        if sys.byteorder == "big":
+            for column in columns:
+                column.byteswap()
+        self._starts, self._ends, self._nums, self._types = columns
+        self._indexed_end = end
+
+    def save_index(self, index_fname: Optional[str] = None) -> str:
+        """Persist the record index next to the log, or to `index_fname`."""
+        index_fname = index_fname or self._fname + LEVELDBLOG_INDEX_SUFFIX
+        end = self._indexed_end
+        columns = (self._starts, self._ends, self._nums, self._types)
+        if sys.byteorder == "big":
+            columns = tuple(array(c.typecode, c) for c in columns)
+            for column in columns:
+                column.byteswap()
+        tmp_fname = index_fname + ".tmp"
+        with open(tmp_fname, "wb") as f:
+            f.write(
+                _INDEX_HEADER.pack(
+                    LEVELDBLOG_INDEX_MAGIC,
+                    LEVELDBLOG_INDEX_VERSION,
+                    len(self),
+                    end,
+                    self._index_checksum(end),
+                )
+            )
+            for column in columns:
+                column.tofile(f)
+        os.replace(tmp_fname, index_fname)
+        return index_fname
+
+    def offsets(self, n: int) -> Tuple[int, int]:
+        """Return the start and end offset of record `n`."""
+        return self._starts[n], self._ends[n]
+
+    def record_type(self, n: int) -> str:
+        """Return the record type (e.g. "history") of record `n`."""
+        return _RECORD_TYPE_NAMES.get(self._types[n], "")
+
+    def select(self, record_type: str) -> List[int]:
+        """Return the positions of all records of `record_type`."""
+        number = _RECORD_TYPE_FIELDS[record_type]
+        return [n for n, t in enumerate(self._types) if t == number]
+
+    def find_offset(self, offset: int) -> Optional[int]:
+        """Return the position of the record starting at `offset`."""
+        n = bisect.bisect_left(self._starts, offset)
+        if n < len(self) and self._starts[n] == offset:
+            return n
+        return None
+
+    def find_num(self, num: int) -> Optional[int]:
+        """Return the position of the record with `Record.num` equal to `num`."""
+        try:
+            return self._nums.index(num)
+        except ValueError:
+            return None
+
+    def read(self, n: int) -> bytes:
+        """Return the serialized record at position `n`."""
+        data, _ = self._decode(self._starts[n])
+        return data
+
+    def read_batch(self, positions: Iterable[int]) -> List[bytes]:
+        return [self._decode(self._starts[n])[0] for n in positions]
+
+    def parse_batch(self, positions: Iterable[int]) -> List["Record"]:
+        records = []
+        for data in self.read_batch(positions):
+            record = wandb_internal_pb2.Record()
+            record.ParseFromString(data)
+            records.append(record)
+        return records
+
+    def scan(self, start_offset: int, final_offset: int) -> Iterator[Tuple[bytes, int]]:
+        """Yield the data and end offset of records between two offsets.
+
+        This does not need the index, so it can follow a log that is still
+        being written, such as the `sender_read` replay of the live run file.
+        """
+        if final_offset > self._size:
+            self._remap()
+        pos = start_offset
+        while pos < final_offset:
+            data, pos = self._decode(pos)
+            yield data, pos
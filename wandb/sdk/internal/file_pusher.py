@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from wandb.sdk.artifacts import artifact_saver
     from wandb.sdk.artifacts.artifact_manifest import ArtifactManifest
     from wandb.sdk.internal import file_stream, internal_api
+    from wandb.sdk.internal.pipeline_stats import PipelineStats
     from wandb.sdk.internal.settings_static import SettingsStatic
 
 
@@ -43,6 +44,7 @@ class FilePusher:
         api: "internal_api.Api",
         file_stream: "file_stream.FileStreamApi",
         settings: Optional["SettingsStatic"] = None,
+        pipeline_stats: Optional["PipelineStats"] = None,
     ) -> None:
         self._api = api
 
@@ -66,9 +68,10 @@ class FilePusher:
             self._api,
             self._stats,
             self._event_queue,
-            self.MAX_UPLOAD_JOBS,
+            (settings and settings._max_upload_jobs) or self.MAX_UPLOAD_JOBS,
             file_stream=file_stream,
             settings=settings,
+            pipeline_stats=pipeline_stats,
         )
         self._step_upload.start()
 
@@ -1,6 +1,8 @@
 import base64
 import functools
+import gzip
 import itertools
+import json
 import logging
 import os
 import queue
@@ -8,12 +10,14 @@ import random
 import sys
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     NamedTuple,
     Optional,
@@ -24,6 +28,8 @@ from typing import (
 )
 
 if TYPE_CHECKING:
+    from wandb.sdk.internal.pipeline_stats import PipelineStats
+
     if sys.version_info >= (3, 8):
         from typing import TypedDict
     else:
@@ -293,12 +299,131 @@ class BinaryFilePolicy(DefaultFilePolicy):
         return {"offset": self._offset, "content": enc, "encoding": "base64"}
 
 
+def _chunk_size(chunk: Chunk) -> int:
+    data = chunk.data
+    return len(data) if isinstance(data, (str, bytes)) else 0
+
+
+class AdaptiveBatchPolicy:
+    """Chooses when the file stream flushes and how much each flush carries.
+
+    The baseline cadence is `rate_limit_seconds`, which already follows the
+    `heartbeat_seconds` limit the server sends back. Around it:
+
+    - the flush interval shrinks as the backlog fills a request, down to an
+      immediate flush once a full request is waiting;
+    - each flush carries as many full requests as fit into one interval at the
+      measured request latency, so a burst drains in a few large flushes
+      without a long run of back-to-back requests starving heartbeats and
+      control messages.
+    """
+
+    LATENCY_SMOOTHING = 0.2
+
+    def __init__(
+        self,
+        rate_limit_seconds: Callable[[], Union[int, float]],
+        request_bytes: int = util.MAX_LINE_BYTES,
+        max_inflight: int = 1,
+    ) -> None:
+        self._rate_limit_seconds = rate_limit_seconds
+        self._request_bytes = request_bytes
+        self._max_inflight = max_inflight
+        self._latency: Optional[float] = None
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Smoothed request latency in seconds, None until a request completes."""
+        return self._latency
+
+    def observe_latency(self, seconds: float) -> None:
+        if self._latency is None:
+            self._latency = seconds
+        else:
+            self._latency += self.LATENCY_SMOOTHING * (seconds - self._latency)
+
+    def flush_interval(self, backlog_bytes: int) -> float:
+        fill = min(1.0, backlog_bytes / self._request_bytes)
+        return float(self._rate_limit_seconds()) * (1.0 - fill)
+
+    def batch_bytes(self) -> int:
+        requests = self._max_inflight
+        if self._latency:
+            fit = int(self._rate_limit_seconds() / self._latency)
+            requests = max(requests, fit)
+        return requests * self._request_bytes
+
+
+class OrderedRequestPipeline:
+    """Runs requests concurrently while keeping requests for the same file ordered.
+
+    Each submitted request is tagged with the filenames it carries. A request
+    only starts once every earlier request that shares one of its filenames has
+    completed, so chunks of a given file always reach the server in order, while
+    requests for unrelated files (history vs. console output, say) overlap.
+
+    `submit` blocks once `max_inflight` requests are queued or running, which
+    pushes back on the caller instead of buffering without bound.
+    """
+
+    def __init__(self, max_inflight: int) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_inflight, thread_name_prefix="FileStreamRequest"
+        )
+        self._slots = threading.BoundedSemaphore(max_inflight)
+        self._lock = threading.Lock()
+        self._tails: Dict[str, "Future[Any]"] = {}
+        self._pending: Set["Future[Any]"] = set()
+
+    def submit(self, keys: Iterable[str], fn: Callable[[], Any]) -> "Future[Any]":
+        self._slots.acquire()
+        with self._lock:
+            keys = set(keys)
+            waits = [self._tails[k] for k in keys if k in self._tails]
+
+            def run() -> Any:
+                # Predecessors sit ahead of us in the executor's FIFO queue, so
+                # they are already running or done: waiting cannot deadlock.
+                for w in waits:
+                    w.exception()
+                return fn()
+
+            future = self._executor.submit(run)
+            for k in keys:
+                self._tails[k] = future
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: "Future[Any]") -> None:
+        with self._lock:
+            self._pending.discard(future)
+            for k in [k for k, f in self._tails.items() if f is future]:
+                del self._tails[k]
+        self._slots.release()
+
+    def drain(self) -> None:
+        """Block until every submitted request has completed."""
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.exception()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
 class FileStreamApi:
     """Pushes chunks of files to our streaming endpoint.
 
     This class is used as a singleton. It has a thread that serializes access to
     the streaming endpoint and performs rate-limiting and batching.
 
+    Request bodies can optionally be compressed (`compression="gzip"` or
+    `"zstd"`), and with `max_inflight > 1` data requests are pipelined through
+    an `OrderedRequestPipeline` so that a slow response does not hold back
+    chunks of unrelated files.
+
     TODO: Differentiate between binary/text encoding.
     """
 
@@ -321,6 +446,9 @@ class FileStreamApi:
         start_time: float,
         timeout: float = 0,
         settings: Optional[dict] = None,
+        compression: Optional[str] = None,
+        max_inflight: int = 1,
+        pipeline_stats: Optional["PipelineStats"] = None,
     ) -> None:
         settings = settings or dict()
         # NOTE: exc_info is set in thread_except_body context and readable by calling threads
@@ -342,6 +470,21 @@ class FileStreamApi:
         self._client.cookies.update(api.client.transport.cookies or {})  # type: ignore[no-untyped-call]
         self._file_policies: Dict[str, "DefaultFilePolicy"] = {}
         self._dropped_chunks: int = 0
+        self._response_lock = threading.Lock()
+        self._compression, self._compressor = self._get_compressor(compression)
+        # bytes of serialized request bodies before and after compression
+        self._bytes_uncompressed: int = 0
+        self._bytes_compressed: int = 0
+        self._pipeline_stats = pipeline_stats
+        self._pipeline: Optional[OrderedRequestPipeline] = None
+        if max_inflight > 1:
+            self._pipeline = OrderedRequestPipeline(max_inflight)
+        self._batch_policy = AdaptiveBatchPolicy(
+            self.rate_limit_seconds, max_inflight=max_inflight
+        )
+        # bytes pushed but not yet handed off to a request
+        self._backlog_bytes: int = 0
+        self._backlog_lock = threading.Lock()
         self._queue: queue.Queue = queue.Queue()
         self._thread = threading.Thread(target=self._thread_except_body)
         # It seems we need to make this a daemon thread to get sync.py's atexit handler to run, which
@@ -360,6 +503,31 @@ class FileStreamApi:
             run=self._run_id,
         )
 
+    @staticmethod
+    def _get_compressor(
+        compression: Optional[str],
+    ) -> Tuple[Optional[str], Optional[Callable[[bytes], bytes]]]:
+        if not compression:
+            return None, None
+        if compression == "zstd":
+            zstandard = util.get_module("zstandard")
+            if zstandard is not None:
+                return compression, zstandard.ZstdCompressor().compress
+            logger.warning("zstandard is not installed, using gzip for file stream")
+            compression = "gzip"
+        if compression == "gzip":
+            return compression, functools.partial(gzip.compress, compresslevel=6)
+        raise ValueError(f"Unsupported file stream compression: {compression}")
+
+    @property
+    def transmit_stats(self) -> Dict[str, int]:
+        """Bytes of request bodies before and after compression."""
+        with self._response_lock:
+            return {
+                "uncompressed_bytes": self._bytes_uncompressed,
+                "compressed_bytes": self._bytes_compressed,
+            }
+
     def start(self) -> None:
         self._init_endpoint()
         self._thread.start()
@@ -382,6 +550,11 @@ class FileStreamApi:
         ]
         return heartbeat_seconds
 
+    @property
+    def backlog_bytes(self) -> int:
+        """Approximate size of the chunks waiting to be sent."""
+        return self._backlog_bytes
+
     def rate_limit_seconds(self) -> Union[int, float]:
         run_time = time.time() - self._start_time
         if run_time < 60:
@@ -391,9 +564,10 @@ class FileStreamApi:
         else:
             return max(5.0, self.heartbeat_seconds)
 
-    def _read_queue(self) -> List:
+    def _read_queue(self, backlog_bytes: int = 0) -> List:
         # called from the push thread (_thread_body), this does an initial read
-        # that'll block for up to rate_limit_seconds. Then it tries to read
+        # that'll block for up to the flush interval picked by the batch policy
+        # (rate_limit_seconds when nothing is waiting). Then it tries to read
         # as much out of the queue as it can. We do this because the http post
         # to the server happens within _thread_body, and can take longer than
         # our rate limit. So next time we get a chance to read the queue we want
@@ -402,25 +576,41 @@ class FileStreamApi:
         # If we have more than MAX_ITEMS_PER_PUSH in the queue then the push thread
         # will get behind and data will buffer up in the queue.
         return util.read_many_from_queue(
-            self._queue, self.MAX_ITEMS_PER_PUSH, self.rate_limit_seconds()
+            self._queue,
+            self.MAX_ITEMS_PER_PUSH,
+            self._batch_policy.flush_interval(backlog_bytes),
         )
 
+    def _take_batch(self, ready_chunks: List[Chunk]) -> List[Chunk]:
+        """Remove and return the next batch from the front of `ready_chunks`."""
+        limit = self._batch_policy.batch_bytes()
+        size = 0
+        count = 0
+        for chunk in ready_chunks:
+            if count and size + _chunk_size(chunk) > limit:
+                break
+            size += _chunk_size(chunk)
+            count += 1
+        batch = ready_chunks[:count]
+        del ready_chunks[:count]
+        with self._backlog_lock:
+            self._backlog_bytes -= size
+        return batch
+
     def _thread_body(self) -> None:
         posted_data_time = time.time()
         posted_anything_time = time.time()
-        ready_chunks = []
+        ready_chunks: List[Chunk] = []
         uploaded: Set[str] = set()
         finished: Optional["FileStreamApi.Finish"] = None
         while finished is None:
-            items = self._read_queue()
+            items = self._read_queue(self._backlog_bytes)
             for item in items:
                 if isinstance(item, self.Finish):
                     finished = item
                 elif isinstance(item, self.Preempting):
-                    request_with_retry(
-                        self._client.post,
-                        self._endpoint,
-                        json={
+                    self._post(
+                        {
                             "complete": False,
                             "preempting": True,
                             "dropped": self._dropped_chunks,
@@ -436,15 +626,18 @@ class FileStreamApi:
 
             cur_time = time.time()
 
-            if ready_chunks and (
-                finished or cur_time - posted_data_time > self.rate_limit_seconds()
+            flush_interval = self._batch_policy.flush_interval(self._backlog_bytes)
+            while ready_chunks and (
+                finished or cur_time - posted_data_time >= flush_interval
             ):
                 posted_data_time = cur_time
                 posted_anything_time = cur_time
-                success = self._send(ready_chunks, uploaded=uploaded)
-                ready_chunks = []
+                success = self._send(self._take_batch(ready_chunks), uploaded=uploaded)
                 if success:
                     uploaded = set()
+                if not finished:
+                    # leftovers go out on the next pass, after control messages
+                    break
 
             # If there aren't ready chunks or uploaded files, we still want to
             # send regular heartbeats so the backend doesn't erroneously mark this
@@ -456,10 +649,8 @@ class FileStreamApi:
                 # list of uploaded files, don't reset the `uploaded`
                 # list. Retry publishing the list on the next attempt.
                 if not isinstance(
-                    request_with_retry(
-                        self._client.post,
-                        self._endpoint,
-                        json={
+                    self._post(
+                        {
                             "complete": False,
                             "failed": False,
                             "dropped": self._dropped_chunks,
@@ -470,17 +661,27 @@ class FileStreamApi:
                 ):
                     uploaded = set()
 
+        # every data request must land before the run is marked complete
+        if self._pipeline:
+            self._pipeline.drain()
+            self._pipeline.shutdown()
+
         # post the final close message. (item is self.Finish instance now)
-        request_with_retry(
-            self._client.post,
-            self._endpoint,
-            json={
+        self._post(
+            {
                 "complete": True,
                 "exitcode": int(finished.exitcode),
                 "dropped": self._dropped_chunks,
                 "uploaded": list(uploaded),
             },
         )
+        if self._compression:
+            logger.info(
+                "file stream sent %d bytes (%d uncompressed, %s)",
+                self._bytes_compressed,
+                self._bytes_uncompressed,
+                self._compression,
+            )
 
     def _thread_except_body(self) -> None:
         # TODO: Consolidate with internal_util.ExceptionThread
@@ -493,6 +694,52 @@ class FileStreamApi:
             wandb._sentry.exception(exc_info)
             raise e
 
+    def _post(
+        self, payload: Dict[str, Any], **kwargs: Any
+    ) -> Union["requests.Response", "requests.RequestException"]:
+        """Post a JSON payload to the file stream endpoint, compressing if enabled."""
+        start_time = time.monotonic()
+        if not self._compressor:
+            response = request_with_retry(
+                self._client.post, self._endpoint, json=payload, **kwargs
+            )
+            if self._pipeline_stats is not None:
+                self._pipeline_stats.log_transfer(
+                    "file_stream",
+                    len(json.dumps(payload).encode("utf-8")),
+                    time.monotonic() - start_time,
+                )
+            return response
+        body = json.dumps(payload).encode("utf-8")
+        data = self._compressor(body)
+        with self._response_lock:
+            self._bytes_uncompressed += len(body)
+            self._bytes_compressed += len(data)
+        response = request_with_retry(
+            self._client.post,
+            self._endpoint,
+            data=data,
+            headers={
+                "Content-Type": "application/json",
+                "Content-Encoding": self._compression,
+            },
+            **kwargs,
+        )
+        if self._pipeline_stats is not None:
+            self._pipeline_stats.log_transfer(
+                "file_stream", len(data), time.monotonic() - start_time
+            )
+        return response
+
+    def _post_files(self, fs: Dict[str, Any]) -> None:
+        start_time = time.monotonic()
+        response = self._post(
+            {"files": fs, "dropped": self._dropped_chunks},
+            retry_callback=self._api.retry_callback,
+        )
+        self._batch_policy.observe_latency(time.monotonic() - start_time)
+        self._handle_response(response)
+
     def _handle_response(self, response: Union[Exception, "requests.Response"]) -> None:
         """Log dropped chunks and updates dynamic settings."""
         if isinstance(response, Exception):
@@ -500,7 +747,8 @@ class FileStreamApi:
                 "Dropped streaming file chunk (see wandb/debug-internal.log)"
             )
             logging.exception("dropped chunk %s" % response)
-            self._dropped_chunks += 1
+            with self._response_lock:
+                self._dropped_chunks += 1
         else:
             parsed: Optional[dict] = None
             try:
@@ -530,21 +778,17 @@ class FileStreamApi:
                 del files[filename]
 
         for fs in file_stream_utils.split_files(files, max_bytes=util.MAX_LINE_BYTES):
-            self._handle_response(
-                request_with_retry(
-                    self._client.post,
-                    self._endpoint,
-                    json={"files": fs, "dropped": self._dropped_chunks},
-                    retry_callback=self._api.retry_callback,
+            if self._pipeline:
+                self._pipeline.submit(
+                    fs.keys(), functools.partial(self._post_files, fs)
                 )
-            )
+            else:
+                self._post_files(fs)
 
         if uploaded_list:
             if isinstance(
-                request_with_retry(
-                    self._client.post,
-                    self._endpoint,
-                    json={
+                self._post(
+                    {
                         "complete": False,
                         "failed": False,
                         "dropped": self._dropped_chunks,
@@ -560,6 +804,8 @@ class FileStreamApi:
         name = path.split("/")[-1]
         with open(path) as f:
             self._send([Chunk(name, line) for line in f])
+        if self._pipeline:
+            self._pipeline.drain()
 
     def enqueue_preempting(self) -> None:
         self._queue.put(self.Preempting())
@@ -571,7 +817,10 @@ class FileStreamApi:
             filename: Name of file that this is a chunk of.
             data: File data.
         """
-        self._queue.put(Chunk(filename, data))
+        chunk = Chunk(filename, data)
+        with self._backlog_lock:
+            self._backlog_bytes += _chunk_size(chunk)
+        self._queue.put(chunk)
 
     def push_success(self, artifact_id: str, save_name: str) -> None:
         """Notification that a file upload has been successfully completed.
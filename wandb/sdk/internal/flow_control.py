@@ -13,6 +13,8 @@ Thresholds:
     Threshold_High_MaxOutstandingData      - When above this, stop sending requests to sender
     Threshold_Mid_StartSendingReadRequests - When below this, start sending read requests
     Threshold_Low_RestartSendingData       - When below this, start sending normal records
+    Threshold_FileStreamBacklog            - When the sender reports a file stream backlog
+                                             above this, pause until it drains below half
 
 State machine:
     FORWARDING
@@ -44,6 +46,9 @@ logger = logging.getLogger(__name__)
 # before falling back to the transaction log.
 DEFAULT_THRESHOLD = 128 * 1024 * 1024  # 128 MiB
 
+# Data the sender has accepted but the file stream has not posted yet.
+DEFAULT_FILE_STREAM_BACKLOG_THRESHOLD = 64 * 1024 * 1024  # 64 MiB
+
 
 def _get_request_type(record: "Record") -> Optional[str]:
     record_type = record.WhichOneof("record_type")
@@ -66,6 +71,7 @@ class StateContext:
     last_forwarded_offset: int = 0
     last_sent_offset: int = 0
     last_written_offset: int = 0
+    file_stream_backlog_bytes: int = 0
 
 
 class FlowControl:
@@ -81,6 +87,7 @@ class FlowControl:
         _threshold_bytes_high: int = 0,
         _threshold_bytes_mid: int = 0,
         _threshold_bytes_low: int = 0,
+        _threshold_backlog_bytes: int = 0,
     ) -> None:
         # thresholds to define when to PAUSE, RESTART, FORWARDING
         if (
@@ -93,18 +100,25 @@ class FlowControl:
             _threshold_bytes_mid = threshold // 2
             _threshold_bytes_low = threshold // 4
         assert _threshold_bytes_high > _threshold_bytes_mid > _threshold_bytes_low
+        if _threshold_backlog_bytes == 0:
+            _threshold_backlog_bytes = (
+                settings._file_stream_max_backlog_bytes
+                or DEFAULT_FILE_STREAM_BACKLOG_THRESHOLD
+            )
 
         # FSM definition
         state_forwarding = StateForwarding(
             forward_record=forward_record,
             pause_marker=pause_marker,
             threshold_pause=_threshold_bytes_high,
+            threshold_backlog=_threshold_backlog_bytes,
         )
         state_pausing = StatePausing(
             forward_record=forward_record,
             recover_records=recover_records,
             threshold_recover=_threshold_bytes_mid,
             threshold_forward=_threshold_bytes_low,
+            threshold_backlog=_threshold_backlog_bytes,
         )
         self._fsm = fsm.FsmWithContext(
             states=[state_forwarding, state_pausing],
@@ -146,9 +160,11 @@ class FlowControl:
 
 class StateShared:
     _context: StateContext
+    _threshold_backlog: int
 
-    def __init__(self) -> None:
+    def __init__(self, threshold_backlog: int) -> None:
         self._context = StateContext()
+        self._threshold_backlog = threshold_backlog
 
     def _update_written_offset(self, record: "Record") -> None:
         end_offset = record.control.end_offset
@@ -171,8 +187,11 @@ class StateShared:
         process_handler(record)
 
     def _process_status_report(self, record: "Record") -> None:
-        sent_offset = record.request.status_report.sent_offset
-        self._context.last_sent_offset = sent_offset
+        status_report = record.request.status_report
+        self._context.last_sent_offset = status_report.sent_offset
+        self._context.file_stream_backlog_bytes = (
+            status_report.file_stream_backlog_bytes
+        )
 
     def on_exit(self, record: "Record") -> StateContext:
         return self._context
@@ -184,6 +203,10 @@ class StateShared:
     def _behind_bytes(self) -> int:
         return self._context.last_forwarded_offset - self._context.last_sent_offset
 
+    @property
+    def _backlog_bytes(self) -> int:
+        return self._context.file_stream_backlog_bytes
+
 
 class StateForwarding(StateShared):
     _forward_record: Callable[["Record"], None]
@@ -195,14 +218,18 @@ class StateForwarding(StateShared):
         forward_record: Callable[["Record"], None],
         pause_marker: Callable[[], None],
         threshold_pause: int,
+        threshold_backlog: int,
     ) -> None:
-        super().__init__()
+        super().__init__(threshold_backlog=threshold_backlog)
         self._forward_record = forward_record
         self._pause_marker = pause_marker
         self._threshold_pause = threshold_pause
 
     def _should_pause(self, record: "Record") -> bool:
-        return self._behind_bytes >= self._threshold_pause
+        return (
+            self._behind_bytes >= self._threshold_pause
+            or self._backlog_bytes >= self._threshold_backlog
+        )
 
     def _pause(self, record: "Record") -> None:
         self._pause_marker()
@@ -227,21 +254,26 @@ class StatePausing(StateShared):
         recover_records: Callable[[int, int], None],
         threshold_recover: int,
         threshold_forward: int,
+        threshold_backlog: int,
     ) -> None:
-        super().__init__()
+        super().__init__(threshold_backlog=threshold_backlog)
         self._forward_record = forward_record
         self._recover_records = recover_records
         self._threshold_recover = threshold_recover
         self._threshold_forward = threshold_forward
 
+    @property
+    def _backlog_drained(self) -> bool:
+        return self._backlog_bytes < self._threshold_backlog // 2
+
     def _should_unpause(self, record: "Record") -> bool:
-        return self._behind_bytes < self._threshold_forward
+        return self._behind_bytes < self._threshold_forward and self._backlog_drained
 
     def _unpause(self, record: "Record") -> None:
         self._quiesce(record)
 
     def _should_recover(self, record: "Record") -> bool:
-        return self._behind_bytes < self._threshold_recover
+        return self._behind_bytes < self._threshold_recover and self._backlog_drained
 
     def _recover(self, record: "Record") -> None:
         self._quiesce(record)
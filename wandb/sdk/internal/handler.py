@@ -17,6 +17,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     cast,
 )
@@ -36,33 +37,48 @@ from wandb.proto.wandb_internal_pb2 import (
 from ..interface.interface_queue import InterfaceQueue
 from ..lib import handler_util, proto_util, tracelog
 from . import context, sample, tb_watcher
+from .metric_tracker import MetricTracker
 from .settings_static import SettingsStatic
 from .system.system_monitor import SystemMonitor
 
 if TYPE_CHECKING:
-    from wandb.proto.wandb_internal_pb2 import ArtifactDoneRequest, MetricSummary
+    from wandb.proto.wandb_internal_pb2 import ArtifactDoneRequest
 
 
 SummaryDict = Dict[str, Any]
 
+# tracker slot, mask of tracked statistics, summary names written when those
+# statistics change, whether to write the mean and whether to copy the value
+_MetricPlan = Tuple[int, int, Tuple[Tuple[int, str], ...], bool, bool]
+# key list, value and plan of a numeric history leaf
+_PendingMetric = Tuple[List[str], Any, _MetricPlan]
+
 logger = logging.getLogger(__name__)
 
 
-def _dict_nested_set(target: Dict[str, Any], key_list: Sequence[str], v: Any) -> None:
+def _dict_nested_target(
+    target: Dict[str, Any], key_list: Sequence[str]
+) -> Dict[str, Any]:
     # recurse down the dictionary structure:
-
-    for k in key_list[:-1]:
+    for k in key_list:
         target.setdefault(k, {})
         new_target = target.get(k)
         if TYPE_CHECKING:
             new_target = cast(Dict[str, Any], new_target)
         target = new_target
+    return target
+
+
+def _dict_nested_set(target: Dict[str, Any], key_list: Sequence[str], v: Any) -> None:
+    target = _dict_nested_target(target, key_list[:-1])
     # use the last element of the key to write the leaf:
     target[key_list[-1]] = v
 
 
 class HandleManager:
     _consolidated_summary: SummaryDict
+    _summary_dirty: Set[str]
+    _summary_removed: Set[str]
     _sampled_history: Dict[str, sample.UniformSampleAccumulator]
     _partial_history: Dict[str, Any]
     _run_proto: Optional[RunRecord]
@@ -76,7 +92,9 @@ class HandleManager:
     _tb_watcher: Optional[tb_watcher.TBWatcher]
     _metric_defines: Dict[str, MetricRecord]
     _metric_globs: Dict[str, MetricRecord]
-    _metric_track: Dict[Tuple[str, ...], float]
+    _metric_tracker: MetricTracker
+    _metric_plans: Dict[Tuple[str, ...], "_MetricPlan"]
+    _metric_pending: List["_PendingMetric"]
     _metric_copy: Dict[Tuple[str, ...], Any]
     _track_time: Optional[float]
     _accumulate_time: float
@@ -112,12 +130,17 @@ class HandleManager:
 
         # keep track of summary from key/val updates
         self._consolidated_summary = dict()
+        # top level summary keys changed or removed since the last summary update
+        self._summary_dirty = set()
+        self._summary_removed = set()
         self._sampled_history = defaultdict(sample.UniformSampleAccumulator)
         self._run_proto = None
         self._partial_history = dict()
         self._metric_defines = defaultdict(MetricRecord)
         self._metric_globs = defaultdict(MetricRecord)
-        self._metric_track = dict()
+        self._metric_tracker = MetricTracker()
+        self._metric_plans = dict()
+        self._metric_pending = []
         self._metric_copy = dict()
 
         # TODO: implement release protocol to clean this up
@@ -182,7 +205,7 @@ class HandleManager:
         elif state == defer.FLUSH_PARTIAL_HISTORY:
             self._flush_partial_history()
         elif state == defer.FLUSH_SUM:
-            self._save_summary(self._consolidated_summary, flush=True)
+            self._save_summary(flush=True)
 
         # defer is used to drive the sender finish state machine
         self._dispatch_record(record, always_send=True)
@@ -225,16 +248,38 @@ class HandleManager:
     def handle_alert(self, record: Record) -> None:
         self._dispatch_record(record)
 
-    def _save_summary(self, summary_dict: SummaryDict, flush: bool = False) -> None:
+    def _mark_summary_dirty(self, key: str) -> None:
+        self._summary_dirty.add(key)
+        self._summary_removed.discard(key)
+
+    def _save_summary(self, flush: bool = False) -> None:
+        """Send the summary to the sender.
+
+        Flushes persist the full summary as a `SummaryRecord`; every other update
+        is a `SummaryRecordRequest` carrying only the top level keys that changed
+        (or were removed) since the previous update.
+        """
         summary = SummaryRecord()
-        for k, v in summary_dict.items():
+        if flush:
+            keys: Iterable[str] = self._consolidated_summary.keys()
+        else:
+            keys = self._summary_dirty
+            for k in self._summary_removed:
+                summary.remove.add().key = k
+        for k in keys:
             update = summary.update.add()
             update.key = k
-            update.value_json = json.dumps(v)
+            update.value_json = json.dumps(self._consolidated_summary[k])
         if flush:
+            self._summary_dirty = set()
+            self._summary_removed = set()
             record = Record(summary=summary)
             self._dispatch_record(record)
         elif not self._settings._offline:
+            if not summary.update and not summary.remove:
+                return
+            self._summary_dirty = set()
+            self._summary_removed = set()
             # Send this summary update as a request since we arent persisting every update
             summary_record = SummaryRecordRequest(summary=summary)
             request_record = self._interface._make_request(
@@ -253,66 +298,60 @@ class HandleManager:
             if isinstance(v, numbers.Real):
                 self._sampled_history[k].add(v)
 
-    def _update_summary_metrics(
-        self,
-        s: "MetricSummary",
-        kl: List[str],
-        v: "numbers.Real",
-        float_v: float,
-        goal_max: Optional[bool],
-    ) -> bool:
-        updated = False
-        best_key: Optional[Tuple[str, ...]] = None
-        if s.none:
-            return False
-        if s.copy:
-            # non key list copy already done in _update_summary
-            if len(kl) > 1:
-                _dict_nested_set(self._consolidated_summary, kl, v)
-                return True
+    def _summary_metric_plan(self, kl: List[str], d: MetricRecord) -> "_MetricPlan":
+        """Resolve the summary options of a metric key into a cached plan."""
+        key = tuple(kl)
+        plan = self._metric_plans.get(key)
+        if plan is not None:
+            return plan
+        tracker = self._metric_tracker
+        s = d.summary
+        goal_max = d.goal == d.GOAL_MAXIMIZE if d.goal else None
+        outputs: List[Tuple[int, str]] = []
         if s.last:
-            last_key = tuple(kl + ["last"])
-            old_last = self._metric_track.get(last_key)
-            if old_last is None or float_v != old_last:
-                self._metric_track[last_key] = float_v
-                _dict_nested_set(self._consolidated_summary, last_key, v)
-                updated = True
-        if s.best:
-            best_key = tuple(kl + ["best"])
-        if s.max or best_key and goal_max:
-            max_key = tuple(kl + ["max"])
-            old_max = self._metric_track.get(max_key)
-            if old_max is None or float_v > old_max:
-                self._metric_track[max_key] = float_v
-                if s.max:
-                    _dict_nested_set(self._consolidated_summary, max_key, v)
-                    updated = True
-                if best_key:
-                    _dict_nested_set(self._consolidated_summary, best_key, v)
-                    updated = True
+            outputs.append((tracker.LAST, "last"))
+        if s.max or s.best and goal_max:
+            if s.max:
+                outputs.append((tracker.MAX, "max"))
+            if s.best:
+                outputs.append((tracker.MAX, "best"))
         # defaulting to minimize if goal is not supecified
-        if s.min or best_key and not goal_max:
-            min_key = tuple(kl + ["min"])
-            old_min = self._metric_track.get(min_key)
-            if old_min is None or float_v < old_min:
-                self._metric_track[min_key] = float_v
-                if s.min:
-                    _dict_nested_set(self._consolidated_summary, min_key, v)
-                    updated = True
-                if best_key:
-                    _dict_nested_set(self._consolidated_summary, best_key, v)
-                    updated = True
-        if s.mean:
-            tot_key = tuple(kl + ["tot"])
-            num_key = tuple(kl + ["num"])
-            avg_key = tuple(kl + ["mean"])
-            tot = self._metric_track.get(tot_key, 0.0)
-            num = self._metric_track.get(num_key, 0)
-            tot += float_v
-            num += 1
-            self._metric_track[tot_key] = tot
-            self._metric_track[num_key] = num
-            _dict_nested_set(self._consolidated_summary, avg_key, tot / num)
+        if s.min or s.best and not goal_max:
+            if s.min:
+                outputs.append((tracker.MIN, "min"))
+            if s.best:
+                outputs.append((tracker.MIN, "best"))
+        want = 0
+        for bit, _ in outputs:
+            want |= bit
+        # non key list copy already done in _update_summary
+        copy = s.copy and len(kl) > 1
+        plan = (tracker.slot(key), want, tuple(outputs), s.mean, copy)
+        self._metric_plans[key] = plan
+        return plan
+
+    def _update_summary_metrics(self, pending: List["_PendingMetric"]) -> bool:
+        """Fold the numeric leaves of one history row into the metric tracker."""
+        tracker = self._metric_tracker
+        changes = tracker.update_row(
+            [p[2][0] for p in pending], [float(p[1]) for p in pending]
+        )
+
+        updated = False
+        summary = self._consolidated_summary
+        for (kl, v, (slot, want, outputs, mean, copy)), changed in zip(
+            pending, changes
+        ):
+            if copy:
+                _dict_nested_set(summary, kl, v)
+            elif changed & want or mean:
+                values = {name: v for bit, name in outputs if changed & bit}
+                if mean:
+                    values["mean"] = tracker.mean(slot)
+                _dict_nested_target(summary, kl).update(values)
+            else:
+                continue
+            self._mark_summary_dirty(kl[0])
             updated = True
         return updated
 
@@ -331,23 +370,22 @@ class HandleManager:
                 # Store copy metric if not specified, or copy behavior
                 if not has_summary or (d and d.summary.copy):
                     self._consolidated_summary[kl[0]] = v
+                    self._mark_summary_dirty(kl[0])
                     return True
         if not d:
             return False
         if not has_summary:
             return False
-        if not isinstance(v, numbers.Real):
-            return False
+        # check the common types before the (slow) abstract base class
+        if type(v) is not float and type(v) is not int:
+            if not isinstance(v, numbers.Real):
+                return False
         if math.isnan(v):
             return False
-        float_v = float(v)
-        goal_max = None
-        if d.goal:
-            goal_max = d.goal == d.GOAL_MAXIMIZE
-        if self._update_summary_metrics(
-            d.summary, kl=kl, v=v, float_v=float_v, goal_max=goal_max
-        ):
-            return True
+        if d.summary.none:
+            return False
+        # summary metrics are computed for the whole row in _update_summary
+        self._metric_pending.append((kl, v, self._summary_metric_plan(kl, d)))
         return False
 
     def _update_summary_list(
@@ -392,11 +430,17 @@ class HandleManager:
         if not self._metric_defines:
             history_dict = self._update_summary_media_objects(history_dict)
             self._consolidated_summary.update(history_dict)
+            self._summary_dirty.update(history_dict)
+            self._summary_removed.difference_update(history_dict)
             return True
         updated = False
         for k, v in history_dict.items():
             if self._update_summary_list(kl=[k], v=v):
                 updated = True
+        if self._metric_pending:
+            if self._update_summary_metrics(self._metric_pending):
+                updated = True
+            self._metric_pending = []
         return updated
 
     def _history_assign_step(
@@ -513,7 +557,7 @@ class HandleManager:
         self._save_history(record.history)
         updated = self._update_summary(history_dict)
         if updated:
-            self._save_summary(self._consolidated_summary)
+            self._save_summary()
 
     def _flush_partial_history(
         self,
@@ -585,6 +629,7 @@ class HandleManager:
 
             # use the last element of the key to write the leaf:
             target[key[-1]] = json.loads(item.value_json)
+            self._mark_summary_dirty(key[0])
 
         for item in summary.remove:
             if len(item.nested_key) > 0:
@@ -604,8 +649,13 @@ class HandleManager:
 
             # use the last element of the key to erase the leaf:
             del target[key[-1]]
+            if len(key) == 1:
+                self._summary_dirty.discard(key[0])
+                self._summary_removed.add(key[0])
+            else:
+                self._mark_summary_dirty(key[0])
 
-        self._save_summary(self._consolidated_summary)
+        self._save_summary()
 
     def handle_exit(self, record: Record) -> None:
         if self._track_time is not None:
@@ -768,6 +818,7 @@ class HandleManager:
             self._metric_defines[metric.name].CopyFrom(metric)
         else:
             self._metric_defines[metric.name].MergeFrom(metric)
+        self._metric_plans.clear()
 
         # before dispatching, make sure step_metric is defined, if not define it and
         # dispatch it locally first
@@ -22,7 +22,7 @@ import threading
 import time
 import traceback
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 import psutil
 
@@ -30,9 +30,10 @@ import wandb
 
 from ..interface.interface_queue import InterfaceQueue
 from ..lib import tracelog
-from . import context, handler, internal_util, sender, writer
+from . import context, handler, internal_util, pipeline_stats, sender, writer
 
 if TYPE_CHECKING:
+    import http.server
     from queue import Queue
     from threading import Event
 
@@ -44,6 +45,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# seconds between writes of the pipeline stats file
+PIPELINE_STATS_INTERVAL = 10
+
 
 def wandb_internal(
     settings: "SettingsStatic",
@@ -98,10 +102,13 @@ def wandb_internal(
 
     context_keeper = context.ContextKeeper()
 
-    send_record_q: "Queue[Record]" = queue.Queue()
+    stats, stats_server = _setup_pipeline_stats(_settings)
+    queue_class = pipeline_stats.TimedQueue if stats is not None else queue.Queue
+
+    send_record_q: "Queue[Record]" = queue_class()
     tracelog.annotate_queue(send_record_q, "send_q")
 
-    write_record_q: "Queue[Record]" = queue.Queue()
+    write_record_q: "Queue[Record]" = queue_class()
     tracelog.annotate_queue(write_record_q, "write_q")
 
     record_sender_thread = SenderThread(
@@ -112,6 +119,7 @@ def wandb_internal(
         interface=publish_interface,
         debounce_interval_ms=5000,
         context_keeper=context_keeper,
+        pipeline_stats=stats,
     )
     threads.append(record_sender_thread)
 
@@ -123,6 +131,7 @@ def wandb_internal(
         interface=publish_interface,
         sender_q=send_record_q,
         context_keeper=context_keeper,
+        pipeline_stats=stats,
     )
     threads.append(record_writer_thread)
 
@@ -134,6 +143,7 @@ def wandb_internal(
         writer_q=write_record_q,
         interface=publish_interface,
         context_keeper=context_keeper,
+        pipeline_stats=stats,
     )
     threads.append(record_handler_thread)
 
@@ -142,12 +152,21 @@ def wandb_internal(
     for thread in threads:
         thread.start()
 
+    stats_fname = os.path.join(_settings.log_dir, pipeline_stats.STATS_FNAME)
+    stats_dumped = time.monotonic()
+
     interrupt_count = 0
     while not stopped.is_set():
         try:
             # wait for stop event
             while not stopped.is_set():
                 time.sleep(1)
+                if (
+                    stats is not None
+                    and time.monotonic() - stats_dumped >= PIPELINE_STATS_INTERVAL
+                ):
+                    stats.dump(stats_fname)
+                    stats_dumped = time.monotonic()
                 if process_check.is_dead():
                     logger.error("Internal process shutdown.")
                     stopped.set()
@@ -159,8 +178,17 @@ def wandb_internal(
                 logger.error("Internal process interrupted.")
                 stopped.set()
 
-    for thread in threads:
-        thread.join()
+    try:
+        for thread in threads:
+            thread.join()
+
+        if stats is not None:
+            stats.dump(stats_fname)
+    finally:
+        if stats_server:
+            stats_server.shutdown()
+            # release the port for the next run in this process
+            stats_server.server_close()
 
     def close_internal_log() -> None:
         root = logging.getLogger("wandb")
@@ -193,6 +221,23 @@ def _setup_tracelog() -> None:
         tracelog.enable(tracelog_mode)
 
 
+def _setup_pipeline_stats(
+    settings: "SettingsStatic",
+) -> Tuple[Optional[pipeline_stats.PipelineStats], Optional["http.server.HTTPServer"]]:
+    if not settings._pipeline_stats:
+        return None, None
+    # each run has its own stats, also when several share the wandb service
+    stats = pipeline_stats.PipelineStats()
+    if settings._pipeline_stats_port is None:
+        return stats, None
+    try:
+        return stats, pipeline_stats.serve(stats, settings._pipeline_stats_port)
+    except OSError as e:
+        # with several runs in one process only the first one binds the port
+        logger.warning("Not serving pipeline stats: %s", e)
+        return stats, None
+
+
 def configure_logging(
     log_fname: str, log_level: int, run_id: Optional[str] = None
 ) -> None:
@@ -248,12 +293,14 @@ class HandlerThread(internal_util.RecordLoopThread):
         interface: "InterfaceQueue",
         context_keeper: context.ContextKeeper,
         debounce_interval_ms: "float" = 1000,
+        pipeline_stats: Optional["pipeline_stats.PipelineStats"] = None,
     ) -> None:
         super().__init__(
             input_record_q=record_q,
             result_q=result_q,
             stopped=stopped,
             debounce_interval_ms=debounce_interval_ms,
+            pipeline_stats=pipeline_stats,
         )
         self.name = "HandlerThread"
         self._settings = settings
@@ -301,12 +348,14 @@ class SenderThread(internal_util.RecordLoopThread):
         interface: "InterfaceQueue",
         context_keeper: context.ContextKeeper,
         debounce_interval_ms: "float" = 5000,
+        pipeline_stats: Optional["pipeline_stats.PipelineStats"] = None,
     ) -> None:
         super().__init__(
             input_record_q=record_q,
             result_q=result_q,
             stopped=stopped,
             debounce_interval_ms=debounce_interval_ms,
+            pipeline_stats=pipeline_stats,
         )
         self.name = "SenderThread"
         self._settings = settings
@@ -322,6 +371,7 @@ class SenderThread(internal_util.RecordLoopThread):
             result_q=self._result_q,
             interface=self._interface,
             context_keeper=self._context_keeper,
+            pipeline_stats=self._pipeline_stats,
         )
 
     def _process(self, record: "Record") -> None:
@@ -351,12 +401,14 @@ class WriterThread(internal_util.RecordLoopThread):
         sender_q: "Queue[Record]",
         context_keeper: context.ContextKeeper,
         debounce_interval_ms: "float" = 1000,
+        pipeline_stats: Optional["pipeline_stats.PipelineStats"] = None,
     ) -> None:
         super().__init__(
             input_record_q=record_q,
             result_q=result_q,
             stopped=stopped,
             debounce_interval_ms=debounce_interval_ms,
+            pipeline_stats=pipeline_stats,
         )
         self.name = "WriterThread"
         self._settings = settings
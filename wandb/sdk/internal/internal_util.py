@@ -21,6 +21,8 @@ if TYPE_CHECKING:
 
     from wandb.proto.wandb_internal_pb2 import Record, Result
 
+    from .pipeline_stats import PipelineStats
+
     ExceptionType = Union[
         Tuple[Type[BaseException], BaseException, TracebackType],
         Tuple[None, None, None],
@@ -66,12 +68,14 @@ class RecordLoopThread(ExceptionThread):
         result_q: "Queue[Result]",
         stopped: "Event",
         debounce_interval_ms: "float" = 1000,
+        pipeline_stats: Optional["PipelineStats"] = None,
     ) -> None:
         ExceptionThread.__init__(self, stopped=stopped)
         self._input_record_q = input_record_q
         self._result_q = result_q
         self._stopped = stopped
         self._debounce_interval_ms = debounce_interval_ms
+        self._pipeline_stats = pipeline_stats
 
     def _setup(self) -> None:
         raise NotImplementedError
@@ -97,5 +101,15 @@ class RecordLoopThread(ExceptionThread):
             except queue.Empty:
                 continue
             tracelog.log_message_dequeue(record, self._input_record_q)
+            if self._pipeline_stats is None:
+                self._process(record)
+                continue
+            process_start = time.monotonic()
             self._process(record)
+            self._pipeline_stats.log_process(
+                self.name,
+                record,
+                getattr(self._input_record_q, "last_wait", None),
+                time.monotonic() - process_start,
+            )
         self._finish()
@@ -0,0 +1,82 @@
+"""Columnar running statistics for summary metrics."""
+
+from array import array
+from typing import Dict, List, Sequence, Tuple
+
+MetricKey = Tuple[str, ...]
+
+
+class MetricTracker:
+    """Track the running min, max, sum, count and last value of metrics.
+
+    Each metric key is interned once into a slot index. Statistics live in
+    preallocated typed arrays indexed by slot, so folding a value in costs a
+    few array reads and writes instead of building a tuple key and probing a
+    dict for every statistic.
+    """
+
+    # bits of the mask returned by `update`
+    LAST = 1
+    MIN = 2
+    MAX = 4
+
+    def __init__(self, capacity: int = 64) -> None:
+        self._slots: Dict[MetricKey, int] = {}
+        self._capacity = 0
+        self._min = array("d")
+        self._max = array("d")
+        self._sum = array("d")
+        self._last = array("d")
+        self._count = array("q")
+        self._grow(max(1, capacity))
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - self._capacity
+        zeros = [0.0] * extra
+        for column in (self._min, self._max, self._sum, self._last):
+            column.extend(zeros)
+        self._count.extend([0] * extra)
+        self._capacity = capacity
+
+    def slot(self, key: MetricKey) -> int:
+        """Return the slot of `key`, interning it on first use."""
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = len(self._slots)
+            if slot == self._capacity:
+                self._grow(self._capacity * 2)
+            self._slots[key] = slot
+        return slot
+
+    def update(self, slot: int, value: float) -> int:
+        """Fold `value` into `slot` and return a mask of the statistics that changed."""
+        count = self._count[slot]
+        if not count:
+            self._min[slot] = self._max[slot] = self._last[slot] = value
+            self._sum[slot] = value
+            self._count[slot] = 1
+            return self.LAST | self.MIN | self.MAX
+        changed = 0
+        if value != self._last[slot]:
+            self._last[slot] = value
+            changed |= self.LAST
+        if value < self._min[slot]:
+            self._min[slot] = value
+            changed |= self.MIN
+        if value > self._max[slot]:
+            self._max[slot] = value
+            changed |= self.MAX
+        self._sum[slot] += value
+        self._count[slot] = count + 1
+        return changed
+
+    def update_row(self, slots: Sequence[int], values: Sequence[float]) -> List[int]:
+        """Fold one history row into the tracker, one value per slot."""
+        update = self.update
+        return [update(slot, value) for slot, value in zip(slots, values)]
+
+    def mean(self, slot: int) -> float:
+        return self._sum[slot] / self._count[slot]
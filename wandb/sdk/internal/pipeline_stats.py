@@ -0,0 +1,262 @@
+"""pipeline_stats.
+
+Record where the internal process spends its time, per pipeline stage and
+record type: how long records wait in the queue of a stage, how long the
+stage takes to process them, and how many bytes pass through it.
+
+Collection is disabled by default. The internal process of a run with the
+_pipeline_stats setting creates a `PipelineStats` and hands it to its stages,
+so the stats of runs sharing the wandb service are kept apart.
+
+Functions:
+    to_openmetrics   - format a snapshot in the OpenMetrics text format
+    to_table         - format a snapshot as a text table
+    serve            - expose the stats of a run on a local http endpoint
+"""
+
+import http.server
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from wandb.proto import wandb_internal_pb2 as pb
+
+logger = logging.getLogger(__name__)
+
+STATS_FNAME = "pipeline-stats.json"
+
+# field name -> (openmetrics metric name, help)
+_METRICS = {
+    "count": ("wandb_pipeline_records_total", "records processed"),
+    "bytes": ("wandb_pipeline_bytes_total", "bytes processed"),
+    "wait_seconds": (
+        "wandb_pipeline_queue_wait_seconds_total",
+        "time records waited in the stage queue",
+    ),
+    "max_wait_seconds": (
+        "wandb_pipeline_queue_wait_seconds_max",
+        "longest time a record waited in the stage queue",
+    ),
+    "process_seconds": (
+        "wandb_pipeline_process_seconds_total",
+        "time spent processing records",
+    ),
+    "max_process_seconds": (
+        "wandb_pipeline_process_seconds_max",
+        "longest time spent processing a record",
+    ),
+}
+
+
+class TimedQueue(queue.Queue):
+    """Queue that remembers how long the last item returned by get() waited.
+
+    Only meaningful with a single consumer, like the record queues of the
+    internal process threads.
+    """
+
+    last_wait: Optional[float] = None
+
+    def _put(self, item: Any) -> None:
+        self.queue.append((time.monotonic(), item))
+
+    def _get(self) -> Any:
+        put_time, item = self.queue.popleft()
+        self.last_wait = time.monotonic() - put_time
+        return item
+
+
+class _StageStats:
+    __slots__ = (
+        "count",
+        "bytes",
+        "wait_seconds",
+        "max_wait_seconds",
+        "process_seconds",
+        "max_process_seconds",
+    )
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.bytes = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.process_seconds = 0.0
+        self.max_process_seconds = 0.0
+
+    def add(self, nbytes: int, wait: Optional[float], elapsed: float) -> None:
+        self.count += 1
+        self.bytes += nbytes
+        if wait is not None:
+            self.wait_seconds += wait
+            self.max_wait_seconds = max(self.max_wait_seconds, wait)
+        self.process_seconds += elapsed
+        self.max_process_seconds = max(self.max_process_seconds, elapsed)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class PipelineStats:
+    """The stats of the pipeline of a run, by stage and record type."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started = time.time()
+        self._stats: Dict[Tuple[str, str], _StageStats] = {}
+
+    def log_process(
+        self, stage: str, record: "pb.Record", wait: Optional[float], elapsed: float
+    ) -> None:
+        """Record that `stage` processed `record`."""
+        self.add(stage, _record_type(record), record.ByteSize(), wait, elapsed)
+
+    def log_transfer(self, stage: str, nbytes: int, elapsed: float) -> None:
+        """Record that `stage` sent `nbytes` (file stream, file sync)."""
+        self.add(stage, "transfer", nbytes, None, elapsed)
+
+    def add(
+        self,
+        stage: str,
+        record_type: str,
+        nbytes: int,
+        wait: Optional[float],
+        elapsed: float,
+    ) -> None:
+        with self._lock:
+            stats = self._stats.get((stage, record_type))
+            if stats is None:
+                stats = self._stats[(stage, record_type)] = _StageStats()
+            stats.add(nbytes, wait, elapsed)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            stages: Dict[str, Dict[str, Any]] = {}
+            for (stage, record_type), stats in sorted(self._stats.items()):
+                stages.setdefault(stage, {})[record_type] = stats.as_dict()
+        return {
+            "pid": os.getpid(),
+            "started": self._started,
+            "time": time.time(),
+            "stages": stages,
+        }
+
+    def dump(self, path: str) -> None:
+        """Write a snapshot to the json file `path`."""
+        snap = self.snapshot()
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(snap, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.exception("Failed to write pipeline stats to %s", path)
+
+
+def _record_type(record: "pb.Record") -> str:
+    record_type = str(record.WhichOneof("record_type"))
+    if record_type == "request":
+        record_type = str(record.request.WhichOneof("request_type"))
+    return record_type
+
+
+def to_openmetrics(snap: Dict[str, Any]) -> str:
+    lines = []
+    for field, (metric, help_text) in _METRICS.items():
+        kind = "counter" if metric.endswith("_total") else "gauge"
+        name = metric[: -len("_total")] if kind == "counter" else metric
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"# HELP {name} {help_text}")
+        for stage, record_types in snap["stages"].items():
+            for record_type, stats in record_types.items():
+                labels = f'stage="{stage}",record_type="{record_type}"'
+                lines.append(f"{metric}{{{labels}}} {stats[field]}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def to_table(snap: Dict[str, Any]) -> str:
+    """Format a snapshot as a text table, the slowest stages first."""
+    header = (
+        "stage",
+        "record type",
+        "count",
+        "wait avg ms",
+        "wait max ms",
+        "process avg ms",
+        "process max ms",
+        "bytes",
+    )
+    rows = []
+    for stage, record_types in snap["stages"].items():
+        for record_type, stats in record_types.items():
+            count = stats["count"] or 1
+            rows.append(
+                (
+                    stats["process_seconds"],
+                    (
+                        stage,
+                        record_type,
+                        str(stats["count"]),
+                        f"{stats['wait_seconds'] / count * 1000:.2f}",
+                        f"{stats['max_wait_seconds'] * 1000:.2f}",
+                        f"{stats['process_seconds'] / count * 1000:.2f}",
+                        f"{stats['max_process_seconds'] * 1000:.2f}",
+                        str(stats["bytes"]),
+                    ),
+                )
+            )
+    lines = [header] + [row for _, row in sorted(rows, key=lambda r: -r[0])]
+    widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if i < 2 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(line, widths))
+        ).rstrip()
+        for line in lines
+    )
+
+
+class _MetricsServer(http.server.HTTPServer):
+    pipeline_stats: PipelineStats
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    server: _MetricsServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path.rstrip("/") != "/metrics":
+            self.send_error(404)
+            return
+        snap = self.server.pipeline_stats.snapshot()
+        body = to_openmetrics(snap).encode("utf-8")
+        self.send_response(200)
+        self.send_header(
+            "Content-Type",
+            "application/openmetrics-text; version=1.0.0; charset=utf-8",
+        )
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(format, *args)
+
+
+def serve(stats: PipelineStats, port: int) -> http.server.HTTPServer:
+    """Serve `stats` at http://127.0.0.1:<port>/metrics from a daemon thread."""
+    server = _MetricsServer(("127.0.0.1", port), _MetricsHandler)
+    server.pipeline_stats = stats
+    thread = threading.Thread(
+        target=server.serve_forever, name="PipelineStatsServer", daemon=True
+    )
+    thread.start()
+    logger.info(
+        "Serving pipeline stats at http://127.0.0.1:%s/metrics", server.server_port
+    )
+    return server
@@ -69,9 +69,10 @@ if TYPE_CHECKING:
         Result,
         RunExitResult,
         RunRecord,
-        SummaryRecord,
     )
 
+    from .pipeline_stats import PipelineStats
+
     if sys.version_info >= (3, 8):
         from typing import Literal
     else:
@@ -198,6 +199,7 @@ class _OutputRawStream:
 class SendManager:
     UPDATE_CONFIG_TIME: int = 30
     UPDATE_STATUS_TIME: int = 5
+    UPDATE_SUMMARY_TIME: int = 5
 
     _settings: SettingsStatic
     _record_q: "Queue[Record]"
@@ -220,12 +222,13 @@ class SendManager:
     _cached_server_info: Dict[str, Any]
     _cached_viewer: Dict[str, Any]
     _server_messages: List[Dict[str, Any]]
-    _ds: Optional[datastore.DataStore]
+    _ds: Optional[datastore.MappedDataStore]
     _output_raw_streams: Dict["StreamLiterals", _OutputRawStream]
     _output_raw_file: Optional[filesystem.CRDedupedFile]
     _send_record_num: int
     _send_end_offset: int
     _debounce_config_time: float
+    _debounce_summary_time: float
     _debounce_status_time: float
 
     def __init__(
@@ -235,12 +238,14 @@ class SendManager:
         result_q: "Queue[Result]",
         interface: InterfaceQueue,
         context_keeper: context.ContextKeeper,
+        pipeline_stats: Optional["PipelineStats"] = None,
     ) -> None:
         self._settings = settings
         self._record_q = record_q
         self._result_q = result_q
         self._interface = interface
         self._context_keeper = context_keeper
+        self._pipeline_stats = pipeline_stats
 
         self._ds = None
         self._send_record_num = 0
@@ -289,6 +294,7 @@ class SendManager:
 
         # do we need to debounce?
         self._config_needs_debounce: bool = False
+        self._summary_needs_debounce: bool = False
 
         # TODO(jhr): do something better, why do we need to send full lines?
         self._partial_output = dict()
@@ -305,9 +311,15 @@ class SendManager:
         time_now = time.monotonic()
         self._debounce_config_time = time_now
         self._debounce_status_time = time_now
+        self._debounce_summary_time = time_now
 
     @classmethod
-    def setup(cls, root_dir: str, resume: Union[None, bool, str]) -> "SendManager":
+    def setup(
+        cls,
+        root_dir: str,
+        resume: Union[None, bool, str],
+        max_upload_jobs: Optional[int] = None,
+    ) -> "SendManager":
         """Set up a standalone SendManager.
 
         Currently, we're using this primarily for `sync.py`.
@@ -324,6 +336,8 @@ class SendManager:
             _async_upload_concurrency_limit=None,
             _file_stream_timeout_seconds=0,
         )
+        if max_upload_jobs:
+            settings.update(_max_upload_jobs=max_upload_jobs)
         settings = SettingsStatic(settings.to_proto())
         record_q: "Queue[Record]" = queue.Queue()
         result_q: "Queue[Result]" = queue.Queue()
@@ -423,8 +437,8 @@ class SendManager:
 
     def send_request_sender_read(self, record: "Record") -> None:
         if self._ds is None:
-            self._ds = datastore.DataStore()
-            self._ds.open_for_scan(self._settings.sync_file)
+            self._ds = datastore.MappedDataStore(self._settings.sync_file)
+            self._ds.open(build_index=False)
 
         # TODO(cancel_paused): implement cancel_set logic
         # The idea is that there is an active request to cancel a
@@ -432,14 +446,8 @@ class SendManager:
 
         start_offset = record.request.sender_read.start_offset
         final_offset = record.request.sender_read.final_offset
-        self._ds.seek(start_offset)
-
-        current_end_offset = 0
-        while current_end_offset < final_offset:
-            data = self._ds.scan_data()
-            assert data
-            current_end_offset = self._ds.get_offset()
 
+        for data, current_end_offset in self._ds.scan(start_offset, final_offset):
             send_record = wandb_internal_pb2.Record()
             send_record.ParseFromString(data)
             self._update_end_offset(current_end_offset)
@@ -506,15 +514,28 @@ class SendManager:
         status_report = wandb_internal_pb2.StatusReportRequest(
             record_num=self._send_record_num,
             sent_offset=self._send_end_offset,
+            file_stream_backlog_bytes=self._fs.backlog_bytes if self._fs else 0,
         )
         status_time = time.time()
         status_report.sync_time.FromMicroseconds(int(status_time * 1e6))
         record = self._interface._make_request(status_report=status_report)
         self._interface._publish(record)
 
+    def _maybe_update_summary(self, always: bool = False) -> None:
+        time_now = time.monotonic()
+        if (
+            not always
+            and time_now < self._debounce_summary_time + self.UPDATE_SUMMARY_TIME
+        ):
+            return
+        if self._summary_needs_debounce:
+            self._debounce_summary()
+        self._debounce_summary_time = time_now
+
     def debounce(self, final: bool = False) -> None:
         self._maybe_report_status(always=final)
         self._maybe_update_config(always=final)
+        self._maybe_update_summary(always=final)
 
     def _debounce_config(self) -> None:
         config_value_dict = self._config_format(self._consolidated_config)
@@ -1072,6 +1093,9 @@ class SendManager:
             self._run.start_time.ToMicroseconds() / 1e6,
             timeout=self._settings._file_stream_timeout_seconds,
             settings=self._api_settings,
+            compression=self._settings._file_stream_compression,
+            max_inflight=self._settings._file_stream_max_inflight or 1,
+            pipeline_stats=self._pipeline_stats,
         )
         # Ensure the streaming polices have the proper offsets
         self._fs.set_file_policy("wandb-summary.json", file_stream.SummaryFilePolicy())
@@ -1096,7 +1120,12 @@ class SendManager:
         wandb._sentry.configure_scope(tags=_settings, process_context="internal")
 
         self._fs.start()
-        self._pusher = FilePusher(self._api, self._fs, settings=self._settings)
+        self._pusher = FilePusher(
+            self._api,
+            self._fs,
+            settings=self._settings,
+            pipeline_stats=self._pipeline_stats,
+        )
         self._dir_watcher = DirWatcher(self._settings, self._pusher, file_dir)
         logger.info(
             "run started: %s with start time %s",
@@ -1113,18 +1142,25 @@ class SendManager:
         history_dict = proto_util.dict_from_proto_list(history.item)
         self._save_history(history_dict)
 
-    def _update_summary_record(self, summary: "SummaryRecord") -> None:
-        summary_dict = proto_util.dict_from_proto_list(summary.update)
-        self._cached_summary = summary_dict
-        self._update_summary()
-
     def send_summary(self, record: "Record") -> None:
-        self._update_summary_record(record.summary)
+        # summary records carry the full summary (final flush, or a synced run)
+        summary_dict = proto_util.dict_from_proto_list(record.summary.update)
+        self._cached_summary = summary_dict
+        self._update_summary(always=True)
 
     def send_request_summary_record(self, record: "Record") -> None:
-        self._update_summary_record(record.request.summary_record.summary)
+        # summary requests only carry the keys that changed since the last one
+        summary = record.request.summary_record.summary
+        self._cached_summary.update(proto_util.dict_from_proto_list(summary.update))
+        for item in summary.remove:
+            self._cached_summary.pop(item.key, None)
+        self._update_summary()
+
+    def _update_summary(self, always: bool = False) -> None:
+        self._summary_needs_debounce = True
+        self._maybe_update_summary(always=always)
 
-    def _update_summary(self) -> None:
+    def _debounce_summary(self) -> None:
         summary_dict = self._cached_summary.copy()
         summary_dict.pop("_wandb", None)
         if self._metadata_summary:
@@ -1132,11 +1168,11 @@ class SendManager:
         json_summary = json.dumps(summary_dict)
         if self._fs:
             self._fs.push(filenames.SUMMARY_FNAME, json_summary)
-        # TODO(jhr): we should only write this at the end of the script
         summary_path = os.path.join(self._settings.files_dir, filenames.SUMMARY_FNAME)
         with open(summary_path, "w") as f:
             f.write(json_summary)
         self._save_file(interface.GlobStr(filenames.SUMMARY_FNAME))
+        self._summary_needs_debounce = False
 
     def send_stats(self, record: "Record") -> None:
         stats = record.stats
@@ -1532,6 +1568,7 @@ class SendManager:
         logger.info("shutting down sender")
         # if self._tb_watcher:
         #     self._tb_watcher.finish()
+        self._maybe_update_summary(always=True)
         self._output_raw_finish()
         if self._dir_watcher:
             self._dir_watcher.finish()
@@ -1543,6 +1580,9 @@ class SendManager:
         if self._fs:
             self._fs.finish(self._exit_code)
             self._fs = None
+        if self._ds is not None:
+            self._ds.close()
+            self._ds = None
         wandb._sentry.end_session()
 
     def _max_cli_version(self) -> Optional[str]:
@@ -13,8 +13,11 @@ else:
 _Setting = Literal[
     "_args",
     "_aws_lambda",
+    "_async_publish",
+    "_async_publish_max_size",
     "_async_upload_concurrency_limit",
     "_cli_only_mode",
+    "_coalesce_history",
     "_colab",
     "_cuda",
     "_disable_meta",
@@ -25,6 +28,9 @@ _Setting = Literal[
     "_except_exit",
     "_executable",
     "_extra_http_headers",
+    "_file_stream_compression",
+    "_file_stream_max_backlog_bytes",
+    "_file_stream_max_inflight",
     "_file_stream_timeout_seconds",
     "_flow_control_custom",
     "_flow_control_disabled",
@@ -39,12 +45,15 @@ _Setting = Literal[
     "_live_policy_rate_limit",
     "_live_policy_wait_time",
     "_log_level",
+    "_max_upload_jobs",
     "_network_buffer",
     "_noop",
     "_notebook",
     "_offline",
     "_sync",
     "_os",
+    "_pipeline_stats",
+    "_pipeline_stats_port",
     "_platform",
     "_python",
     "_runqueue_item_id",
@@ -158,7 +167,13 @@ _Setting = Literal[
 ]
 
 SETTINGS_TOPOLOGICALLY_SORTED: Final[Tuple[_Setting, ...]] = (
+    "_async_publish",
+    "_async_publish_max_size",
     "_async_upload_concurrency_limit",
+    "_file_stream_compression",
+    "_file_stream_max_inflight",
+    "_max_upload_jobs",
+    "_pipeline_stats_port",
     "_service_wait",
     "_stats_sample_rate_seconds",
     "_stats_samples_to_average",
@@ -0,0 +1,201 @@
+"""Persistent index of file digests.
+
+Maps a file path to the md5 digest of its contents, together with the inode,
+size and modification time the file had when it was hashed. As long as a
+`stat()` of the file still matches, the digest can be reused without reading
+the file again.
+
+The index is a sqlite database in the wandb cache directory, shared by all
+processes of the user. sqlite serializes writers across processes, and any
+error using it only means files get hashed again. Like the artifacts cache
+index, it uses a rollback journal rather than WAL since the cache directory
+is often on NFS, where WAL doesn't work.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+try:
+    import sqlite3
+except ImportError:  # pragma: no cover - python built without sqlite
+    sqlite3 = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Files modified this recently are not indexed: another write within the
+# resolution of the filesystem timestamps would not change their mtime.
+RACY_WINDOW_NS = 2 * 1_000_000_000
+
+# Refresh the last use time of an entry at most this often, in seconds.
+_TOUCH_INTERVAL = 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS digests (
+    path TEXT PRIMARY KEY,
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS digests_used ON digests (used);
+"""
+
+
+class DigestIndex:
+    """Persistent mapping of file path and stat to the digest of the file.
+
+    Entries are invalidated when the file's device, inode, size or mtime
+    change, and the least recently used entries are evicted once there are
+    more than `max_entries`.
+    """
+
+    def __init__(self, db_path: str, max_entries: int = 1_000_000) -> None:
+        self._db_path = db_path
+        self._max_entries = max_entries
+        self._local = threading.local()
+        self._puts = 0
+        self._puts_lock = threading.Lock()
+        # Trim the index whenever this many entries were added
+        self._cleanup_interval = max(1, max_entries // 10)
+
+    def _connection(self) -> "sqlite3.Connection":
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # autocommit, every statement is its own short transaction
+            conn = sqlite3.connect(self._db_path, timeout=10, isolation_level=None)
+            # set explicitly to convert indexes created in WAL mode
+            conn.execute("PRAGMA journal_mode=DELETE")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def get(self, path: str, stat: os.stat_result) -> Optional[str]:
+        """Return the digest of `path` if the file didn't change since it was indexed."""
+        try:
+            return self._get(path, stat)
+        except sqlite3.Error as e:
+            disable_digest_index(e)
+            return None
+
+    def _get(self, path: str, stat: os.stat_result) -> Optional[str]:
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT dev, ino, size, mtime_ns, digest, used FROM digests WHERE path = ?",
+            (path,),
+        ).fetchone()
+        if row is None:
+            return None
+        dev, ino, size, mtime_ns, digest, used = row
+        if (dev, ino, size, mtime_ns) != (
+            stat.st_dev,
+            stat.st_ino,
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return None
+        now = int(time.time())
+        if now - used > _TOUCH_INTERVAL:
+            conn.execute("UPDATE digests SET used = ? WHERE path = ?", (now, path))
+        return digest
+
+    def put(self, path: str, stat: os.stat_result, digest: str) -> None:
+        """Record the digest of `path`, hashed while the file had `stat`."""
+        if int(time.time() * 1e9) - stat.st_mtime_ns < RACY_WINDOW_NS:
+            return
+        try:
+            self._put(path, stat, digest)
+        except sqlite3.Error as e:
+            disable_digest_index(e)
+
+    def _put(self, path: str, stat: os.stat_result, digest: str) -> None:
+        self._connection().execute(
+            "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                stat.st_dev,
+                stat.st_ino,
+                stat.st_size,
+                stat.st_mtime_ns,
+                digest,
+                int(time.time()),
+            ),
+        )
+        with self._puts_lock:
+            self._puts += 1
+            cleanup = self._puts % self._cleanup_interval == 0
+        if cleanup:
+            self.cleanup(self._max_entries)
+
+    def invalidate(self, path: str) -> None:
+        try:
+            self._connection().execute("DELETE FROM digests WHERE path = ?", (path,))
+        except sqlite3.Error as e:
+            disable_digest_index(e)
+
+    def cleanup(self, max_entries: int) -> int:
+        """Evict the least recently used entries beyond `max_entries`.
+
+        Returns the number of evicted entries.
+        """
+        conn = self._connection()
+        (count,) = conn.execute("SELECT COUNT(*) FROM digests").fetchone()
+        excess = count - max_entries
+        if excess <= 0:
+            return 0
+        conn.execute(
+            "DELETE FROM digests WHERE path IN "
+            "(SELECT path FROM digests ORDER BY used LIMIT ?)",
+            (excess,),
+        )
+        return excess
+
+
+_digest_index: Optional[DigestIndex] = None
+_digest_index_disabled = False
+_digest_index_lock = threading.Lock()
+
+
+def get_digest_index() -> Optional[DigestIndex]:
+    """Return the digest index of the user, or None if it can't be used."""
+    global _digest_index, _digest_index_disabled
+    if _digest_index is not None or _digest_index_disabled:
+        return _digest_index
+    from wandb import env
+
+    with _digest_index_lock:
+        if _digest_index is None and not _digest_index_disabled:
+            if sqlite3 is None or env.get_disable_digest_index():
+                _digest_index_disabled = True
+                return None
+            cache_dir = env.get_cache_dir()
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+            except OSError:
+                _digest_index_disabled = True
+                return None
+            _digest_index = DigestIndex(os.path.join(cache_dir, "digests.db"))
+    return _digest_index
+
+
+def _reset_after_fork() -> None:
+    # sqlite connections must not be used across a fork
+    global _digest_index
+    _digest_index = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def disable_digest_index(exc: Exception) -> None:
+    """Stop using the index in this process after it failed with `exc`."""
+    global _digest_index, _digest_index_disabled
+    if not _digest_index_disabled:
+        logger.warning("Disabling the file digest index: %s", exc)
+    _digest_index = None
+    _digest_index_disabled = True
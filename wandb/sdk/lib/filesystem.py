@@ -1,14 +1,16 @@
 import contextlib
+import errno
 import logging
 import os
 import platform
 import re
 import shutil
 import stat
+import sys
 import tempfile
 import threading
 from pathlib import Path
-from typing import IO, Any, BinaryIO, Generator
+from typing import IO, Any, BinaryIO, Generator, Set, Tuple
 
 from wandb.sdk.lib.paths import StrPath
 
@@ -32,6 +34,44 @@ def mkdir_exists_ok(dir_name: StrPath) -> None:
         raise PermissionError(f"{dir_name!s} is not writable") from e
 
 
+# ioctl request to clone a file on linux, _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+
+def reflink(src: StrPath, dst: StrPath) -> None:
+    """Create `dst` as a copy-on-write clone of `src`, sharing its data blocks.
+
+    Supported on linux filesystems that implement FICLONE (btrfs, xfs, ...)
+    and on APFS on macOS. `dst` must not exist.
+
+    Raises:
+        OSError: if the filesystem or platform can't clone files.
+    """
+    if sys.platform == "darwin":
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        clonefile = getattr(libc, "clonefile", None)
+        if clonefile is None:
+            raise OSError(errno.EOPNOTSUPP, "clonefile is not available")
+        if clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), os.fspath(dst))
+        return
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, f"reflinks are not supported on {sys.platform}")
+
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.remove(dst)
+            raise
+
+
 class WriteSerializingFile:
     """Wrapper for a file object that serializes writes."""
 
@@ -84,6 +124,15 @@ class CRDedupedFile(WriteSerializingFile):
         super().close()
 
 
+def _windows_safe_path(path: StrPath) -> StrPath:
+    if platform.system() == "Windows":
+        head, tail = os.path.splitdrive(str(path))
+        if ":" in tail:
+            logger.warning("Replacing ':' in %s with '-'", tail)
+            path = os.path.join(head, tail.replace(":", "-"))
+    return path
+
+
 def copy_or_overwrite_changed(source_path: StrPath, target_path: StrPath) -> StrPath:
     """Copy source_path to target_path, unless it already exists with the same mtime.
 
@@ -98,12 +147,7 @@ def copy_or_overwrite_changed(source_path: StrPath, target_path: StrPath) -> Str
         The path to the copied file (which may be different from target_path).
     """
     return_type = type(target_path)
-
-    if platform.system() == "Windows":
-        head, tail = os.path.splitdrive(str(target_path))
-        if ":" in tail:
-            logger.warning("Replacing ':' in %s with '-'", tail)
-            target_path = os.path.join(head, tail.replace(":", "-"))
+    target_path = _windows_safe_path(target_path)
 
     need_copy = (
         not os.path.isfile(target_path)
@@ -129,6 +173,84 @@ def copy_or_overwrite_changed(source_path: StrPath, target_path: StrPath) -> Str
     return return_type(target_path)  # type: ignore  # 'os.PathLike' is abstract.
 
 
+# errors meaning a link can't work between these filesystems
+_LINK_UNSUPPORTED_ERRNOS = frozenset(
+    (
+        errno.EOPNOTSUPP,
+        errno.ENOTSUP,
+        errno.EXDEV,
+        errno.EINVAL,
+        errno.ENOTTY,
+        errno.EPERM,
+    )
+)
+
+# (link kind, source device, target device) combinations that failed to link
+_link_unsupported: Set[Tuple[str, int, int]] = set()
+_link_unsupported_lock = threading.Lock()
+
+
+def try_link(
+    kind: str, source_path: StrPath, target_path: StrPath, devices: Tuple[int, int]
+) -> bool:
+    """Link target_path to source_path with a "reflink" or a "hardlink".
+
+    A link kind that isn't supported between the `devices` of the source and
+    the target directory isn't tried again for them.
+
+    Returns:
+        Whether the link was made.
+    """
+    key = (kind,) + devices
+    if key in _link_unsupported:
+        return False
+    link = reflink if kind == "reflink" else os.link
+    try:
+        link(source_path, target_path)
+    except OSError as e:
+        if e.errno in _LINK_UNSUPPORTED_ERRNOS:
+            with _link_unsupported_lock:
+                _link_unsupported.add(key)
+        logger.debug("Can't %s %s: %s", kind, source_path, e)
+        return False
+    return True
+
+
+def link_or_copy_changed(
+    source_path: StrPath, target_path: StrPath, hardlink: bool = False
+) -> StrPath:
+    """Materialize source_path at target_path without copying its data if possible.
+
+    Tries a reflink, then a hardlink if `hardlink` is set, and falls back to
+    `copy_or_overwrite_changed`. A hardlinked target is the same file as the
+    source, so writing to it changes the source too.
+
+    Returns:
+        The path to the materialized file (which may be different from target_path).
+    """
+    return_type = type(target_path)
+    target_path = _windows_safe_path(target_path)
+    if os.path.isfile(target_path) and os.path.samefile(source_path, target_path):
+        return return_type(target_path)  # type: ignore
+
+    target_dir = os.path.dirname(os.path.abspath(target_path))
+    mkdir_exists_ok(target_dir)
+    source_stat = os.stat(source_path)
+    devices = (source_stat.st_dev, os.stat(target_dir).st_dev)
+    kinds = ["reflink", "hardlink"] if hardlink else ["reflink"]
+    for kind in kinds:
+        tmp_name = f".{os.path.basename(target_path)}.{threading.get_ident()}.tmp"
+        tmp_path = os.path.join(target_dir, tmp_name)
+        if not try_link(kind, source_path, tmp_path, devices):
+            continue
+        if kind == "reflink":
+            os.utime(tmp_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+            os.chmod(tmp_path, source_stat.st_mode | WRITE_PERMISSIONS)
+        os.replace(tmp_path, target_path)
+        return return_type(target_path)  # type: ignore
+    return copy_or_overwrite_changed(source_path, target_path)
+
+
 @contextlib.contextmanager
 def safe_open(
     path: StrPath, mode: str = "r", *args: Any, **kwargs: Any
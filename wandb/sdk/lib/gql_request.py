@@ -35,6 +35,21 @@ class GraphQLSession(HTTPTransport):
         self.session.auth = auth
         self.default_timeout = timeout
         self.use_json = use_json
+        self.pool_maxsize = requests.adapters.DEFAULT_POOLSIZE
+
+    def set_pool_maxsize(self, maxsize: int) -> None:
+        """Keep up to `maxsize` connections open, for sending queries concurrently.
+
+        The pool only ever grows, and connections already open are dropped.
+        """
+        if maxsize <= self.pool_maxsize:
+            return
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=requests.adapters.DEFAULT_POOLSIZE, pool_maxsize=maxsize
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.pool_maxsize = maxsize
 
     def execute(
         self,
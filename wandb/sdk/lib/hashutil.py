@@ -4,14 +4,17 @@ import mmap
 import os
 import sys
 from pathlib import Path
-from typing import NewType, Union
+from typing import NewType, Optional, Union
 
+from wandb.sdk.lib import digest_index
 from wandb.sdk.lib.paths import StrPath
 
 ETag = NewType("ETag", str)
 HexMD5 = NewType("HexMD5", str)
 B64MD5 = NewType("B64MD5", str)
 
+COPY_BUFSIZE = 1024 * 1024
+
 
 def _md5(data: bytes = b"") -> "hashlib._Hash":
     """Allow FIPS-compliant md5 hash when supported."""
@@ -41,9 +44,65 @@ def hex_to_b64_id(encoded_string: Union[str, bytes]) -> B64MD5:
 
 
 def md5_file_b64(*paths: StrPath) -> B64MD5:
+    if len(paths) == 1:
+        return _md5_file_b64_indexed(paths[0])
     return _b64_from_hasher(_md5_file_hasher(*paths))
 
 
+def _md5_file_b64_indexed(path: StrPath) -> B64MD5:
+    """Hash a single file, reusing its digest from the index when unchanged."""
+    index = digest_index.get_digest_index()
+    if index is None:
+        return _b64_from_hasher(_md5_file_hasher(path))
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    digest = index.get(path, stat)
+    if digest is None:
+        digest = _b64_from_hasher(_md5_file_hasher(path))
+        index.put(path, stat, digest)
+    return B64MD5(digest)
+
+
+def md5_file_b64_unindexed(path: StrPath) -> B64MD5:
+    """Hash a single file, without trusting a digest in the index."""
+    return _b64_from_hasher(_md5_file_hasher(path))
+
+
+def lookup_md5_file_b64(path: StrPath) -> Optional[B64MD5]:
+    """Return the digest of `path` from the digest index, without reading the file.
+
+    Returns None if the file isn't indexed or changed since it was.
+    """
+    index = digest_index.get_digest_index()
+    if index is None:
+        return None
+    path = os.path.abspath(path)
+    digest = index.get(path, os.stat(path))
+    return None if digest is None else B64MD5(digest)
+
+
+def record_md5_file_b64(path: StrPath, stat: os.stat_result, digest: B64MD5) -> None:
+    """Add the digest of `path`, hashed while the file had `stat`, to the digest index."""
+    index = digest_index.get_digest_index()
+    if index is not None:
+        index.put(os.path.abspath(path), stat, digest)
+
+
+def md5_copy_file_b64(src: StrPath, dst: StrPath) -> B64MD5:
+    """Copy `src` to `dst`, hashing the data in the same pass over the file."""
+    md5_hash = _md5()
+    buf = bytearray(COPY_BUFSIZE)
+    view = memoryview(buf)
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            md5_hash.update(view[:n])
+            fdst.write(view[:n])
+    return _b64_from_hasher(md5_hash)
+
+
 def md5_file_hex(*paths: StrPath) -> HexMD5:
     return HexMD5(_md5_file_hasher(*paths).hexdigest())
 
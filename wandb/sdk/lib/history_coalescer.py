@@ -0,0 +1,90 @@
+"""Coalescing of partial history updates in the user process.
+
+With the _coalesce_history setting, updates of a history row made of plain
+values (numbers, booleans and strings) are merged in the user process and
+sent as a single partial history request when the row is committed, instead
+of one request per `wandb.log` call. The internal process merges updates of
+the same row the same way, so the logged history doesn't change.
+
+Updates with other values, like media, are sent as they are, after the
+pending update. A pending update is also sent when it gets more than
+MAX_PENDING_ITEMS keys or gets older than FLUSH_INTERVAL seconds.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from wandb.util import PLAIN_JSON_TYPES
+
+MAX_PENDING_ITEMS = 1000
+FLUSH_INTERVAL = 1.0
+
+
+class HistoryCoalescer:
+    """Merges partial history updates of plain values until their row ends.
+
+    Arguments:
+        publish: publishes an update, given its row, step and whether it
+            ends the row, like `Run._publish_partial_history`.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[Dict[str, Any], Optional[int], Optional[bool]], None],
+    ) -> None:
+        self._publish = publish
+        self._lock = threading.Lock()
+        self._row: Dict[str, Any] = {}
+        self._step: Optional[int] = None
+        self._since = 0.0
+
+    def add(
+        self,
+        row: Dict[str, Any],
+        step: Optional[int] = None,
+        commit: Optional[bool] = None,
+    ) -> bool:
+        """Merge an update into the pending one.
+
+        Returns:
+            False if the update can't be merged, to be published by the
+            caller; the pending update has been published before it then.
+        """
+        with self._lock:
+            if any(type(v) not in PLAIN_JSON_TYPES for v in row.values()):
+                self._flush()
+                return False
+            # an update with a step applies to that step, after ending the
+            # row of a pending update without one
+            if self._row and step is not None and step != self._step:
+                self._flush()
+
+            now = time.time()
+            if not self._row:
+                self._step = step
+                self._since = now
+            self._row.update(row)
+            if "_timestamp" not in row:
+                self._row["_timestamp"] = now
+
+            # like the internal process, an update without a step or commit
+            # ends the row
+            ends_row = commit if commit is not None else step is None
+            if ends_row:
+                self._flush(commit=True)
+            elif (
+                len(self._row) > MAX_PENDING_ITEMS
+                or now - self._since >= FLUSH_INTERVAL
+            ):
+                self._flush()
+            return True
+
+    def flush(self) -> None:
+        """Publish the pending update, without ending its row."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self, commit: bool = False) -> None:
+        if self._row:
+            row, self._row = self._row, {}
+            self._publish(row, self._step, commit)
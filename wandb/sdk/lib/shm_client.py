@@ -0,0 +1,138 @@
+"""Socket client sending its requests through shared memory.
+
+After connecting, `ShmSockClient.connect_shm` creates a `ShmRing` and asks
+the service to read requests from it instead of from the socket. Responses
+still come through the socket, which the user process also uses to wake up
+the service, by sending it a byte while it waits for requests.
+"""
+import select
+import time
+from typing import Optional
+
+from wandb.proto import wandb_server_pb2 as spb
+
+from .shm_ring import DEFAULT_CAPACITY, ShmRing
+from .sock_client import SockClient
+
+# How long the reader checks for requests before sleeping, and the longest it
+# sleeps at once in case a wakeup is missed.
+SPIN_SECONDS = 0.00005
+WAKEUP_INTERVAL = 0.05
+
+# How often the writer wakes up the reader while waiting for room in the
+# ring, which also finds out if the service has gone away.
+WAKE_WHILE_BLOCKED_INTERVAL = 0.1
+
+_WAKEUP = b"\x00"
+
+
+class ShmAttachError(Exception):
+    """The service didn't attach to the ring."""
+
+    pass
+
+
+class ShmSockClient(SockClient):
+    _send_ring: Optional[ShmRing]
+    _recv_ring: Optional[ShmRing]
+    _peer_closed: bool
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._send_ring = None
+        self._recv_ring = None
+        self._peer_closed = False
+        self._last_wake = 0.0
+
+    def connect_shm(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Send the requests through a ring of `capacity` bytes from now on.
+
+        Raises:
+            ShmAttachError: the service didn't attach to the ring.
+        """
+        ring = ShmRing.create(capacity)
+        try:
+            self.send(inform_shm=spb.ServerInformShmRequest(name=ring.name))
+            # the service reads the next requests from the ring only if it
+            # attached, wait for it either way
+            response = self.read_server_response()
+            if response is None:
+                raise ShmAttachError("No response")
+            error = response.inform_shm_response.error
+            if error:
+                raise ShmAttachError(error)
+        except Exception:
+            ring.close()
+            raise
+        # the service has mapped the ring, it goes away once both are done
+        ring.unlink()
+        self._send_ring = ring
+
+    def accept_shm(self, name: str) -> None:
+        """Read the requests from the ring named `name` from now on."""
+        self._recv_ring = ShmRing.attach(name)
+
+    def close_shm(self) -> None:
+        for ring in (self._send_ring, self._recv_ring):
+            if ring is not None:
+                ring.close()
+        self._send_ring = self._recv_ring = None
+
+    def _wake(self) -> None:
+        self._sendall_with_error_handle(_WAKEUP)
+
+    def _wake_while_blocked(self) -> None:
+        now = time.monotonic()
+        if now - self._last_wake >= WAKE_WHILE_BLOCKED_INTERVAL:
+            self._last_wake = now
+            self._wake()
+
+    def _send_locked(self, data: bytes) -> None:
+        ring = self._send_ring
+        if ring is None:
+            super()._send_locked(data)
+            return
+        with self._lock:
+            ring.write(
+                data, wake=self._wake, wake_while_blocked=self._wake_while_blocked
+            )
+
+    def _recv_into_buffer(
+        self, size: int, timeout: Optional[int] = None
+    ) -> Optional[int]:
+        ring = self._recv_ring
+        if ring is None:
+            return super()._recv_into_buffer(size, timeout=timeout)
+        deadline = time.monotonic() + timeout if timeout else None
+        while True:
+            received = self._buffer.recv_into(ring, size)  # type: ignore
+            if received or self._peer_closed:
+                return received
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            self._wait_for_ring(ring, deadline)
+
+    def _wait_for_ring(self, ring: ShmRing, deadline: Optional[float]) -> None:
+        spin_until = time.monotonic() + SPIN_SECONDS
+        while time.monotonic() < spin_until:
+            if ring.readable():
+                return
+        ring.set_waiting(True)
+        try:
+            if ring.readable():
+                return
+            wait = WAKEUP_INTERVAL
+            if deadline is not None:
+                wait = max(0.0, min(wait, deadline - time.monotonic()))
+            readable, _, _ = select.select([self._sock], [], [], wait)
+            if readable:
+                try:
+                    data = self._sock.recv(4096)
+                except OSError:
+                    data = b""
+                if not data:
+                    # the user process has gone away, what it wrote is read
+                    # before reporting the socket closed
+                    self._peer_closed = True
+        finally:
+            ring.set_waiting(False)
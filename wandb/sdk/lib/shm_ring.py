@@ -0,0 +1,205 @@
+"""A byte stream through a ring buffer in shared memory.
+
+`ShmRing` carries bytes from a single writer to a single reader in another
+process, without a system call per write. The shared memory starts with a
+header of counters, each on its own cache line: the total number of bytes
+written and read, and a flag for a waiting reader, followed by the ring of
+data.
+
+A reader with nothing to read sets the waiting flag and sleeps on a separate
+channel, like a futex: the writer only wakes it, through that channel, when
+the flag is set. The writer waits for room by polling, as the reader makes
+room as fast as it can.
+
+CPython has no memory barriers, so the counters are updated between lock
+operations, which order memory accesses around them in practice (they are
+locked instructions on x86-64). A reader waiting on the wakeup channel should
+also wake up periodically, to bound the delay of a wakeup missed anyway.
+"""
+import threading
+import time
+from typing import Callable, Optional
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # python < 3.8
+    shared_memory = None  # type: ignore
+
+# Indexes of the 8 byte counters in the header. They are set through a
+# memoryview, which copies them at once, so they are never seen half written,
+# unlike with struct.pack_into, which clears the bytes before packing them.
+_HEAD = 0
+_TAIL = 8
+_WAITING = 16
+_CAPACITY = 24
+HEADER_SIZE = 256
+
+DEFAULT_CAPACITY = 16 * 1024**2
+
+# The longest wait between checks for room in the ring.
+MAX_POLL_INTERVAL = 0.001
+
+
+def is_supported() -> bool:
+    return shared_memory is not None
+
+
+class ShmRing:
+    """One end of a ring in a shared memory segment.
+
+    Use `create` to make a ring and `attach` to open it in another process.
+    """
+
+    def __init__(self, shm: "shared_memory.SharedMemory", owner: bool) -> None:
+        # set before the segment, to be freed before it
+        self._counters = shm.buf[:HEADER_SIZE].cast("Q")
+        self._shm = shm
+        self._owner = owner
+        self._buf = shm.buf
+        self._capacity = self._get(_CAPACITY)
+        self._fence_lock = threading.Lock()
+        self.blocked_seconds = 0.0
+
+    @classmethod
+    def create(cls, capacity: int = DEFAULT_CAPACITY) -> "ShmRing":
+        shm = shared_memory.SharedMemory(create=True, size=HEADER_SIZE + capacity)
+        shm.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+        ring = cls(shm, owner=True)
+        ring._capacity = capacity
+        ring._set(_CAPACITY, capacity)
+        return ring
+
+    @classmethod
+    def attach(cls, name: str) -> "ShmRing":
+        # the creator unlinks the segment, don't let the resource tracker of
+        # this process unlink it again at exit
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)  # type: ignore
+        except TypeError:  # python < 3.13
+            shm = shared_memory.SharedMemory(name=name)
+            try:
+                from multiprocessing import resource_tracker
+
+                resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore
+            except (ImportError, AttributeError):
+                pass
+        return cls(shm, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def _get(self, index: int) -> int:
+        value: int = self._counters[index]
+        return value
+
+    def _set(self, index: int, value: int) -> None:
+        self._counters[index] = value
+
+    def _fence(self) -> None:
+        self._fence_lock.acquire()
+        self._fence_lock.release()
+        self._fence_lock.acquire()
+        self._fence_lock.release()
+
+    def unlink(self) -> None:
+        """Remove the name of the segment, once the other end has attached."""
+        if self._owner:
+            self._shm.unlink()
+            self._owner = False
+
+    def close(self) -> None:
+        self._counters.release()
+        self._shm.close()
+        self.unlink()
+
+    # writer
+
+    def write(
+        self,
+        data: bytes,
+        wake: Callable[[], None],
+        wake_while_blocked: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Write all of `data`, waiting for room as needed.
+
+        Arguments:
+            data: the bytes to write.
+            wake: wakes up the reader, called when it is waiting for data.
+            wake_while_blocked: called while waiting for room, to wake up the
+                reader in case a wakeup was missed, or to check on it.
+        """
+        view = memoryview(data)
+        capacity = self._capacity
+        head = self._get(_HEAD)
+        while view:
+            room = capacity - (head - self._get(_TAIL))
+            if not room:
+                self._wait_for_room(head, wake_while_blocked)
+                continue
+            size = min(room, len(view))
+            start = head % capacity
+            first = min(size, capacity - start)
+            start += HEADER_SIZE
+            self._buf[start : start + first] = view[:first]
+            if first < size:
+                self._buf[HEADER_SIZE : HEADER_SIZE + size - first] = view[first:size]
+            view = view[size:]
+            head += size
+            # the data has to be visible before the counter covering it
+            self._fence()
+            self._set(_HEAD, head)
+            self._fence()
+            if self._get(_WAITING):
+                wake()
+
+    def _wait_for_room(
+        self, head: int, wake_while_blocked: Optional[Callable[[], None]]
+    ) -> None:
+        start = time.monotonic()
+        interval = 0.0
+        while head - self._get(_TAIL) >= self._capacity:
+            if wake_while_blocked is not None:
+                wake_while_blocked()
+            time.sleep(interval)
+            interval = min(2 * interval or 1e-5, MAX_POLL_INTERVAL)
+        self.blocked_seconds += time.monotonic() - start
+
+    # reader
+
+    def readable(self) -> int:
+        """Return the number of bytes ready to read."""
+        return self._get(_HEAD) - self._get(_TAIL)
+
+    def recv_into(self, buffer: memoryview, nbytes: int = 0) -> int:
+        """Read the bytes ready, up to `nbytes`, like `socket.recv_into`.
+
+        Doesn't wait, returns 0 if there is nothing to read.
+        """
+        capacity = self._capacity
+        tail = self._get(_TAIL)
+        ready = self._get(_HEAD) - tail
+        size = min(ready, nbytes or len(buffer), len(buffer))
+        if not size:
+            return 0
+        # the data has to be read after the counter covering it
+        self._fence()
+        start = tail % capacity
+        first = min(size, capacity - start)
+        start += HEADER_SIZE
+        buffer[:first] = self._buf[start : start + first]
+        if first < size:
+            buffer[first:size] = self._buf[HEADER_SIZE : HEADER_SIZE + size - first]
+        self._fence()
+        self._set(_TAIL, tail + size)
+        return size
+
+    def set_waiting(self, waiting: bool) -> None:
+        """Tell the writer whether to wake up the reader."""
+        self._set(_WAITING, int(waiting))
+        # the flag has to be visible before checking for data again
+        self._fence()
@@ -1,17 +1,25 @@
+import atexit
+import logging
 import socket
 import struct
 import threading
 import time
 import uuid
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from wandb.proto import wandb_server_pb2 as spb
 
 from . import tracelog
+from .sock_writer import DEFAULT_MAX_SIZE, SockWriter
 
 if TYPE_CHECKING:
     from wandb.proto import wandb_internal_pb2 as pb
 
+logger = logging.getLogger("wandb")
+
+# Seconds to wait at exit for the asynchronously published records to be sent.
+ASYNC_PUBLISH_EXIT_TIMEOUT = 30
+
 
 class SockClientClosedError(Exception):
     """Socket has been closed."""
@@ -20,62 +28,96 @@ class SockClientClosedError(Exception):
 
 
 class SockBuffer:
-    _buf_list: List[bytes]
-    _buf_lengths: List[int]
-    _buf_total: int
+    """Bytes received from a socket, read in place.
+
+    Data is received into the free space at the end of a `bytearray`, and
+    messages are read from it as memoryviews, so they are not copied on the
+    way to protobuf. The buffer grows to fit the largest message; growing
+    allocates a new buffer, so views read before stay valid, but unread
+    bytes may be moved to the front of the buffer to make room, so views are
+    only valid until the next `put` or `recv_into`.
+    """
+
+    _buf: bytearray
+    _start: int
+    _end: int
+
+    # Size of the buffer, and the most it keeps once emptied after growing.
+    INITIAL_SIZE = 65536
+    MAX_IDLE_SIZE = 4 * 1024**2
 
     def __init__(self) -> None:
-        self._buf_list = []
-        self._buf_lengths = []
-        self._buf_total = 0
+        self._buf = bytearray(self.INITIAL_SIZE)
+        self._start = 0
+        self._end = 0
 
     @property
     def length(self) -> int:
-        return self._buf_total
-
-    def _get(self, start: int, end: int, peek: bool = False) -> bytes:
-        index: Optional[int] = None
-        buffers = []
-        need = end
-
-        # compute buffers needed
-        for i, (buf_len, buf_data) in enumerate(zip(self._buf_lengths, self._buf_list)):
-            buffers.append(buf_data[:need] if need < buf_len else buf_data)
-            if need <= buf_len:
-                index = i
-                break
-            need -= buf_len
+        return self._end - self._start
 
+    def _view(self, start: int, end: int) -> memoryview:
         # buffer not large enough, caller should have made sure there was enough data
-        if index is None:
+        if end > self.length:
             raise IndexError("SockBuffer index out of range")
-
-        # advance buffer internals if we are not peeking into the data
-        if not peek:
-            self._buf_total -= end
-            if need < buf_len:
-                # update partially used buffer list
-                self._buf_list = self._buf_list[index:]
-                self._buf_lengths = self._buf_lengths[index:]
-                self._buf_list[0] = self._buf_list[0][need:]
-                self._buf_lengths[0] -= need
-            else:
-                # update fully used buffer list
-                self._buf_list = self._buf_list[index + 1 :]
-                self._buf_lengths = self._buf_lengths[index + 1 :]
-
-        return b"".join(buffers)[start:end]
+        return memoryview(self._buf)[self._start + start : self._start + end]
+
+    def _consume(self, size: int) -> None:
+        self._start += size
+        if self._start == self._end:
+            self._start = self._end = 0
+            if len(self._buf) > self.MAX_IDLE_SIZE:
+                self._buf = bytearray(self.INITIAL_SIZE)
+
+    def _reserve(self, size: int) -> None:
+        """Make room for `size` more bytes at the end of the buffer."""
+        if self._end + size <= len(self._buf):
+            return
+        length = self.length
+        if length + size <= len(self._buf):
+            self._buf[:length] = self._buf[self._start : self._end]
+        else:
+            buf = bytearray(max(2 * len(self._buf), length + size))
+            buf[:length] = memoryview(self._buf)[self._start : self._end]
+            self._buf = buf
+        self._start = 0
+        self._end = length
 
     def get(self, start: int, end: int) -> bytes:
-        return self._get(start, end)
+        data = bytes(self._view(start, end))
+        self._consume(end)
+        return data
+
+    def get_view(self, start: int, end: int) -> memoryview:
+        """Like `get`, but return a view of the data instead of a copy."""
+        view = self._view(start, end)
+        self._consume(end)
+        return view
 
     def peek(self, start: int, end: int) -> bytes:
-        return self._get(start, end, peek=True)
+        return bytes(self._view(start, end))
+
+    def unpack_from(self, fmt: struct.Struct, start: int = 0) -> Tuple[Any, ...]:
+        """Unpack the data at `start` in place, without consuming it."""
+        if start + fmt.size > self.length:
+            raise IndexError("SockBuffer index out of range")
+        return fmt.unpack_from(self._buf, self._start + start)
 
     def put(self, data: bytes, data_len: int) -> None:
-        self._buf_list.append(data)
-        self._buf_lengths.append(data_len)
-        self._buf_total += data_len
+        self._reserve(data_len)
+        self._buf[self._end : self._end + data_len] = data
+        self._end += data_len
+
+    def recv_into(self, sock: socket.socket, size: int) -> int:
+        """Receive up to `size` bytes from `sock` into the buffer.
+
+        Returns:
+            The number of bytes received, 0 if the socket was shutdown.
+        """
+        self._reserve(size)
+        with memoryview(self._buf) as view:
+            received = sock.recv_into(view[self._end : self._end + size], size)
+        self._end += received
+        return received
 
 
 class SockClient:
@@ -85,9 +127,11 @@ class SockClient:
     _lock: "threading.Lock"
     _bufsize: int
     _buffer: SockBuffer
+    _writer: Optional[SockWriter]
 
     # current header is magic byte "W" followed by 4 byte length of the message
     HEADLEN = 1 + 4
+    _HEADER = struct.Struct("<BI")
 
     def __init__(self) -> None:
         # TODO: use safe uuid's (python3.7+) or emulate this
@@ -96,6 +140,7 @@ class SockClient:
         self._lock = threading.Lock()
         self._bufsize = 4096
         self._buffer = SockBuffer()
+        self._writer = None
 
     def connect(self, port: int) -> None:
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -124,16 +169,17 @@ class SockClient:
         # an error handling in case of timeout.
         total_sent = 0
         total_data = len(data)
+        view = memoryview(data)
         while total_sent < total_data:
             start_time = time.monotonic()
             try:
-                sent = self._sock.send(data)
+                sent = self._sock.send(view)
                 # sent equal to 0 indicates a closed socket
                 if sent == 0:
                     raise SockClientClosedError("socket connection broken")
                 total_sent += sent
-                # truncate our data to save memory
-                data = data[sent:]
+                # advance a view of our data, slicing bytes would copy the rest
+                view = view[sent:]
             # we handle the timeout case for the cases when timeout is set
             # on a system level by another application
             except socket.timeout:
@@ -142,17 +188,57 @@ class SockClient:
                 if delta_time < self._retry_delay:
                     time.sleep(self._retry_delay - delta_time)
 
-    def _send_message(self, msg: Any) -> None:
+    def _send_locked(self, data: bytes) -> None:
+        with self._lock:
+            self._sendall_with_error_handle(data)
+
+    def _send_message(self, msg: Any, kind: Optional[str] = None) -> None:
         tracelog.log_message_send(msg, self._sockid)
         raw_size = msg.ByteSize()
         data = msg.SerializeToString()
         assert len(data) == raw_size, "invalid serialization"
-        header = struct.pack("<BI", ord("W"), raw_size)
-        with self._lock:
-            self._sendall_with_error_handle(header + data)
+        header = self._HEADER.pack(ord("W"), raw_size)
+        writer = self._writer
+        if writer is not None:
+            writer.put(header + data, kind)
+        else:
+            self._send_locked(header + data)
+
+    def start_async_publish(
+        self, policy: str = "block", max_size: Optional[int] = None
+    ) -> None:
+        """Send messages from a writer thread from now on.
 
-    def send_server_request(self, msg: Any) -> None:
-        self._send_message(msg)
+        Messages are queued in order, the writer thread sends them in
+        batches. When `max_size` bytes are queued, `policy` decides what
+        happens to published records, see `SockWriter`. The connection is
+        shared by the runs of the process, the first call configures it.
+        """
+        if self._writer is not None:
+            return
+        self._writer = SockWriter(
+            self._send_locked, max_size=max_size or DEFAULT_MAX_SIZE, policy=policy
+        )
+        atexit.register(self.stop_async_publish)
+
+    def stop_async_publish(self) -> None:
+        """Send the queued messages, and send synchronously from now on."""
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        atexit.unregister(self.stop_async_publish)
+        if not writer.flush(timeout=ASYNC_PUBLISH_EXIT_TIMEOUT):
+            logger.warning("Timed out sending asynchronously published records")
+        writer.close(timeout=0)
+        logger.info("Async publish stats: %s", writer.stats.as_dict())
+
+    def async_publish_stats(self) -> Optional[Dict[str, object]]:
+        """Return the stats of the async publish writer, None if not started."""
+        writer = self._writer
+        return writer.stats.as_dict() if writer is not None else None
+
+    def send_server_request(self, msg: Any, kind: Optional[str] = None) -> None:
+        self._send_message(msg, kind)
 
     def send_server_response(self, msg: Any) -> None:
         try:
@@ -170,6 +256,7 @@ class SockClient:
         inform_attach: Optional[spb.ServerInformAttachRequest] = None,
         inform_finish: Optional[spb.ServerInformFinishRequest] = None,
         inform_teardown: Optional[spb.ServerInformTeardownRequest] = None,
+        inform_shm: Optional[spb.ServerInformShmRequest] = None,
     ) -> spb.ServerResponse:
         self.send(
             inform_init=inform_init,
@@ -177,6 +264,7 @@ class SockClient:
             inform_attach=inform_attach,
             inform_finish=inform_finish,
             inform_teardown=inform_teardown,
+            inform_shm=inform_shm,
         )
         # TODO: this solution is fragile, but for checking attach
         # it should be relatively stable.
@@ -194,6 +282,7 @@ class SockClient:
         inform_attach: Optional[spb.ServerInformAttachRequest] = None,
         inform_finish: Optional[spb.ServerInformFinishRequest] = None,
         inform_teardown: Optional[spb.ServerInformTeardownRequest] = None,
+        inform_shm: Optional[spb.ServerInformShmRequest] = None,
     ) -> None:
         server_req = spb.ServerRequest()
         if inform_init:
@@ -206,6 +295,8 @@ class SockClient:
             server_req.inform_finish.CopyFrom(inform_finish)
         elif inform_teardown:
             server_req.inform_teardown.CopyFrom(inform_teardown)
+        elif inform_shm:
+            server_req.inform_shm.CopyFrom(inform_shm)
         else:
             raise Exception("unmatched")
         self.send_server_request(server_req)
@@ -218,26 +309,36 @@ class SockClient:
     def send_record_publish(self, record: "pb.Record") -> None:
         server_req = spb.ServerRequest()
         server_req.record_publish.CopyFrom(record)
-        self.send_server_request(server_req)
+        kind = record.WhichOneof("record_type")
+        if kind == "request":
+            kind = record.request.WhichOneof("request_type")
+        self.send_server_request(server_req, kind)
 
-    def _extract_packet_bytes(self) -> Optional[bytes]:
+    def _extract_packet_bytes(self) -> Optional[memoryview]:
         # Do we have enough data to read the header?
         start_offset = self.HEADLEN
         if self._buffer.length >= start_offset:
-            header = self._buffer.peek(0, start_offset)
-            fields = struct.unpack("<BI", header)
-            magic, dlength = fields
+            magic, dlength = self._buffer.unpack_from(self._HEADER)
             assert magic == ord("W")
             # Do we have enough data to read the full record?
             end_offset = self.HEADLEN + dlength
             if self._buffer.length >= end_offset:
-                rec_data = self._buffer.get(start_offset, end_offset)
-                return rec_data
+                return self._buffer.get_view(start_offset, end_offset)
         return None
 
-    def _read_packet_bytes(self, timeout: Optional[int] = None) -> Optional[bytes]:
+    def _missing_packet_bytes(self) -> int:
+        """Return how many bytes of the next message are yet to be received."""
+        if self._buffer.length < self.HEADLEN:
+            return 0
+        _, dlength = self._buffer.unpack_from(self._HEADER)
+        return self.HEADLEN + dlength - self._buffer.length
+
+    def _read_packet_bytes(self, timeout: Optional[int] = None) -> Optional[memoryview]:
         """Read full message from socket.
 
+        The message is returned as a view of the receive buffer, valid until
+        the next read.
+
         Args:
             timeout: number of seconds to wait on socket data.
 
@@ -249,33 +350,42 @@ class SockClient:
             if rec:
                 return rec
 
-            if timeout:
-                self._sock.settimeout(timeout)
-            try:
-                data = self._sock.recv(self._bufsize)
-            except socket.timeout:
+            # receive the rest of a large message at once
+            size = max(self._bufsize, self._missing_packet_bytes())
+            data_len = self._recv_into_buffer(size, timeout=timeout)
+            if data_len is None:
                 break
-            except ConnectionResetError:
-                raise SockClientClosedError
-            except OSError:
-                raise SockClientClosedError
-            finally:
-                if timeout:
-                    self._sock.settimeout(None)
-            data_len = len(data)
             if data_len == 0:
                 # socket.recv() will return 0 bytes if socket was shutdown
                 # caller will handle this condition like other connection problems
                 raise SockClientClosedError
-            self._buffer.put(data, data_len)
         return None
 
+    def _recv_into_buffer(
+        self, size: int, timeout: Optional[int] = None
+    ) -> Optional[int]:
+        """Receive up to `size` bytes into the buffer, return None on timeout."""
+        if timeout:
+            self._sock.settimeout(timeout)
+        try:
+            return self._buffer.recv_into(self._sock, size)
+        except socket.timeout:
+            return None
+        except ConnectionResetError:
+            raise SockClientClosedError
+        except OSError:
+            raise SockClientClosedError
+        finally:
+            if timeout:
+                self._sock.settimeout(None)
+
     def read_server_request(self) -> Optional[spb.ServerRequest]:
         data = self._read_packet_bytes()
         if not data:
             return None
         rec = spb.ServerRequest()
-        rec.ParseFromString(data)
+        with data:
+            rec.ParseFromString(data)
         tracelog.log_message_recv(rec, self._sockid)
         return rec
 
@@ -286,6 +396,7 @@ class SockClient:
         if not data:
             return None
         rec = spb.ServerResponse()
-        rec.ParseFromString(data)
+        with data:
+            rec.ParseFromString(data)
         tracelog.log_message_recv(rec, self._sockid)
         return rec
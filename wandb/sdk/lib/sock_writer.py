@@ -0,0 +1,228 @@
+"""Asynchronous writing of messages to a socket.
+
+`SockWriter` queues framed messages in a buffer of bounded size and sends
+them from a writer thread, joining the frames queued meanwhile into a single
+send, so callers don't wait for the socket. What a caller does when the
+buffer is full depends on the policy:
+
+- block: wait until the writer thread has made room,
+- drop_oldest: drop the oldest queued messages of the same kind as the new
+  one, for the kinds in DROPPABLE_KINDS, and wait for other kinds,
+- spill: write the message, and the ones after it until the writer catches
+  up, to a temporary file, which the writer thread sends after the buffer.
+
+The time callers spent waiting, and what was dropped or spilled, is kept
+in `SockWriter.stats`.
+"""
+import collections
+import tempfile
+import threading
+import time
+from typing import IO, Callable, Deque, Dict, Optional, Tuple
+
+POLICIES = ("block", "drop_oldest", "spill")
+
+# Kinds of records that may be dropped by the drop_oldest policy: streams
+# of samples, where a newer one makes up for a lost older one. Not history,
+# whose records carry the step and the flush that delimit the rows.
+DROPPABLE_KINDS = frozenset(("stats", "output", "output_raw"))
+
+DEFAULT_MAX_SIZE = 64 * 1024**2
+
+# The most bytes sent at once.
+MAX_SEND_SIZE = 4 * 1024**2
+
+
+class SockWriterStats:
+    def __init__(self) -> None:
+        self.blocked_seconds = 0.0
+        self.blocked_puts = 0
+        self.dropped: Dict[str, int] = collections.defaultdict(int)
+        self.spilled_bytes = 0
+        self.sent_bytes = 0
+        self.sends = 0
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "blocked_seconds": self.blocked_seconds,
+            "blocked_puts": self.blocked_puts,
+            "dropped": dict(self.dropped),
+            "spilled_bytes": self.spilled_bytes,
+            "sent_bytes": self.sent_bytes,
+            "sends": self.sends,
+        }
+
+
+class SockWriter:
+    """Sends frames with `send` from a writer thread.
+
+    Arguments:
+        send: sends all of the given bytes, called by the writer thread.
+        max_size: the most bytes of frames to queue in memory.
+        policy: what `put` does when the queue is full, one of POLICIES.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[bytes], None],
+        max_size: int = DEFAULT_MAX_SIZE,
+        policy: str = "block",
+    ) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown async publish policy {policy!r}")
+        self._send = send
+        self._max_size = max_size
+        self._policy = policy
+        self._cond = threading.Condition()
+        self._frames: Deque[Tuple[Optional[str], bytes]] = collections.deque()
+        self._size = 0
+        self._spill: Optional[IO[bytes]] = None
+        self._spill_read = 0
+        self._spill_write = 0
+        self._sending = False
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self.stats = SockWriterStats()
+        self._thread = threading.Thread(
+            target=self._run, name="SockWriter", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, frame: bytes, kind: Optional[str] = None) -> None:
+        """Queue a frame to send.
+
+        Arguments:
+            frame: the bytes of the framed message.
+            kind: the type of the record in the message, if it may be dropped.
+        """
+        with self._cond:
+            self._check()
+            if self._spill_write > self._spill_read:
+                # frames are spilled until the writer catches up, in order
+                self._write_spill(frame)
+                return
+            if self._is_full(len(frame)):
+                if self._policy == "spill":
+                    self._write_spill(frame)
+                    return
+                if self._policy == "drop_oldest" and kind in DROPPABLE_KINDS:
+                    self._drop_oldest(kind, len(frame))
+                if self._is_full(len(frame)):
+                    self._wait_for_room(len(frame))
+            self._frames.append((kind, frame))
+            self._size += len(frame)
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued frames are sent, return False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._error is not None or not self._pending(), timeout
+            )
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Send the queued frames and stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        if self._spill is not None:
+            self._spill.close()
+
+    def _check(self) -> None:
+        if self._error is not None:
+            raise self._error
+        if self._closed:
+            raise ValueError("SockWriter is closed")
+
+    def _is_full(self, size: int) -> bool:
+        return bool(self._frames) and self._size + size > self._max_size
+
+    def _pending(self) -> bool:
+        return (
+            bool(self._frames)
+            or self._spill_write > self._spill_read
+            or (self._sending)
+        )
+
+    def _wait_for_room(self, size: int) -> None:
+        start = time.monotonic()
+        while self._is_full(size):
+            self._cond.wait()
+            self._check()
+        self.stats.blocked_seconds += time.monotonic() - start
+        self.stats.blocked_puts += 1
+
+    def _drop_oldest(self, kind: str, size: int) -> None:
+        while self._is_full(size):
+            for i, (frame_kind, frame) in enumerate(self._frames):
+                if frame_kind == kind:
+                    del self._frames[i]
+                    self._size -= len(frame)
+                    self.stats.dropped[kind] += 1
+                    break
+            else:
+                return
+
+    def _write_spill(self, frame: bytes) -> None:
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile(prefix="wandb-spill-")
+        self._spill.seek(self._spill_write)
+        self._spill.write(frame)
+        self._spill_write += len(frame)
+        self.stats.spilled_bytes += len(frame)
+        self._cond.notify_all()
+
+    def _read_spill(self) -> bytes:
+        assert self._spill is not None
+        self._spill.seek(self._spill_read)
+        data = self._spill.read(
+            min(MAX_SEND_SIZE, self._spill_write - self._spill_read)
+        )
+        self._spill_read += len(data)
+        if self._spill_read == self._spill_write:
+            # caught up, start over
+            self._spill.truncate(0)
+            self._spill_read = self._spill_write = 0
+        return data
+
+    def _next_data(self) -> Optional[bytes]:
+        """Take the next bytes to send, None when closed and all are sent."""
+        with self._cond:
+            while not (self._frames or self._spill_write or self._closed):
+                self._cond.wait()
+            if self._frames:
+                frames = []
+                size = 0
+                while self._frames and size < MAX_SEND_SIZE:
+                    _, frame = self._frames.popleft()
+                    frames.append(frame)
+                    size += len(frame)
+                self._size -= size
+                data = b"".join(frames)
+            elif self._spill_write:
+                data = self._read_spill()
+            else:
+                return None
+            self._sending = True
+            self._cond.notify_all()
+            return data
+
+    def _run(self) -> None:
+        while True:
+            data = self._next_data()
+            if data is None:
+                return
+            try:
+                self._send(data)
+            except Exception as e:
+                with self._cond:
+                    self._error = e
+                    self._sending = False
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                self._sending = False
+                self.stats.sent_bytes += len(data)
+                self.stats.sends += 1
+                self._cond.notify_all()
@@ -1,3 +1,4 @@
+import logging
 import queue
 import socket
 import threading
@@ -8,6 +9,7 @@ from wandb.proto import wandb_server_pb2 as spb
 from wandb.sdk.internal.settings_static import SettingsStatic
 
 from ..lib import tracelog
+from ..lib.shm_client import ShmSockClient
 from ..lib.sock_client import SockClient, SockClientClosedError
 from .streams import StreamMux
 
@@ -16,6 +18,8 @@ if TYPE_CHECKING:
 
     from ..interface.interface_relay import InterfaceRelay
 
+logger = logging.getLogger(__name__)
+
 
 class ClientDict:
     _client_dict: Dict[str, SockClient]
@@ -76,7 +80,7 @@ class SockServerInterfaceReaderThread(threading.Thread):
 
 
 class SockServerReadThread(threading.Thread):
-    _sock_client: SockClient
+    _sock_client: ShmSockClient
     _mux: StreamMux
     _stopped: "Event"
     _clients: ClientDict
@@ -87,7 +91,7 @@ class SockServerReadThread(threading.Thread):
         self._mux = mux
         threading.Thread.__init__(self)
         self.name = "SockSrvRdThr"
-        sock_client = SockClient()
+        sock_client = ShmSockClient()
         sock_client.set_socket(conn)
         self._sock_client = sock_client
         self._stopped = mux._get_stopped_event()
@@ -109,6 +113,7 @@ class SockServerReadThread(threading.Thread):
             )
             assert shandler, f"unknown handle: {shandler_str}"  # type: ignore
             shandler(sreq)
+        self._sock_client.close_shm()
 
     def stop(self) -> None:
         try:
@@ -178,6 +183,18 @@ class SockServerReadThread(threading.Thread):
         stream_id = request._info.stream_id
         self._mux.drop_stream(stream_id)
 
+    def server_inform_shm(self, sreq: "spb.ServerRequest") -> None:
+        request = sreq.inform_shm
+        inform_shm_response = spb.ServerInformShmResponse()
+        try:
+            self._sock_client.accept_shm(request.name)
+        except Exception as e:
+            # the client keeps sending through the socket
+            logger.warning(f"Failed to attach shared memory {request.name}: {e}")
+            inform_shm_response.error = str(e)
+        response = spb.ServerResponse(inform_shm_response=inform_shm_response)
+        self._sock_client.send_server_response(response)
+
     def server_inform_teardown(self, sreq: "spb.ServerRequest") -> None:
         request = sreq.inform_teardown
         exit_code = request.exit_code
@@ -12,10 +12,12 @@ import tempfile
 import time
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
+import wandb
 from wandb import _sentry
 from wandb.errors import Error
 from wandb.util import get_module
 
+from ..lib import shm_ring
 from . import _startup_debug, port_file
 from .service_base import ServiceInterface
 from .service_sock import ServiceSockInterface
@@ -74,9 +76,26 @@ class _Service:
             from .service_grpc import ServiceGrpcInterface
 
             self._service_interface = ServiceGrpcInterface()
+        elif self._use_shm():
+            from .service_shm import ServiceShmInterface
+
+            self._service_interface = ServiceShmInterface()
         else:
             self._service_interface = ServiceSockInterface()
 
+    def _use_shm(self) -> bool:
+        if self._settings._service_transport != "shm":
+            return False
+        if not shm_ring.is_supported():
+            wandb.termwarn(
+                "The shm service transport requires python 3.8 or newer, using tcp."
+            )
+            return False
+        if self._settings._require_nexus:
+            wandb.termwarn("The shm service transport is not supported by nexus.")
+            return False
+        return True
+
     def _startup_debug_print(self, message: str) -> None:
         if not self._startup_debug_enabled:
             return
@@ -0,0 +1,29 @@
+"""shared memory service.
+
+Implement ServiceInterface for socket transport, with requests sent through
+shared memory.
+"""
+
+import logging
+
+from ..lib.shm_client import ShmSockClient
+from .service_sock import ServiceSockInterface
+
+logger = logging.getLogger("wandb")
+
+
+class ServiceShmInterface(ServiceSockInterface):
+    _sock_client: ShmSockClient
+
+    def __init__(self) -> None:
+        self._sock_client = ShmSockClient()
+
+    def get_transport(self) -> str:
+        return "shm"
+
+    def _svc_connect(self, port: int) -> None:
+        super()._svc_connect(port=port)
+        try:
+            self._sock_client.connect_shm()
+        except Exception as e:
+            logger.warning(f"Shared memory transport unavailable, using tcp: {e}")
@@ -18,6 +18,7 @@ import psutil
 import wandb
 import wandb.util
 from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.internal import pipeline_stats
 from wandb.sdk.internal.settings_static import SettingsStatic
 from wandb.sdk.lib.mailbox import (
     Mailbox,
@@ -60,7 +61,10 @@ class StreamRecord:
     def __init__(self, settings: SettingsStatic, mailbox: Mailbox) -> None:
         self._started = False
         self._mailbox = mailbox
-        self._record_q = queue.Queue()
+        # timestamp records to measure how long they wait for the handler
+        self._record_q = (
+            pipeline_stats.TimedQueue() if settings._pipeline_stats else queue.Queue()
+        )
         self._result_q = queue.Queue()
         self._relay_q = queue.Queue()
         process = multiprocessing.current_process()
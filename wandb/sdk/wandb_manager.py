@@ -35,7 +35,7 @@ class ManagerConnectionRefusedError(ManagerConnectionError):
 
 class _ManagerToken:
     _version = "2"
-    _supported_transports = {"grpc", "tcp"}
+    _supported_transports = {"grpc", "tcp", "shm"}
     _token_str: str
     _pid: int
     _transport: str
@@ -147,7 +147,8 @@ class _Manager:
                 transport = "grpc"
                 port = self._service.grpc_port
             else:
-                transport = "tcp"
+                # tcp, or shm which connects over tcp first
+                transport = self._service.service_interface.get_transport()
                 port = self._service.sock_port
             assert port
             token = _ManagerToken.from_params(transport=transport, host=host, port=port)
@@ -83,6 +83,7 @@ from .lib import (
 )
 from .lib.exit_hooks import ExitHooks
 from .lib.gitlib import GitRepo
+from .lib.history_coalescer import HistoryCoalescer
 from .lib.mailbox import MailboxError, MailboxHandle, MailboxProbe, MailboxProgress
 from .lib.printer import get_printer
 from .lib.proto_util import message_to_dict
@@ -561,6 +562,9 @@ class Run:
         self.summary._set_update_callback(self._summary_update_callback)
         self._step = 0
         self._torch_history: Optional["wandb.wandb_torch.TorchHistory"] = None
+        self._history_coalescer: Optional[HistoryCoalescer] = None
+        if self._settings._coalesce_history:
+            self._history_coalescer = HistoryCoalescer(self._publish_partial_history)
 
         # todo: eventually would be nice to make this configurable using self._settings._start_time
         #  need to test (jhr): if you set start time to 2 days ago and run a test for 15 minutes,
@@ -1386,6 +1390,18 @@ class Run:
         row: Dict[str, Any],
         step: Optional[int] = None,
         commit: Optional[bool] = None,
+    ) -> None:
+        if self._history_coalescer is not None and self._history_coalescer.add(
+            row, step, commit
+        ):
+            return
+        self._publish_partial_history(row, step, commit)
+
+    def _publish_partial_history(
+        self,
+        row: Dict[str, Any],
+        step: Optional[int] = None,
+        commit: Optional[bool] = None,
     ) -> None:
         row = row.copy()
         if row:
@@ -1524,6 +1540,15 @@ class Run:
         if any(not isinstance(key, str) for key in data.keys()):
             raise ValueError("Key values passed to `wandb.log` must be strings.")
 
+        if self._torch_history is not None and (
+            commit
+            or (step is None and commit is None)
+            or (step is not None and step > self._step)
+        ):
+            # histograms logged from the background belong to the step this
+            # commits, don't let them spill into the next one
+            self._torch_history.wait()
+
         self._partial_history_callback(data, step, commit)
 
         if step is not None:
@@ -1891,6 +1916,9 @@ class Run:
             if hook.stage == TeardownStage.EARLY:
                 hook.call()
 
+        if self._torch_history is not None:
+            self._torch_history.close()
+
         self._atexit_cleanup(exit_code=exit_code)
         if self._wl and len(self._wl._global_run_stack) > 0:
             self._wl._global_run_stack.pop()
@@ -2118,6 +2146,9 @@ class Run:
             return
         self._atexit_cleanup_called = True
 
+        if self._history_coalescer is not None:
+            self._history_coalescer.flush()
+
         exit_code = exit_code or self._hooks.exit_code if self._hooks else 0
         logger.info(f"got exitcode: {exit_code}")
         if exit_code == 0:
@@ -2540,8 +2571,12 @@ class Run:
         log_freq=100,
         idx=None,
         log_graph=False,
+        batched=False,
+        background=False,
     ) -> None:
-        wandb.watch(models, criterion, log, log_freq, idx, log_graph)
+        wandb.watch(
+            models, criterion, log, log_freq, idx, log_graph, batched, background
+        )
 
     # TODO(jhr): annotate this
     @_run_decorator._attach
@@ -51,6 +51,7 @@ from .lib import apikey
 from .lib.gitlib import GitRepo
 from .lib.ipython import _get_python_type
 from .lib.runid import generate_id
+from .lib.sock_writer import POLICIES as ASYNC_PUBLISH_POLICIES
 
 if sys.version_info >= (3, 8):
     from typing import get_args, get_origin, get_type_hints
@@ -294,8 +295,11 @@ class SettingsData:
 
     _args: Sequence[str]
     _aws_lambda: bool
+    _async_publish: str  # Send records from a writer thread, with this full buffer policy
+    _async_publish_max_size: int  # Bytes of records buffered by async publish
     _async_upload_concurrency_limit: int
     _cli_only_mode: bool  # Avoid running any code specific for runs
+    _coalesce_history: bool  # Merge scalar history updates before sending them
     _colab: bool
     # _config_dict: Config
     _cuda: str
@@ -307,6 +311,9 @@ class SettingsData:
     _except_exit: bool
     _executable: str
     _extra_http_headers: Mapping[str, str]
+    _file_stream_compression: str  # compress file stream request bodies (gzip, zstd)
+    _file_stream_max_backlog_bytes: int  # pause flow control above this backlog
+    _file_stream_max_inflight: int  # max concurrent file stream requests
     _file_stream_timeout_seconds: float
     _flow_control_custom: bool
     _flow_control_disabled: bool
@@ -321,12 +328,15 @@ class SettingsData:
     _live_policy_rate_limit: int
     _live_policy_wait_time: int
     _log_level: int
+    _max_upload_jobs: int  # max concurrent file uploads of a run
     _network_buffer: int
     _noop: bool
     _notebook: bool
     _offline: bool
     _sync: bool
     _os: str
+    _pipeline_stats: bool  # collect per stage timings in the internal process
+    _pipeline_stats_port: int  # serve the pipeline stats on this local port
     _platform: str
     _python: str
     _runqueue_item_id: str
@@ -591,6 +601,11 @@ class Settings(SettingsData):
                 "hook": lambda _: is_aws_lambda(),
                 "auto_hook": True,
             },
+            _async_publish={"validator": self._validate__async_publish},
+            _async_publish_max_size={
+                "preprocessor": int,
+                "validator": self._validate__async_publish_max_size,
+            },
             _async_upload_concurrency_limit={
                 "preprocessor": int,
                 "validator": self._validate__async_upload_concurrency_limit,
@@ -606,6 +621,7 @@ class Settings(SettingsData):
             _disable_viewer={"preprocessor": _str_as_bool},
             _extra_http_headers={"preprocessor": _str_as_json},
             _network_buffer={"preprocessor": int},
+            _coalesce_history={"value": False, "preprocessor": _str_as_bool},
             _colab={
                 "hook": lambda _: "google.colab" in sys.modules,
                 "auto_hook": True,
@@ -638,10 +654,29 @@ class Settings(SettingsData):
                 ),
                 "auto_hook": True,
             },
+            _file_stream_compression={
+                "validator": self._validate__file_stream_compression,
+            },
+            _file_stream_max_backlog_bytes={"preprocessor": int},
+            _file_stream_max_inflight={
+                "value": 1,
+                "preprocessor": int,
+                "validator": self._validate__file_stream_max_inflight,
+            },
             _file_stream_timeout_seconds={
                 "value": 60,
                 "preprocessor": float,
             },
+            _max_upload_jobs={
+                "value": 64,
+                "preprocessor": int,
+                "validator": self._validate__max_upload_jobs,
+            },
+            _pipeline_stats={"value": False, "preprocessor": _str_as_bool},
+            _pipeline_stats_port={
+                "preprocessor": int,
+                "validator": self._validate__pipeline_stats_port,
+            },
             _flow_control_disabled={
                 "hook": lambda _: self._network_buffer == 0,
                 "auto_hook": True,
@@ -1059,6 +1094,33 @@ class Settings(SettingsData):
 
         return True
 
+    @staticmethod
+    def _validate__file_stream_compression(value: str) -> bool:
+        choices: Set[str] = {"gzip", "zstd"}
+        if value not in choices:
+            raise UsageError(
+                f"Settings field `_file_stream_compression`: {value!r} not in {choices}"
+            )
+        return True
+
+    @staticmethod
+    def _validate__file_stream_max_inflight(value: int) -> bool:
+        if value < 1:
+            raise UsageError("_file_stream_max_inflight must be >= 1")
+        return True
+
+    @staticmethod
+    def _validate__max_upload_jobs(value: int) -> bool:
+        if value < 1:
+            raise UsageError("_max_upload_jobs must be >= 1")
+        return True
+
+    @staticmethod
+    def _validate__pipeline_stats_port(value: int) -> bool:
+        if not 0 <= value <= 65535:
+            raise UsageError("_pipeline_stats_port must be between 0 and 65535")
+        return True
+
     @staticmethod
     def _validate__service_wait(value: float) -> bool:
         if value <= 0:
@@ -1077,6 +1139,20 @@ class Settings(SettingsData):
             raise UsageError("_stats_samples_to_average must be between 1 and 30")
         return True
 
+    @staticmethod
+    def _validate__async_publish(value: str) -> bool:
+        if value not in ASYNC_PUBLISH_POLICIES:
+            raise UsageError(
+                f"_async_publish must be one of {', '.join(ASYNC_PUBLISH_POLICIES)}"
+            )
+        return True
+
+    @staticmethod
+    def _validate__async_publish_max_size(value: int) -> bool:
+        if value <= 0:
+            raise UsageError("_async_publish_max_size must be positive")
+        return True
+
     @staticmethod
     def _validate__async_upload_concurrency_limit(value: int) -> bool:
         if value <= 0:
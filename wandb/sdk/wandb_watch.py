@@ -24,6 +24,8 @@ def watch(
     log_freq: int = 1000,
     idx: Optional[int] = None,
     log_graph: bool = False,
+    batched: bool = False,
+    background: bool = False,
 ):
     """Hook into the torch model to collect gradients and the topology.
 
@@ -36,6 +38,11 @@ def watch(
         log_freq: (int) log gradients and parameters every N batches
         idx: (int) an index to be used when calling wandb.watch on multiple models
         log_graph: (boolean) log graph topology
+        batched: (boolean) compute the histograms of all the gradients or
+            parameters of a step together and log them at once, faster on
+            models with many parameter tensors
+        background: (boolean) log batched histograms from a background thread,
+            so the step doesn't wait for them; implies batched
 
     Returns:
         `wandb.Graph`: The graph object that will populate after the first backward pass
@@ -90,6 +97,8 @@ def watch(
                 model,
                 prefix=prefix,
                 log_freq=log_freq,
+                batched=batched,
+                background=background,
             )
 
         if log_gradients:
@@ -97,6 +106,8 @@ def watch(
                 model,
                 prefix=prefix,
                 log_freq=log_freq,
+                batched=batched,
+                background=background,
             )
 
         if log_graph:
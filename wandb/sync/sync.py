@@ -14,6 +14,7 @@ import wandb
 from wandb.proto import wandb_internal_pb2  # type: ignore
 from wandb.sdk.interface.interface_queue import InterfaceQueue
 from wandb.sdk.internal import context, datastore, handler, sender, tb_watcher
+from wandb.sdk.internal.file_pusher import FilePusher
 from wandb.sdk.internal.settings_static import SettingsStatic
 from wandb.sdk.lib import filesystem
 from wandb.util import check_and_warn_old
@@ -22,6 +23,13 @@ WANDB_SUFFIX = ".wandb"
 SYNCED_SUFFIX = ".synced"
 TFEVENT_SUBSTRING = ".tfevents."
 TMPDIR = tempfile.TemporaryDirectory()
+MAX_UPLOAD_JOBS = FilePusher.MAX_UPLOAD_JOBS
+
+# outcome of syncing a path, reported by parallel syncs
+SYNC_DONE = "synced"
+SYNC_INCOMPLETE = "incomplete"
+SYNC_SKIPPED = "skipped"
+SYNC_FAILED = "failed"
 
 
 class _LocalRun:
@@ -51,6 +59,8 @@ class SyncThread(threading.Thread):
         sync_tensorboard=None,
         log_path=None,
         append=None,
+        results=None,
+        max_upload_jobs=None,
     ):
         threading.Thread.__init__(self)
         # mark this process as internal
@@ -66,6 +76,10 @@ class SyncThread(threading.Thread):
         self._sync_tensorboard = sync_tensorboard
         self._log_path = log_path
         self._append = append
+        # set when syncing in parallel with other threads
+        self._results = results
+        self._parallel = results is not None
+        self._max_upload_jobs = max_upload_jobs
 
     def _parse_pb(self, data, exit_pb=None):
         pb = wandb_internal_pb2.Record()
@@ -219,99 +233,161 @@ class SyncThread(threading.Thread):
         handle_manager.finish()
         send_manager.finish()
 
-    def _robust_scan(self, ds):
-        """Attempt to scan data, handling incomplete files."""
-        try:
-            return ds.scan_data()
-        except AssertionError as e:
-            if ds.in_last_block():
-                wandb.termwarn(
-                    ".wandb file is incomplete ({}), be sure to sync this run again once it's finished".format(
-                        e
-                    )
-                )
-                return None
-            else:
-                raise e
-
     def run(self):
-        if self._log_path is not None:
+        if self._log_path is not None and not self._parallel:
             print(f"Find logs at: {self._log_path}")
-        for sync_item in self._sync_list:
-            tb_event_files, tb_logdirs, tb_root = self._find_tfevent_files(sync_item)
-            if os.path.isdir(sync_item):
-                files = os.listdir(sync_item)
-                filtered_files = list(filter(lambda f: f.endswith(WANDB_SUFFIX), files))
-                if tb_root is None and (
-                    check_and_warn_old(files) or len(filtered_files) != 1
-                ):
-                    print(f"Skipping directory: {sync_item}")
-                    continue
-                if len(filtered_files) > 0:
-                    sync_item = os.path.join(sync_item, filtered_files[0])
-            sync_tb = self._setup_tensorboard(
-                tb_root, tb_logdirs, tb_event_files, sync_item
-            )
-            # If we're syncing tensorboard, let's use a tmp dir for images etc.
-            root_dir = TMPDIR.name if sync_tb else os.path.dirname(sync_item)
+        for sync_item in self._next_items():
+            try:
+                status = self._sync_item(sync_item)
+            except Exception as e:
+                if self._results is None:
+                    raise
+                wandb.termerror(f"Failed to sync {sync_item}: {e}")
+                status = SYNC_FAILED
+            if self._results is not None:
+                self._results.add(sync_item, status)
+
+    def _next_items(self):
+        if isinstance(self._sync_list, queue.Queue):
+            while True:
+                try:
+                    yield self._sync_list.get_nowait()
+                except queue.Empty:
+                    return
+        else:
+            yield from self._sync_list
+
+    def _send_record(self, sm, pb, shown):
+        """Send a record, returning whether the run url has been shown."""
+        sm.send(pb)
+        # send any records that were added in previous send
+        while not sm._record_q.empty():
+            data = sm._record_q.get(block=True)
+            sm.send(data)
+
+        if pb.control.req_resp:
+            result = sm._result_q.get(block=True)
+            result_type = result.WhichOneof("result_type")
+            if not shown and result_type == "run_result":
+                r = result.run_result.run
+                # TODO(jhr): hardcode until we have settings in sync
+                url = "{}/{}/{}/runs/{}".format(
+                    self._app_url,
+                    url_quote(r.entity),
+                    url_quote(r.project),
+                    url_quote(r.run_id),
+                )
+                if self._parallel:
+                    print(f"Syncing: {url}")
+                else:
+                    print("Syncing: %s ... " % url, end="")
+                sys.stdout.flush()
+                shown = True
+        return shown
+
+    def _sync_item(self, sync_item):
+        tb_event_files, tb_logdirs, tb_root = self._find_tfevent_files(sync_item)
+        if os.path.isdir(sync_item):
+            files = os.listdir(sync_item)
+            filtered_files = list(filter(lambda f: f.endswith(WANDB_SUFFIX), files))
+            if tb_root is None and (
+                check_and_warn_old(files) or len(filtered_files) != 1
+            ):
+                print(f"Skipping directory: {sync_item}")
+                return SYNC_SKIPPED
+            if len(filtered_files) > 0:
+                sync_item = os.path.join(sync_item, filtered_files[0])
+        sync_tb = self._setup_tensorboard(
+            tb_root, tb_logdirs, tb_event_files, sync_item
+        )
+        # If we're syncing tensorboard, let's use a tmp dir for images etc.,
+        # one per item since parallel syncs would clobber each other's files
+        if sync_tb:
+            root_dir = tempfile.mkdtemp(dir=TMPDIR.name)
+        else:
+            root_dir = os.path.dirname(sync_item)
 
-            # When appending we are allowing a possible resume, ie the run
-            # doesnt have to exist already
-            resume = "allow" if self._append else None
+        # When appending we are allowing a possible resume, ie the run
+        # doesnt have to exist already
+        resume = "allow" if self._append else None
 
-            sm = sender.SendManager.setup(root_dir, resume=resume)
-            if sync_tb:
-                self._send_tensorboard(tb_root, tb_logdirs, sm)
-                continue
+        sm = sender.SendManager.setup(
+            root_dir, resume=resume, max_upload_jobs=self._max_upload_jobs
+        )
+        if sync_tb:
+            self._send_tensorboard(tb_root, tb_logdirs, sm)
+            return SYNC_DONE
 
-            ds = datastore.DataStore()
+        ds = datastore.MappedDataStore(sync_item)
+        try:
+            # records are read in a single pass, they don't need an index
+            ds.open(build_index=False)
+        except AssertionError as e:
+            print(f".wandb file is empty ({e}), skipping: {sync_item}")
+            ds.close()
+            return SYNC_SKIPPED
+
+        # save exit for final send
+        exit_pb = None
+        finished = False
+        shown = False
+        corrupt = None
+        records = ds.records()
+        while True:
             try:
-                ds.open_for_scan(sync_item)
+                data = next(records)
+            except StopIteration:
+                break
             except AssertionError as e:
-                print(f".wandb file is empty ({e}), skipping: {sync_item}")
+                # sync the records before the corruption
+                corrupt = str(e)
+                break
+            pb, exit_pb, cont = self._parse_pb(data, exit_pb)
+            if exit_pb is not None:
+                finished = True
+            if cont:
                 continue
-
-            # save exit for final send
-            exit_pb = None
-            finished = False
-            shown = False
-            while True:
-                data = self._robust_scan(ds)
-                if data is None:
-                    break
-                pb, exit_pb, cont = self._parse_pb(data, exit_pb)
-                if exit_pb is not None:
-                    finished = True
-                if cont:
-                    continue
-                sm.send(pb)
-                # send any records that were added in previous send
-                while not sm._record_q.empty():
-                    data = sm._record_q.get(block=True)
-                    sm.send(data)
-
-                if pb.control.req_resp:
-                    result = sm._result_q.get(block=True)
-                    result_type = result.WhichOneof("result_type")
-                    if not shown and result_type == "run_result":
-                        r = result.run_result.run
-                        # TODO(jhr): hardcode until we have settings in sync
-                        url = "{}/{}/{}/runs/{}".format(
-                            self._app_url,
-                            url_quote(r.entity),
-                            url_quote(r.project),
-                            url_quote(r.run_id),
-                        )
-                        print("Syncing: %s ... " % url, end="")
-                        sys.stdout.flush()
-                        shown = True
-            sm.finish()
-            # Only mark synced if the run actually finished
-            if self._mark_synced and not self._view and finished:
-                synced_file = f"{sync_item}{SYNCED_SUFFIX}"
-                with open(synced_file, "w"):
-                    pass
+            shown = self._send_record(sm, pb, shown)
+        if corrupt:
+            wandb.termerror(
+                f".wandb file is corrupt ({corrupt}), only synced the records "
+                f"before the corruption: {sync_item}"
+            )
+        elif ds.incomplete:
+            wandb.termwarn(
+                ".wandb file is incomplete ({}), be sure to sync this run again once it's finished".format(
+                    ds.incomplete
+                )
+            )
+        ds.close()
+        sm.finish()
+        # Only mark synced if the run actually finished
+        if self._mark_synced and not self._view and finished and not corrupt:
+            synced_file = f"{sync_item}{SYNCED_SUFFIX}"
+            with open(synced_file, "w"):
+                pass
+        if not self._parallel:
             print("done.")
+        if corrupt:
+            return SYNC_FAILED
+        return SYNC_DONE if finished else SYNC_INCOMPLETE
+
+
+class _SyncResults:
+    """Thread safe record of the outcome of each synced path."""
+
+    def __init__(self, total):
+        self.total = total
+        self._lock = threading.Lock()
+        self._statuses = {}
+
+    def add(self, path, status):
+        with self._lock:
+            self._statuses[path] = status
+
+    def statuses(self):
+        with self._lock:
+            return dict(self._statuses)
 
 
 class SyncManager:
@@ -327,9 +403,10 @@ class SyncManager:
         sync_tensorboard=None,
         log_path=None,
         append=None,
+        jobs=None,
     ):
         self._sync_list = []
-        self._thread = None
+        self._threads = []
         self._project = project
         self._entity = entity
         self._run_id = run_id
@@ -340,6 +417,9 @@ class SyncManager:
         self._sync_tensorboard = sync_tensorboard
         self._log_path = log_path
         self._append = append
+        self._jobs = max(1, jobs or 1)
+        self._results = None
+        self._reported = None
 
     def status(self):
         pass
@@ -348,29 +428,65 @@ class SyncManager:
         self._sync_list.append(os.path.abspath(str(p)))
 
     def start(self):
-        # create a thread for each file?
-        self._thread = SyncThread(
-            sync_list=self._sync_list,
-            project=self._project,
-            entity=self._entity,
-            run_id=self._run_id,
-            view=self._view,
-            verbose=self._verbose,
-            mark_synced=self._mark_synced,
-            app_url=self._app_url,
-            sync_tensorboard=self._sync_tensorboard,
-            log_path=self._log_path,
-            append=self._append,
-        )
-        self._thread.start()
+        jobs = min(self._jobs, len(self._sync_list)) or 1
+        sync_list = self._sync_list
+        max_upload_jobs = None
+        if jobs > 1:
+            # shard the paths across the workers through a shared queue and
+            # split the upload threads of one run between them, so the total
+            # number of connections stays the same as syncing a single run
+            sync_list = queue.Queue()
+            for p in self._sync_list:
+                sync_list.put(p)
+            self._results = _SyncResults(len(self._sync_list))
+            max_upload_jobs = max(1, MAX_UPLOAD_JOBS // jobs)
+            if self._log_path is not None:
+                print(f"Find logs at: {self._log_path}")
+        for _ in range(jobs):
+            thread = SyncThread(
+                sync_list=sync_list,
+                project=self._project,
+                entity=self._entity,
+                run_id=self._run_id,
+                view=self._view,
+                verbose=self._verbose,
+                mark_synced=self._mark_synced,
+                app_url=self._app_url,
+                sync_tensorboard=self._sync_tensorboard,
+                log_path=self._log_path,
+                append=self._append,
+                results=self._results,
+                max_upload_jobs=max_upload_jobs,
+            )
+            thread.start()
+            self._threads.append(thread)
 
     def is_done(self):
-        return not self._thread.is_alive()
+        return not any(thread.is_alive() for thread in self._threads)
 
     def poll(self):
         time.sleep(1)
+        if self._results is not None:
+            done = len(self._results.statuses())
+            if done != self._reported:
+                self._reported = done
+                wandb.termlog(f"Synced {done} of {self._results.total} runs")
         return False
 
+    def report(self):
+        """Print the outcome of each run of a parallel sync."""
+        if self._results is None:
+            return
+        statuses = self._results.statuses()
+        for path in self._sync_list:
+            wandb.termlog(f"  {statuses.get(path, SYNC_FAILED)}: {path}")
+        failed = sum(status != SYNC_DONE for status in statuses.values())
+        failed += self._results.total - len(statuses)
+        if failed:
+            wandb.termwarn(f"{failed} of {self._results.total} runs were not synced")
+        else:
+            wandb.termlog(f"Synced all {self._results.total} runs")
+
 
 def get_runs(
     include_offline=None,
@@ -821,6 +821,23 @@ def json_dumps_safer_history(obj: Any, **kwargs: Any) -> str:
     return json.dumps(obj, cls=WandBHistoryJSONEncoder, **kwargs)
 
 
+# Values of these exact types need no conversion before json encoding.
+PLAIN_JSON_TYPES = (int, float, bool, str)
+
+
+def json_dumps_plain(obj: Union[int, float, bool, str]) -> str:
+    """Convert a value of one of PLAIN_JSON_TYPES to json, like json.dumps."""
+    if obj is True:
+        return "true"
+    if obj is False:
+        return "false"
+    if type(obj) is int:
+        return int.__repr__(obj)
+    if type(obj) is float and math.isfinite(obj):
+        return float.__repr__(obj)
+    return json.dumps(obj)
+
+
 def make_json_if_not_number(
     v: Union[int, float, str, Mapping, Sequence]
 ) -> Union[int, float, str]:
@@ -4,9 +4,12 @@
 """
 
 import itertools
+import logging
+import queue
+import threading
 from functools import reduce
 from operator import mul
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 import wandb
 from wandb import util
@@ -14,6 +17,16 @@ from wandb.data_types import Node
 
 torch = None
 
+logger = logging.getLogger("wandb")
+
+# Batched tensors are summarized in groups of at most this many elements, to
+# bound the memory used by the temporaries of the summaries.
+_MAX_BATCH_ELEMENTS = 2**23
+
+# The number of batches waiting for the background thread before adding more
+# waits for it.
+_MAX_QUEUED_BATCHES = 2
+
 
 def nested_shape(array_or_tuple, seen=None):
     """Figure out the shape of tensors possibly embedded in tuples
@@ -65,6 +78,198 @@ def log_track_update(log_track: int) -> bool:
     return True
 
 
+class HistogramBatcher:
+    """Logs the histograms of many tensors together.
+
+    Tensors are added as their hooks fire and summarized on `flush`: they are
+    concatenated into a few flat buffers, the min, max and histogram of each
+    tensor are computed from those without waiting for the device, and the
+    summaries are copied to the host in a single transfer. The histograms of
+    all the tensors are logged in a single history update.
+
+    With `background`, the transfer and the logging happen on a background
+    thread, so the training step doesn't wait for them. The run waits for
+    them with `wait` before committing a step, so the histograms are logged
+    at the step they were flushed in.
+    """
+
+    def __init__(self, num_bins: int, background: bool = False) -> None:
+        self._num_bins = num_bins
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, "torch.Tensor"]] = []
+        self._flush_queued = False
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._queue = queue.Queue(maxsize=_MAX_QUEUED_BATCHES)
+            self._thread = threading.Thread(
+                target=self._run, name="WandbHistograms", daemon=True
+            )
+            self._thread.start()
+
+    def add(self, name: str, tensor: "torch.Tensor") -> bool:
+        """Add a tensor to the next flush, return False if it can't be batched."""
+        if not isinstance(tensor, torch.Tensor) or tensor.is_sparse:
+            return False
+        if tensor.numel() > 0:
+            with self._lock:
+                self._pending.append((name, tensor.detach()))
+        return True
+
+    def add_gradient(self, name: str, grad: "torch.Tensor") -> bool:
+        """Add a gradient to the flush at the end of the running backward pass."""
+        if not self.add(name, grad):
+            return False
+        with self._lock:
+            if self._flush_queued:
+                return True
+            self._flush_queued = True
+        try:
+            torch.autograd.Variable._execution_engine.queue_callback(self.flush)
+        except (AttributeError, RuntimeError):
+            # not in a backward pass, or a torch without the callbacks
+            self.flush()
+        return True
+
+    def flush(self) -> None:
+        """Log the histograms of the tensors added since the last flush."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._flush_queued = False
+        run = wandb.run
+        if not pending or run is None:
+            return
+        names = [name for name, _ in pending]
+        groups = self._concat_groups([tensor for _, tensor in pending])
+        if self._queue is None:
+            self._log(run, names, [self._summarize(*group) for group in groups])
+        elif all(values.device.type == "cpu" for values, _ in groups):
+            # the groups are copies, the thread can summarize them
+            self._queue.put((run, names, groups, None))
+        else:
+            # summarizing doesn't wait for the device, only the transfer does
+            summaries = [self._summarize(*group) for group in groups]
+            self._queue.put((run, names, None, summaries))
+
+    def wait(self) -> None:
+        """Wait for the background thread to log the histograms flushed so far."""
+        q = self._queue
+        if q is not None and threading.current_thread() is not self._thread:
+            q.join()
+
+    def close(self) -> None:
+        """Flush, and wait for the background thread to log everything."""
+        self.flush()
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._queue = None
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                run, names, groups, summaries = job
+                if summaries is None:
+                    summaries = [self._summarize(*group) for group in groups]
+                self._log(run, names, summaries)
+            except Exception:
+                logger.exception("Failed to log histograms")
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _concat_groups(
+        tensors: List["torch.Tensor"],
+    ) -> List[Tuple["torch.Tensor", List[int]]]:
+        """Concatenate consecutive tensors on the same device into flat buffers."""
+        groups = []
+        group: List["torch.Tensor"] = []
+        size = 0
+        for tensor in tensors + [None]:
+            if group and (
+                tensor is None
+                or tensor.device != group[0].device
+                or size + tensor.numel() > _MAX_BATCH_ELEMENTS
+            ):
+                values = torch.cat([t.reshape(-1).float() for t in group])
+                groups.append((values, [t.numel() for t in group]))
+                group, size = [], 0
+            if tensor is not None:
+                group.append(tensor)
+                size += tensor.numel()
+        return groups
+
+    def _summarize(self, values: "torch.Tensor", sizes: List[int]) -> "torch.Tensor":
+        """Summarize the tensors concatenated in `values` without device syncs.
+
+        Returns:
+            A row per tensor with the min and max of its finite values, then
+            its histogram of those between them, like `torch.histc`.
+        """
+        device = values.device
+        n, bins = len(sizes), self._num_bins
+        # the index of the tensor of each value
+        starts = torch.zeros(len(values), dtype=torch.long, device=device)
+        offsets = list(itertools.accumulate(sizes))[:-1]
+        if offsets:
+            starts[torch.tensor(offsets).to(device, non_blocking=True)] = 1
+        segments = starts.cumsum(0)
+        del starts
+
+        finite = torch.isfinite(values)
+        for_min = values.masked_fill(~finite, float("inf"))
+        for_max = values.masked_fill(~finite, float("-inf"))
+        if hasattr(values, "scatter_reduce_"):
+            tmin = torch.full((n,), float("inf"), device=device)
+            tmin.scatter_reduce_(0, segments, for_min, "amin")
+            tmax = torch.full((n,), float("-inf"), device=device)
+            tmax.scatter_reduce_(0, segments, for_max, "amax")
+        else:
+            tmin = torch.stack([v.min() for v in for_min.split(sizes)])
+            tmax = torch.stack([v.max() for v in for_max.split(sizes)])
+        del for_min, for_max
+        # tensors without finite values have no histogram, their counts are 0
+        empty = tmin > tmax
+        tmin = tmin.masked_fill(empty, 0)
+        tmax = tmax.masked_fill(empty, 0)
+
+        # like histc, widen the range of tensors of a single value
+        single = tmin == tmax
+        left = torch.where(single, tmin - 1, tmin)
+        width = torch.where(single, tmax + 1, tmax) - left
+        position = (values - left[segments]) * bins / width[segments]
+        position = position.masked_fill(~finite, 0)
+        index = position.long().clamp_(0, bins - 1) + segments * bins
+        counts = torch.zeros(n * bins, device=device)
+        counts.index_add_(0, index, finite.float())
+        return torch.cat([tmin[:, None], tmax[:, None], counts.view(n, bins)], dim=1)
+
+    def _log(
+        self,
+        run: "wandb.sdk.wandb_run.Run",
+        names: List[str],
+        summaries: List["torch.Tensor"],
+    ) -> None:
+        if len({summary.device for summary in summaries}) == 1:
+            rows = torch.cat(summaries).cpu().tolist()
+        else:
+            rows = torch.cat([summary.cpu() for summary in summaries]).tolist()
+        histograms = {}
+        for name, row in zip(names, rows):
+            tmin, tmax, counts = row[0], row[1], row[2:]
+            # Skip logging if all values are nan or inf.
+            if not any(counts):
+                continue
+            bins = torch.linspace(tmin, tmax, steps=self._num_bins + 1)
+            histograms[name] = wandb.Histogram(np_histogram=(counts, bins.tolist()))
+        if histograms:
+            run._log(histograms, commit=False)
+
+
 class TorchHistory:
     """History methods specific to PyTorch"""
 
@@ -74,18 +279,34 @@ class TorchHistory:
         self._hook_handles = {}
         self._num_bins = 64
         self._is_cuda_histc_supported = None
+        self._histogram_batchers: Dict[bool, HistogramBatcher] = {}
         self.hook_torch = TorchGraph.hook_torch
 
+    def _get_histogram_batcher(
+        self, batched: bool, background: bool
+    ) -> Optional[HistogramBatcher]:
+        if not (batched or background):
+            return None
+        if background not in self._histogram_batchers:
+            self._histogram_batchers[background] = HistogramBatcher(
+                self._num_bins, background=background
+            )
+        return self._histogram_batchers[background]
+
     def add_log_parameters_hook(
         self,
         module: "torch.nn.Module",
         name: str = "",
         prefix: str = "",
         log_freq: int = 0,
+        batched: bool = False,
+        background: bool = False,
     ) -> None:
         """This instruments hooks into the pytorch module
         log parameters after a forward pass
         log_freq - log gradients/parameters every N batches
+        batched - log the histograms of all the parameters of a forward pass at once
+        background - log batched histograms from a background thread
         """
         # if name is not None:
         prefix = prefix + name
@@ -93,6 +314,8 @@ class TorchHistory:
         if not hasattr(module, "_wandb_hook_names"):
             module._wandb_hook_names = []
 
+        batcher = self._get_histogram_batcher(batched, background)
+
         def parameter_log_hook(module, input_, output, log_track):
             if not log_track_update(log_track):
                 return
@@ -102,7 +325,12 @@ class TorchHistory:
                     data = parameter.data
                 else:
                     data = parameter
-                self.log_tensor_stats(data.cpu(), "parameters/" + prefix + name)
+                if batcher is None or not batcher.add(
+                    "parameters/" + prefix + name, data
+                ):
+                    self.log_tensor_stats(data.cpu(), "parameters/" + prefix + name)
+            if batcher is not None:
+                batcher.flush()
 
         log_track_params = log_track_init(log_freq)
         try:
@@ -124,10 +352,14 @@ class TorchHistory:
         name: str = "",
         prefix: str = "",
         log_freq: int = 0,
+        batched: bool = False,
+        background: bool = False,
     ) -> None:
         """This instruments hooks into the pytorch module
         log gradients after a backward pass
         log_freq - log gradients/parameters every N batches
+        batched - log the histograms of all the gradients of a backward pass at once
+        background - log batched histograms from a background thread
         """
 
         # if name is not None:
@@ -136,12 +368,13 @@ class TorchHistory:
         if not hasattr(module, "_wandb_hook_names"):
             module._wandb_hook_names = []
 
+        batcher = self._get_histogram_batcher(batched, background)
         for name, parameter in module.named_parameters():
             if parameter.requires_grad:
                 log_track_grad = log_track_init(log_freq)
                 module._wandb_hook_names.append("gradients/" + prefix + name)
                 self._hook_variable_gradient_stats(
-                    parameter, "gradients/" + prefix + name, log_track_grad
+                    parameter, "gradients/" + prefix + name, log_track_grad, batcher
                 )
 
     def log_tensor_stats(self, tensor, name):
@@ -258,7 +491,7 @@ class TorchHistory:
             commit=False,
         )
 
-    def _hook_variable_gradient_stats(self, var, name, log_track):
+    def _hook_variable_gradient_stats(self, var, name, log_track, batcher=None):
         """Logs a Variable's gradient's distribution statistics next time backward()
         is called on it.
         """
@@ -275,7 +508,8 @@ class TorchHistory:
         def _callback(grad, log_track):
             if not log_track_update(log_track):
                 return
-            self.log_tensor_stats(grad.data, name)
+            if batcher is None or not batcher.add_gradient(name, grad.data):
+                self.log_tensor_stats(grad.data, name)
 
         handle = var.register_hook(lambda grad: _callback(grad, log_track))
         self._hook_handles[name] = handle
@@ -290,6 +524,16 @@ class TorchHistory:
         handle = self._hook_handles.pop(name)
         handle.remove()
 
+    def wait(self):
+        """Wait for the histograms flushed so far to be logged."""
+        for batcher in self._histogram_batchers.values():
+            batcher.wait()
+
+    def close(self):
+        """Log the pending batched histograms."""
+        for batcher in self._histogram_batchers.values():
+            batcher.close()
+
     def _torch_hook_handle_is_valid(self, handle):
         d = handle.hooks_dict_ref()
         if d is None: